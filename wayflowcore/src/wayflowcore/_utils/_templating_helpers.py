@@ -6,6 +6,7 @@
 
 import re
 from collections import Counter
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional, Tuple, Type, Union, overload
 
 import jinja2.exceptions
@@ -21,6 +22,8 @@ from wayflowcore.tools.tools import ExtraContentT
 
 _MAX_RECURSION_DEPTH = 50
 _DEFAULT_VARIABLE_DESCRIPTION_TEMPLATE = '"{var_name}" input variable for the template'
+_TEMPLATE_CACHE_MAX_SIZE = 1024
+"""Maximum number of parsed and compiled templates kept in the template caches"""
 
 
 class ToolRequestAsDictT(TypedDict, total=True):
@@ -163,7 +166,7 @@ def check_template_validity(template: str) -> None:
     # Note that in jinja parse/compilation and rendering stages are different
     # This code only requires parsing, which transforms the template in an internal representation
     # It does not execute any code in the template, and it does not trigger security exceptions
-    RestrictedSandboxedEnvironment().from_string(source=template)
+    _compile_str_template(template, partial=False)
 
 
 def get_variable_names_from_object(
@@ -226,8 +229,13 @@ def get_variable_names_from_object(
 
 def get_variable_names_from_str_template(jinja_template: str) -> List[str]:
     """Extracts the variable name from a jinja template."""
+    # the cached tuple is shared, callers get their own list
+    return list(_get_variable_names_from_str_template(jinja_template))
 
-    ast = RestrictedSandboxedEnvironment().parse(jinja_template)
+
+@lru_cache(maxsize=_TEMPLATE_CACHE_MAX_SIZE)
+def _get_variable_names_from_str_template(jinja_template: str) -> Tuple[str, ...]:
+    ast = _get_environment(partial=False).parse(jinja_template)
     # extract all variable names using jinja2 function, in case our implementation
     # is missing some variables
     found_var_names_using_jinja2 = set(meta.find_undeclared_variables(ast))
@@ -279,7 +287,7 @@ def get_variable_names_from_str_template(jinja_template: str) -> List[str]:
         if var_name not in found_variables:
             found_variables.append(var_name)
 
-    return found_variables
+    return tuple(found_variables)
 
 
 def _wrap_variable(var_name: str) -> str:
@@ -479,17 +487,43 @@ def render_nested_object_template(
             raise ValueError(f"Cannot render template for {object}")
 
 
+@lru_cache(maxsize=2)
+def _get_environment(partial: bool) -> RestrictedSandboxedEnvironment:
+    """Returns the sandboxed environment shared by all templates rendered with the same undefined mode.
+    The environments are never modified after their creation."""
+    env = RestrictedSandboxedEnvironment(undefined=DebugUndefined if partial else StrictUndefined)
+    # don't sort the keys in dicts
+    env.policies["json.dumps_kwargs"] = {"sort_keys": False}
+    return env
+
+
+@lru_cache(maxsize=_TEMPLATE_CACHE_MAX_SIZE)
+def _compile_str_template(template: str, partial: bool) -> Tuple[Template, Tuple[str, ...]]:
+    """Compiles the template in the shared sandboxed environment, and extracts its variable names.
+    The compiled template still enforces all the sandbox checks when it is rendered."""
+    return (
+        _get_environment(partial).from_string(source=template),
+        _get_variable_names_from_str_template(template),
+    )
+
+
+def _get_template_cache_info() -> Dict[str, Any]:
+    """Returns the hits, misses and sizes of the caches of compiled templates and of variable names."""
+    return {
+        "compiled_templates": _compile_str_template.cache_info(),
+        "variable_names": _get_variable_names_from_str_template.cache_info(),
+    }
+
+
+def _clear_template_caches() -> None:
+    _compile_str_template.cache_clear()
+    _get_variable_names_from_str_template.cache_clear()
+
+
 def render_str_template(template: str, inputs: Dict[str, Any], partial: bool = False) -> str:
-    variable_names = get_variable_names_from_str_template(template)
     try:
-        env = RestrictedSandboxedEnvironment(
-            undefined=DebugUndefined if partial else StrictUndefined
-        )
-        # don't sort the keys in dicts
-        env.policies["json.dumps_kwargs"] = {"sort_keys": False}
-        return env.from_string(source=template).render(
-            **{k: v for k, v in inputs.items() if k in variable_names}
-        )
+        compiled_template, variable_names = _compile_str_template(template, partial)
+        return compiled_template.render(**{k: v for k, v in inputs.items() if k in variable_names})
     except (SecurityException, jinja2.exceptions.SecurityError) as e:
         raise SecurityException(
             f"The jinja template `{template}` is not safe and raised a security error: {e}"
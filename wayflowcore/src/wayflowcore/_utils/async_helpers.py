@@ -3,9 +3,12 @@
 # This software is under the Apache License 2.0
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+import atexit
 import contextlib
 import contextvars
 import inspect
+import logging
+import threading
 import warnings
 from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
@@ -16,6 +19,7 @@ from typing import (
     AsyncIterator,
     Awaitable,
     Callable,
+    ContextManager,
     Dict,
     Generic,
     Iterable,
@@ -30,6 +34,10 @@ from exceptiongroup import BaseExceptionGroup
 from sniffio import AsyncLibraryNotFoundError
 from typing_extensions import Self
 
+from wayflowcore._utils.singleton import Singleton
+
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T")
 
 
@@ -92,6 +100,129 @@ def get_execution_context() -> AsyncContext:
             return AsyncContext.SYNC
 
 
+class SyncExecutionMode(Enum):
+    """How the synchronous APIs of WayFlow (e.g. ``Conversation.execute``) run their async implementation"""
+
+    NEW_EVENT_LOOP = "new_event_loop"
+    """Each synchronous call starts and closes its own event loop"""
+    PERSISTENT_EVENT_LOOP = "persistent_event_loop"
+    """Synchronous calls are submitted to a long-lived event loop running in a background thread"""
+
+
+_SYNC_EXECUTION_MODE = SyncExecutionMode.NEW_EVENT_LOOP
+
+
+def set_sync_execution_mode(mode: SyncExecutionMode) -> None:
+    """
+    Sets how the synchronous APIs of WayFlow run their async implementation, for the whole process.
+
+    With ``SyncExecutionMode.PERSISTENT_EVENT_LOOP``, the resources bound to an event loop, such as
+    the pooled HTTP connections of remote models, are kept alive across synchronous calls instead of
+    being re-created by every call.
+    """
+    global _SYNC_EXECUTION_MODE
+    if not isinstance(mode, SyncExecutionMode):
+        raise ValueError(f"Expected a SyncExecutionMode, but got: {mode!r}")
+    _SYNC_EXECUTION_MODE = mode
+
+
+def get_sync_execution_mode() -> SyncExecutionMode:
+    """Returns how the synchronous APIs of WayFlow run their async implementation"""
+    return _SYNC_EXECUTION_MODE
+
+
+async def _call_with_context(
+    context: contextvars.Context, async_function: Callable[..., Awaitable[T]], *args: Any
+) -> T:
+    # the portal task does not inherit the context of the calling thread, so
+    # we set the context variables of the caller before executing the workload
+    for var, val in context.items():
+        var.set(val)
+    return await async_function(*args)
+
+
+class BackgroundEventLoop(metaclass=Singleton):
+    def __init__(self) -> None:
+        """
+        Singleton class for the long-lived event loop used by the synchronous APIs of WayFlow in
+        ``SyncExecutionMode.PERSISTENT_EVENT_LOOP``. The loop runs in a dedicated background thread,
+        which synchronous callers submit their async work into, so that the resources bound to the
+        loop survive across calls.
+
+        The loop is started on first use and shut down at program termination.
+        """
+        self._lock = threading.Lock()
+        self._portal_cm: Optional[ContextManager[from_thread.BlockingPortal]] = None
+        self._portal: Optional[from_thread.BlockingPortal] = None
+        self._thread_id: Optional[int] = None
+        self._atexit_registered = False
+
+    @property
+    def is_live(self) -> bool:
+        """Whether the background event loop is started or not"""
+        return self._portal is not None
+
+    @property
+    def is_current_thread(self) -> bool:
+        """Whether the caller is running in the thread of the background event loop"""
+        return self._thread_id is not None and self._thread_id == threading.get_ident()
+
+    def start(self) -> from_thread.BlockingPortal:
+        """Starts the background event loop, if not already started, and returns its portal"""
+        portal = self._portal
+        if portal is not None:
+            return portal
+        with self._lock:
+            if self._portal is not None:
+                return self._portal
+            logger.debug("Starting the WayFlow background event loop")
+            portal_cm = from_thread.start_blocking_portal()
+            portal = portal_cm.__enter__()
+            self._thread_id = portal.call(threading.get_ident)
+            self._portal_cm = portal_cm
+            self._portal = portal
+            if not self._atexit_registered:
+                atexit.register(self.shutdown)
+                self._atexit_registered = True
+            return portal
+
+    def call(self, async_function: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """
+        Runs an async function in the background event loop and waits for its result.
+        Must not be called from the thread of the background event loop.
+        """
+        if self.is_current_thread:
+            raise RuntimeError(
+                "Cannot wait for the background event loop from its own thread, this would deadlock"
+            )
+        portal = self.start()
+        return portal.call(
+            _call_with_context, contextvars.copy_context(), async_function, *args  # type: ignore
+        )
+
+    def shutdown(self) -> None:
+        """
+        Stops the background event loop, after closing the resources bound to it.
+        It is started again on next use.
+        """
+        with self._lock:
+            portal_cm = self._portal_cm
+            self._portal_cm = None
+            self._portal = None
+            self._thread_id = None
+        if portal_cm is not None:
+            logger.debug("Stopping the WayFlow background event loop")
+            portal_cm.__exit__(None, None, None)
+
+
+def _run_in_new_thread(async_function: Callable[..., Awaitable[T]], *args: Any) -> T:
+    def thread_target() -> T:
+        return anyio.run(async_function, *args)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(thread_target).result()
+
+
 def run_async_in_sync(
     async_function: Callable[..., Awaitable[T]], *args: Any, method_name: str = ""
 ) -> T:
@@ -101,6 +232,8 @@ def run_async_in_sync(
     match get_execution_context():
         case AsyncContext.SYNC:
             # case 1: synchronous context
+            if _SYNC_EXECUTION_MODE == SyncExecutionMode.PERSISTENT_EVENT_LOOP:
+                return BackgroundEventLoop().call(async_function, *args)
             return anyio.run(async_function, *args)
         case AsyncContext.SYNC_WORKER:
             # case 2: from worker thread get back to existing async event loop
@@ -116,14 +249,17 @@ def run_async_in_sync(
                 UserWarning,
             )
 
+            background_event_loop = BackgroundEventLoop()
+            if (
+                _SYNC_EXECUTION_MODE == SyncExecutionMode.PERSISTENT_EVENT_LOOP
+                and not background_event_loop.is_current_thread
+            ):
+                return background_event_loop.call(async_function, *args)
+
             # workaround: anyio does not have any API run asynchronous code in a
             # synchronous method that was not started with anyio.to_thread
             # instead, we spawn a thread to execute it in a completely new event loop
-            def thread_target() -> T:
-                return anyio.run(async_function, *args)
-
-            future = ThreadPoolExecutor(max_workers=1).submit(thread_target)
-            return future.result()
+            return _run_in_new_thread(async_function, *args)
         case unsupported_context:
             raise NotImplementedError(f"Unsupported async context: {unsupported_context}")
 
@@ -166,8 +302,16 @@ class SyncAsyncIterable(Generic[T], Iterable[T]):
 
     def _lazy_init(self) -> None:
         if self.portal is None:
-            self.portal_cm = from_thread.start_blocking_portal()  # type: ignore
-            self.portal = self.portal_cm.__enter__()  # type: ignore
+            background_event_loop = BackgroundEventLoop()
+            if (
+                _SYNC_EXECUTION_MODE == SyncExecutionMode.PERSISTENT_EVENT_LOOP
+                and not background_event_loop.is_current_thread
+            ):
+                # the background event loop outlives the iteration, so it is not closed with it
+                self.portal = background_event_loop.start()  # type: ignore
+            else:
+                self.portal_cm = from_thread.start_blocking_portal()  # type: ignore
+                self.portal = self.portal_cm.__enter__()  # type: ignore
             self.ait = self.portal.call(self.async_iterable.__aiter__)  # type: ignore
 
     def __next__(self) -> T:
@@ -197,7 +341,8 @@ class SyncAsyncIterable(Generic[T], Iterable[T]):
             try:
                 self.portal.call(self.ait.aclose)
             finally:
-                self.portal_cm.__exit__(None, None, None)
+                if self.portal_cm is not None:
+                    self.portal_cm.__exit__(None, None, None)
         self.closed = True
 
 
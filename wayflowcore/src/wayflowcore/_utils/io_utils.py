@@ -4,15 +4,32 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+import json
 import os
 from pathlib import Path
-from typing import Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from wayflowcore.exceptions import SecurityException
 
 
+def _secure_write(filepath: Union[str, Path], write: Callable[[Path], Any]) -> None:
+    _filepath = Path(filepath).resolve()  # filepath sanitation
+    _filepath.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    # Due to security constraints, we set the permissions for all the files we generate to 600 (rw only for owner)
+    old_umask = os.umask(0o077)
+    try:
+        write(_filepath)
+        if _filepath.stat().st_mode & 0o777 != 0o600:  # Verify final permissions
+            raise SecurityException("Final file has incorrect permissions")
+    finally:
+        # Whatever happens, we restore the original umask
+        os.umask(old_umask)
+
+
 def secure_to_csv(df: pd.DataFrame, filepath: Union[str, Path]) -> None:
     """
     Securely write a DataFrame to a CSV file with strict permissions.
@@ -25,15 +42,120 @@ def secure_to_csv(df: pd.DataFrame, filepath: Union[str, Path]) -> None:
         The path where the CSV file should be saved. If the directory doesn't
         exist, it will be created with secure permissions.
     """
-    _filepath = Path(filepath).resolve()  # filepath sanitation
-    _filepath.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    _secure_write(filepath, lambda path: df.to_csv(path, index=False))
 
-    # Due to security constraints, we set the permissions for all the files we generate to 600 (rw only for owner)
-    old_umask = os.umask(0o077)
-    try:
-        df.to_csv(_filepath, index=False)
-        if _filepath.stat().st_mode & 0o777 != 0o600:  # Verify final permissions
-            raise SecurityException("Final file has incorrect permissions")
-    finally:
-        # Whatever happens, we restore the original umask
-        os.umask(old_umask)
+
+def secure_write_json(content: Any, filepath: Union[str, Path]) -> None:
+    """
+    Securely write a JSON-serializable object to a file with strict permissions.
+
+    Parameters
+    ----------
+    content : Any
+        The JSON-serializable object to write.
+    filepath : str or pathlib.Path
+        The path where the JSON file should be saved. If the directory doesn't
+        exist, it will be created with secure permissions.
+    """
+    _secure_write(filepath, lambda path: path.write_text(json.dumps(content), encoding="utf-8"))
+
+
+def secure_save_npy(array: np.ndarray, filepath: Union[str, Path]) -> None:  # type: ignore
+    """
+    Securely write a numpy array to a ``.npy`` file with strict permissions.
+
+    The ``.npy`` format stores the raw array data, so that it can be memory-mapped when loaded
+    with ``np.load(filepath, mmap_mode=...)``.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        The array to write.
+    filepath : str or pathlib.Path
+        The path where the array should be saved. If the directory doesn't
+        exist, it will be created with secure permissions.
+    """
+    _secure_write(filepath, lambda path: np.save(path, array, allow_pickle=False))
+
+
+def _is_vector_column(values: List[Any]) -> bool:
+    """Whether all values are non-empty float lists of the same length (e.g. embeddings)."""
+    if not values or not all(isinstance(value, list) for value in values):
+        return False
+    length = len(values[0])
+    return (
+        length > 0
+        and all(len(value) == length for value in values)
+        and all(isinstance(x, float) for value in values for x in value)
+    )
+
+
+def save_columnar_records(
+    records: List[Dict[str, Any]], directory: Union[str, Path], name: str
+) -> None:
+    """
+    Securely write a list of records (dictionaries) to a directory, in a columnar format.
+
+    The records are stored column by column in ``<name>.json``. Columns of float vectors (e.g.
+    embeddings) are stored separately as raw ``.npy`` arrays.
+
+    Parameters
+    ----------
+    records : list of dict
+        The records to write. The values must be JSON-serializable.
+    directory : str or pathlib.Path
+        The directory where the records should be saved.
+    name : str
+        Name of the records, used as prefix of the written files.
+    """
+    directory = Path(directory)
+    column_names: Dict[str, None] = {}
+    for record in records:
+        column_names.update(dict.fromkeys(record))
+
+    columns: Dict[str, Dict[str, Any]] = {}
+    for column_idx, column_name in enumerate(column_names):
+        missing = [i for i, record in enumerate(records) if column_name not in record]
+        values = [record.get(column_name) for record in records]
+        column: Dict[str, Any] = {}
+        if not missing and _is_vector_column(values):
+            filename = f"{name}.column_{column_idx}.npy"
+            secure_save_npy(np.array(values, dtype=np.float64), directory / filename)
+            column["file"] = filename
+        else:
+            column["values"] = values
+        if missing:
+            column["missing"] = missing
+        columns[column_name] = column
+
+    secure_write_json({"num_records": len(records), "columns": columns}, directory / f"{name}.json")
+
+
+def load_columnar_records(directory: Union[str, Path], name: str) -> List[Dict[str, Any]]:
+    """
+    Read a list of records written with ``save_columnar_records``.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path
+        The directory the records were saved to.
+    name : str
+        Name of the records, as given when saving them.
+
+    Returns
+    -------
+    list of dict
+        The records.
+    """
+    directory = Path(directory)
+    content = json.loads((directory / f"{name}.json").read_text(encoding="utf-8"))
+    records: List[Dict[str, Any]] = [{} for _ in range(content["num_records"])]
+    for column_name, column in content["columns"].items():
+        values: Optional[List[Any]] = column.get("values")
+        if values is None:
+            values = np.load(directory / column["file"], allow_pickle=False).tolist()
+        missing = set(column.get("missing", []))
+        for i, (record, value) in enumerate(zip(records, values)):
+            if i not in missing:
+                record[column_name] = value
+    return records
@@ -75,6 +75,8 @@ class Agent(ConversationalComponent, SerializableDataclassMixin, SerializableObj
     """Whether the agent can just exist the conversation when thinks it is done helping the user"""
     raise_exceptions: bool
     """Whether exceptions from sub-executions (tool, sub-agent, or sub-flow execution) are raised or not."""
+    max_concurrent_tool_calls: int
+    """Maximum number of server tools the agent can execute concurrently when the LLM requests several tools at once"""
     initial_message: Optional[str]
     """Initial hardcoded message the agent might post if it doesn't have any user message in the conversation"""
     caller_input_mode: CallerInputMode
@@ -120,6 +122,7 @@ class Agent(ConversationalComponent, SerializableDataclassMixin, SerializableObj
         context_providers: Optional[List["ContextProvider"]] = None,
         can_finish_conversation: bool = False,
         raise_exceptions: bool = False,
+        max_concurrent_tool_calls: int = 1,
         initial_message: Optional[str] = NOT_SET_INITIAL_MESSAGE,
         caller_input_mode: CallerInputMode = CallerInputMode.ALWAYS,
         input_descriptors: Optional[List["Property"]] = None,
@@ -195,6 +198,12 @@ class Agent(ConversationalComponent, SerializableDataclassMixin, SerializableObj
             Whether the agent can decide to end the conversation or not.
         raise_exceptions
             Whether exceptions from sub-executions (tool, sub-agent, or sub-flow execution) are raised or not.
+        max_concurrent_tool_calls
+            Maximum number of tool requests executed concurrently when the LLM requests several tools
+            in a single message. Defaults to 1, which executes the tool requests one after the other.
+            Only consecutive server tools that do not require confirmation are executed concurrently,
+            and their results are appended to the conversation in the order of the requests. Client
+            tools, tools requiring confirmation, flows and sub-agents are always executed sequentially.
         initial_message:
             Initial message the agent will post if no previous user message. It must be None for `CallerInputMode.NEVER`
             If None for `CallerInputMode.ALWAYS`, the LLM will generate it given the `custom_instruction`. Default to
@@ -283,6 +292,11 @@ class Agent(ConversationalComponent, SerializableDataclassMixin, SerializableObj
                 "The caller input mode for the agent is set to `CallerInputMode.NEVER`, which does not allow setting an initial message."
             )
 
+        if max_concurrent_tool_calls < 1:
+            raise ValueError(
+                f"`max_concurrent_tool_calls` should be at least 1, but was {max_concurrent_tool_calls}"
+            )
+
         if (
             caller_input_mode == CallerInputMode.NEVER
             and tools is not None
@@ -305,6 +319,7 @@ class Agent(ConversationalComponent, SerializableDataclassMixin, SerializableObj
         self.context_providers = context_providers or []
         self.can_finish_conversation = can_finish_conversation
         self.raise_exceptions = raise_exceptions
+        self.max_concurrent_tool_calls = max_concurrent_tool_calls
         self.initial_message = initial_message
         self.caller_input_mode = caller_input_mode
         self._add_talk_to_user_tool = _add_talk_to_user_tool
@@ -0,0 +1,78 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+"""
+Structural deltas between two serialized conversation states.
+
+A delta only contains what changed from one turn of a conversation to the next one. Referenced
+objects that did not change, such as the definition of the served component, are not repeated,
+and lists that grow along the conversation (messages, events, step history) only store their
+new items.
+
+A delta is a dictionary with the optional sections:
+
+- ``set``: values of keys that are new or whose value was replaced
+- ``unset``: keys that were removed
+- ``dicts``: deltas of nested dictionaries
+- ``lists``: for nested lists, the number of leading items to ``keep`` and the items to ``extend`` them with
+"""
+
+from typing import Any, Dict, List
+
+
+def _get_common_prefix_length(previous: List[Any], current: List[Any]) -> int:
+    prefix_length = 0
+    for previous_item, current_item in zip(previous, current):
+        if previous_item != current_item:
+            break
+        prefix_length += 1
+    return prefix_length
+
+
+def _compute_state_delta(previous: Dict[Any, Any], current: Dict[Any, Any]) -> Dict[str, Any]:
+    """Computes the delta to apply on ``previous`` to obtain ``current``"""
+    set_values: Dict[Any, Any] = {}
+    dict_deltas: Dict[Any, Dict[str, Any]] = {}
+    list_deltas: Dict[Any, Dict[str, Any]] = {}
+    for key, value in current.items():
+        if key not in previous:
+            set_values[key] = value
+            continue
+        previous_value = previous[key]
+        if previous_value == value:
+            continue
+        if isinstance(previous_value, dict) and isinstance(value, dict):
+            dict_deltas[key] = _compute_state_delta(previous_value, value)
+        elif isinstance(previous_value, list) and isinstance(value, list):
+            kept_length = _get_common_prefix_length(previous_value, value)
+            list_deltas[key] = {"keep": kept_length, "extend": value[kept_length:]}
+        else:
+            set_values[key] = value
+    unset_keys = [key for key in previous if key not in current]
+
+    delta: Dict[str, Any] = {}
+    if set_values:
+        delta["set"] = set_values
+    if unset_keys:
+        delta["unset"] = unset_keys
+    if dict_deltas:
+        delta["dicts"] = dict_deltas
+    if list_deltas:
+        delta["lists"] = list_deltas
+    return delta
+
+
+def _apply_state_delta(base: Dict[Any, Any], delta: Dict[str, Any]) -> Dict[Any, Any]:
+    """Applies a delta computed by ``_compute_state_delta`` on ``base``, in place, and returns it"""
+    for key in delta.get("unset", []):
+        base.pop(key, None)
+    for key, value in delta.get("set", {}).items():
+        base[key] = value
+    for key, nested_delta in delta.get("dicts", {}).items():
+        _apply_state_delta(base[key], nested_delta)
+    for key, list_delta in delta.get("lists", {}).items():
+        base[key] = base[key][: list_delta["keep"]] + list_delta["extend"]
+    return base
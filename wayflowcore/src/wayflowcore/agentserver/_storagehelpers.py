@@ -3,9 +3,11 @@
 # This software is under the Apache License 2.0
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+import base64
 import logging
+from copy import deepcopy
 from textwrap import dedent
-from typing import Dict, Optional, cast
+from typing import Any, Dict, Optional, Tuple, Union, cast
 
 from wayflowcore.agentserver.serverstorageconfig import ServerStorageConfig
 from wayflowcore.component import Component
@@ -15,18 +17,37 @@ from wayflowcore.datastore.postgres import (
     PostgresDatabaseConnectionConfig,
     _execute_query_on_postgres_db,
 )
-from wayflowcore.serialization import autodeserialize
 from wayflowcore.serialization.context import DeserializationContext
+from wayflowcore.serialization.formats import _dump_serialized_dict, _load_serialized_dict
+from wayflowcore.serialization.serializer import SerializableObject, autodeserialize_from_dict
 from wayflowcore.tools import Tool
 
 logger = logging.getLogger(__name__)
 
 
+def _get_base_turn_id_column_queries(
+    storage_config: ServerStorageConfig, column_type: str
+) -> Tuple[str, Optional[str]]:
+    """Returns the definition of the base turn id column, and the query creating its index"""
+    column_name = storage_config.base_turn_id_column_name
+    if column_name is None:
+        return "", None
+    # nullable, since Oracle stores empty strings as NULL
+    return (
+        f"{column_name} {column_type},",
+        f"CREATE INDEX {storage_config.table_name}_{column_name}_idx "
+        f"ON {storage_config.table_name} ({column_name})",
+    )
+
+
 def _prepare_postgres_datastore(
     connection_config: PostgresDatabaseConnectionConfig, storage_config: ServerStorageConfig
 ) -> None:
     from sqlalchemy.exc import ProgrammingError
 
+    base_turn_id_column, create_index_query = _get_base_turn_id_column_queries(
+        storage_config, "VARCHAR(255)"
+    )
     create_table_query = dedent(f"""
         CREATE TABLE {storage_config.table_name} (
             {storage_config.turn_id_column_name} VARCHAR(255) PRIMARY KEY,
@@ -35,11 +56,14 @@ def _prepare_postgres_datastore(
             {storage_config.created_at_column_name} INTEGER NOT NULL,
             {storage_config.conversation_turn_state_column_name} TEXT NOT NULL,
             {storage_config.is_last_turn_column_name} INTEGER NOT NULL,
+            {base_turn_id_column}
             {storage_config.extra_metadata_column_name} TEXT NOT NULL
         );
         """)
     try:
         _execute_query_on_postgres_db(connection_config, create_table_query)
+        if create_index_query is not None:
+            _execute_query_on_postgres_db(connection_config, create_index_query)
     except ProgrammingError as e:
         if f'relation "{storage_config.table_name}" already exists' in str(e):
             raise ValueError(
@@ -52,6 +76,9 @@ def _prepare_postgres_datastore(
 def _prepare_oracle_datastore(
     connection_config: OracleDatabaseConnectionConfig, storage_config: ServerStorageConfig
 ) -> None:
+    base_turn_id_column, create_index_query = _get_base_turn_id_column_queries(
+        storage_config, "VARCHAR2(255)"
+    )
     create_table_query = dedent(f"""
         CREATE TABLE {storage_config.table_name} (
             {storage_config.turn_id_column_name} VARCHAR2(255) PRIMARY KEY,
@@ -60,11 +87,14 @@ def _prepare_oracle_datastore(
             {storage_config.created_at_column_name} INTEGER NOT NULL,
             {storage_config.conversation_turn_state_column_name} CLOB NOT NULL,
             {storage_config.is_last_turn_column_name} INTEGER NOT NULL,
+            {base_turn_id_column}
             {storage_config.extra_metadata_column_name} CLOB NOT NULL
         );
         """)
     try:
         _execute_query_on_oracle_db(connection_config, query=create_table_query)
+        if create_index_query is not None:
+            _execute_query_on_oracle_db(connection_config, query=create_index_query)
     except Exception as e:
         if "already exists" in str(e):
             raise ValueError(
@@ -74,8 +104,50 @@ def _prepare_oracle_datastore(
             raise e
 
 
+_BINARY_STATE_PREFIX = "base64:"
+
+
+def _encode_serialized_state(
+    obj_as_dict: Dict[str, Any], storage_config: ServerStorageConfig
+) -> str:
+    """Encodes a serialized state, or a delta of states, in the format of the storage configuration"""
+    serialized_state = _dump_serialized_dict(
+        obj_as_dict,
+        serialization_format=storage_config.serialization_format,
+        compress=storage_config.compress_states,
+    )
+    if isinstance(serialized_state, bytes):
+        # the states are stored in text columns
+        return _BINARY_STATE_PREFIX + base64.b64encode(serialized_state).decode("ascii")
+    return serialized_state
+
+
+def _decode_serialized_state(serialized_state: str) -> Dict[str, Any]:
+    """
+    Decodes a state encoded by ``_encode_serialized_state``. The format is detected, so that states
+    stored before a change of the storage configuration can still be loaded.
+    """
+    if serialized_state.startswith(_BINARY_STATE_PREFIX):
+        return cast(
+            Dict[str, Any],
+            _load_serialized_dict(base64.b64decode(serialized_state[len(_BINARY_STATE_PREFIX) :])),
+        )
+    return cast(Dict[str, Any], _load_serialized_dict(serialized_state))
+
+
+def _autodeserialize_state(
+    serialized_state: Union[str, Dict[str, Any]], deserialization_context: DeserializationContext
+) -> SerializableObject:
+    if isinstance(serialized_state, str):
+        return autodeserialize_from_dict(
+            _decode_serialized_state(serialized_state), deserialization_context
+        )
+    # deserialization consumes the dictionary, which is kept intact for the caller
+    return autodeserialize_from_dict(deepcopy(serialized_state), deserialization_context)
+
+
 def _deserialize_conversation_safely(
-    serialized_state: str,
+    serialized_state: Union[str, Dict[str, Any]],
     tool_registry: Optional[Dict[str, Tool]] = None,
     component: Optional[Component] = None,
 ) -> Conversation:
@@ -87,9 +159,7 @@ def _deserialize_conversation_safely(
     deserialization_context = DeserializationContext()
     deserialization_context.registered_tools = tool_registry.copy() if tool_registry else {}
     try:
-        conversation = autodeserialize(
-            serialized_state, deserialization_context=deserialization_context
-        )
+        conversation = _autodeserialize_state(serialized_state, deserialization_context)
     except (TypeError, ValueError) as e:
         if component is None:
             raise e
@@ -103,7 +173,5 @@ def _deserialize_conversation_safely(
         deserialization_context.registered_tools = tool_registry.copy() if tool_registry else {}
         deserialization_context._add_component_to_context(component)
 
-        conversation = autodeserialize(
-            serialized_state, deserialization_context=deserialization_context
-        )
+        conversation = _autodeserialize_state(serialized_state, deserialization_context)
     return cast(Conversation, conversation)
@@ -17,10 +17,12 @@ from typing_extensions import TypeVar
 from wayflowcore.conversation import Conversation
 from wayflowcore.datastore import Datastore, InMemoryDatastore
 from wayflowcore.datastore._relational import RelationalDatastore
-from wayflowcore.serialization import autodeserialize, serialize
+from wayflowcore.serialization import serialize_to_dict
 from wayflowcore.serialization.context import DeserializationContext
+from wayflowcore.serialization.serializer import autodeserialize_from_dict
 from wayflowcore.tools import Tool
 
+from .._storagehelpers import _decode_serialized_state, _encode_serialized_state
 from ..serverstorageconfig import ServerStorageConfig
 
 ContextT = TypeVar("ContextT", default=Any)
@@ -32,13 +34,16 @@ class A2AStorage(Storage[ContextT]):  # type: ignore[misc]
     def __init__(self, storage_config: ServerStorageConfig):
         self.storage_config = storage_config
         if storage_config.datastore is None:
-            self.datastore: Datastore = InMemoryDatastore(schema=self.storage_config.to_schema())
+            self.datastore: Datastore = InMemoryDatastore(
+                schema=self.storage_config.to_schema(),
+                indexed_columns=self.storage_config.to_indexed_columns(),
+            )
         else:
             self.datastore = storage_config.datastore
 
     async def load_task(self, task_id: str, history_length: Optional[int] = None) -> Optional[Task]:
         """Load a task from the storage, if the task is not found, return None"""
-        retrieved_results = self.datastore.list(
+        retrieved_results = await self.datastore.list_async(
             collection_name=self.storage_config.table_name,
             where={self.storage_config.turn_id_column_name: task_id},
             limit=1,
@@ -90,7 +95,7 @@ class A2AStorage(Storage[ContextT]):  # type: ignore[misc]
             history=[message],
         )
 
-        self.datastore.create(
+        await self.datastore.create_async(
             collection_name=self.storage_config.table_name,
             entities=[
                 {
@@ -152,7 +157,7 @@ class A2AStorage(Storage[ContextT]):  # type: ignore[misc]
         if "artifacts" in task:
             extra_data["artifacts"] = task["artifacts"]
 
-        self.datastore.update(
+        await self.datastore.update_async(
             collection_name=self.storage_config.table_name,
             where={self.storage_config.turn_id_column_name: task_id},
             update={self.storage_config.extra_metadata_column_name: json.dumps(extra_data)},
@@ -162,7 +167,7 @@ class A2AStorage(Storage[ContextT]):  # type: ignore[misc]
 
     async def load_latest_task(self, context_id: str) -> Optional[Dict[str, Any]]:
         "Load the latest processed task if existing else return None"
-        retrieved_results = self.datastore.list(
+        retrieved_results = await self.datastore.list_async(
             collection_name=self.storage_config.table_name,
             where={
                 self.storage_config.conversation_id_column_name: context_id,
@@ -191,17 +196,25 @@ class A2AStorage(Storage[ContextT]):  # type: ignore[misc]
         for tool in tools_dict.values():
             deserialization_context.registered_tools[tool.name] = tool
 
-        conv = cast(Conversation, autodeserialize(serialized_conv, deserialization_context))
+        conv = cast(
+            Conversation,
+            autodeserialize_from_dict(
+                _decode_serialized_state(serialized_conv), deserialization_context
+            ),
+        )
         return conv
 
     async def load_task_conversation(
         self, task_id: str, tools_dict: Dict[str, Tool]
     ) -> Optional[Conversation]:
         """Load task's corresponding Wayflow conversation"""
-        serialized_conv = self.datastore.list(
+        retrieved_results = await self.datastore.list_async(
             collection_name=self.storage_config.table_name,
             where={self.storage_config.turn_id_column_name: task_id},
-        )[0][self.storage_config.conversation_turn_state_column_name]
+        )
+        serialized_conv = retrieved_results[0][
+            self.storage_config.conversation_turn_state_column_name
+        ]
 
         if len(serialized_conv) == 0:
             return None
@@ -210,7 +223,12 @@ class A2AStorage(Storage[ContextT]):  # type: ignore[misc]
         for tool in tools_dict.values():
             deserialization_context.registered_tools[tool.name] = tool
 
-        conv = cast(Conversation, autodeserialize(serialized_conv, deserialization_context))
+        conv = cast(
+            Conversation,
+            autodeserialize_from_dict(
+                _decode_serialized_state(serialized_conv), deserialization_context
+            ),
+        )
         return conv
 
     async def update_task_conversation(
@@ -226,7 +244,7 @@ class A2AStorage(Storage[ContextT]):  # type: ignore[misc]
             self.storage_config.is_last_turn_column_name: 1,
         }
 
-        serialized_conv = serialize(conv)
+        serialized_conv = _encode_serialized_state(serialize_to_dict(conv), self.storage_config)
         updates_new = {
             self.storage_config.conversation_turn_state_column_name: serialized_conv,
             self.storage_config.is_last_turn_column_name: 1,
@@ -252,18 +270,15 @@ class A2AStorage(Storage[ContextT]):  # type: ignore[misc]
                 update=updates_new,
             )
 
-            with data_table.engine.connect() as connection:
-                connection.execute(sql_update_stmt_1)
-                connection.execute(sql_update_stmt_2)
-                connection.commit()
+            await data_table._execute_in_transaction_async(sql_update_stmt_1, sql_update_stmt_2)
         else:
-            self.datastore.update(
+            await self.datastore.update_async(
                 collection_name=self.storage_config.table_name,
                 where=updates_old_where,
                 update=updates_old,
             )
 
-            self.datastore.update(
+            await self.datastore.update_async(
                 collection_name=self.storage_config.table_name,
                 where=updates_new_where,
                 update=updates_new,
@@ -69,3 +69,8 @@ class OpenAIResponsesService(ABC):
     @abstractmethod
     def _add_agent(self, agent_id: str, agent: Any) -> None:
         pass
+
+    def shutdown(self) -> None:
+        """
+        Releases the resources held by the service, when the server shuts down
+        """
@@ -7,8 +7,25 @@
 
 import json
 import logging
+import threading
 import time
-from typing import Any, AsyncIterable, Dict, List, Optional, Union, cast
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import anyio
 from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
@@ -21,11 +38,17 @@ from wayflowcore.conversationalcomponent import ConversationalComponent
 from wayflowcore.datastore import Datastore, InMemoryDatastore
 from wayflowcore.datastore._relational import RelationalDatastore
 from wayflowcore.events import register_event_listeners
+from wayflowcore.executors._agentexecutor import _sequential_tool_calls
 from wayflowcore.executors.executionstatus import ExecutionStatus, ToolRequestStatus
 from wayflowcore.idgeneration import IdGenerator
-from wayflowcore.serialization import serialize
+from wayflowcore.serialization.serializer import serialize_to_dict
 
-from ..._storagehelpers import _deserialize_conversation_safely
+from ..._statedeltas import _apply_state_delta, _compute_state_delta
+from ..._storagehelpers import (
+    _decode_serialized_state,
+    _deserialize_conversation_safely,
+    _encode_serialized_state,
+)
 from ..models.openairesponsespydanticmodels import (
     Conversation2,
     CreateResponse,
@@ -55,6 +78,18 @@ from .service import OpenAIResponsesService
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+@dataclass
+class _StoredTurnState:
+    """Serialized state of a stored conversation turn, reconstructed from the datastore"""
+
+    turn_id: str
+    serialized_state: Dict[str, Any]
+    turns_since_snapshot: int
+    """Number of deltas applied on the latest complete snapshot to reconstruct the state"""
+
 
 class WayFlowOpenAIResponsesService(OpenAIResponsesService):
     def __init__(
@@ -65,12 +100,25 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
     ):
         self.agents = agents
         self.storage_config = storage_config or ServerStorageConfig()
-        self.storage = storage or InMemoryDatastore(schema=self.storage_config.to_schema())
+        self.storage = storage or InMemoryDatastore(
+            schema=self.storage_config.to_schema(),
+            indexed_columns=self.storage_config.to_indexed_columns(),
+        )
         self.created_at = int(time.time())
         self.tool_registries = {
             agent_name: {t.name: t for t in agent._referenced_tools()}
             for agent_name, agent in self.agents.items()
         }
+        # The (de)serialization of states and the datastore I/O are blocking, so they are run in
+        # worker threads to not stall the other requests served by the event loop
+        self._storage_limiter = anyio.CapacityLimiter(self.storage_config.max_storage_workers)
+        self._write_executor: Optional[ThreadPoolExecutor] = None
+        # Writes still running, indexed by the response id and the conversation id they write,
+        # so that reading a response or a conversation waits for its state to be written
+        self._pending_writes: Dict[str, "Future[None]"] = {}
+        # all the writes not completed yet, bounded by ``max_pending_writes``
+        self._all_pending_writes: Set["Future[None]"] = set()
+        self._pending_writes_lock = threading.Lock()
 
     def _add_agent(self, agent_id: str, agent: ConversationalComponent) -> None:
         if agent_id in self.agents:
@@ -80,6 +128,19 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
         self.agents[agent_id] = agent
         self.tool_registries[agent_id] = {t.name: t for t in agent._referenced_tools()}
 
+    def shutdown(self) -> None:
+        """Waits for the pending writes of conversation states, and stops the writing threads"""
+        with self._pending_writes_lock:
+            pending_writes = list(self._all_pending_writes)
+        # the writes chained after other writes of their conversation are only submitted to the
+        # executor once these complete, so they are waited for before stopping it
+        wait(pending_writes)
+        with self._pending_writes_lock:
+            write_executor = self._write_executor
+            self._write_executor = None
+        if write_executor is not None:
+            write_executor.shutdown(wait=True)
+
     # ROUTER APIS
 
     async def list_models(
@@ -121,8 +182,10 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
                 detail="Get endpoint for wayflow server only supports non-streaming requests",
             )
 
+        await self._wait_for_pending_writes(response_id)
         try:
-            metadata = self._lookup_conversation(
+            metadata = await self._run_storage_operation(
+                self._lookup_conversation,
                 where={self.storage_config.turn_id_column_name: response_id},
                 what=self.storage_config.extra_metadata_column_name,
             )
@@ -134,10 +197,8 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
         return Response.model_validate_json(response_as_txt)
 
     async def delete_response(self, response_id: str) -> Optional[ResponseError]:
-        self.storage.delete(
-            collection_name=self.storage_config.table_name,
-            where={self.storage_config.turn_id_column_name: response_id},
-        )
+        await self._wait_for_pending_writes(response_id)
+        await self._run_storage_operation(self._delete_turn, turn_id=response_id)
         return None
 
     async def cancel_response(self, response_id: str) -> Union[Response, ResponseError]:
@@ -149,7 +210,6 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
     async def create_response(self, body: CreateResponse) -> AsyncIterable[ResponseStreamEvent]:
         unsupported_options: Dict[str, str] = {
             "max_tool_calls": "`max_tool_calls` is not supported yet",
-            "parallel_tool_calls": "`parallel_tool_calls` is not supported yet",
             "prompt": "`prompt` is not supported yet",
             "reasoning": "`reasoning` is not supported yet",
             "safety_identifier": "`safety_identifier` is not supported yet",
@@ -187,7 +247,9 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
         if conversation_id is not None and not isinstance(conversation_id, str):
             conversation_id = conversation_id.id
 
-        state = self._load_state(
+        await self._wait_for_pending_writes(previous_response_id, conversation_id)
+        state, stored_turn_state = await self._run_storage_operation(
+            self._load_state,
             previous_response_id=previous_response_id,
             conversation_id=conversation_id,
             agent_id=model,
@@ -209,7 +271,9 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
             model=model,
             object="response",
             output=[],
-            parallel_tool_calls=body.parallel_tool_calls or True,
+            parallel_tool_calls=(
+                body.parallel_tool_calls if body.parallel_tool_calls is not None else True
+            ),
             temperature=body.temperature,
             tool_choice=cast(ToolChoiceOptions, body.tool_choice or "auto"),
             tools=body.tools or [],
@@ -250,7 +314,14 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
         async def runner(conversation: Conversation) -> None:
             nonlocal status
             try:
-                with register_event_listeners([token_usage_listener, yielding_listener]):
+                with (
+                    register_event_listeners([token_usage_listener, yielding_listener]),
+                    (
+                        _sequential_tool_calls()
+                        if body.parallel_tool_calls is False
+                        else nullcontext()
+                    ),
+                ):
                     status = await conversation.execute_async()
             except Exception as e:
                 nonlocal raised_exception
@@ -259,7 +330,7 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
                 # close the send side so the receiver side's async for terminates
                 await send_stream.aclose()
 
-        async with anyio.create_task_group() as tg:
+        async with anyio.create_task_group() as tg, receive_stream:
             tg.start_soon(runner, state)
 
             async for ev in receive_stream:
@@ -296,9 +367,12 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
         )
 
         if body.store is None or body.store is True:
-            self._save_state(
+            # the state is written in the background, so that the final event is
+            # streamed without waiting for the write to be committed
+            await self._submit_write(
                 state=state,
                 response=current_response,
+                base_turn_state=stored_turn_state,
             )
 
         if current_response.error is not None:
@@ -313,6 +387,107 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
             )
 
     # PRIVATE METHODS
+    async def _run_storage_operation(self, func: Callable[..., T], **kwargs: Any) -> T:
+        return await anyio.to_thread.run_sync(
+            partial(func, **kwargs), limiter=self._storage_limiter
+        )
+
+    async def _wait_for_pending_writes(self, *keys: Optional[str]) -> None:
+        with self._pending_writes_lock:
+            pending_writes = [
+                self._pending_writes[key]
+                for key in keys
+                if key is not None and key in self._pending_writes
+            ]
+        if pending_writes:
+            await anyio.to_thread.run_sync(wait, pending_writes)
+
+    async def _submit_write(
+        self,
+        response: Response,
+        state: Conversation,
+        base_turn_state: Optional[_StoredTurnState],
+    ) -> None:
+        keys = [response.id]
+        conversation_id = None
+        if response.conversation is not None and response.conversation.id is not None:
+            conversation_id = response.conversation.id
+            keys.append(conversation_id)
+        save_state = partial(
+            self._save_state, response=response, state=state, base_turn_state=base_turn_state
+        )
+        while True:
+            with self._pending_writes_lock:
+                # the capacity is checked and taken atomically, so that concurrent requests
+                # cannot exceed it
+                if len(self._all_pending_writes) < self.storage_config.max_pending_writes:
+                    if self._write_executor is None:
+                        self._write_executor = ThreadPoolExecutor(
+                            max_workers=self.storage_config.max_storage_workers,
+                            thread_name_prefix="wayflow_server_storage",
+                        )
+                    # the writes of a conversation are applied in order, since each of them updates
+                    # the latest turn of the conversation and can be a delta on the previous one
+                    previous_write = (
+                        self._pending_writes.get(conversation_id)
+                        if conversation_id is not None
+                        else None
+                    )
+                    future = self._submit_after(self._write_executor, previous_write, save_state)
+                    for key in keys:
+                        self._pending_writes[key] = future
+                    self._all_pending_writes.add(future)
+                    break
+                pending_writes = set(self._all_pending_writes)
+            # backpressure: when too many writes are pending, wait for one of them to complete
+            await anyio.to_thread.run_sync(
+                partial(wait, pending_writes, return_when=FIRST_COMPLETED)
+            )
+        future.add_done_callback(partial(self._on_write_done, keys))
+
+    @staticmethod
+    def _submit_after(
+        executor: ThreadPoolExecutor,
+        previous_write: Optional["Future[None]"],
+        write: Callable[[], None],
+    ) -> "Future[None]":
+        """Submits a write to the executor once the previous write is completed"""
+        if previous_write is None:
+            return executor.submit(write)
+        chained_write: "Future[None]" = Future()
+
+        def _on_write_done(future: "Future[None]") -> None:
+            exception = future.exception()
+            if exception is not None:
+                chained_write.set_exception(exception)
+            else:
+                chained_write.set_result(None)
+
+        def _on_previous_write_done(_: "Future[None]") -> None:
+            try:
+                future = executor.submit(write)
+            except RuntimeError as e:  # the executor was shut down
+                chained_write.set_exception(e)
+                return
+            future.add_done_callback(_on_write_done)
+
+        previous_write.add_done_callback(_on_previous_write_done)
+        return chained_write
+
+    def _on_write_done(self, keys: List[str], future: "Future[None]") -> None:
+        with self._pending_writes_lock:
+            for key in keys:
+                if self._pending_writes.get(key) is future:
+                    del self._pending_writes[key]
+            self._all_pending_writes.discard(future)
+        exception = future.exception()
+        if exception is not None:
+            logger.error(
+                "Failed to save the state of the response `%s`",
+                keys[0],
+                exc_info=exception,
+            )
+
     @staticmethod
     def _select_only(
         items: List[Any],
@@ -353,12 +528,11 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
         previous_response_id: Optional[str],
         conversation_id: Optional[str],
         agent_id: str,
-    ) -> Optional[Conversation]:
+    ) -> Tuple[Optional[Conversation], Optional[_StoredTurnState]]:
         if previous_response_id:
             try:
-                serialized_conversation = self._lookup_conversation(
+                turn = self._lookup_turn(
                     where={self.storage_config.turn_id_column_name: previous_response_id},
-                    what=self.storage_config.conversation_turn_state_column_name,
                 )
             except ValueError:
                 raise HTTPException(
@@ -367,12 +541,11 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
                 )
         elif conversation_id:
             try:
-                serialized_conversation = self._lookup_conversation(
+                turn = self._lookup_turn(
                     where={
                         self.storage_config.conversation_id_column_name: conversation_id,
                         self.storage_config.is_last_turn_column_name: 1,  # only latest round
                     },
-                    what=self.storage_config.conversation_turn_state_column_name,
                 )
             except ValueError:
                 raise HTTPException(
@@ -380,10 +553,11 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
                     detail=f"No conversation with id `{conversation_id}` was found",
                 )
         else:
-            return None
+            return None, None
         try:
-            return _deserialize_conversation_safely(
-                serialized_state=serialized_conversation,
+            stored_turn_state = self._reconstruct_turn_state(turn)
+            conversation = _deserialize_conversation_safely(
+                serialized_state=stored_turn_state.serialized_state,
                 tool_registry=self.tool_registries[agent_id],
                 component=self.agents[agent_id],
             )
@@ -392,11 +566,57 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
                 status_code=http_status_code.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Conversation state is corrupted, it cannot be de-serialized: {e}",
             )
+        return conversation, stored_turn_state
+
+    @staticmethod
+    def _get_state_delta_info(turn: Dict[str, Any], metadata_column_name: str) -> Any:
+        # turns stored as deltas record the turn they are based on in their metadata,
+        # turns without it store a complete snapshot of the state
+        return json.loads(turn[metadata_column_name]).get("state_delta")
+
+    def _reconstruct_turn_state(self, turn: Dict[str, Any]) -> _StoredTurnState:
+        config = self.storage_config
+        turn_id = turn[config.turn_id_column_name]
+        delta_turns = []
+        # the chain of deltas is walked one turn at a time until the latest complete snapshot,
+        # so that at most ``snapshot_interval`` turns are read whatever the conversation length
+        while True:
+            state_delta_info = self._get_state_delta_info(turn, config.extra_metadata_column_name)
+            if state_delta_info is None:
+                break
+            delta_turns.append(turn)
+            base_turn_id = state_delta_info["base_turn_id"]
+            base_turns = self.storage.list(
+                collection_name=config.table_name,
+                where={config.turn_id_column_name: base_turn_id},
+                limit=1,
+            )
+            if not base_turns:
+                raise ValueError(
+                    f"The state of the turn `{turn_id}` cannot be reconstructed because the turn "
+                    f"`{base_turn_id}` it is based on was not found"
+                )
+            turn = base_turns[0]
+
+        serialized_state = _decode_serialized_state(
+            turn[config.conversation_turn_state_column_name]
+        )
+        for delta_turn in reversed(delta_turns):
+            _apply_state_delta(
+                serialized_state,
+                _decode_serialized_state(delta_turn[config.conversation_turn_state_column_name]),
+            )
+        return _StoredTurnState(
+            turn_id=turn_id,
+            serialized_state=serialized_state,
+            turns_since_snapshot=len(delta_turns),
+        )
 
     def _save_state(
         self,
         response: Response,
         state: Conversation,
+        base_turn_state: Optional[_StoredTurnState] = None,
     ) -> None:
         conversation_model = response.conversation
         if conversation_model is None:
@@ -410,7 +630,22 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
             self.storage_config.conversation_id_column_name: conversation_id,
             self.storage_config.is_last_turn_column_name: 1,
         }
-        serialized_state = serialize(state)
+        metadata: Dict[str, Any] = {"response": response.model_dump_json()}
+        state_as_dict = serialize_to_dict(state)
+        base_turn_id = ""  # complete snapshots are not based on another turn
+        if (
+            self.storage_config.state_storage_mode == "delta"
+            and base_turn_state is not None
+            and base_turn_state.turns_since_snapshot + 1 < self.storage_config.snapshot_interval
+        ):
+            serialized_state = _encode_serialized_state(
+                _compute_state_delta(base_turn_state.serialized_state, state_as_dict),
+                self.storage_config,
+            )
+            base_turn_id = base_turn_state.turn_id
+            metadata["state_delta"] = {"base_turn_id": base_turn_id}
+        else:
+            serialized_state = _encode_serialized_state(state_as_dict, self.storage_config)
         new_entity = {
             self.storage_config.agent_id_column_name: response.model,
             self.storage_config.conversation_id_column_name: conversation_id,
@@ -418,10 +653,10 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
             self.storage_config.created_at_column_name: int(time.time()),
             self.storage_config.conversation_turn_state_column_name: serialized_state,
             self.storage_config.is_last_turn_column_name: 1,
-            self.storage_config.extra_metadata_column_name: json.dumps(
-                {"response": response.model_dump_json()}
-            ),
+            self.storage_config.extra_metadata_column_name: json.dumps(metadata),
         }
+        if self.storage_config.base_turn_id_column_name is not None:
+            new_entity[self.storage_config.base_turn_id_column_name] = base_turn_id
         if isinstance(self.storage, RelationalDatastore):
             # for relational datastores, we prefer making a single
             # transaction, to avoid corrupting the state of the DB
@@ -449,12 +684,72 @@ class WayFlowOpenAIResponsesService(OpenAIResponsesService):
             )
 
     def _lookup_conversation(self, where: Dict[str, Any], what: str) -> Any:
+        return self._lookup_turn(where)[what]
+
+    def _lookup_turn(self, where: Dict[str, Any]) -> Dict[str, Any]:
         serialized_conversations = self.storage.list(
             collection_name=self.storage_config.table_name, where=where
         )
         if len(serialized_conversations) != 1:
             raise ValueError(f"No conversation with: {where}")
-        return serialized_conversations[0][what]
+        return serialized_conversations[0]
+
+    def _list_dependent_turns(self, turn_id: str, conversation_id: str) -> List[Dict[str, Any]]:
+        """Lists the turns storing their state as a delta on the given turn"""
+        config = self.storage_config
+        if config.base_turn_id_column_name is not None:
+            return self.storage.list(
+                collection_name=config.table_name,
+                where={config.base_turn_id_column_name: turn_id},
+            )
+        # without the base turn id column, the base turns are only recorded in the metadata
+        dependent_turns = []
+        for turn in self.storage.list(
+            collection_name=config.table_name,
+            where={config.conversation_id_column_name: conversation_id},
+        ):
+            state_delta_info = self._get_state_delta_info(turn, config.extra_metadata_column_name)
+            if state_delta_info is not None and state_delta_info["base_turn_id"] == turn_id:
+                dependent_turns.append(turn)
+        return dependent_turns
+
+    def _delete_turn(self, turn_id: str) -> None:
+        config = self.storage_config
+        turns = self.storage.list(
+            collection_name=config.table_name,
+            where={config.turn_id_column_name: turn_id},
+        )
+        if len(turns) == 1:
+            conversation_id = turns[0][config.conversation_id_column_name]
+            # a turn based on the deleted turn might still be being written, it is keyed by its
+            # own turn id and by the conversation id
+            with self._pending_writes_lock:
+                pending_write = self._pending_writes.get(conversation_id)
+            if pending_write is not None:
+                wait([pending_write])
+            # the turns storing their state as a delta on the deleted turn are
+            # replaced by a complete snapshot, so that they can still be loaded
+            for dependent_turn in self._list_dependent_turns(turn_id, conversation_id):
+                stored_turn_state = self._reconstruct_turn_state(dependent_turn)
+                metadata = json.loads(dependent_turn[config.extra_metadata_column_name])
+                del metadata["state_delta"]
+                update = {
+                    config.conversation_turn_state_column_name: _encode_serialized_state(
+                        stored_turn_state.serialized_state, config
+                    ),
+                    config.extra_metadata_column_name: json.dumps(metadata),
+                }
+                if config.base_turn_id_column_name is not None:
+                    update[config.base_turn_id_column_name] = ""
+                self.storage.update(
+                    collection_name=config.table_name,
+                    where={config.turn_id_column_name: stored_turn_state.turn_id},
+                    update=update,
+                )
+        self.storage.delete(
+            collection_name=config.table_name,
+            where={config.turn_id_column_name: turn_id},
+        )
 
     async def _create_state(
         self,
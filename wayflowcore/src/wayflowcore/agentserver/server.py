@@ -201,12 +201,6 @@ class OpenAIResponsesServer:
         allowed_headers:
             HTTP headers accepted by CORS preflight requests.
         """
-        self.app = FastAPI(
-            title="WayFlow Responses API",
-            version="1.0.0",
-            description="Serve WayFlow agents through OpenAI Responses-compatible endpoints.",
-            servers=[{"description": "WayFlow Responses API Server"}],
-        )
         agents = agents or {}
         # Initialize services
         self.agent_service: OpenAIResponsesService = WayFlowOpenAIResponsesService(
@@ -214,6 +208,22 @@ class OpenAIResponsesServer:
             storage=storage,
             storage_config=storage_config,
         )
+
+        @asynccontextmanager
+        async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+            try:
+                yield
+            finally:
+                # waits for the pending writes of conversation states
+                self.agent_service.shutdown()
+
+        self.app = FastAPI(
+            title="WayFlow Responses API",
+            version="1.0.0",
+            description="Serve WayFlow agents through OpenAI Responses-compatible endpoints.",
+            servers=[{"description": "WayFlow Responses API Server"}],
+            lifespan=lifespan,
+        )
         self._setup_middleware(
             allowed_origins=allowed_origins,
             allow_credentials=allow_credentials,
@@ -6,10 +6,13 @@
 
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, List, Literal, Optional
 
 from wayflowcore.datastore import Datastore, Entity
-from wayflowcore.property import IntegerProperty, StringProperty
+from wayflowcore.property import IntegerProperty, Property, StringProperty
+from wayflowcore.serialization.formats import SerializationFormat
+
+StateStorageMode = Literal["full", "delta"]
 
 
 @dataclass
@@ -35,21 +38,82 @@ class ServerStorageConfig:
     """Name of the column where the marker for the most recent turn of a given conversation is stored"""
     extra_metadata_column_name: str = "extra_metadata"
     """Name of the column where the server stores its own attributes"""
+    base_turn_id_column_name: Optional[str] = "base_turn_id"
+    """Name of the column where the id of the turn that a state stored as a delta is based on is stored, empty for
+    complete snapshots. It is indexed, so that deleting a turn only loads the turns depending on it. If None, the
+    column is not used and deleting a turn in ``"delta"`` mode reads all the turns of its conversation, e.g. for
+    tables created without this column"""
 
     max_retention: Optional[int] = None
     """Number of seconds for which to retain a conversation before discarding it"""
 
+    state_storage_mode: StateStorageMode = "full"
+    """How the states of the conversation turns are stored:
+
+    * ``"full"``: every turn stores the complete serialized state of the conversation.
+    * ``"delta"``: turns only store what changed since the turn they continue from, and a complete snapshot of
+      the state, including the definition of the component, is only stored every ``snapshot_interval`` turns.
+      States are reconstructed from the latest snapshot and the following deltas.
+    """
+    snapshot_interval: int = 10
+    """In ``"delta"`` mode, maximum number of turns between two complete snapshots of the state of a conversation"""
+
+    serialization_format: SerializationFormat = SerializationFormat.YAML
+    """Format in which the states of the conversation turns are serialized. JSON and MessagePack are much faster to
+    write and load than YAML. Binary formats are stored base64-encoded. States stored in another format remain
+    readable, so the format can be changed on an existing datastore"""
+    compress_states: bool = False
+    """Whether to compress the serialized states with zstd. Requires the ``zstandard`` package"""
+
+    max_storage_workers: int = 4
+    """Number of worker threads running the (de)serialization of states and the datastore operations of the server,
+    off the event loop"""
+    max_pending_writes: int = 32
+    """Number of states that can be waiting to be written to the datastore. When reached, new responses wait for a
+    pending write to complete before writing their state"""
+
+    def __post_init__(self) -> None:
+        if self.state_storage_mode not in ("full", "delta"):
+            raise ValueError(
+                f"`state_storage_mode` should be either 'full' or 'delta', but got: {self.state_storage_mode}"
+            )
+        try:
+            self.serialization_format = SerializationFormat(self.serialization_format)
+        except ValueError as e:
+            raise ValueError(
+                f"`serialization_format` should be one of {[f.value for f in SerializationFormat]}, "
+                f"but got: {self.serialization_format}"
+            ) from e
+        if self.snapshot_interval < 1:
+            raise ValueError(
+                f"`snapshot_interval` should be at least 1, but got: {self.snapshot_interval}"
+            )
+        if self.max_storage_workers < 1:
+            raise ValueError(
+                f"`max_storage_workers` should be at least 1, but got: {self.max_storage_workers}"
+            )
+        if self.max_pending_writes < 1:
+            raise ValueError(
+                f"`max_pending_writes` should be at least 1, but got: {self.max_pending_writes}"
+            )
+
     def to_schema(self) -> Dict[str, Entity]:
-        return {
-            self.table_name: Entity(
-                properties={
-                    self.agent_id_column_name: StringProperty(),
-                    self.conversation_id_column_name: StringProperty(),
-                    self.turn_id_column_name: StringProperty(),
-                    self.is_last_turn_column_name: IntegerProperty(),
-                    self.conversation_turn_state_column_name: StringProperty(),
-                    self.created_at_column_name: IntegerProperty(),
-                    self.extra_metadata_column_name: StringProperty(),
-                }
-            ),
+        properties: Dict[str, Property] = {
+            self.agent_id_column_name: StringProperty(),
+            self.conversation_id_column_name: StringProperty(),
+            self.turn_id_column_name: StringProperty(),
+            self.is_last_turn_column_name: IntegerProperty(),
+            self.conversation_turn_state_column_name: StringProperty(),
+            self.created_at_column_name: IntegerProperty(),
+            self.extra_metadata_column_name: StringProperty(),
         }
+        if self.base_turn_id_column_name is not None:
+            properties[self.base_turn_id_column_name] = StringProperty(default_value="")
+        return {self.table_name: Entity(properties=properties)}
+
+    def to_indexed_columns(self) -> Dict[str, List[str]]:
+        """Columns on which the server looks conversation turns up, per table."""
+        indexed_columns = [self.conversation_id_column_name, self.turn_id_column_name]
+        if self.base_turn_id_column_name is not None:
+            indexed_columns.append(self.base_turn_id_column_name)
+        return {self.table_name: indexed_columns}
@@ -35,6 +35,8 @@ class ExtendedAgent(Agent):
     """Whether exceptions from sub-executions (tool, sub-agent, or sub-flow execution) are raised or not."""
     max_iterations: int = 10
     """Maximum number of calls to the agent executor before yielding back to the user."""
+    max_concurrent_tool_calls: int = 1
+    """Maximum number of server tools executed concurrently when the LLM requests several tools at once."""
     initial_message: Optional[str] = NOT_SET_INITIAL_MESSAGE
     """Initial message the agent will post if no previous user message.
     Default to ``Agent.NOT_SET_INITIAL_MESSAGE``. If None, the LLM will generate it but the agent requires
@@ -19,7 +19,7 @@ from wayflowcore.agentspec.components.contextprovider import PluginContextProvid
 
 
 class ExtendedFlow(Flow):
-    """Extension of the basic Agent Spec Flow that supports context providers"""
+    """Extension of the basic Agent Spec Flow that supports context providers, state and concurrent steps"""
 
     context_providers: Optional[List[SerializeAsAny[PluginContextProvider]]] = None
     """List of providers that add context to specific steps."""
@@ -27,6 +27,9 @@ class ExtendedFlow(Flow):
     state: List[Property] = Field(default_factory=list)
     """The list of properties that compose the state of the Flow"""
 
+    max_concurrent_steps: int = 1
+    """Maximum number of independent consecutive steps executed concurrently"""
+
     @model_validator_with_error_accumulation
     def _validate_data_edges_use_existing_nodes(self) -> Self:
         # we override the default flow validation to enable also using context providers as source
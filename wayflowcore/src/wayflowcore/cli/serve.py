@@ -312,7 +312,13 @@ def _get_persistence_arguments(
             )
             return storage, storage_config
         case "in-memory":
-            return InMemoryDatastore(schema=storage_schema), storage_config
+            return (
+                InMemoryDatastore(
+                    schema=storage_schema,
+                    indexed_columns=storage_config.to_indexed_columns(),
+                ),
+                storage_config,
+            )
         case "oracle-db":
             if datastore_connection_config is None:
                 raise ValueError(
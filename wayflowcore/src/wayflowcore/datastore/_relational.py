@@ -3,13 +3,21 @@
 # This software is under the Apache License 2.0
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+import asyncio
+import importlib
+import threading
 import warnings
+import weakref
 from abc import ABC
+from contextlib import contextmanager
 from logging import getLogger
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncGenerator,
+    Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -20,6 +28,7 @@ from typing import (
 )
 
 from wayflowcore._metadata import MetadataType
+from wayflowcore._utils.async_helpers import run_sync_in_thread
 from wayflowcore._utils.lazy_loader import LazyLoader
 from wayflowcore.datastore._datatable import Datatable
 from wayflowcore.datastore._utils import check_collection_name
@@ -48,6 +57,7 @@ if TYPE_CHECKING:
     # block so long as sqlalchemy is an optional dependency.
     # Otherwise, importing the module when it is not installed would lead to an import error.
     import sqlalchemy
+    from sqlalchemy.ext.asyncio import AsyncEngine
 
     SqlachemyStatementT = TypeVar(
         "SqlachemyStatementT", sqlalchemy.Select[Any], sqlalchemy.Update, sqlalchemy.Delete
@@ -150,6 +160,106 @@ def _results_to_dict(results: Sequence["sqlalchemy.Row[Any]"]) -> List[Dict[str,
     return [{str(k): v for k, v in dict(result._mapping).items()} for result in results]
 
 
+@contextmanager
+def _translate_write_errors(integrity_error_message: str) -> Iterator[None]:
+    try:
+        yield
+    except sqlalchemy.exc.IntegrityError as e:
+        raise DatastoreConstraintViolationError(integrity_error_message) from e
+    except sqlalchemy.exc.StatementError as e:
+        raise DatastoreEntityError(str(e)) from e
+    except sqlalchemy.exc.CompileError as e:
+        if str(e).startswith("Unconsumed column names:"):
+            invalid_field = str(e).split(": ")[-1]
+            raise DatastoreEntityError(
+                f"Invalid field: {invalid_field} not in data representation"
+            ) from e
+        raise
+
+
+@contextmanager
+def _translate_query_errors() -> Iterator[None]:
+    try:
+        yield
+    except sqlalchemy.exc.DatabaseError as e:
+        raise DatastoreError(
+            "SQL query execution failed. See stacktrace to find out more "
+            "(note: bind variables should be provided with the :varname syntax)"
+        ) from e
+
+
+async def _dispose_engine_on_loop_shutdown(engine: "AsyncEngine") -> AsyncGenerator[None, None]:
+    # Event loops finalize the pending async generators before closing, which is the last chance
+    # to gracefully close the pooled connections bound to the loop
+    try:
+        yield
+    finally:
+        await engine.dispose()
+
+
+def _create_async_engine(*args: Any, **kwargs: Any) -> "AsyncEngine":
+    """Creates a SQLAlchemy async engine, or raises an ``ImportError`` if it cannot be used"""
+    # SQLAlchemy runs async drivers through greenlet, but only fails with a ``ValueError`` on the
+    # first awaited operation when it is not installed. It is checked here instead, so that the
+    # datastore operations fall back to worker threads
+    importlib.import_module("greenlet")
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    return create_async_engine(*args, **kwargs)
+
+
+class _AsyncEngines:
+    def __init__(self, create_async_engine: Callable[[], "AsyncEngine"]):
+        """
+        SQLAlchemy async engines of a relational datastore.
+
+        Engines are created per event loop, since their pooled connections cannot be used from
+        another loop, and disposed of when the loop shuts down. When the async driver of the
+        database is not installed, no engine is returned and the datastore operations run in
+        worker threads instead.
+        """
+        self._create_async_engine = create_async_engine
+        self._is_available = True
+        self._lock = threading.Lock()
+        self._engines: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncEngine]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._finalizers: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGenerator[None, None]]"
+        ) = weakref.WeakKeyDictionary()
+
+    async def get_engine(self) -> Optional["AsyncEngine"]:
+        """Gets the engine of the running event loop, or ``None`` if no async engine can be used"""
+        if not self._is_available:
+            return None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        with self._lock:
+            engine = self._engines.get(loop)
+            finalizer = None
+            if engine is None:
+                try:
+                    engine = self._create_async_engine()
+                except (ImportError, NotImplementedError) as e:
+                    logger.info(
+                        "Async database engine is not available, datastore operations will run in "
+                        "worker threads: %s",
+                        e,
+                    )
+                    self._is_available = False
+                    return None
+                self._engines[loop] = engine
+                finalizer = _dispose_engine_on_loop_shutdown(engine)
+                self._finalizers[loop] = finalizer
+        if finalizer is not None:
+            # Starting the generator registers it to the loop for finalization
+            await finalizer.__anext__()
+        return engine
+
+
 class _RelationalDatatable(Datatable):
     """Class to manage access to an *existing* database table."""
 
@@ -158,6 +268,7 @@ class _RelationalDatatable(Datatable):
         entity_description: Entity,
         sqlalchemy_table: "sqlalchemy.Table",
         engine: "sqlalchemy.Engine",
+        async_engines: Optional[_AsyncEngines] = None,
     ):
         """
         Initializes the ``DatabaseDatatable``.
@@ -170,10 +281,14 @@ class _RelationalDatatable(Datatable):
             SQLAlchemy representation of the table
         engine:
             SQLAlchemy engine to use for database connections.
+        async_engines:
+            SQLAlchemy async engines to use for the database connections of the async methods.
+            If None, the async methods run the synchronous ones in worker threads.
         """
         self.entity_description = entity_description
         self._defined_property_names = set([p for p in self.entity_description.properties])
         self.engine = engine
+        self.async_engines = async_engines
         self.sqlalchemy_table = sqlalchemy_table
         self._sqlalchemy_columns_in_entity = [
             column
@@ -225,15 +340,36 @@ class _RelationalDatatable(Datatable):
             columns.append(column_with_alias)
         return columns
 
+    async def _get_async_engine(self) -> Optional["AsyncEngine"]:
+        if self.async_engines is None:
+            return None
+        return await self.async_engines.get_engine()
+
+    def _list_query(
+        self, where: Optional[Dict[str, Any]], limit: Optional[int]
+    ) -> "sqlalchemy.Select[Any]":
+        query = sqlalchemy.select(*self._get_columns_with_case_sensitive_aliases())
+        return self._apply_where_clause(query, where).limit(limit=limit)
+
     def list(
         self, where: Optional[Dict[str, Any]] = None, limit: Optional[int] = None
     ) -> List[EntityAsDictT]:
-        query = sqlalchemy.select(*self._get_columns_with_case_sensitive_aliases())
-        query = self._apply_where_clause(query, where).limit(limit=limit)
+        query = self._list_query(where, limit)
         with self.engine.connect() as conn:
             results = conn.execute(query).fetchall()
             return _results_to_dict(results)
 
+    async def list_async(
+        self, where: Optional[Dict[str, Any]] = None, limit: Optional[int] = None
+    ) -> List[EntityAsDictT]:
+        async_engine = await self._get_async_engine()
+        if async_engine is None:
+            return await run_sync_in_thread(self.list, where, limit)
+        query = self._list_query(where, limit)
+        async with async_engine.connect() as conn:
+            results = (await conn.execute(query)).fetchall()
+            return _results_to_dict(results)
+
     @overload
     def create(self, entities: EntityAsDictT) -> EntityAsDictT: ...
 
@@ -247,36 +383,42 @@ class _RelationalDatatable(Datatable):
         Adds new rows to the Database table
         It also returns the added rows without including any VectorProperty columns in the returned values.
         """
-        return_single_element = False
-        if not isinstance(entities, list):
-            entities = [entities]
-            return_single_element = True
+        return_single_element = not isinstance(entities, list)
+        entities_list = entities if isinstance(entities, list) else [entities]
 
         with self.engine.connect() as connection:
-            try:
-                result = connection.execute(
-                    *self._create_query(entities),
-                ).fetchall()
+            with _translate_write_errors("Entity violates integrity constraint"):
+                result = connection.execute(*self._create_query(entities_list)).fetchall()
                 if len(result) == 0:
                     raise DatastoreEntityError("Failed to create entity")
-            except sqlalchemy.exc.IntegrityError as e:
-                raise DatastoreConstraintViolationError(
-                    "Entity violates integrity constraint"
-                ) from e
-            except sqlalchemy.exc.StatementError as e:
-                raise DatastoreEntityError(str(e)) from e
-            except sqlalchemy.exc.CompileError as e:
-                if str(e).startswith("Unconsumed column names:"):
-                    invalid_field = str(e).split(": ")[-1]
-                    raise DatastoreEntityError(
-                        f"Invalid field: {invalid_field} not in data representation"
-                    ) from e
-                raise
-
             connection.commit()
             result_as_dict = _results_to_dict(result)
         return result_as_dict[0] if return_single_element else result_as_dict
 
+    @overload
+    async def create_async(self, entities: EntityAsDictT) -> EntityAsDictT: ...
+
+    @overload
+    async def create_async(self, entities: List[EntityAsDictT]) -> List[EntityAsDictT]: ...
+
+    async def create_async(
+        self, entities: Union[EntityAsDictT, List[EntityAsDictT]]
+    ) -> Union[EntityAsDictT, List[EntityAsDictT]]:
+        async_engine = await self._get_async_engine()
+        if async_engine is None:
+            return await run_sync_in_thread(self.create, entities)
+        return_single_element = not isinstance(entities, list)
+        entities_list = entities if isinstance(entities, list) else [entities]
+
+        async with async_engine.connect() as connection:
+            with _translate_write_errors("Entity violates integrity constraint"):
+                result = (await connection.execute(*self._create_query(entities_list))).fetchall()
+                if len(result) == 0:
+                    raise DatastoreEntityError("Failed to create entity")
+            await connection.commit()
+            result_as_dict = _results_to_dict(result)
+        return result_as_dict[0] if return_single_element else result_as_dict
+
     def _create_query(
         self, entities: List[EntityAsDictT]
     ) -> Tuple["sqlalchemy.Executable", List[Dict[str, Any]]]:
@@ -300,46 +442,126 @@ class _RelationalDatatable(Datatable):
             *self._get_columns_with_case_sensitive_aliases_without_vectors()
         )
 
+    @staticmethod
+    def _log_updated_rows(where: Dict[str, Any], num_rows: int) -> None:
+        if num_rows == 0:
+            logger.warning("Update operation with filter %s did not change any rows", where)
+        else:
+            logger.info("Updated %i entities", num_rows)
+
     def update(self, where: Dict[str, Any], update: EntityAsDictT) -> List[EntityAsDictT]:
         query = self._update_query(where, update)
         with self.engine.connect() as connection:
-            try:
+            with _translate_write_errors("Update violates integrity constraint"):
                 result = connection.execute(query).fetchall()
-            except sqlalchemy.exc.IntegrityError as e:
-                raise DatastoreConstraintViolationError(
-                    "Update violates integrity constraint"
-                ) from e
-            except sqlalchemy.exc.StatementError as e:
-                raise DatastoreEntityError(str(e)) from e
-            except sqlalchemy.exc.CompileError as e:
-                if str(e).startswith("Unconsumed column names:"):
-                    invalid_field = str(e).split(": ")[-1]
-                    raise DatastoreEntityError(
-                        f"Invalid field: {invalid_field} not in data representation"
-                    ) from e
-                raise
-            if len(result) == 0:
-                logger.warning("Update operation with filter %s did not change any rows", where)
-            else:
-                logger.info("Updated %i entities", len(result))
+            self._log_updated_rows(where, len(result))
             connection.commit()
-            # NOTE: This is not a protected attribute, but rather a poor naming convention
-            # in sqlalchemy (should be mapping_). From the docs:
-            # > all `Row` methods and library-level attributes are intended to be underscored to
-            # > avoid name conflicts
             result_as_dict = _results_to_dict(result)
         return result_as_dict
 
-    def delete(self, where: Dict[str, Any]) -> None:
+    async def update_async(
+        self, where: Dict[str, Any], update: EntityAsDictT
+    ) -> List[EntityAsDictT]:
+        async_engine = await self._get_async_engine()
+        if async_engine is None:
+            return await run_sync_in_thread(self.update, where, update)
+        query = self._update_query(where, update)
+        async with async_engine.connect() as connection:
+            with _translate_write_errors("Update violates integrity constraint"):
+                result = (await connection.execute(query)).fetchall()
+            self._log_updated_rows(where, len(result))
+            await connection.commit()
+            result_as_dict = _results_to_dict(result)
+        return result_as_dict
+
+    def _delete_query(self, where: Dict[str, Any]) -> "sqlalchemy.Delete":
         query = sqlalchemy.delete(self.sqlalchemy_table)
-        query = self._apply_where_clause(query, where)
+        return self._apply_where_clause(query, where)
+
+    @staticmethod
+    def _log_deleted_rows(where: Dict[str, Any], num_rows: int) -> None:
+        if num_rows == 0:
+            logger.warning("Delete operation with filter %s did not delete any rows", where)
+        else:
+            logger.info("Deleted %i entities", num_rows)
+
+    def delete(self, where: Dict[str, Any]) -> None:
+        query = self._delete_query(where)
+        with self.engine.connect() as connection:
+            result = connection.execute(query)
+            self._log_deleted_rows(where, result.rowcount)
+            connection.commit()
+
+    async def delete_async(self, where: Dict[str, Any]) -> None:
+        async_engine = await self._get_async_engine()
+        if async_engine is None:
+            await run_sync_in_thread(self.delete, where)
+            return
+        query = self._delete_query(where)
+        async with async_engine.connect() as connection:
+            result = await connection.execute(query)
+            self._log_deleted_rows(where, result.rowcount)
+            await connection.commit()
+
+    def _execute_in_transaction(self, *statements: "sqlalchemy.Executable") -> None:
+        """Executes the statements in a single transaction"""
+        with self.engine.connect() as connection:
+            for statement in statements:
+                connection.execute(statement)
+            connection.commit()
+
+    async def _execute_in_transaction_async(self, *statements: "sqlalchemy.Executable") -> None:
+        """Executes the statements in a single transaction"""
+        async_engine = await self._get_async_engine()
+        if async_engine is None:
+            await run_sync_in_thread(self._execute_in_transaction, *statements)
+            return
+        async with async_engine.connect() as connection:
+            for statement in statements:
+                await connection.execute(statement)
+            await connection.commit()
+
+    def _execute_bulk_delete(self, query: "sqlalchemy.Delete") -> int:
         with self.engine.connect() as connection:
             result = connection.execute(query)
-            if result.rowcount == 0:
-                logger.warning("Delete operation with filter %s did not delete any rows", where)
-            else:
-                logger.info("Deleted %i entities", result.rowcount)
             connection.commit()
+        logger.info("Deleted %i entities", result.rowcount)
+        return int(result.rowcount)
+
+    def _delete_lower_than(self, column_name: str, value: Any) -> int:
+        """Deletes, in a single statement, the rows whose value of ``column_name`` is lower than ``value``"""
+        self._check_all_columns_in_entity({column_name: value})
+        column = self.sqlalchemy_table.c[_case_insensitive(column_name)]
+        return self._execute_bulk_delete(
+            sqlalchemy.delete(self.sqlalchemy_table).where(column < value)
+        )
+
+    def _delete_in(self, column_name: str, values: List[Any]) -> int:
+        """Deletes, in a single statement, the rows whose value of ``column_name`` is one of ``values``"""
+        self._check_all_columns_in_entity({column_name: None})
+        column = self.sqlalchemy_table.c[_case_insensitive(column_name)]
+        return self._execute_bulk_delete(
+            sqlalchemy.delete(self.sqlalchemy_table).where(column.in_(values))
+        )
+
+    def _replace(self, where: Dict[str, Any], entity: EntityAsDictT) -> None:
+        """Deletes the rows matching ``where`` and adds ``entity``, in a single transaction"""
+        delete_query = self._delete_query(where)
+        with self.engine.connect() as connection:
+            with _translate_write_errors("Entity violates integrity constraint"):
+                connection.execute(delete_query)
+                connection.execute(*self._create_query([entity]))
+            connection.commit()
+
+    def _list_in(self, column_name: str, values: List[Any]) -> List[EntityAsDictT]:
+        """Lists, in a single statement, the rows whose value of ``column_name`` is one of ``values``"""
+        self._check_all_columns_in_entity({column_name: None})
+        column = self.sqlalchemy_table.c[_case_insensitive(column_name)]
+        query = sqlalchemy.select(*self._get_columns_with_case_sensitive_aliases()).where(
+            column.in_(values)
+        )
+        with self.engine.connect() as conn:
+            return _results_to_dict(conn.execute(query).fetchall())
 
 
 class RelationalDatastore(Datastore, ABC):
@@ -360,6 +582,7 @@ class RelationalDatastore(Datastore, ABC):
         description: Optional[str] = None,
         id: Optional[str] = None,
         __metadata_info__: Optional["MetadataType"] = None,
+        async_engine_factory: Optional[Callable[[], "AsyncEngine"]] = None,
     ):
         """Initialize a ``RelationalDatastore``
 
@@ -370,6 +593,12 @@ class RelationalDatastore(Datastore, ABC):
             Datastore
         engine :
             SQLAlchemy engine used to connect to the relational database
+        async_engine_factory :
+            Callable creating a SQLAlchemy async engine connecting to the same
+            database, used by the asynchronous methods of the datastore. It is
+            called once per event loop. If None, or if it raises an ``ImportError``
+            because the async driver or ``greenlet`` is not installed, the asynchronous
+            methods run the synchronous ones in worker threads.
         search_configs :
             List of search configurations for vector search capabilities.
             By default, it's set as None.
@@ -386,6 +615,9 @@ class RelationalDatastore(Datastore, ABC):
             ID of the datastore
         """
         self.engine = engine
+        self._async_engines = (
+            _AsyncEngines(async_engine_factory) if async_engine_factory is not None else None
+        )
         self.schema = schema
         normalized_entity_names = {
             _case_insensitive(entity_name): entity_name for entity_name in self.schema
@@ -448,7 +680,9 @@ class RelationalDatastore(Datastore, ABC):
                     )
                 self._validate_property_against_table(prop, col)
 
-            data_tables[entity_name] = _RelationalDatatable(entity, tbl, self.engine)
+            data_tables[entity_name] = _RelationalDatatable(
+                entity, tbl, self.engine, self._async_engines
+            )
 
         return data_tables
 
@@ -495,6 +729,41 @@ class RelationalDatastore(Datastore, ABC):
         check_collection_name(self.schema, collection_name)
         return self.data_tables[collection_name].delete(where)
 
+    async def list_async(
+        self,
+        collection_name: str,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+    ) -> List[EntityAsDictT]:
+        check_collection_name(self.schema, collection_name)
+        return await self.data_tables[collection_name].list_async(where, limit)
+
+    @overload
+    async def create_async(
+        self, collection_name: str, entities: EntityAsDictT
+    ) -> EntityAsDictT: ...
+
+    @overload
+    async def create_async(
+        self, collection_name: str, entities: List[EntityAsDictT]
+    ) -> List[EntityAsDictT]: ...
+
+    async def create_async(
+        self, collection_name: str, entities: Union[EntityAsDictT, List[EntityAsDictT]]
+    ) -> Union[EntityAsDictT, List[EntityAsDictT]]:
+        check_collection_name(self.schema, collection_name)
+        return await self.data_tables[collection_name].create_async(entities)
+
+    async def update_async(
+        self, collection_name: str, where: Dict[str, Any], update: EntityAsDictT
+    ) -> List[EntityAsDictT]:
+        check_collection_name(self.schema, collection_name)
+        return await self.data_tables[collection_name].update_async(where, update)
+
+    async def delete_async(self, collection_name: str, where: Dict[str, Any]) -> None:
+        check_collection_name(self.schema, collection_name)
+        await self.data_tables[collection_name].delete_async(where)
+
     def describe(self) -> Dict[str, Entity]:
         return self.schema
 
@@ -529,11 +798,25 @@ class RelationalDatastore(Datastore, ABC):
             keys `"COUNT(DISTINCT ID)"` and `"MAX(salary)"`
         """
         with self.engine.connect() as connection:
-            try:
+            with _translate_query_errors():
                 cursor = connection.execute(sqlalchemy.text(query), bind)
-            except sqlalchemy.exc.DatabaseError as e:
-                raise DatastoreError(
-                    "SQL query execution failed. See stacktrace to find out more "
-                    "(note: bind variables should be provided with the :varname syntax)"
-                ) from e
+            return _results_to_dict(cursor.fetchall())
+
+    async def query_async(
+        self, query: str, bind: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Execute a query against the stored data, in an asynchronous
+        manner. See the ``query`` method to get details about the parameters.
+
+        The query runs on the async engine of the datastore if available,
+        and in a worker thread otherwise.
+        """
+        async_engine = (
+            await self._async_engines.get_engine() if self._async_engines is not None else None
+        )
+        if async_engine is None:
+            return await run_sync_in_thread(self.query, query, bind)
+        async with async_engine.connect() as connection:
+            with _translate_query_errors():
+                cursor = await connection.execute(sqlalchemy.text(query), bind)
             return _results_to_dict(cursor.fetchall())
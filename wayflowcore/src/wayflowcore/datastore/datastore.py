@@ -7,10 +7,10 @@
 import warnings
 from abc import ABC, abstractmethod
 from logging import getLogger
-from typing import Any, Dict, List, Optional, Sequence, Union, overload
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, overload
 
 from wayflowcore._metadata import MetadataType
-from wayflowcore._utils.async_helpers import run_async_in_sync
+from wayflowcore._utils.async_helpers import run_async_in_sync, run_sync_in_thread
 from wayflowcore.component import Component
 from wayflowcore.datastore.entity import Entity, EntityAsDictT
 from wayflowcore.embeddingmodels import EmbeddingModel
@@ -155,6 +155,126 @@ class Datastore(Component, ABC):
         List[Dict[str, Any]]
             List of matching entities ordered by relevance.
         """
+        collection_name, metric, vector_config, model = self._resolve_search_target(
+            collection_name, search_config
+        )
+        _query_embedding = await model.embed_async([query])
+        query_embedding = _query_embedding[0]
+
+        results = self._search_backend(
+            collection_name=collection_name,
+            query_embedding=query_embedding,
+            k=k,
+            metric=metric,
+            where=where,
+            columns_to_exclude=columns_to_exclude,
+            vector_config=vector_config,
+        )
+        return results[:k]
+
+    def search_batch(
+        self,
+        *args: Any,
+        **kwargs: Any,
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for entities matching several queries in an synchronous manner. See the `search_batch_async` method to get details about the parameters.
+
+        Note: While performing search, at least one of search_config or collection_name must be specified.
+        """
+
+        # need to wrap because we can't pass named arguments to anyio
+        async def inside_wrapped() -> Any:
+            return await self.search_batch_async(*args, **kwargs)
+
+        return run_async_in_sync(inside_wrapped)
+
+    def _search_batch_backend(
+        self,
+        collection_name: str,
+        query_embeddings: List[List[float]],
+        k: int,
+        metric: SimilarityMetric,
+        where: Optional[Dict[str, Any]],
+        columns_to_exclude: Optional[List[str]],
+        vector_config: Optional[VectorConfig],
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Subclass hook for the execution of several searches over the chosen backend/index.
+        Defaults to one ``_search_backend`` call per query embedding.
+        """
+        return [
+            self._search_backend(
+                collection_name=collection_name,
+                query_embedding=query_embedding,
+                k=k,
+                metric=metric,
+                where=where,
+                columns_to_exclude=columns_to_exclude,
+                vector_config=vector_config,
+            )
+            for query_embedding in query_embeddings
+        ]
+
+    async def search_batch_async(
+        self,
+        queries: List[str],
+        collection_name: Optional[str] = None,
+        search_config: Optional[str] = None,
+        k: int = 3,
+        where: Optional[Dict[str, Any]] = None,
+        columns_to_exclude: Optional[List[str]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for entities matching several queries in an asynchronous manner.
+
+        All queries are embedded with a single call to the embedding model and searched together
+        on the backend, which is faster than calling ``search_async`` once per query.
+
+        Note: While performing search, at least one of search_config or collection_name must be specified.
+
+        Parameters
+        ----------
+        queries : List[str]
+            Search query strings to find matching entities.
+        collection_name : Optional[str]
+            Optional name of the collection to search within.
+        search_config : Optional[str]
+            Optional search configuration name to use; if None, infers config from collection name.
+        k : int
+            Number of results to return for each query (default: 3).
+        where : Optional[Dict[str, Any]]
+            Optional filters to apply to the search results of all queries.
+            The dictionary keys are column names, and the values are specific the values in that column
+            If given, returns results only matching the filters
+        columns_to_exclude : Optional[List[str]]
+            Optional list of columns to exclude from the search results. The vector embedding column is excluded by default
+
+        Returns
+        -------
+        List[List[Dict[str, Any]]]
+            List of matching entities ordered by relevance, for each query in the order of ``queries``.
+        """
+        collection_name, metric, vector_config, model = self._resolve_search_target(
+            collection_name, search_config
+        )
+        if len(queries) == 0:
+            return []
+        query_embeddings = await model.embed_async(list(queries))
+
+        results = self._search_batch_backend(
+            collection_name=collection_name,
+            query_embeddings=query_embeddings,
+            k=k,
+            metric=metric,
+            where=where,
+            columns_to_exclude=columns_to_exclude,
+            vector_config=vector_config,
+        )
+        return [query_results[:k] for query_results in results]
+
+    def _resolve_search_target(
+        self, collection_name: Optional[str], search_config: Optional[str]
+    ) -> Tuple[str, SimilarityMetric, Optional[VectorConfig], EmbeddingModel]:
+        """Find the collection, metric, vector config and embedding model to use for a search."""
         from wayflowcore.datastore._utils import check_collection_name
 
         if search_config:
@@ -194,24 +314,11 @@ class Datastore(Component, ABC):
         model = self._get_first_embedding_model(
             collection_name, vector_config=vector_config, search_config=config
         )
-        if model:
-            _query_embedding = await model.embed_async([query])
-            query_embedding = _query_embedding[0]
-        else:
+        if model is None:
             raise ValueError(
                 f"Could not find any embedding model for collection_name: {collection_name}"
             )
-
-        results = self._search_backend(
-            collection_name=collection_name,
-            query_embedding=query_embedding,
-            k=k,
-            metric=retriever.distance_metric,
-            where=where,
-            columns_to_exclude=columns_to_exclude,
-            vector_config=vector_config,
-        )
-        return results[:k]
+        return collection_name, retriever.distance_metric, vector_config, model
 
     @abstractmethod
     def list(
@@ -326,6 +433,64 @@ class Datastore(Component, ABC):
             The updated entities, including any defaults or values not set in the update.
         """
 
+    async def list_async(
+        self,
+        collection_name: str,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+    ) -> List[EntityAsDictT]:
+        """Retrieve a list of entities in a collection based on the
+        given criteria, in an asynchronous manner. See the ``list``
+        method to get details about the parameters.
+
+        Datastores without a native asynchronous implementation run
+        ``list`` in a worker thread, so that the event loop is not blocked.
+        """
+        return await run_sync_in_thread(self.list, collection_name, where, limit)
+
+    @overload
+    async def create_async(
+        self, collection_name: str, entities: EntityAsDictT
+    ) -> EntityAsDictT: ...
+
+    @overload
+    async def create_async(
+        self, collection_name: str, entities: List[EntityAsDictT]
+    ) -> List[EntityAsDictT]: ...
+
+    async def create_async(
+        self, collection_name: str, entities: Union[EntityAsDictT, List[EntityAsDictT]]
+    ) -> Union[EntityAsDictT, List[EntityAsDictT]]:
+        """Create new entities of the specified type, in an asynchronous
+        manner. See the ``create`` method to get details about the parameters.
+
+        Datastores without a native asynchronous implementation run
+        ``create`` in a worker thread, so that the event loop is not blocked.
+        """
+        return await run_sync_in_thread(self.create, collection_name, entities)
+
+    async def delete_async(self, collection_name: str, where: Dict[str, Any]) -> None:
+        """Delete entities based on the specified criteria, in an
+        asynchronous manner. See the ``delete`` method to get details
+        about the parameters.
+
+        Datastores without a native asynchronous implementation run
+        ``delete`` in a worker thread, so that the event loop is not blocked.
+        """
+        await run_sync_in_thread(self.delete, collection_name, where)
+
+    async def update_async(
+        self, collection_name: str, where: Dict[str, Any], update: EntityAsDictT
+    ) -> List[EntityAsDictT]:
+        """Update existing entities that match the provided conditions,
+        in an asynchronous manner. See the ``update`` method to get details
+        about the parameters.
+
+        Datastores without a native asynchronous implementation run
+        ``update`` in a worker thread, so that the event loop is not blocked.
+        """
+        return await run_sync_in_thread(self.update, collection_name, where, update)
+
     @abstractmethod
     def describe(self) -> Dict[str, Entity]:
         """Get the descriptions of the schema associated with this
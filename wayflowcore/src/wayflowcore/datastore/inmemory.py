@@ -4,14 +4,18 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+import json
 import warnings
 from logging import getLogger
-from typing import Any, Dict, List, Optional, Union, cast, overload
-
-import numpy as np
-import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast, overload
 
 from wayflowcore._metadata import MetadataType
+from wayflowcore._utils.io_utils import (
+    load_columnar_records,
+    save_columnar_records,
+    secure_write_json,
+)
 from wayflowcore.datastore._datatable import Datatable
 from wayflowcore.datastore._utils import (
     check_collection_name,
@@ -32,6 +36,7 @@ from wayflowcore.search import (
     VectorGenerator,
     VectorRetrieverConfig,
 )
+from wayflowcore.search.vectorindex import _create_entity_vector_index
 from wayflowcore.serialization.context import DeserializationContext, SerializationContext
 from wayflowcore.serialization.serializer import serialize_to_dict
 
@@ -54,22 +59,122 @@ _USER_WARNING_MESSAGE_INTERNAL = (
 )
 
 
+# Marks the values of the properties missing from an entity in the column store
+_MISSING = object()
+
+
 class _InMemoryDatatable(Datatable):
-    def __init__(self, entity_description: Entity):
+    """Column-store table of entities.
+
+    Each property is stored as a Python list of values, so that inserting entities is amortized
+    O(1). Deleted rows are only marked as such, and physically dropped once they represent a
+    quarter of the rows. Entities are only materialized as dictionaries for the rows returned by
+    an operation. Equality filters on the ``indexed_columns`` are resolved with hash indexes
+    instead of scanning the table.
+    """
+
+    _COMPACTION_DELETED_RATIO = 0.25
+
+    def __init__(self, entity_description: Entity, indexed_columns: Optional[List[str]] = None):
         self.entity_description = entity_description
-        column_names = [p_name for p_name in entity_description.properties]
-        self._data = pd.DataFrame(columns=column_names)
+        self.indexed_columns = list(indexed_columns or [])
+        for column_name in self.indexed_columns:
+            if column_name not in entity_description.properties:
+                raise ValueError(
+                    f"Cannot index column {column_name}, it is not a property of the entity {entity_description.name}"
+                )
+        # Order of the properties of the returned entities
+        self._column_names: List[str] = list(entity_description.properties)
+        self._columns: Dict[str, List[Any]] = {name: [] for name in self._column_names}
+        # Stable row id of each stored row. Row ids are never reused, so that derived structures
+        # (e.g. vector indices) can be updated incrementally
+        self._row_ids: List[int] = []
+        self._deleted: List[bool] = []
+        self._num_deleted = 0
+        self._next_row_id = 0
+        # Hash index of each indexed column: value -> positions of the live rows with this value.
+        # An index is None when the column holds unhashable values, and filters then scan the column
+        self._hash_indexes: Dict[str, Optional[Dict[Any, Set[int]]]] = {}
+        self._build_hash_indexes()
+
+    def __len__(self) -> int:
+        return len(self._row_ids) - self._num_deleted
+
+    def _build_hash_indexes(self) -> None:
+        for column_name in self.indexed_columns:
+            column_index: Optional[Dict[Any, Set[int]]] = {}
+            for position, value in enumerate(self._columns[column_name]):
+                if self._deleted[position]:
+                    continue
+                try:
+                    column_index.setdefault(value, set()).add(position)  # type: ignore
+                except TypeError:
+                    column_index = None
+                    break
+            self._hash_indexes[column_name] = column_index
 
-    def _convert_where_to_filter(
-        self, where: Dict[str, Any]
-    ) -> np.ndarray[Any, np.dtype[np.bool_]]:
+    def _add_to_hash_index(self, column_name: str, value: Any, position: int) -> None:
+        column_index = self._hash_indexes.get(column_name)
+        if column_index is None:
+            return
+        try:
+            column_index.setdefault(value, set()).add(position)
+        except TypeError:
+            self._hash_indexes[column_name] = None
+
+    def _remove_from_hash_index(self, column_name: str, value: Any, position: int) -> None:
+        column_index = self._hash_indexes.get(column_name)
+        if column_index is None:
+            return
+        positions = column_index.get(value)
+        if positions is not None:
+            positions.discard(position)
+            if not positions:
+                del column_index[value]
+
+    def _find_positions(self, where: Dict[str, Any], limit: Optional[int] = None) -> List[int]:
+        """Get the positions of the live rows matching all the filters, in insertion order."""
         if not where:
-            return np.zeros((len(self._data),), dtype=bool)
-        where_clauses = [
-            self._data[where_col] == where_val for where_col, where_val in where.items()
-        ]
-        # np.all returns Any, for some reason
-        return cast(np.ndarray[Any, np.dtype[np.bool_]], np.all(where_clauses, axis=0))
+            # An empty filter does not match any entity
+            return []
+        remaining_filters = dict(where)
+
+        indexed_buckets: List[Set[int]] = []
+        for column_name, value in where.items():
+            column_index = self._hash_indexes.get(column_name)
+            if column_index is None:
+                continue
+            try:
+                indexed_buckets.append(column_index.get(value, set()))
+            except TypeError:
+                # Unhashable filter value, the column is scanned instead
+                continue
+            remaining_filters.pop(column_name)
+
+        candidates: Optional[List[int]] = None
+        if indexed_buckets:
+            indexed_buckets.sort(key=len)
+            candidates = sorted(indexed_buckets[0].intersection(*indexed_buckets[1:]))
+        if candidates is None:
+            candidates = [position for position, deleted in enumerate(self._deleted) if not deleted]
+        for column_name, value in remaining_filters.items():
+            column = self._columns[column_name]
+            candidates = [position for position in candidates if column[position] == value]
+        if limit is not None:
+            candidates = candidates[:limit]
+        return candidates
+
+    def _get_live_positions(self, limit: Optional[int] = None) -> List[int]:
+        positions = [position for position, deleted in enumerate(self._deleted) if not deleted]
+        return positions if limit is None else positions[:limit]
+
+    def _materialize(self, position: int) -> EntityAsDictT:
+        entity = {}
+        for column_name in self._column_names:
+            value = self._columns[column_name][position]
+            if value is not _MISSING:
+                entity[column_name] = value
+        return entity
 
     def _add_defaults(self, entities: List[EntityAsDictT]) -> List[EntityAsDictT]:
         default_values_dict = self.entity_description.get_entity_defaults()
@@ -77,32 +182,75 @@ class _InMemoryDatatable(Datatable):
         validate_entities(self.entity_description, entities_with_defaults)
         return entities_with_defaults
 
+    def _append(self, entities: List[EntityAsDictT], row_ids: List[int]) -> None:
+        if len(self) == 0 and entities:
+            # Entities are returned with the properties in the order of the first inserted entity
+            first_entity_columns = [name for name in entities[0] if name in self._columns]
+            self._column_names = first_entity_columns + [
+                name for name in self._column_names if name not in entities[0]
+            ]
+        for entity, row_id in zip(entities, row_ids):
+            position = len(self._row_ids)
+            for column_name, column in self._columns.items():
+                value = entity.get(column_name, _MISSING)
+                column.append(value)
+                if column_name in self._hash_indexes:
+                    self._add_to_hash_index(column_name, value, position)
+            self._row_ids.append(row_id)
+            self._deleted.append(False)
+
+    def _compact(self) -> None:
+        """Physically drop the deleted rows."""
+        live_positions = self._get_live_positions()
+        self._columns = {
+            column_name: [column[position] for position in live_positions]
+            for column_name, column in self._columns.items()
+        }
+        self._row_ids = [self._row_ids[position] for position in live_positions]
+        self._deleted = [False] * len(live_positions)
+        self._num_deleted = 0
+        self._build_hash_indexes()
+
     def list(
         self, where: Optional[Dict[str, Any]] = None, limit: Optional[int] = None
     ) -> List[EntityAsDictT]:
-        if len(self._data) == 0:
-            return []
+        return self.list_with_row_ids(where, limit)[1]
 
-        data = self._data
+    def list_with_row_ids(
+        self, where: Optional[Dict[str, Any]] = None, limit: Optional[int] = None
+    ) -> Tuple[List[int], List[EntityAsDictT]]:
+        """List entities along with their stable row ids."""
         if where is not None:
             validate_partial_entity(self.entity_description, where)
-            where_filter = self._convert_where_to_filter(where)
-            data = self._data.loc[where_filter]
-        if limit is not None:
-            data = data.iloc[:limit, :]
-        # We can cast here, because we create the data ourselves and ensure column names
-        # are str (stricter than hashable returned by DataFrame.to_dict)
-        return cast(List[EntityAsDictT], data.to_dict("records"))
+            positions = self._find_positions(where, limit)
+        else:
+            positions = self._get_live_positions(limit)
+        return (
+            [self._row_ids[position] for position in positions],
+            [self._materialize(position) for position in positions],
+        )
 
     def update(self, where: Dict[str, Any], update: EntityAsDictT) -> List[EntityAsDictT]:
+        return self.update_with_row_ids(where, update)[1]
+
+    def update_with_row_ids(
+        self, where: Dict[str, Any], update: EntityAsDictT
+    ) -> Tuple[List[int], List[EntityAsDictT]]:
+        """Update entities and return the updated entities along with their stable row ids."""
         validate_partial_entity(self.entity_description, where)
         validate_partial_entity(self.entity_description, update)
-        where_filter = self._convert_where_to_filter(where)
-        for column, new_value in update.items():
-            self._data.loc[where_filter, column] = new_value
-        # We can cast here, because we create the data ourselves and ensure column names
-        # are str (stricter than hashable returned by DataFrame.to_dict)
-        return cast(List[EntityAsDictT], self._data[where_filter].to_dict("records"))
+        positions = self._find_positions(where)
+        for column_name, new_value in update.items():
+            column = self._columns[column_name]
+            for position in positions:
+                if column_name in self._hash_indexes:
+                    self._remove_from_hash_index(column_name, column[position], position)
+                    self._add_to_hash_index(column_name, new_value, position)
+                column[position] = new_value
+        return (
+            [self._row_ids[position] for position in positions],
+            [self._materialize(position) for position in positions],
+        )
 
     @overload
     def create(self, entities: EntityAsDictT) -> EntityAsDictT: ...
@@ -117,26 +265,61 @@ class _InMemoryDatatable(Datatable):
         if not isinstance(entities, list):
             entities = [entities]
             unpack_list = True
-        new_data = self._add_defaults(entities)
-        if len(self._data) > 0:
-            self._data = pd.concat([self._data, pd.DataFrame(new_data)])
-        else:
-            # Pandas throws a FutureWarning on concatenation when self._data is empty:
-            # The behavior of DataFrame concatenation with empty or all-NA entries is deprecated.
-            # In a future version, this will no longer exclude empty or all-NA columns when
-            # determining the result dtypes. To retain the old behavior, exclude the relevant
-            # entries before the concat operation.
-            self._data = pd.DataFrame(new_data)
+        new_data = self.create_with_row_ids(entities)[1]
         return new_data[0] if unpack_list else new_data
 
+    def create_with_row_ids(
+        self, entities: List[EntityAsDictT]
+    ) -> Tuple[List[int], List[EntityAsDictT]]:
+        """Create entities and return the created entities along with their stable row ids."""
+        new_data = self._add_defaults(entities)
+        row_ids = list(range(self._next_row_id, self._next_row_id + len(new_data)))
+        self._next_row_id += len(new_data)
+        self._append(new_data, row_ids)
+        return row_ids, new_data
+
+    def save(self, directory: Path) -> None:
+        """Save the entities of the datatable, along with their stable row ids, to a directory."""
+        row_ids, entities = self.list_with_row_ids()
+        save_columnar_records(entities, directory, "entities")
+        secure_write_json(
+            {"row_ids": row_ids, "next_row_id": self._next_row_id}, directory / "row_ids.json"
+        )
+
+    def load(self, directory: Path) -> None:
+        """Replace the entities of the datatable with the ones saved in a directory."""
+        entities = load_columnar_records(directory, "entities")
+        saved_row_ids = json.loads((directory / "row_ids.json").read_text(encoding="utf-8"))
+        self._columns = {name: [] for name in self._columns}
+        self._row_ids = []
+        self._deleted = []
+        self._num_deleted = 0
+        self._build_hash_indexes()
+        self._append(entities, saved_row_ids["row_ids"])
+        self._next_row_id = saved_row_ids["next_row_id"]
+
     def delete(self, where: Dict[str, Any]) -> None:
+        self.delete_with_row_ids(where)
+
+    def delete_with_row_ids(self, where: Dict[str, Any]) -> List[int]:
+        """Delete entities and return the stable row ids of the deleted entities."""
         validate_partial_entity(self.entity_description, where)
-        where_filter = self._convert_where_to_filter(where)
-        if not any(where_filter):
+        positions = self._find_positions(where)
+        if not positions:
             logger.warning(
                 "Found no matching %s records on delete, skipping...", self.entity_description.name
             )
-        self._data = self._data.loc[~where_filter]
+        for position in positions:
+            for column_name in self._hash_indexes:
+                self._remove_from_hash_index(
+                    column_name, self._columns[column_name][position], position
+                )
+            self._deleted[position] = True
+        self._num_deleted += len(positions)
+        deleted_row_ids = [self._row_ids[position] for position in positions]
+        if self._num_deleted > self._COMPACTION_DELETED_RATIO * len(self._row_ids):
+            self._compact()
+        return deleted_row_ids
 
 
 class InMemoryDatastore(Datastore):
@@ -157,7 +340,8 @@ class InMemoryDatastore(Datastore):
 
     .. note::
         When this ``Datastore`` is serialized, only its configuration
-        will be serialized, without any of the stored data.
+        will be serialized, without any of the stored data. Data saved to a
+        directory with ``save`` is referenced by the serialization instead.
 
     """
 
@@ -169,6 +353,8 @@ class InMemoryDatastore(Datastore):
         vector_configs: Optional[List["VectorConfig"]] = None,
         name: Optional[str] = None,
         description: Optional[str] = None,
+        data_directory: Optional[str] = None,
+        indexed_columns: Optional[Dict[str, List[str]]] = None,
         __metadata_info__: Optional["MetadataType"] = None,
     ):
         """Initialize an ``InMemoryDatastore``.
@@ -192,6 +378,15 @@ class InMemoryDatastore(Datastore):
             By default, it's set as None.
             If None, an implicit vector config will be created.
             Any operation on the Datastore might trigger the vector indices for these vector configs to be rebuilt again.
+        data_directory
+            Directory where the data of a datastore was saved with ``save``. If given, the entities
+            and vector indices are loaded from it, without computing any embedding. The vectors are
+            memory-mapped, so that the processes loading the same directory share them.
+        indexed_columns
+            Mapping of collection names to the properties to build hash indexes on. Filtering
+            entities on these properties with ``where`` is resolved with a lookup instead of a scan
+            of the collection, which is faster for properties matched with equality on large
+            collections (e.g. identifiers).
 
         Example
         -------
@@ -253,7 +448,13 @@ class InMemoryDatastore(Datastore):
         )
         self._validate_schema(schema)
         self.schema = schema
-        self._datatables = {name: _InMemoryDatatable(e) for name, e in self.schema.items()}
+        self.indexed_columns = indexed_columns or {}
+        for collection_name in self.indexed_columns:
+            if collection_name not in schema:
+                raise ValueError(
+                    f"Cannot index columns of collection {collection_name}, it is not part of the datastore schema"
+                )
+        self._datatables = self._create_datatables()
 
         self._implicit_vector_property_name = "_embedding"  # Only used when the user has not defined a vector property name and wants to use search
         # Initialize vector infrastructure
@@ -268,11 +469,69 @@ class InMemoryDatastore(Datastore):
         self._create_implicit_vector_properties()
 
         # Initialize datatables after schema modification
-        self._datatables = {name: _InMemoryDatatable(e) for name, e in self.schema.items()}
+        self._datatables = self._create_datatables()
 
         # Initialize vector infrastructure for each collection
         self._initialize_vector_infrastructure()
 
+        self.data_directory = data_directory
+        if data_directory is not None:
+            self._load_data(Path(data_directory))
+
+    def _create_datatables(self) -> Dict[str, _InMemoryDatatable]:
+        return {
+            name: _InMemoryDatatable(entity, self.indexed_columns.get(name))
+            for name, entity in self.schema.items()
+        }
+
+    def save(self, directory: str) -> None:
+        """Save the entities and vector indices of the datastore to a directory.
+
+        The vectors of the indices are written as raw ``.npy`` arrays that are memory-mapped when
+        the directory is loaded back with ``InMemoryDatastore(..., data_directory=directory)``.
+        After saving, the serialization of the datastore references this directory, with the data
+        as of this call.
+
+        Parameters
+        ----------
+        directory
+            Directory to save the data to. It is created if it does not exist.
+        """
+        path = Path(directory)
+        manifest: Dict[str, Any] = {"collections": {}}
+        for collection_idx, (collection_name, datatable) in enumerate(self._datatables.items()):
+            collection_directory = f"collection_{collection_idx}"
+            datatable.save(path / collection_directory)
+            indices: Dict[str, str] = {}
+            for index_idx, (vector_config_name, index) in enumerate(
+                self._vector_indices.get(collection_name, {}).items()
+            ):
+                if not isinstance(index, EntityVectorIndex):
+                    continue
+                index_directory = f"{collection_directory}/index_{index_idx}"
+                index.save(path / index_directory)
+                indices[vector_config_name] = index_directory
+            manifest["collections"][collection_name] = {
+                "directory": collection_directory,
+                "indices": indices,
+            }
+        secure_write_json(manifest, path / "datastore.json")
+        self.data_directory = directory
+
+    def _load_data(self, path: Path) -> None:
+        """Load the entities and vector indices saved in a directory with ``save``."""
+        manifest = json.loads((path / "datastore.json").read_text(encoding="utf-8"))
+        for collection_name, collection in manifest["collections"].items():
+            if collection_name not in self._datatables:
+                raise ValueError(
+                    f"Collection '{collection_name}' saved in {path} is not part of the datastore schema"
+                )
+            self._datatables[collection_name].load(path / collection["directory"])
+            for vector_config_name, index_directory in collection["indices"].items():
+                self._vector_indices[collection_name][vector_config_name] = EntityVectorIndex.load(
+                    path / index_directory
+                )
+
     def _create_implicit_vector_properties(self) -> None:
         """Create implicit vector properties for entities that need them.
 
@@ -393,6 +652,12 @@ class InMemoryDatastore(Datastore):
             "description": self.description,
         }
 
+        if self.data_directory is not None:
+            result["data_directory"] = self.data_directory
+
+        if self.indexed_columns:
+            result["indexed_columns"] = self.indexed_columns
+
         if self.search_configs is not None:
             result["search_configs"] = [
                 serialize_to_dict(config, serialization_context) for config in self.search_configs
@@ -444,6 +709,8 @@ class InMemoryDatastore(Datastore):
             vector_configs=vector_configs,
             name=name,
             description=description,
+            data_directory=input_dict.get("data_directory"),
+            indexed_columns=input_dict.get("indexed_columns"),
         )
 
     def list(
@@ -459,11 +726,12 @@ class InMemoryDatastore(Datastore):
         self, collection_name: str, where: Dict[str, Any], update: EntityAsDictT
     ) -> List[EntityAsDictT]:
         check_collection_name(self.schema, collection_name)
-        updated = self._datatables[collection_name].update(where, update)
+        row_ids, updated = self._datatables[collection_name].update_with_row_ids(where, update)
 
         if self._affects_vectors(collection_name, update):
             self._process_vectors_for_entities(collection_name, updated)
-            self._rebuild_affected_indices(collection_name)
+        if collection_name in self._vector_generators:
+            self._update_affected_indices(collection_name, upserted=(row_ids, updated))
 
         return updated
 
@@ -502,47 +770,45 @@ class InMemoryDatastore(Datastore):
         check_collection_name(self.schema, collection_name)
 
         entities_list = self._check_normalized_entities(entities)
-        is_single = isinstance(entities, dict)
 
         # Generate vectors before creating if we have a vector generator
         if collection_name in self._vector_generators:
-            # First ensure entities have the default empty vectors
-            entity_schema = self.schema[collection_name]
-
-            defaults = entity_schema.get_entity_defaults()
-            for entity in entities_list:
-                for key, value in defaults.items():
-                    if key not in entity:
-                        entity[key] = value
+            self._add_entity_defaults(collection_name, entities_list)
             self._process_vectors_for_entities(collection_name, entities_list)
 
-        result: Union[EntityAsDictT, List[EntityAsDictT]]
-        # Create entities with vectors already included
-        if is_single:
-            result = self._datatables[collection_name].create(entities_list[0])
+        created = self._create_entities_with_vectors(collection_name, entities_list)
+        return created[0] if isinstance(entities, dict) else created
 
-        else:
-            result = self._datatables[collection_name].create(entities_list)
+    def _add_entity_defaults(self, collection_name: str, entities: List[EntityAsDictT]) -> None:
+        # ensure entities have the default empty vectors
+        defaults = self.schema[collection_name].get_entity_defaults()
+        for entity in entities:
+            for key, value in defaults.items():
+                if key not in entity:
+                    entity[key] = value
+
+    def _create_entities_with_vectors(
+        self, collection_name: str, entities: List[EntityAsDictT]
+    ) -> List[EntityAsDictT]:
+        # Create entities with vectors already included
+        row_ids, created = self._datatables[collection_name].create_with_row_ids(entities)
 
         if collection_name in self._vector_generators:
-            self._rebuild_affected_indices(collection_name)
+            self._update_affected_indices(collection_name, upserted=(row_ids, created))
 
-        return result
+        return created
 
-    def _process_vectors_for_entities(
+    def _get_vector_generation(
         self, collection_name: str, entities: List[EntityAsDictT]
-    ) -> None:
-        """Generate and store vectors for entities.
-
-        Generates entity-level vectors.
-        """
+    ) -> Optional[Tuple[VectorGenerator, str]]:
+        """Return the vector generator and the vector property to fill, if the entities need vectors."""
         # Safeguard: ensure entities is a flat list of dicts
         if not isinstance(entities, list) or not all(isinstance(x, dict) for x in entities):
             raise TypeError("entities must be a list of dicts (EntityAsDictT)")
 
         vector_generator = self._vector_generators.get(collection_name)
-        if not vector_generator:
-            return
+        if not vector_generator or not entities:
+            return None
 
         vector_property = self._get_first_vector_property_name(collection_name)
 
@@ -552,22 +818,42 @@ class InMemoryDatastore(Datastore):
             )
 
         if vector_property in entities[0] and entities[0][vector_property]:
-            return
+            return None
+
+        return vector_generator, vector_property
+
+    def _process_vectors_for_entities(
+        self, collection_name: str, entities: List[EntityAsDictT]
+    ) -> None:
+        """Generate and store vectors for entities.
 
+        Generates entity-level vectors.
+        """
+        vector_generation = self._get_vector_generation(collection_name, entities)
+        if vector_generation is None:
+            return
+        vector_generator, vector_property = vector_generation
         vectors = vector_generator.generate_vectors(entities)
         for entity, vector in zip(entities, vectors):
             entity[vector_property] = vector
 
+    async def _process_vectors_for_entities_async(
+        self, collection_name: str, entities: List[EntityAsDictT]
+    ) -> None:
+        """Generate and store vectors for entities, in an asynchronous manner."""
+        vector_generation = self._get_vector_generation(collection_name, entities)
+        if vector_generation is None:
+            return
+        vector_generator, vector_property = vector_generation
+        vectors = await vector_generator.generate_vectors_async(entities)
+        for entity, vector in zip(entities, vectors):
+            entity[vector_property] = vector
+
     def _handle_vector_property_name_not_found(self, collection_name: str) -> str:
         return self._implicit_vector_property_name
 
-    def _rebuild_affected_indices(self, collection_name: str) -> None:
-        """Rebuild vector indices after entity changes.
-
-        Rebuilds entity-level indices based on the collection's vector configurations.
-        """
-        entities = self._datatables[collection_name].list()
-
+    def _get_affected_vector_configs(self, collection_name: str) -> List[VectorConfig]:
+        """Get the vector configurations whose indices depend on the given collection."""
         relevant_configs = []
         for config in self.vector_configs:
             if config.collection_name and config.collection_name == collection_name:
@@ -575,25 +861,120 @@ class InMemoryDatastore(Datastore):
         if not relevant_configs and collection_name in self._vector_generators:
             implicit_config = self._find_or_create_vector_config(collection_name)
             relevant_configs.append(implicit_config)
+        return relevant_configs
+
+    def _rebuild_affected_indices(self, collection_name: str) -> None:
+        """Rebuild vector indices from scratch.
 
-        for vector_config in relevant_configs:
+        Rebuilds entity-level indices based on the collection's vector configurations.
+        """
+        row_ids, entities = self._datatables[collection_name].list_with_row_ids()
+
+        for vector_config in self._get_affected_vector_configs(collection_name):
             vector_property = vector_config.vector_property or self._get_first_vector_property_name(
                 collection_name
             )
 
             # Build entity index using EntityVectorIndex
-            dimension = None
-            for entity in entities:
-                if vector_property in entity and entity[vector_property]:
-                    dimension = len(entity[vector_property])
-                    break
+            dimension = self._infer_vector_dimension(entities, vector_property)
             if dimension is not None:
-                index = EntityVectorIndex(dimension, SimilarityMetric.COSINE)
-                index.build(entities, vector_property)
+                index = _create_entity_vector_index(
+                    dimension,
+                    SimilarityMetric.COSINE,
+                    self._get_index_params(collection_name, vector_config),
+                )
+                index.build(entities, vector_property, item_ids=row_ids)
                 if not vector_config.name:
                     raise ValueError("Vector Config name is not configured properly")
                 self._vector_indices[collection_name][vector_config.name] = index
 
+    def _update_affected_indices(
+        self,
+        collection_name: str,
+        upserted: Optional[Tuple[List[int], List[EntityAsDictT]]] = None,
+        removed_row_ids: Optional[List[int]] = None,
+    ) -> None:
+        """Apply entity changes to the vector indices, without rebuilding them.
+
+        Parameters
+        ----------
+        collection_name
+            Collection in which the entities were changed.
+        upserted
+            Row ids and content of the entities that were created or updated.
+        removed_row_ids
+            Row ids of the entities that were deleted.
+        """
+        upserted_row_ids, upserted_entities = upserted or ([], [])
+        # the upserted entities are also returned to the caller, who must not be able to mutate the
+        # entities stored in the indices
+        upserted_entities = [dict(entity) for entity in upserted_entities]
+
+        for vector_config in self._get_affected_vector_configs(collection_name):
+            if not vector_config.name:
+                raise ValueError("Vector Config name is not configured properly")
+            vector_property = vector_config.vector_property or self._get_first_vector_property_name(
+                collection_name
+            )
+
+            index = self._vector_indices[collection_name].get(vector_config.name)
+            if index is None:
+                # The dimension of the index is only known once some entity has a vector
+                dimension = self._infer_vector_dimension(upserted_entities, vector_property)
+                if dimension is None:
+                    continue
+                index = _create_entity_vector_index(
+                    dimension,
+                    SimilarityMetric.COSINE,
+                    self._get_index_params(collection_name, vector_config),
+                )
+                index.build([], vector_property)
+                self._vector_indices[collection_name][vector_config.name] = index
+
+            if not isinstance(index, EntityVectorIndex):
+                # Other index types cannot be updated in place
+                self._rebuild_affected_indices(collection_name)
+                return
+
+            if removed_row_ids:
+                index.remove(removed_row_ids)
+            if upserted_row_ids:
+                index.upsert(
+                    upserted_entities, item_ids=upserted_row_ids, vector_field=vector_property
+                )
+
+    def _get_index_params(
+        self, collection_name: str, vector_config: VectorConfig
+    ) -> Dict[str, Any]:
+        """Get the index parameters of the search configs using the given vector config.
+
+        The parameters of the first matching search config defining some are used.
+        """
+        for search_config in self.search_configs:
+            retriever = search_config.retriever
+            if not retriever.index_params:
+                continue
+            if retriever.collection_name and retriever.collection_name != collection_name:
+                continue
+            try:
+                vector_config_name = self._find_vector_config_name_for_search(
+                    retriever, collection_name
+                )
+            except ValueError:
+                continue
+            if vector_config_name == vector_config.name:
+                return retriever.index_params
+        return {}
+
+    @staticmethod
+    def _infer_vector_dimension(
+        entities: List[EntityAsDictT], vector_property: str
+    ) -> Optional[int]:
+        for entity in entities:
+            if vector_property in entity and entity[vector_property]:
+                return len(entity[vector_property])
+        return None
+
     def _affects_vectors(self, collection_name: str, update: EntityAsDictT) -> bool:
         """Check if an update affects vector generation for a collection."""
         if collection_name not in self._vector_generators:
@@ -615,10 +996,72 @@ class InMemoryDatastore(Datastore):
 
     def delete(self, collection_name: str, where: Dict[str, Any]) -> None:
         check_collection_name(self.schema, collection_name)
-        self._datatables[collection_name].delete(where)
+        deleted_row_ids = self._datatables[collection_name].delete_with_row_ids(where)
 
         if collection_name in self._vector_generators:
-            self._rebuild_affected_indices(collection_name)
+            self._update_affected_indices(collection_name, removed_row_ids=deleted_row_ids)
+
+    async def list_async(
+        self,
+        collection_name: str,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+    ) -> List[EntityAsDictT]:
+        # in-memory operations do not block, they are run directly in the event loop
+        return self.list(collection_name, where, limit)
+
+    @overload
+    async def create_async(
+        self, collection_name: str, entities: EntityAsDictT
+    ) -> EntityAsDictT: ...
+
+    @overload
+    async def create_async(
+        self, collection_name: str, entities: List[EntityAsDictT]
+    ) -> List[EntityAsDictT]: ...
+
+    async def create_async(
+        self, collection_name: str, entities: Union[EntityAsDictT, List[EntityAsDictT]]
+    ) -> Union[EntityAsDictT, List[EntityAsDictT]]:
+        if collection_name not in self._vector_generators:
+            return self.create(collection_name, entities)
+        check_collection_name(self.schema, collection_name)
+        entities_list = self._check_normalized_entities(entities)
+        self._add_entity_defaults(collection_name, entities_list)
+        # The vectors are generated in the event loop, with the asynchronous API of the embedding
+        # models. The datatable and its vector indices are only mutated afterward, without yielding
+        # to the event loop, so they are never accessed concurrently.
+        await self._process_vectors_for_entities_async(collection_name, entities_list)
+        created = self._create_entities_with_vectors(collection_name, entities_list)
+        return created[0] if isinstance(entities, dict) else created
+
+    async def update_async(
+        self, collection_name: str, where: Dict[str, Any], update: EntityAsDictT
+    ) -> List[EntityAsDictT]:
+        if not self._affects_vectors(collection_name, update):
+            return self.update(collection_name, where, update)
+        check_collection_name(self.schema, collection_name)
+        datatable = self._datatables[collection_name]
+        # Like for ``create_async``, the vectors of the updated entities are generated before
+        # mutating the datatable. Generating them yields to the event loop, so they are generated
+        # again if other entities match the update once they are generated.
+        while True:
+            row_ids, entities = datatable.list_with_row_ids(where)
+            entities_with_update = [{**entity, **update} for entity in entities]
+            await self._process_vectors_for_entities_async(collection_name, entities_with_update)
+            if datatable.list_with_row_ids(where)[0] == row_ids:
+                break
+
+        row_ids, updated = datatable.update_with_row_ids(where, update)
+        vector_property = self._get_first_vector_property_name(collection_name)
+        for entity, entity_with_update in zip(updated, entities_with_update):
+            if vector_property in entity_with_update:
+                entity[vector_property] = entity_with_update[vector_property]
+        self._update_affected_indices(collection_name, upserted=(row_ids, updated))
+        return updated
+
+    async def delete_async(self, collection_name: str, where: Dict[str, Any]) -> None:
+        self.delete(collection_name, where)
 
     def describe(self) -> Dict[str, Entity]:
         return self.schema
@@ -652,6 +1095,33 @@ class InMemoryDatastore(Datastore):
 
         return results
 
+    def _search_batch_backend(
+        self,
+        collection_name: str,
+        query_embeddings: List[List[float]],
+        k: int,
+        metric: SimilarityMetric,
+        where: Optional[Dict[str, Any]],
+        columns_to_exclude: Optional[List[str]],
+        vector_config: Optional[VectorConfig],
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Backend execution for in-memory batched search: searches all query embeddings at once on the in-memory vector index.
+        """
+        vector_config_name = vector_config.name if vector_config else None
+        if not isinstance(vector_config_name, str):
+            raise ValueError(
+                f"Expected Vector Config name to be a string, but got a config of type: {type(vector_config_name)}"
+            )
+        index = self._vector_indices[collection_name][vector_config_name]
+        return index.search_batch(
+            query_embeddings,
+            k,
+            metric=metric,
+            where=where,
+            columns_to_exclude=columns_to_exclude,
+        )
+
     def _find_vector_config_from_name(
         self,
         vector_config_name: Optional[str],
@@ -25,7 +25,7 @@ from wayflowcore.serialization.context import DeserializationContext, Serializat
 from wayflowcore.serialization.serializer import SerializableObject, serialize_to_dict
 from wayflowcore.warnings import SecurityWarning
 
-from ._relational import RelationalDatastore
+from ._relational import RelationalDatastore, _create_async_engine
 
 if TYPE_CHECKING:
     # Important: do not move these imports out of the TYPE_CHECKING
@@ -33,6 +33,7 @@ if TYPE_CHECKING:
     # Otherwise, importing the module when they are not installed would lead to an import error.
     import oracledb
     import sqlalchemy
+    from sqlalchemy.ext.asyncio import AsyncEngine
 else:
     oracledb = LazyLoader("oracledb")
     sqlalchemy = LazyLoader("sqlalchemy")
@@ -53,18 +54,36 @@ class OracleDatabaseConnectionConfig(DataclassComponent):
             A `python-oracledb` connection object
         """
         try:
-            connection_config = asdict(self)
-            # pop metadata object attributes
-            connection_config.pop("id")
-            connection_config.pop("name")
-            connection_config.pop("description")
-            connection_config.pop("__metadata_info__")
-            return oracledb.connect(**connection_config)
+            return oracledb.connect(**self._get_connection_kwargs())
         except oracledb.DatabaseError as e:
             raise DatastoreError(
                 "Connection to the database failed. Check the root exception for more details."
             ) from e
 
+    async def get_async_connection(self) -> Any:
+        """Create an asynchronous connection object from the configuration
+
+        Returns
+        -------
+        Any
+            A `python-oracledb` asynchronous connection object
+        """
+        try:
+            return await oracledb.connect_async(**self._get_connection_kwargs())
+        except oracledb.DatabaseError as e:
+            raise DatastoreError(
+                "Connection to the database failed. Check the root exception for more details."
+            ) from e
+
+    def _get_connection_kwargs(self) -> Dict[str, Any]:
+        connection_config = asdict(self)
+        # pop metadata object attributes
+        connection_config.pop("id")
+        connection_config.pop("name")
+        connection_config.pop("description")
+        connection_config.pop("__metadata_info__")
+        return connection_config
+
     def _serialize_to_dict(self, serialization_context: SerializationContext) -> Dict[str, Any]:
         warnings.warn(
             "OracleDatabaseConnectionConfig is a security sensitive configuration object, "
@@ -214,10 +233,16 @@ class OracleDatabaseDatastore(RelationalDatastore, SerializableObject):
             name=IdGenerator.get_or_generate_name(name, prefix="oracle_datastore", length=8),
             description=description,
             __metadata_info__=__metadata_info__,
+            async_engine_factory=self._create_async_engine,
         )
 
         SerializableObject.__init__(self, None)
 
+    def _create_async_engine(self) -> "AsyncEngine":
+        return _create_async_engine(
+            "oracle+oracledb_async://", async_creator=self.connection_config.get_async_connection
+        )
+
     def _serialize_to_dict(self, serialization_context: SerializationContext) -> Dict[str, Any]:
         result: Dict[str, Any] = {
             "schema": {
@@ -322,6 +347,35 @@ class OracleDatabaseDatastore(RelationalDatastore, SerializableObject):
 
         return results
 
+    def _search_batch_backend(
+        self,
+        collection_name: str,
+        query_embeddings: List[List[float]],
+        k: int,
+        metric: SimilarityMetric,
+        where: Optional[Dict[str, Any]],
+        columns_to_exclude: Optional[List[str]],
+        vector_config: Optional[VectorConfig],
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Backend execution for Oracle batched vector search: all queries are run in a single SQL statement.
+        """
+
+        vector_property = None
+
+        if vector_config:
+            vector_property = vector_config.vector_property
+
+        if vector_property is None:
+            vector_property = self._get_first_vector_property_name(collection_name)
+
+        index = OracleDatabaseVectorIndex(
+            self.engine, vector_property, table=self.data_tables[collection_name].sqlalchemy_table
+        )
+        results = index.search_batch(query_embeddings, k, metric, where, columns_to_exclude)
+
+        return results
+
     def _find_vector_config_from_name(
         self, vector_config_name: Optional[str], collection_name: Optional[str] = None
     ) -> Optional[VectorConfig]:
@@ -16,13 +16,14 @@ from wayflowcore.serialization.serializer import SerializableObject, serialize_t
 from wayflowcore.warnings import SecurityWarning
 
 from ..component import DataclassComponent
-from ._relational import RelationalDatastore
+from ._relational import RelationalDatastore, _create_async_engine
 
 if TYPE_CHECKING:
     # Important: do not move these imports out of the TYPE_CHECKING
     # block so long as sqlalchemy is an optional dependencies.
     # Otherwise, importing the module when they are not installed would lead to an import error.
     import sqlalchemy
+    from sqlalchemy.ext.asyncio import AsyncEngine
 else:
     sqlalchemy = LazyLoader("sqlalchemy")
 
@@ -35,6 +36,14 @@ class PostgresDatabaseConnectionConfig(DataclassComponent, ABC):
     def get_connection(self) -> "sqlalchemy.Engine":
         raise NotImplementedError()
 
+    def get_async_connection(self) -> "AsyncEngine":
+        """Creates a SQLAlchemy async engine for the asynchronous operations of the datastore.
+
+        Configurations not supporting async drivers can leave it unimplemented, in which case
+        the asynchronous operations run in worker threads.
+        """
+        raise NotImplementedError()
+
     def _serialize_to_dict(self, serialization_context: "SerializationContext") -> Dict[str, Any]:
         warnings.warn(
             f"{self.__class__.__name__} is a security sensitive configuration object, "
@@ -96,9 +105,14 @@ class TlsPostgresDatabaseConnectionConfig(PostgresDatabaseConnectionConfig):
     def _remove_trailing_http(self, url: str) -> str:
         return url.rstrip("http://").rstrip("https://")
 
-    def get_connection(self) -> "sqlalchemy.Engine":
-        from sqlalchemy import create_engine
+    def get_async_sqlalchemy_url(self) -> str:
+        """Builds a SQLAlchemy connection URL using the async driver of psycopg (version 3)."""
+        return (
+            f"postgresql+psycopg://{str(self.user)}:{str(self.password)}@"
+            f"{self._remove_trailing_http(self.url)}/postgres"
+        )
 
+    def _get_connect_args(self) -> Dict[str, Any]:
         connect_args: Dict[str, Any] = {"sslmode": self.sslmode}
 
         # Only apply SSL-related parameters when SSL is not disabled
@@ -111,8 +125,18 @@ class TlsPostgresDatabaseConnectionConfig(PostgresDatabaseConnectionConfig):
                 connect_args["sslrootcert"] = self.sslrootcert
             if self.sslcrl is not None:
                 connect_args["sslcrl"] = self.sslcrl
+        return connect_args
 
-        return create_engine(self.get_sqlalchemy_url(), connect_args=connect_args)
+    def get_connection(self) -> "sqlalchemy.Engine":
+        from sqlalchemy import create_engine
+
+        return create_engine(self.get_sqlalchemy_url(), connect_args=self._get_connect_args())
+
+    def get_async_connection(self) -> "AsyncEngine":
+        # psycopg accepts the same libpq SSL parameters as psycopg2
+        return _create_async_engine(
+            self.get_async_sqlalchemy_url(), connect_args=self._get_connect_args()
+        )
 
 
 class PostgresDatabaseDatastore(RelationalDatastore, SerializableObject):
@@ -160,6 +184,7 @@ class PostgresDatabaseDatastore(RelationalDatastore, SerializableObject):
             description=description,
             id=id,
             __metadata_info__=__metadata_info__,
+            async_engine_factory=connection_config.get_async_connection,
         )
         SerializableObject.__init__(self)
 
@@ -4,6 +4,7 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+from .cachedembeddingmodel import CachedEmbeddingModel
 from .embeddingmodel import EmbeddingModel
 from .ocigenaimodel import OCIGenAIEmbeddingModel
 from .ollamamodel import OllamaEmbeddingModel
@@ -12,6 +13,7 @@ from .openaimodel import OpenAIEmbeddingModel
 from .vllmmodel import VllmEmbeddingModel
 
 __all__ = [
+    "CachedEmbeddingModel",
     "EmbeddingModel",
     "OCIGenAIEmbeddingModel",
     "OllamaEmbeddingModel",
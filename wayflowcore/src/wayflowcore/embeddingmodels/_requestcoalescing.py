@@ -0,0 +1,119 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import logging
+import threading
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import anyio
+import anyio.lowlevel
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingEmbeddingBatch:
+    def __init__(self) -> None:
+        self.texts: List[str] = []
+        self.full = anyio.Event()
+        self.done = anyio.Event()
+        self.embeddings: Optional[List[List[float]]] = None
+        self.error: Optional[BaseException] = None
+
+
+class _EmbeddingRequestCoalescer:
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], Awaitable[List[List[float]]]],
+        max_delay: float,
+        max_batch_size: int,
+    ):
+        """
+        Coalesces the texts of concurrent embedding requests into batched requests.
+
+        The first request of a batch waits for at most ``max_delay`` seconds, or until the batch holds
+        ``max_batch_size`` texts, then sends the texts of all the requests that joined the batch in a
+        single call to ``embed_batch`` and hands each request its own embeddings. If the first request
+        is cancelled, the batch is still sent for the other requests, and the cancellation takes
+        effect once the batch is done.
+
+        Batches are only shared between requests running in the same event loop.
+        """
+        self._embed_batch = embed_batch
+        self.max_delay = max_delay
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        # event loop token -> batch still accepting texts
+        self._open_batches: Dict[object, _PendingEmbeddingBatch] = {}
+
+    def _join_batch(self, texts: List[str]) -> Tuple[_PendingEmbeddingBatch, int, bool]:
+        loop_token = anyio.lowlevel.current_token()
+        with self._lock:
+            batch = self._open_batches.get(loop_token)
+            is_leader = batch is None or len(batch.texts) + len(texts) > self.max_batch_size
+            if is_leader:
+                if batch is not None:
+                    # the open batch cannot take these texts, its leader can send it right away
+                    batch.full.set()
+                batch = _PendingEmbeddingBatch()
+                self._open_batches[loop_token] = batch
+            assert batch is not None
+            offset = len(batch.texts)
+            batch.texts.extend(texts)
+            if len(batch.texts) >= self.max_batch_size:
+                batch.full.set()
+        return batch, offset, is_leader
+
+    def _close_batch(self, batch: _PendingEmbeddingBatch) -> None:
+        loop_token = anyio.lowlevel.current_token()
+        with self._lock:
+            if self._open_batches.get(loop_token) is batch:
+                del self._open_batches[loop_token]
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        if not texts:
+            return []
+        if len(texts) >= self.max_batch_size:
+            # already a full batch, nothing to gain by waiting for other requests
+            return await self._embed_batch(texts)
+
+        batch, offset, is_leader = self._join_batch(texts)
+        if is_leader:
+            await self._send_batch(batch)
+            # the batch is sent even if the leading request is cancelled, which then stops here
+            await anyio.lowlevel.checkpoint_if_cancelled()
+        else:
+            await batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+        assert batch.embeddings is not None
+        return batch.embeddings[offset : offset + len(texts)]
+
+    async def _send_batch(self, batch: _PendingEmbeddingBatch) -> None:
+        # The batch is sent in a shielded scope: the other requests of the batch still get their
+        # embeddings if the leading request is cancelled, for example when its client disconnects
+        with anyio.CancelScope(shield=True):
+            try:
+                with anyio.move_on_after(self.max_delay):
+                    await batch.full.wait()
+                self._close_batch(batch)
+                logger.debug("Sending a coalesced batch of %s texts to embed", len(batch.texts))
+                embeddings = await self._embed_batch(batch.texts)
+                if len(embeddings) != len(batch.texts):
+                    raise ValueError(
+                        f"Expected {len(batch.texts)} embeddings for the coalesced batch, but got {len(embeddings)}"
+                    )
+                batch.embeddings = embeddings
+            except Exception as e:
+                batch.error = e
+            except BaseException:
+                self._close_batch(batch)
+                batch.error = RuntimeError(
+                    "The request sending this batch of texts to embed was interrupted"
+                )
+                raise
+            finally:
+                batch.done.set()
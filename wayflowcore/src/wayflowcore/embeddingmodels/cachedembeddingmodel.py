@@ -0,0 +1,312 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
+
+import anyio
+
+from wayflowcore._metadata import MetadataType
+from wayflowcore._utils.async_helpers import run_async_in_sync, run_sync_in_thread
+from wayflowcore.embeddingmodels.embeddingmodel import EmbeddingModel
+from wayflowcore.serialization.context import DeserializationContext, SerializationContext
+from wayflowcore.serialization.serializer import (
+    SerializableObject,
+    autodeserialize_from_dict,
+    deserialize_any_from_dict,
+    serialize_to_dict,
+)
+
+if TYPE_CHECKING:
+    from wayflowcore.datastore import Datastore, Entity
+
+logger = logging.getLogger(__name__)
+
+# Number of cache keys looked up in the datastore with a single query. It stays below the limits on
+# the number of items of ``IN`` clauses of the databases (for example 1000 in Oracle)
+_DATASTORE_LOOKUP_CHUNK_SIZE = 500
+
+
+class CachedEmbeddingModel(EmbeddingModel, SerializableObject):
+    def __init__(
+        self,
+        embedding_model: EmbeddingModel,
+        max_batch_size: int = 96,
+        max_concurrent_batches: int = 4,
+        max_cache_size: Optional[int] = 10_000,
+        datastore: Optional["Datastore"] = None,
+        cache_collection_name: str = "embedding_cache",
+        __metadata_info__: Optional[MetadataType] = None,
+        id: Optional[str] = None,
+        name: Optional[str] = None,
+        description: Optional[str] = None,
+    ):
+        """
+        Embedding model wrapping another embedding model to cache its embeddings and to split large
+        inputs into batches.
+
+        Identical texts are only embedded once. Texts whose embedding is not cached are sent to the
+        wrapped model in batches of at most ``max_batch_size`` texts, with at most ``max_concurrent_batches``
+        requests at a time. Embeddings are cached in memory, keyed by a hash of the model and of the text,
+        and optionally in a datastore, so that they can be shared between processes and restarts.
+
+        Parameters
+        ----------
+        embedding_model:
+            The embedding model computing the embeddings.
+        max_batch_size:
+            Maximum number of texts sent to the wrapped model in a single request.
+        max_concurrent_batches:
+            Maximum number of concurrent requests to the wrapped model.
+        max_cache_size:
+            The number of embeddings kept in the in-memory cache. The least recently used embeddings are evicted first.
+            If None, there is no limit on cache size and no eviction occurs.
+        datastore:
+            Optional datastore used as a second cache tier, looked up for the embeddings missing from the in-memory cache.
+
+            .. important::
+
+                The datastore needs to have a collection called ``cache_collection_name``, whose entries are defined
+                with ``CachedEmbeddingModel.get_entity_definition``.
+
+        cache_collection_name:
+            Name of the collection of the datastore in which the embeddings are cached.
+        id:
+            ID of the component.
+        name:
+            Name of the component.
+        description:
+            Description of the component.
+
+        Examples
+        --------
+        >>> from wayflowcore.embeddingmodels import CachedEmbeddingModel, VllmEmbeddingModel
+        >>> embedding_model = CachedEmbeddingModel(
+        ...     VllmEmbeddingModel(base_url="EMBEDDING_API_URL", model_id="model-id"),
+        ...     max_batch_size=64,
+        ... )
+        >>> embeddings = embedding_model.embed(["WayFlow is a framework", "WayFlow is a framework"])  # doctest: +SKIP
+
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"`max_batch_size` should be at least 1, but was {max_batch_size}")
+        if max_concurrent_batches < 1:
+            raise ValueError(
+                f"`max_concurrent_batches` should be at least 1, but was {max_concurrent_batches}"
+            )
+        if max_cache_size is not None and max_cache_size < 1:
+            raise ValueError(f"`max_cache_size` should be at least 1, but was {max_cache_size}")
+        super().__init__(
+            __metadata_info__=__metadata_info__,
+            id=id,
+            name=name,
+            description=description,
+        )
+        self.embedding_model = embedding_model
+        self.max_batch_size = max_batch_size
+        self.max_concurrent_batches = max_concurrent_batches
+        self.max_cache_size = max_cache_size
+        self.datastore = datastore
+        self.cache_collection_name = cache_collection_name
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        # embeddings of the same text by different models should not collide, even in a shared datastore
+        self._model_key = (
+            f"{type(embedding_model).__name__}:"
+            f"{getattr(embedding_model, '_model_id', None) or embedding_model.name}"
+        )
+
+    @staticmethod
+    def get_entity_definition() -> "Entity":
+        from wayflowcore.datastore import Entity
+        from wayflowcore.property import StringProperty
+
+        return Entity(
+            properties={
+                "cache_key": StringProperty(),
+                "embedding": StringProperty(),
+            }
+        )
+
+    def _get_cache_key(self, text: str) -> str:
+        return hashlib.sha256(f"{self._model_key}\x00{text}".encode("utf-8")).hexdigest()
+
+    def _get_from_memory(self, cache_keys: List[str]) -> Dict[str, List[float]]:
+        embeddings = {}
+        with self._lock:
+            for cache_key in cache_keys:
+                embedding = self._cache.get(cache_key)
+                if embedding is not None:
+                    self._cache.move_to_end(cache_key)
+                    embeddings[cache_key] = embedding
+        return embeddings
+
+    def _store_in_memory(self, embeddings: Dict[str, List[float]]) -> None:
+        with self._lock:
+            for cache_key, embedding in embeddings.items():
+                self._cache[cache_key] = embedding
+                self._cache.move_to_end(cache_key)
+            if self.max_cache_size is not None:
+                while len(self._cache) > self.max_cache_size:
+                    self._cache.popitem(last=False)
+
+    async def _get_from_datastore(self, cache_keys: List[str]) -> Dict[str, List[float]]:
+        from wayflowcore.datastore._relational import RelationalDatastore
+
+        if self.datastore is None or not cache_keys:
+            return {}
+        datastore = self.datastore
+        entries: List[Dict[str, Any]] = []
+        limiter = anyio.CapacityLimiter(self.max_concurrent_batches)
+
+        async def _list_entries(chunk: List[str]) -> None:
+            async with limiter:
+                if isinstance(datastore, RelationalDatastore):
+                    # a single query per chunk of keys, instead of one query per key
+                    entries.extend(
+                        await run_sync_in_thread(
+                            datastore.data_tables[self.cache_collection_name]._list_in,
+                            "cache_key",
+                            chunk,
+                        )
+                    )
+                else:
+                    for cache_key in chunk:
+                        entries.extend(
+                            await datastore.list_async(
+                                self.cache_collection_name, where={"cache_key": cache_key}, limit=1
+                            )
+                        )
+
+        async with anyio.create_task_group() as tg:
+            for start in range(0, len(cache_keys), _DATASTORE_LOOKUP_CHUNK_SIZE):
+                tg.start_soon(
+                    _list_entries, cache_keys[start : start + _DATASTORE_LOOKUP_CHUNK_SIZE]
+                )
+
+        return {entry["cache_key"]: json.loads(entry["embedding"]) for entry in entries}
+
+    async def _store_in_datastore(self, embeddings: Dict[str, List[float]]) -> None:
+        if self.datastore is None or not embeddings:
+            return
+        # other processes sharing the datastore might have cached some of these embeddings since
+        # they were looked up
+        already_stored_keys = await self._get_from_datastore(list(embeddings))
+        new_entries = [
+            {"cache_key": cache_key, "embedding": json.dumps(embedding)}
+            for cache_key, embedding in embeddings.items()
+            if cache_key not in already_stored_keys
+        ]
+        if new_entries:
+            await self.datastore.create_async(self.cache_collection_name, new_entries)
+
+    async def _embed_in_batches(self, texts: List[str]) -> List[List[float]]:
+        batches = [
+            texts[start : start + self.max_batch_size]
+            for start in range(0, len(texts), self.max_batch_size)
+        ]
+        if len(batches) == 1:
+            return await self.embedding_model.embed_async(batches[0])
+
+        batch_embeddings: List[List[List[float]]] = [[] for _ in batches]
+        limiter = anyio.CapacityLimiter(self.max_concurrent_batches)
+
+        async def _embed_batch(batch_idx: int) -> None:
+            async with limiter:
+                batch_embeddings[batch_idx] = await self.embedding_model.embed_async(
+                    batches[batch_idx]
+                )
+
+        async with anyio.create_task_group() as tg:
+            for batch_idx in range(len(batches)):
+                tg.start_soon(_embed_batch, batch_idx)
+
+        return [embedding for embeddings in batch_embeddings for embedding in embeddings]
+
+    def embed(self, data: List[str]) -> List[List[float]]:
+        return run_async_in_sync(self.embed_async, data, method_name="embed_async")
+
+    async def embed_async(self, data: List[str]) -> List[List[float]]:
+        cache_keys = [self._get_cache_key(text) for text in data]
+        # identical texts are only looked up and embedded once
+        texts_per_key = dict(zip(cache_keys, data))
+
+        embeddings = self._get_from_memory(list(texts_per_key))
+        missing_keys = [cache_key for cache_key in texts_per_key if cache_key not in embeddings]
+
+        if missing_keys and self.datastore is not None:
+            stored_embeddings = await self._get_from_datastore(missing_keys)
+            self._store_in_memory(stored_embeddings)
+            embeddings.update(stored_embeddings)
+            missing_keys = [cache_key for cache_key in missing_keys if cache_key not in embeddings]
+
+        if missing_keys:
+            logger.debug(
+                "Embedding %s texts out of %s, the others were cached or duplicated",
+                len(missing_keys),
+                len(data),
+            )
+            new_embeddings = dict(
+                zip(
+                    missing_keys,
+                    await self._embed_in_batches(
+                        [texts_per_key[cache_key] for cache_key in missing_keys]
+                    ),
+                )
+            )
+            self._store_in_memory(new_embeddings)
+            if self.datastore is not None:
+                await self._store_in_datastore(new_embeddings)
+            embeddings.update(new_embeddings)
+
+        return [embeddings[cache_key] for cache_key in cache_keys]
+
+    def _serialize_to_dict(self, serialization_context: "SerializationContext") -> Dict[str, Any]:
+        return {
+            "embedding_model": serialize_to_dict(self.embedding_model, serialization_context),
+            "max_batch_size": self.max_batch_size,
+            "max_concurrent_batches": self.max_concurrent_batches,
+            "max_cache_size": self.max_cache_size,
+            "datastore": (
+                serialize_to_dict(self.datastore, serialization_context)
+                if self.datastore is not None
+                else None
+            ),
+            "cache_collection_name": self.cache_collection_name,
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+        }
+
+    @classmethod
+    def _deserialize_from_dict(
+        cls, input_dict: Dict[str, Any], deserialization_context: "DeserializationContext"
+    ) -> "SerializableObject":
+        datastore = (
+            cast(
+                "Datastore",
+                autodeserialize_from_dict(input_dict["datastore"], deserialization_context),
+            )
+            if input_dict.get("datastore") is not None
+            else None
+        )
+        return cls(
+            embedding_model=deserialize_any_from_dict(
+                input_dict["embedding_model"], EmbeddingModel, deserialization_context
+            ),
+            max_batch_size=input_dict.get("max_batch_size", 96),
+            max_concurrent_batches=input_dict.get("max_concurrent_batches", 4),
+            max_cache_size=input_dict.get("max_cache_size", 10_000),
+            datastore=datastore,
+            cache_collection_name=input_dict.get("cache_collection_name", "embedding_cache"),
+            id=input_dict.get("id"),
+            name=input_dict.get("name"),
+            description=input_dict.get("description"),
+        )
@@ -7,11 +7,12 @@ import warnings
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
 from wayflowcore._metadata import MetadataType
-from wayflowcore._utils.async_helpers import run_sync_in_thread
 from wayflowcore._utils.lazy_loader import LazyLoader
 from wayflowcore.embeddingmodels.embeddingmodel import EmbeddingModel
+from wayflowcore.models._ociasynctransport import _OciAsyncTransport
 from wayflowcore.models._requesthelpers import (
     _classify_oci_service_error_for_retry,
+    execute_async_with_retry,
     execute_sync_with_retry,
 )
 from wayflowcore.models.ociclientconfig import OCIClientConfig, _client_config_to_oci_client_kwargs
@@ -155,6 +156,7 @@ class OCIGenAIEmbeddingModel(EmbeddingModel, SerializableObject):
         # The client is set in a lazy manner to prevent the model from crashing before being
         # used in case the configuration is not valid for some reason.
         self._lazy_client = None
+        self._lazy_transport: Optional[_OciAsyncTransport] = None
         self.config = config
 
     def _set_client(self) -> None:
@@ -174,20 +176,29 @@ class OCIGenAIEmbeddingModel(EmbeddingModel, SerializableObject):
         self._set_client()
         return self._lazy_client
 
-    def embed(self, data: List[str]) -> List[List[float]]:
-        embed_text_details = oci.generative_ai_inference.models.EmbedTextDetails(
+    @property
+    def _transport(self) -> _OciAsyncTransport:
+        if self._lazy_transport is None:
+            self._lazy_transport = _OciAsyncTransport(self._client)
+        return self._lazy_transport
+
+    def _build_embed_text_details(self, data: List[str]) -> Any:
+        return oci.generative_ai_inference.models.EmbedTextDetails(
             inputs=data,
             compartment_id=self.compartment_id,
             serving_mode=oci.generative_ai_inference.models.OnDemandServingMode(
                 model_id=self._model_id
             ),
         )
-        response = self._embed_with_retry(embed_text_details)
+
+    def embed(self, data: List[str]) -> List[List[float]]:
+        response = self._embed_with_retry(self._build_embed_text_details(data))
         # Cast the embeddings to the expected return type (mainly for mypy)
         return cast(List[List[float]], response.data.embeddings)
 
     async def embed_async(self, data: List[str]) -> List[List[float]]:
-        return await run_sync_in_thread(self.embed, data)
+        response = await self._embed_with_retry_async(self._build_embed_text_details(data))
+        return cast(List[List[float]], response.data.embeddings)
 
     def _serialize_to_dict(self, serialization_context: "SerializationContext") -> Dict[str, Any]:
         # Store minimal information needed to recreate the embedding model
@@ -286,17 +297,26 @@ class OCIGenAIEmbeddingModel(EmbeddingModel, SerializableObject):
         )
 
     def _embed_with_retry(self, embed_text_details: Any) -> Any:
-        def _classify_embedding_retry_exception(
-            exc: Exception, policy: RetryPolicy
-        ) -> Optional[tuple[Optional[int], Optional[str]]]:
-            """Classify OCI embedding exceptions into retry metadata."""
-            if isinstance(exc, oci.exceptions.ServiceError):
-                return _classify_oci_service_error_for_retry(exc, policy)
-            return None
-
         return execute_sync_with_retry(
             lambda: self._client.embed_text(embed_text_details=embed_text_details),
             retry_policy=self.retry_policy,
             classify_exception=_classify_embedding_retry_exception,
             retry_budget_exhausted_message="OCI embedding retry budget exhausted",
         )
+
+    async def _embed_with_retry_async(self, embed_text_details: Any) -> Any:
+        return await execute_async_with_retry(
+            lambda: self._transport.embed_text(embed_text_details=embed_text_details),
+            retry_policy=self.retry_policy,
+            classify_exception=_classify_embedding_retry_exception,
+            retry_budget_exhausted_message="OCI embedding retry budget exhausted",
+        )
+
+
+def _classify_embedding_retry_exception(
+    exc: Exception, policy: RetryPolicy
+) -> Optional[tuple[Optional[int], Optional[str]]]:
+    """Classify OCI embedding exceptions into retry metadata."""
+    if isinstance(exc, oci.exceptions.ServiceError):
+        return _classify_oci_service_error_for_retry(exc, policy)
+    return None
@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional
 
 from wayflowcore._metadata import MetadataType
 from wayflowcore._utils.async_helpers import run_async_in_sync
+from wayflowcore.embeddingmodels._requestcoalescing import _EmbeddingRequestCoalescer
 from wayflowcore.embeddingmodels.embeddingmodel import EmbeddingModel
 from wayflowcore.models._requesthelpers import request_post_with_retries
 from wayflowcore.models.openaicompatiblemodel import _build_ssl_verification, _resolve_api_key
@@ -42,6 +43,14 @@ class OpenAICompatibleEmbeddingModel(EmbeddingModel, SerializableObject):
         The path to an optional client certificate chain file (PEM format).
     ca_file:
         The path to an optional trusted CA certificate file (PEM format) to verify the server.
+    max_coalescing_delay:
+        Opt-in coalescing of concurrent requests. When set, the texts of the requests made concurrently
+        (e.g. single queries of different conversations) are gathered for at most this many seconds,
+        then sent to the endpoint in a single batched request. A few milliseconds (e.g. ``0.005``)
+        are usually enough under load. If None, each request is sent on its own.
+    max_coalesced_batch_size:
+        Maximum number of texts of a coalesced request. A batch is sent as soon as it is full,
+        without waiting for ``max_coalescing_delay``. Ignored when coalescing is disabled.
     """
 
     def __init__(
@@ -57,7 +66,17 @@ class OpenAICompatibleEmbeddingModel(EmbeddingModel, SerializableObject):
         name: Optional[str] = None,
         description: Optional[str] = None,
         retry_policy: Optional[RetryPolicy] = None,
+        max_coalescing_delay: Optional[float] = None,
+        max_coalesced_batch_size: int = 64,
     ):
+        if max_coalescing_delay is not None and max_coalescing_delay < 0:
+            raise ValueError(
+                f"`max_coalescing_delay` should be non-negative, but was {max_coalescing_delay}"
+            )
+        if max_coalesced_batch_size < 1:
+            raise ValueError(
+                f"`max_coalesced_batch_size` should be at least 1, but was {max_coalesced_batch_size}"
+            )
         super().__init__(
             __metadata_info__=__metadata_info__,
             id=id,
@@ -76,6 +95,17 @@ class OpenAICompatibleEmbeddingModel(EmbeddingModel, SerializableObject):
             cert_file=cert_file,
             ca_file=ca_file,
         )
+        self.max_coalescing_delay = max_coalescing_delay
+        self.max_coalesced_batch_size = max_coalesced_batch_size
+        self._coalescer = (
+            _EmbeddingRequestCoalescer(
+                self._embed_batch_async,
+                max_delay=max_coalescing_delay,
+                max_batch_size=max_coalesced_batch_size,
+            )
+            if max_coalescing_delay is not None
+            else None
+        )
 
     def _get_headers(self) -> Dict[str, Any]:
         headers = {
@@ -89,6 +119,11 @@ class OpenAICompatibleEmbeddingModel(EmbeddingModel, SerializableObject):
         return run_async_in_sync(self.embed_async, data, method_name="embed_async")
 
     async def embed_async(self, data: List[str]) -> List[List[float]]:
+        if self._coalescer is not None:
+            return await self._coalescer.embed(data)
+        return await self._embed_batch_async(data)
+
+    async def _embed_batch_async(self, data: List[str]) -> List[List[float]]:
         url = (
             self._base_url
             if self._base_url.endswith("embeddings")
@@ -114,6 +149,8 @@ class OpenAICompatibleEmbeddingModel(EmbeddingModel, SerializableObject):
                 if self.retry_policy is not None
                 else None
             ),
+            "max_coalescing_delay": self.max_coalescing_delay,
+            "max_coalesced_batch_size": self.max_coalesced_batch_size,
             "name": self.name,
             "id": self.id,
             "description": self.description,
@@ -147,6 +184,8 @@ class OpenAICompatibleEmbeddingModel(EmbeddingModel, SerializableObject):
                 if retry_policy is not None
                 else None
             ),
+            max_coalescing_delay=input_dict.get("max_coalescing_delay"),
+            max_coalesced_batch_size=input_dict.get("max_coalesced_batch_size", 64),
         )
 
 
@@ -28,6 +28,10 @@ class OpenAIEmbeddingModel(OpenAICompatibleEmbeddingModel, SerializableObject):
     api_key:
         The API key for the service. If not provided, the value of the
         OPENAI_API_KEY environment variable will be used, if set.
+    max_coalescing_delay:
+        Opt-in coalescing of concurrent requests into batched requests. See ``OpenAICompatibleEmbeddingModel``.
+    max_coalesced_batch_size:
+        Maximum number of texts of a coalesced request. See ``OpenAICompatibleEmbeddingModel``.
 
     Examples
     --------
@@ -56,6 +60,8 @@ class OpenAIEmbeddingModel(OpenAICompatibleEmbeddingModel, SerializableObject):
         name: Optional[str] = None,
         description: Optional[str] = None,
         retry_policy: Optional[RetryPolicy] = None,
+        max_coalescing_delay: Optional[float] = None,
+        max_coalesced_batch_size: int = 64,
         _validate_api_key: bool = True,
     ):
         base_url = "https://api.openai.com"
@@ -68,6 +74,8 @@ class OpenAIEmbeddingModel(OpenAICompatibleEmbeddingModel, SerializableObject):
             name=name,
             description=description,
             retry_policy=retry_policy,
+            max_coalescing_delay=max_coalescing_delay,
+            max_coalesced_batch_size=max_coalesced_batch_size,
         )
 
         if api_key:
@@ -89,6 +97,8 @@ class OpenAIEmbeddingModel(OpenAICompatibleEmbeddingModel, SerializableObject):
                 if self.retry_policy is not None
                 else None
             ),
+            "max_coalescing_delay": self.max_coalescing_delay,
+            "max_coalesced_batch_size": self.max_coalesced_batch_size,
             "name": self.name,
             "id": self.id,
             "description": self.description,
@@ -118,5 +128,7 @@ class OpenAIEmbeddingModel(OpenAICompatibleEmbeddingModel, SerializableObject):
                 if retry_policy is not None
                 else None
             ),
+            max_coalescing_delay=input_dict.get("max_coalescing_delay"),
+            max_coalesced_batch_size=input_dict.get("max_coalesced_batch_size", 64),
             _validate_api_key=False,
         )
@@ -19,6 +19,11 @@ class VllmEmbeddingModel(OpenAICompatibleEmbeddingModel, SerializableObject):
         Both HTTP and HTTPS protocols are supported.
     model_id
         The name of the model to use on the server.
+    max_coalescing_delay
+        Opt-in coalescing of concurrent requests into batched requests, which vLLM serves much more
+        efficiently than many single-text requests. See ``OpenAICompatibleEmbeddingModel``.
+    max_coalesced_batch_size
+        Maximum number of texts of a coalesced request. See ``OpenAICompatibleEmbeddingModel``.
 
     Examples
     --------
@@ -28,6 +33,13 @@ class VllmEmbeddingModel(OpenAICompatibleEmbeddingModel, SerializableObject):
     >>> # Using HTTPS
     >>> secure_model = VllmEmbeddingModel(url="https://secure-vllm.example.com", model_id="hosted-model-name")  # doctest: +SKIP
     >>> embeddings = model.embed(["WayFlow is a framework to develop and run LLM-based assistants."])  # doctest: +SKIP
+    >>> # Coalescing the concurrent requests made within 5ms, up to 64 texts per request
+    >>> coalescing_model = VllmEmbeddingModel(
+    ...     base_url="http://localhost:8000",
+    ...     model_id="hosted-model-name",
+    ...     max_coalescing_delay=0.005,
+    ...     max_coalesced_batch_size=64,
+    ... )  # doctest: +SKIP
 
     Notes
     -----
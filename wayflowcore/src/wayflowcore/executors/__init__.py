@@ -3,3 +3,15 @@
 # This software is under the Apache License 2.0
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+from wayflowcore._utils.async_helpers import (
+    SyncExecutionMode,
+    get_sync_execution_mode,
+    set_sync_execution_mode,
+)
+
+__all__ = [
+    "SyncExecutionMode",
+    "get_sync_execution_mode",
+    "set_sync_execution_mode",
+]
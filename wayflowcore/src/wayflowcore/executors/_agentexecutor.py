@@ -7,8 +7,12 @@
 import logging
 import os
 import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import anyio
 
 from wayflowcore import Flow
 from wayflowcore._utils._templating_helpers import (
@@ -51,7 +55,7 @@ from wayflowcore.messagelist import Message, MessageList, MessageType
 from wayflowcore.ociagent import OciAgent
 from wayflowcore.planning import ExecutionPlan
 from wayflowcore.property import JsonSchemaParam, Property, StringProperty
-from wayflowcore.tools import ClientTool, Tool, ToolRequest, ToolResult
+from wayflowcore.tools import ClientTool, ServerTool, Tool, ToolRequest, ToolResult
 from wayflowcore.tools.tools import _descriptors_to_json_schema_map, _sanitize_tool_name
 from wayflowcore.tracing.span import AgentExecutionSpan
 
@@ -1061,6 +1065,119 @@ class AgentConversationExecutor(ConversationExecutor):
             should_yield = False
         return None, should_yield
 
+    @staticmethod
+    def _get_concurrent_server_tool(
+        config: Agent, state: AgentConversationExecutionState, tool_request: ToolRequest
+    ) -> Optional[ServerTool]:
+        """Returns the server tool to execute for the tool request if it can be executed concurrently
+        with other tool requests, otherwise ``None``."""
+        if tool_request.name in {
+            _SUBMIT_TOOL_NAME,
+            _TALK_TO_USER_TOOL_NAME,
+            EXIT_CONVERSATION_TOOL_NAME,
+        } or any(
+            tool_request.name == _sanitize_tool_name(component.name)
+            for component in [*config.agents, *config.flows]
+        ):
+            return None
+        tool = next(
+            (t for t in state.current_retrieved_tools or [] if t.name == tool_request.name), None
+        )
+        if not isinstance(tool, ServerTool) or tool.requires_confirmation:
+            return None
+        return tool
+
+    @staticmethod
+    def _pop_concurrent_tool_calls(
+        config: Agent, state: AgentConversationExecutionState
+    ) -> List[Tuple[ToolRequest, ServerTool]]:
+        """Pops the tool requests at the front of the queue that can be executed concurrently.
+        Returns an empty list (and leaves the queue untouched) if less than two requests can."""
+        if _get_max_concurrent_tool_calls(config) <= 1:
+            return []
+        tool_calls: List[Tuple[ToolRequest, ServerTool]] = []
+        for tool_request in state.tool_call_queue:
+            tool = AgentConversationExecutor._get_concurrent_server_tool(
+                config, state, tool_request
+            )
+            if tool is None:
+                break
+            tool_calls.append((tool_request, tool))
+        if len(tool_calls) < 2:
+            return []
+        del state.tool_call_queue[: len(tool_calls)]
+        return tool_calls
+
+    @staticmethod
+    async def _process_concurrent_tool_calls(
+        agent_config: Agent,
+        tool_calls: List[Tuple[ToolRequest, ServerTool]],
+        conversation: "AgentConversation",
+    ) -> Optional[ExecutionStatus]:
+        limiter = anyio.CapacityLimiter(_get_max_concurrent_tool_calls(agent_config))
+        tool_results: List[Optional[ToolResult]] = [None] * len(tool_calls)
+
+        async def _run_tool(idx: int, tool_request: ToolRequest, tool: ServerTool) -> None:
+            async with limiter:
+                logger.debug(
+                    'Agent executing tool "%s" (id=%s) concurrently with arguments: %s',
+                    tool_request.name,
+                    tool_request.tool_request_id,
+                    tool_request.args,
+                )
+                _normalize_tool_request_args(tool_request, tool.parameters)
+                tool_results[idx] = await tool._run(
+                    conversation,
+                    tool_request,
+                    append_message=False,
+                    raise_exceptions=agent_config.raise_exceptions,
+                )
+
+        async with anyio.create_task_group() as tg:
+            for idx, (tool_request, tool) in enumerate(tool_calls):
+                tg.start_soon(_run_tool, idx, tool_request, tool)
+
+        # Results are appended in the order of the requests, not of completion. The requests
+        # interrupted for authentication are put back in the queue to be executed again once the
+        # authentication is completed
+        agent_state = conversation.state
+        interrupted_tool_requests: List[ToolRequest] = []
+        auth_status: Optional[ExecutionStatus] = None
+        raised_exception: Optional[Exception] = None
+        failed_tool_name = ""
+        for (tool_request, tool), tool_result in zip(tool_calls, tool_results):
+            if tool_result is None:
+                raise ValueError("Internal error: server tools should always return a result")
+            if isinstance(tool_result.content, AuthInterrupt):
+                interrupted_tool_requests.append(tool_request)
+                auth_status = auth_status or tool_result.content.status
+                continue
+            tool._append_tool_result_message(
+                conversation, tool_result, raise_exceptions=agent_config.raise_exceptions
+            )
+            if isinstance(tool_result.content, Exception) and raised_exception is None:
+                raised_exception = tool_result.content
+                failed_tool_name = tool.name
+
+        if raised_exception is not None and agent_config.raise_exceptions:
+            agent_state.tool_call_queue[:0] = interrupted_tool_requests
+            logger.info(
+                f"Tool `{failed_tool_name}` raised an error during exception, the current tool requests will be cleaned before raising the error."
+            )
+            AgentConversationExecutor._clear_tool_queue_state_before_raising_error(
+                state=agent_state,
+                tool_name=failed_tool_name,
+                messages=conversation.message_list,
+                config=agent_config,
+            )
+            raise raised_exception
+
+        if auth_status is not None:
+            agent_state.current_tool_request = interrupted_tool_requests[0]
+            agent_state.tool_call_queue[:0] = interrupted_tool_requests[1:]
+            return auth_status
+        return None
+
     @staticmethod
     async def _execute_agent(
         conversation: "AgentConversation",
@@ -1099,7 +1216,21 @@ class AgentConversationExecutor(ConversationExecutor):
                 agent_state.current_tool_request = None
 
             elif len(agent_state.tool_call_queue) > 0:
-                agent_state._get_current_tool_request()
+                concurrent_tool_calls = AgentConversationExecutor._pop_concurrent_tool_calls(
+                    agent_config, agent_state
+                )
+                if concurrent_tool_calls:
+                    execution_status = (
+                        await AgentConversationExecutor._process_concurrent_tool_calls(
+                            agent_config=agent_config,
+                            tool_calls=concurrent_tool_calls,
+                            conversation=conversation,
+                        )
+                    )
+                    if execution_status is not None:
+                        return execution_status
+                else:
+                    agent_state._get_current_tool_request()
             elif agent_state.curr_iter >= agent_config.max_iterations:
                 if len(agent_config.output_descriptors) > 0:
                     # need to generate some outputs
@@ -1260,6 +1391,28 @@ class AgentConversationExecutor(ConversationExecutor):
         return agent_outputs
 
 
+_CONCURRENT_TOOL_CALLS_ENABLED: ContextVar[bool] = ContextVar(
+    "_CONCURRENT_TOOL_CALLS_ENABLED", default=True
+)
+
+
+@contextmanager
+def _sequential_tool_calls() -> Iterator[None]:
+    """Executes the tool requests of agents sequentially in this context, whatever their
+    ``max_concurrent_tool_calls``."""
+    token = _CONCURRENT_TOOL_CALLS_ENABLED.set(False)
+    try:
+        yield
+    finally:
+        _CONCURRENT_TOOL_CALLS_ENABLED.reset(token)
+
+
+def _get_max_concurrent_tool_calls(agent_config: Agent) -> int:
+    if not _CONCURRENT_TOOL_CALLS_ENABLED.get():
+        return 1
+    return agent_config.max_concurrent_tool_calls
+
+
 def _convert_talk_to_user_tool_call_into_agent_message(
     agent_config: Agent, tool_request: ToolRequest, conversation: "AgentConversation"
 ) -> bool:
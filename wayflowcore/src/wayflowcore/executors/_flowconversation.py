@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
 from wayflowcore.contextproviders import ContextProvider
 from wayflowcore.conversation import Conversation
-from wayflowcore.executors._flowexecutor import FlowConversationExecutionState
+from wayflowcore.executors._flowexecutor import _CONCURRENT_STEP, FlowConversationExecutionState
 from wayflowcore.flow import Flow
 from wayflowcore.variable import Variable
 
@@ -171,6 +171,10 @@ class FlowConversation(Conversation):
 
     @property
     def current_step_name(self) -> str:
+        # steps executed concurrently each see their own name
+        concurrent_step = _CONCURRENT_STEP.get()
+        if concurrent_step is not None and concurrent_step[0] is self.state:
+            return concurrent_step[1]
         return self.state.current_step_name or "None"
 
     @property
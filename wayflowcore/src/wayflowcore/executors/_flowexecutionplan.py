@@ -0,0 +1,129 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple
+
+if TYPE_CHECKING:
+    from wayflowcore.contextproviders import ContextProvider
+    from wayflowcore.controlconnection import ControlFlowEdge
+    from wayflowcore.dataconnection import DataFlowEdge
+    from wayflowcore.executors._flowexecutor import _IoKeyType
+    from wayflowcore.steps.step import Step
+
+
+@dataclass(frozen=True)
+class _FlowExecutionPlan:
+    """
+    Immutable lookup tables compiled once from the steps and edges of a flow, so that the flow
+    executor does not scan all the edges of the flow at every step.
+
+    Steps are indexed by identity (``id``), since steps do not implement equality.
+    """
+
+    step_names_by_id: Mapping[int, str]
+    """Name of each step of the flow, indexed by the ``id`` of the step"""
+    outgoing_data_edges: Mapping[str, Mapping[str, Tuple["_IoKeyType", ...]]]
+    """For each source step name and each of its outputs, the I/O dict keys the output is pushed to"""
+    next_step_names: Mapping[str, Mapping[str, Optional[str]]]
+    """For each step name, the name of the next step for each of its branches"""
+    context_providers: Mapping["_IoKeyType", "ContextProvider"]
+    """Context provider connected to each (destination step name, destination input name)"""
+    inputs_from_start_step: Mapping[str, FrozenSet[str]]
+    """Names of the inputs of each step that are connected to the start step of the flow"""
+
+    @staticmethod
+    def compile(
+        steps: Mapping[str, "Step"],
+        begin_step_name: str,
+        control_flow_edges: Sequence["ControlFlowEdge"],
+        data_flow_edges: Sequence["DataFlowEdge"],
+    ) -> "_FlowExecutionPlan":
+        from wayflowcore.contextproviders import ContextProvider
+
+        step_names_by_id = {id(step): step_name for step_name, step in steps.items()}
+
+        def _get_step_name(step: "Step") -> str:
+            if id(step) not in step_names_by_id:
+                raise ValueError(f"Could not find a name for the step '{step}'")
+            return step_names_by_id[id(step)]
+
+        next_step_names: Dict[str, Dict[str, Optional[str]]] = {}
+        for control_flow_edge in control_flow_edges:
+            branches = next_step_names.setdefault(_get_step_name(control_flow_edge.source_step), {})
+            # if several edges share a branch, the first one is used, as when scanning the edges
+            branches.setdefault(
+                control_flow_edge.source_branch,
+                (
+                    _get_step_name(control_flow_edge.destination_step)
+                    if control_flow_edge.destination_step is not None
+                    else None
+                ),
+            )
+
+        outgoing_data_edges: Dict[str, Dict[str, List["_IoKeyType"]]] = {}
+        context_providers: Dict["_IoKeyType", ContextProvider] = {}
+        inputs_from_start_step: Dict[str, Set[str]] = {}
+        begin_step = steps[begin_step_name]
+        for data_flow_edge in data_flow_edges:
+            destination_step_name = _get_step_name(data_flow_edge.destination_step)
+            io_key = (destination_step_name, data_flow_edge.destination_input)
+            if isinstance(data_flow_edge.source_step, ContextProvider):
+                context_providers.setdefault(io_key, data_flow_edge.source_step)
+                continue
+            source_step_name = _get_step_name(data_flow_edge.source_step)
+            outgoing_data_edges.setdefault(source_step_name, {}).setdefault(
+                data_flow_edge.source_output, []
+            ).append(io_key)
+            if data_flow_edge.source_step is begin_step:
+                inputs_from_start_step.setdefault(destination_step_name, set()).add(
+                    data_flow_edge.destination_input
+                )
+
+        return _FlowExecutionPlan(
+            step_names_by_id=MappingProxyType(step_names_by_id),
+            outgoing_data_edges=MappingProxyType(
+                {
+                    step_name: MappingProxyType(
+                        {output_name: tuple(keys) for output_name, keys in outputs.items()}
+                    )
+                    for step_name, outputs in outgoing_data_edges.items()
+                }
+            ),
+            next_step_names=MappingProxyType(
+                {
+                    step_name: MappingProxyType(branches)
+                    for step_name, branches in next_step_names.items()
+                }
+            ),
+            context_providers=MappingProxyType(context_providers),
+            inputs_from_start_step=MappingProxyType(
+                {
+                    step_name: frozenset(input_names)
+                    for step_name, input_names in inputs_from_start_step.items()
+                }
+            ),
+        )
+
+    def get_next_step_name(self, step_name: str, branch_taken: str) -> Optional[str]:
+        from wayflowcore.steps.step import Step
+
+        if branch_taken == Step.BRANCH_SELF:
+            return step_name
+
+        branches = self.next_step_names.get(step_name)
+        # There's no control flow edge going out of the current step
+        # Since we assume the Flow to be valid, this must be a CompleteStep
+        if branches is None:
+            return None
+
+        if branch_taken not in branches:
+            raise ValueError(
+                f"Step '{step_name}' completed with branch '{branch_taken}' which is not part"
+                f" of the configured control flow edges: {list(branches)}"
+            )
+        return branches[branch_taken]
@@ -9,9 +9,12 @@ from __future__ import annotations
 import dataclasses
 import logging
 import warnings
+from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, cast
 
+import anyio
+
 from wayflowcore._utils.async_helpers import run_async_in_sync
 from wayflowcore.conversation import Conversation
 from wayflowcore.dataconnection import DataFlowEdge
@@ -43,13 +46,14 @@ from wayflowcore.property import (
 )
 from wayflowcore.serialization.serializer import SerializableObject
 from wayflowcore.steps import CompleteStep
-from wayflowcore.steps.step import Step, StepExecutionStatus
+from wayflowcore.steps.step import Step, StepExecutionStatus, StepResult
 from wayflowcore.tracing.span import FlowExecutionSpan
 
 if TYPE_CHECKING:
     from wayflowcore.contextproviders import ContextProvider
     from wayflowcore.controlconnection import ControlFlowEdge
     from wayflowcore.executors._flowconversation import FlowConversation
+    from wayflowcore.executors._flowexecutionplan import _FlowExecutionPlan
     from wayflowcore.executors.interrupts.executioninterrupt import ExecutionInterrupt
     from wayflowcore.flow import Flow
     from wayflowcore.serialization.context import DeserializationContext, SerializationContext
@@ -62,6 +66,11 @@ _IoKeyType = Tuple[str, str]
 
 _IO_KEY_SEP = "#$#$#$"
 
+_CONCURRENT_STEP: ContextVar[Optional[Tuple["FlowConversationExecutionState", str]]] = ContextVar(
+    "_CONCURRENT_STEP", default=None
+)
+"""State of the flow conversation and name of the step being executed concurrently in this context"""
+
 
 @dataclass
 class FlowConversationExecutionState(ConversationExecutionState):
@@ -355,30 +364,19 @@ class FlowConversationExecutor(ConversationExecutor):
     def _push_step_output_values_to_io_dict(
         io_value_dict: Dict[_IoKeyType, Any],
         source_step_name: str,
-        data_flow_edges: List[DataFlowEdge],
-        steps: Dict[str, "Step"],
+        execution_plan: "_FlowExecutionPlan",
         outputs: Dict[str, Any],
     ) -> None:
         """
         Given a source step name and step outputs, pushes the outputs to the destination
-        steps using the list of data flow edges.
+        steps using the data flow edges compiled in the execution plan of the flow.
         """
-        for data_flow_edge in data_flow_edges:
-            if data_flow_edge.source_step is steps[source_step_name]:
-                destination_step_name = next(
-                    (
-                        step_name
-                        for step_name, s in steps.items()
-                        if s is data_flow_edge.destination_step
-                    ),
-                    None,
-                )
-                if destination_step_name is None:
-                    raise ValueError(
-                        f"Could not find a name for the step '{data_flow_edge.destination_step}'"
-                    )
-                io_key = (destination_step_name, data_flow_edge.destination_input)
-                io_value_dict[io_key] = outputs.get(data_flow_edge.source_output)
+        for source_output, io_keys in execution_plan.outgoing_data_edges.get(
+            source_step_name, {}
+        ).items():
+            output_value = outputs.get(source_output)
+            for io_key in io_keys:
+                io_value_dict[io_key] = output_value
 
     @staticmethod
     def _push_step_outputs_to_flow_outputs(
@@ -413,9 +411,8 @@ class FlowConversationExecutor(ConversationExecutor):
             raise ValueError("Can't get value for `None` step")
 
         # 1. Collect the value from a Context Provider, I/O dict or default value
-        context_provider = FlowConversationExecutor._get_context_provider_or_none_for_step(
-            state.flow.steps[current_step_name], value_name, state.flow.data_flow_edges
-        )
+        execution_plan = state.flow._execution_plan
+        context_provider = execution_plan.context_providers.get((current_step_name, value_name))
         if context_provider is None:
             context_provider = FlowConversationExecutor._find_context_provider_from_conversation(
                 conversation, value_descriptor.name
@@ -432,18 +429,9 @@ class FlowConversationExecutor(ConversationExecutor):
             # As a temporary solution, we check that the output is coming from the StartStep
             # (i.e., it's an input of the flow), and if that's the case, we do not raise the exception,
             # but we will give precedence to the context provider output value instead.
-            _start_step = state.flow.steps[state.flow.begin_step_name]
-            _current_step = state.flow.steps[current_step_name]
-            data_flow_edges_connecting_start_step_to_current_step = list(
-                data_flow_edge
-                for data_flow_edge in state.flow.data_flow_edges
-                if _start_step is data_flow_edge.source_step
-                and _current_step is data_flow_edge.destination_step
+            input_names_connected_to_start_steps = execution_plan.inputs_from_start_step.get(
+                current_step_name, frozenset()
             )
-            input_names_connected_to_start_steps = {
-                data_flow_edge.destination_input
-                for data_flow_edge in data_flow_edges_connecting_start_step_to_current_step
-            }
             if value_descriptor.name not in input_names_connected_to_start_steps:
                 raise ValueError(
                     f"Found the name: '{value_descriptor.name}' corresponding to both a context provider "
@@ -742,6 +730,15 @@ class FlowConversationExecutor(ConversationExecutor):
 
             while flow_state.current_step_name is not None:
 
+                concurrent_step_names = flow_state.flow._concurrent_step_groups.get(
+                    flow_state.current_step_name
+                )
+                if concurrent_step_names is not None:
+                    await FlowConversationExecutor._execute_concurrent_steps(
+                        conversation, concurrent_step_names
+                    )
+                    continue
+
                 record_event(
                     FlowExecutionIterationStartedEvent(
                         execution_state=conversation.state,
@@ -821,11 +818,8 @@ class FlowConversationExecutor(ConversationExecutor):
                             conversation.status = last_status
                             return last_status
 
-                next_step_name = FlowConversationExecutor.get_next_step_name_from_branch(
-                    control_flow_edges=flow_state.flow.control_flow_edges,
-                    current_step_name=flow_state.current_step_name,
-                    steps=flow_state.flow.steps,
-                    branch_taken=branch_name,
+                next_step_name = flow_state.flow._execution_plan.get_next_step_name(
+                    flow_state.current_step_name, branch_name
                 )
 
                 # make sure that after yielding or being interrupted we will come back to same step
@@ -846,8 +840,7 @@ class FlowConversationExecutor(ConversationExecutor):
                 FlowConversationExecutor._push_step_output_values_to_io_dict(
                     io_value_dict=flow_state.input_output_key_values,
                     source_step_name=flow_state.current_step_name,
-                    data_flow_edges=flow_state.flow.data_flow_edges,
-                    steps=flow_state.flow.steps,
+                    execution_plan=flow_state.flow._execution_plan,
                     outputs=sanitized_outputs,
                 )
 
@@ -921,6 +914,129 @@ class FlowConversationExecutor(ConversationExecutor):
             _conversation_id=conversation.id,
         )
 
+    @staticmethod
+    async def _execute_concurrent_steps(
+        conversation: "FlowConversation", step_names: List[str]
+    ) -> None:
+        """
+        Executes a group of consecutive independent steps concurrently.
+
+        The flow iteration start events of all steps are recorded before starting any of them, so
+        that execution interrupts are checked before the group runs. If an interrupt is triggered at
+        one of the steps, only the steps before it are executed and the flow resumes from the
+        interrupted step, like a sequential execution would. The inputs of the started steps are
+        then gathered (the steps do not depend on each other) and the steps run in a task group
+        bounded by the ``max_concurrent_steps`` of the flow.
+        Once they are all done, their results are applied in the order of the control flow, so the
+        step history and the I/O dictionary updates are deterministic. If some steps failed, the
+        steps before the first failing one are applied and the exception of the failing step is
+        raised.
+        """
+        flow_state = conversation.state
+        flow = flow_state.flow
+
+        interruption: Optional[ExecutionInterruptedException] = None
+        started_step_names: List[str] = []
+        for step_name in step_names:
+            flow_state.current_step_name = step_name
+            try:
+                record_event(FlowExecutionIterationStartedEvent(execution_state=flow_state))
+            except ExecutionInterruptedException as e:
+                interruption = e
+                break
+            started_step_names.append(step_name)
+
+        if interruption is not None and not started_step_names:
+            raise interruption
+
+        steps = [flow.steps[step_name] for step_name in started_step_names]
+        all_step_inputs: List[Dict[str, Any]] = []
+        for step_name, step in zip(started_step_names, steps):
+            flow_state.current_step_name = step_name
+            all_step_inputs.append(
+                await FlowConversationExecutor._gather_step_inputs_async(
+                    conversation, flow_state, step
+                )
+            )
+        flow_state.current_step_name = started_step_names[0]
+
+        limiter = anyio.CapacityLimiter(flow.max_concurrent_steps)
+        step_results: List[Optional[StepResult]] = [None] * len(steps)
+        step_exceptions: List[Optional[Exception]] = [None] * len(steps)
+
+        async def _run_step(idx: int) -> None:
+            async with limiter:
+                token = _CONCURRENT_STEP.set((flow_state, started_step_names[idx]))
+                try:
+                    logger.debug(
+                        'Invoking "%s" (%s) concurrently - inputs %s',
+                        started_step_names[idx],
+                        steps[idx],
+                        all_step_inputs[idx],
+                    )
+                    step_results[idx] = await steps[idx].invoke_async(
+                        inputs=all_step_inputs[idx],
+                        conversation=conversation,
+                    )
+                except Exception as e:
+                    step_exceptions[idx] = e
+                finally:
+                    _CONCURRENT_STEP.reset(token)
+
+        async with anyio.create_task_group() as tg:
+            for idx in range(len(steps)):
+                tg.start_soon(_run_step, idx)
+
+        for step_name, step, step_result, step_exception in zip(
+            started_step_names, steps, step_results, step_exceptions
+        ):
+            flow_state.current_step_name = step_name
+            flow_state.step_history.append(step_name)
+
+            if step_exception is not None:
+                raise step_exception
+            if step_result is None:
+                raise ValueError(f"Internal error: step {step_name} did not return any result")
+            if (
+                step_result.step_type != StepExecutionStatus.PASSTHROUGH
+                or step_result.branch_name != Step.BRANCH_NEXT
+            ):
+                raise ValueError(
+                    f'The step "{step_name}" was executed concurrently but returned the branch '
+                    f"`{step_result.branch_name}` with status `{step_result.step_type}`. Steps "
+                    f"supporting concurrent execution should always continue to their next step."
+                )
+
+            sanitized_outputs = FlowConversationExecutor._writeback_step_outputs(
+                step_result.outputs, step, False, step_name
+            )
+            FlowConversationExecutor._push_step_output_values_to_io_dict(
+                io_value_dict=flow_state.input_output_key_values,
+                source_step_name=step_name,
+                execution_plan=flow._execution_plan,
+                outputs=sanitized_outputs,
+            )
+            FlowConversationExecutor._push_step_outputs_to_flow_outputs(
+                state=flow_state,
+                outputs=sanitized_outputs,
+            )
+
+            flow_state.current_step_name = flow._execution_plan.get_next_step_name(
+                step_name, step_result.branch_name
+            )
+            logger.debug("Next step `%s`", flow_state.current_step_name)
+
+            # all the steps of the group already ran, so an interrupt triggered at the end of one
+            # of them is only raised once the results of the whole group are applied
+            try:
+                record_event(FlowExecutionIterationFinishedEvent(execution_state=flow_state))
+            except ExecutionInterruptedException as e:
+                if interruption is None:
+                    interruption = e
+
+        if interruption is not None:
+            raise interruption
+
     @staticmethod
     def get_all_sub_conversations(
         state: FlowConversationExecutionState,
@@ -53,6 +53,13 @@ class SoftTokenLimitExecutionInterrupt(
         - It does not interrupt the execution of a tool
         - It does not interrupt LLM models during generation
 
+        The token usage of the conversation is read from the ``token_usage_store`` of the LLMs.
+        The store must track the token usage of individual conversations, so models using an
+        :class:`~wayflowcore.models.AggregatedTokenUsageStore` are rejected. With the default
+        :class:`~wayflowcore.models.InMemoryTokenUsageStore`, the token usage of a conversation
+        evicted from the store (see its ``max_conversations`` and ``conversation_ttl`` parameters)
+        restarts from 0, so the limit only applies to the tokens generated after the eviction.
+
         Parameters
         ----------
         tokens_per_model:
@@ -105,22 +112,18 @@ class SoftTokenLimitExecutionInterrupt(
         self.total_tokens = total_tokens
         self.tokens_per_model = tokens_per_model or dict()
         self.all_models = all_models or list()
+        for llm in [*self.tokens_per_model, *self.all_models]:
+            if not llm.token_usage_store._tracks_conversation_token_usage:
+                raise ValueError(
+                    f"The token usage store of the model {llm.model_id} is a "
+                    f"`{llm.token_usage_store.__class__.__name__}`, which does not track the token "
+                    "usage of individual conversations. Use an `InMemoryTokenUsageStore` instead."
+                )
 
         super().__init__(__metadata_info__=__metadata_info__)
 
     def _get_token_usage_from_llm(self, llm: LlmModel, conversation_id: str) -> int:
-        return (
-            sum(
-                token_usage.output_tokens
-                for token_usage in llm.token_usages_flow[conversation_id].values()
-            )
-            if conversation_id in llm.token_usages_flow
-            else 0
-        ) + (
-            llm.token_usages_flexible[conversation_id].output_tokens
-            if conversation_id in llm.token_usages_flexible
-            else 0
-        )
+        return llm.get_total_token_consumption(conversation_id).output_tokens
 
     def _return_status_if_condition_is_met(
         self, state: ConversationExecutionState, conversation: "Conversation"
@@ -32,6 +32,7 @@ from wayflowcore.contextproviders.toolcontextprovider import (
 from wayflowcore.controlconnection import ControlFlowEdge
 from wayflowcore.conversationalcomponent import ConversationalComponent
 from wayflowcore.dataconnection import DataFlowEdge
+from wayflowcore.executors._flowexecutionplan import _FlowExecutionPlan
 from wayflowcore.idgeneration import IdGenerator
 from wayflowcore.messagelist import MessageList
 from wayflowcore.property import (
@@ -479,6 +480,7 @@ class Flow(ConversationalComponent, SerializableObject):
         flow_id: Optional[str] = None,
         input_descriptors: Optional[List[Property]] = None,
         output_descriptors: Optional[List[Property]] = None,
+        max_concurrent_steps: int = 1,
         __metadata_info__: Optional[MetadataType] = None,
         # deprecated
         transitions: Optional[
@@ -569,6 +571,13 @@ class Flow(ConversationalComponent, SerializableObject):
                 by ``name`` against them to check that types can be casted from one another, raising an error if they can't.
                 If some expected descriptors are missing from the ``output_descriptors`` (i.e. you forgot to specify one),
                 a warning will be raised and the flow is not guaranteed to work properly.
+        max_concurrent_steps:
+            Maximum number of steps the flow can execute concurrently. Defaults to 1, which executes the
+            steps one after the other. When larger, consecutive steps that do not depend on each other
+            (no data flow edge between them) and that support concurrent execution (e.g. a ``PromptExecutionStep``
+            that does not post its message to the conversation) are executed concurrently. The step history,
+            the flow iteration events and the outputs are recorded in the order of the control flow edges,
+            as if the steps were executed sequentially.
 
         Examples
         --------
@@ -600,6 +609,11 @@ class Flow(ConversationalComponent, SerializableObject):
         """
         from wayflowcore.executors._flowexecutor import FlowConversationExecutor
 
+        if max_concurrent_steps < 1:
+            raise ValueError(
+                f"`max_concurrent_steps` should be at least 1, but was {max_concurrent_steps}"
+            )
+
         if steps is None:
             if control_flow_edges is None:
                 raise ValueError(
@@ -827,6 +841,14 @@ class Flow(ConversationalComponent, SerializableObject):
             input_mapping_to_io_value_keys
         )
 
+        # The flow is static, so the lookup tables used by the executor are compiled once
+        self._execution_plan = _FlowExecutionPlan.compile(
+            steps=steps,
+            begin_step_name=begin_step_name,
+            control_flow_edges=control_flow_edges,
+            data_flow_edges=data_flow_edges,
+        )
+
         # We are assuming the flow is static to be able to precompute this
         # if that ever changes, we would need to recompute it when it changes
         self._might_yield: bool = any(step.might_yield for step in self.steps.values())
@@ -839,6 +861,13 @@ class Flow(ConversationalComponent, SerializableObject):
 
         self._check_step_outputs_and_context_provider_collisions()
 
+        # The flow is static, so the groups of steps that can be executed concurrently are computed once.
+        # They are indexed by the name of the first step of the group
+        self.max_concurrent_steps = max_concurrent_steps
+        self._concurrent_step_groups: Dict[str, List[str]] = (
+            self._compute_concurrent_step_groups() if max_concurrent_steps > 1 else {}
+        )
+
         self.executor = FlowConversationExecutor()
         # Dictionary of files available in this conversation
         self._files: Dict[str, Path] = {}
@@ -1318,6 +1347,9 @@ class Flow(ConversationalComponent, SerializableObject):
             "description": self.description,
         }
 
+        if self.max_concurrent_steps != 1:
+            serialized_flow_dict["max_concurrent_steps"] = self.max_concurrent_steps
+
         if len(self.context_providers) > 0:
             serialized_flow_dict["context_providers"] = [
                 serialize_to_dict(context_prov, serialization_context)
@@ -1418,6 +1450,7 @@ class Flow(ConversationalComponent, SerializableObject):
             data_flow_edges=data_flow_edges,
             name=input_dict.get("name", None),
             description=input_dict.get("description", ""),
+            max_concurrent_steps=input_dict.get("max_concurrent_steps", 1),
             __metadata_info__=input_dict.get("__metadata_info__", None),
         )
 
@@ -1624,6 +1657,52 @@ class Flow(ConversationalComponent, SerializableObject):
     def _get_step(self, step_name: str) -> "Step":
         return self.steps[step_name]
 
+    def _compute_concurrent_step_groups(self) -> Dict[str, List[str]]:
+        """
+        Computes the chains of consecutive steps that can be executed concurrently.
+
+        A step can join a chain if it supports concurrent execution, cannot yield, has a single
+        ``next`` branch, and does not consume the outputs of a step already in the chain. Only chains
+        of at least two steps are returned, indexed by their first step name.
+        """
+        from wayflowcore.steps.step import Step
+
+        execution_plan = self._execution_plan
+
+        def _can_join_group(step_name: str) -> bool:
+            step = self.steps[step_name]
+            return (
+                step._can_be_executed_concurrently
+                and not step.might_yield
+                and step.get_branches() == [Step.BRANCH_NEXT]
+                and list(execution_plan.next_step_names.get(step_name, {})) == [Step.BRANCH_NEXT]
+            )
+
+        dependencies: Dict[str, Set[str]] = {step_name: set() for step_name in self.steps}
+        for source_step_name, outputs in execution_plan.outgoing_data_edges.items():
+            for io_keys in outputs.values():
+                for destination_step_name, _ in io_keys:
+                    dependencies[destination_step_name].add(source_step_name)
+
+        concurrent_step_groups: Dict[str, List[str]] = {}
+        for step_name in self.steps:
+            if not _can_join_group(step_name):
+                continue
+            group = [step_name]
+            while True:
+                next_step_name = execution_plan.next_step_names[group[-1]][Step.BRANCH_NEXT]
+                if (
+                    next_step_name is None
+                    or next_step_name in group
+                    or not _can_join_group(next_step_name)
+                    or not dependencies[next_step_name].isdisjoint(group)
+                ):
+                    break
+                group.append(next_step_name)
+            if len(group) > 1:
+                concurrent_step_groups[step_name] = group
+        return concurrent_step_groups
+
     @staticmethod
     def from_steps(
         steps: List["Step"],
@@ -1636,6 +1715,7 @@ class Flow(ConversationalComponent, SerializableObject):
         description: str = "",
         input_descriptors: Optional[List[Property]] = None,
         output_descriptors: Optional[List[Property]] = None,
+        max_concurrent_steps: int = 1,
     ) -> "Flow":
         """Helper method to create a sequential flow from a list of steps. Each step will be executed in the order
         they are passed.
@@ -1662,6 +1742,8 @@ class Flow(ConversationalComponent, SerializableObject):
             Input descriptors of the flow
         output_descriptors:
             Output descriptors of the flow
+        max_concurrent_steps:
+            Maximum number of independent consecutive steps executed concurrently
 
         Examples
         --------
@@ -1721,6 +1803,7 @@ class Flow(ConversationalComponent, SerializableObject):
             description=description,
             output_descriptors=output_descriptors,
             input_descriptors=input_descriptors,
+            max_concurrent_steps=max_concurrent_steps,
         )
 
     def clone(self, name: str, description: str) -> "Flow":
@@ -1735,6 +1818,7 @@ class Flow(ConversationalComponent, SerializableObject):
             name=name,
             description=description,
             flow_id=self.flow_id,
+            max_concurrent_steps=self.max_concurrent_steps,
         )
 
     def as_client_tool(self) -> "ClientTool":
@@ -168,6 +168,28 @@ class TextContent(MessageContent, SerializableObject):
         self.logprobs = validated
 
 
+class _StreamingTextContent(TextContent):
+    """
+    Text content of a message being streamed. Streamed fragments are only joined when the content
+    is read, so that accumulating a long stream does not copy the whole text on every chunk.
+    """
+
+    _fragments: List[str]
+
+    @property  # type: ignore[override]
+    def content(self) -> str:
+        if len(self._fragments) != 1:
+            self._fragments = ["".join(self._fragments)]
+        return self._fragments[0]
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._fragments = [value]
+
+    def _append(self, fragment: str) -> None:
+        self._fragments.append(fragment)
+
+
 @dataclass
 class ImageContent(MessageContent, SerializableObject):
     """
@@ -602,6 +624,37 @@ class Message(SerializableDataclass):
             raise ValueError("Message.tool_results should be of type ToolResult")
 
 
+def _get_streaming_text_content(message: Message) -> _StreamingTextContent:
+    """Returns the last text content of a message, converted to a streaming text content if needed."""
+    for content_idx in range(len(message.contents) - 1, -1, -1):
+        content = message.contents[content_idx]
+        if isinstance(content, _StreamingTextContent):
+            return content
+        if isinstance(content, TextContent):
+            streaming_content = _StreamingTextContent(
+                content=content.content, logprobs=content.logprobs
+            )
+            message.contents[content_idx] = streaming_content
+            return streaming_content
+    streaming_content = _StreamingTextContent(content="")
+    message.contents.append(streaming_content)
+    return streaming_content
+
+
+def _finish_streaming_text_contents(message: Message) -> None:
+    """Converts the streaming text contents of a message back to regular text contents."""
+    if not any(isinstance(content, _StreamingTextContent) for content in message.contents):
+        return
+    message.contents = [
+        (
+            TextContent(content=content.content, logprobs=content.logprobs)
+            if isinstance(content, _StreamingTextContent)
+            else content
+        )
+        for content in message.contents
+    ]
+
+
 def _prettify_tool_request(tool_request: ToolRequest) -> str:
     return f"ToolRequest(name={tool_request.name}, args={tool_request.args}, tool_request_id={tool_request.id})"
 
@@ -761,14 +814,7 @@ class MessageList(SerializableDataclass):
         if len(self.messages) == 0:
             raise ValueError("No message to update")
         if append_only:
-            last_message = self.messages[-1]
-            last_text_chunk = next(
-                iter(m for m in last_message.contents[::-1] if isinstance(m, TextContent)), None
-            )
-            if last_text_chunk is None:
-                last_text_chunk = TextContent(content="")
-                last_message.contents.append(last_text_chunk)
-            last_text_chunk.content += new_message.content
+            _get_streaming_text_content(self.messages[-1])._append(new_message.content)
         else:
             self._update_last_message_fields(
                 {field.name: getattr(new_message, field.name) for field in fields(new_message)}
@@ -788,41 +834,48 @@ class MessageList(SerializableDataclass):
         from wayflowcore.models import StreamChunkType
         from wayflowcore.tracing.span import ConversationMessageStreamSpan
 
-        full_streamed_message = ""
+        streamed_fragments: List[str] = []
         new_message = None
         streaming_span: Optional[ConversationMessageStreamSpan] = None
-        async for chunk in stream:
-            chunk_type, content_chunk = chunk
-            if chunk_type == StreamChunkType.IGNORED or content_chunk is None:
-                pass
-            elif chunk_type == StreamChunkType.START_CHUNK:
-                full_streamed_message += content_chunk.content
-                self.messages.append(content_chunk)
-                streaming_span = ConversationMessageStreamSpan(
-                    message_list=self,
-                    initial_message=content_chunk,
-                )
-                streaming_span.start()
-            elif chunk_type == StreamChunkType.TEXT_CHUNK:
-                self._update_last_message(content_chunk, append_only=True)
-                if content_chunk.content:
-                    full_streamed_message += content_chunk.content
-                    record_event(ConversationMessageStreamChunkEvent(chunk=content_chunk.content))
-            elif chunk_type == StreamChunkType.END_CHUNK:
-                new_message = content_chunk
-                self._update_last_message(content_chunk, append_only=False)
-                if streaming_span is not None:
-                    streaming_span.record_end_span_event(message=content_chunk)
-                    streaming_span.end()
-                record_event(
-                    ConversationMessageAddedEvent(message=self.messages[-1], streamed=True)
-                )
-                if full_streamed_message != new_message.content:
-                    logger.debug(
-                        'The content streamed "%s" is different than the final content "%s"',
-                        full_streamed_message,
-                        new_message.content,
+        try:
+            async for chunk in stream:
+                chunk_type, content_chunk = chunk
+                if chunk_type == StreamChunkType.IGNORED or content_chunk is None:
+                    pass
+                elif chunk_type == StreamChunkType.START_CHUNK:
+                    streamed_fragments = [content_chunk.content]
+                    self.messages.append(content_chunk)
+                    streaming_span = ConversationMessageStreamSpan(
+                        message_list=self,
+                        initial_message=content_chunk,
+                    )
+                    streaming_span.start()
+                elif chunk_type == StreamChunkType.TEXT_CHUNK:
+                    self._update_last_message(content_chunk, append_only=True)
+                    chunk_text = content_chunk.content
+                    if chunk_text:
+                        streamed_fragments.append(chunk_text)
+                        record_event(ConversationMessageStreamChunkEvent(chunk=chunk_text))
+                elif chunk_type == StreamChunkType.END_CHUNK:
+                    new_message = content_chunk
+                    self._update_last_message(content_chunk, append_only=False)
+                    if streaming_span is not None:
+                        streaming_span.record_end_span_event(message=content_chunk)
+                        streaming_span.end()
+                    record_event(
+                        ConversationMessageAddedEvent(message=self.messages[-1], streamed=True)
                     )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        full_streamed_message = "".join(streamed_fragments)
+                        if full_streamed_message != new_message.content:
+                            logger.debug(
+                                'The content streamed "%s" is different than the final content "%s"',
+                                full_streamed_message,
+                                new_message.content,
+                            )
+        finally:
+            if self.messages:
+                _finish_streaming_text_contents(self.messages[-1])
         if new_message is None:
             raise ValueError("There was no END_CHUNK, so no message was produced")
         return new_message
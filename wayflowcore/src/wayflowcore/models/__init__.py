@@ -27,6 +27,13 @@ from .ollamamodel import OllamaModel
 from .openaiapitype import OpenAIAPIType
 from .openaicompatiblemodel import OpenAICompatibleModel
 from .openaimodel import OpenAIModel
+from .ratelimiting import LlmRateLimiter, set_llm_rate_limiter
+from .tokenusagestore import (
+    AggregatedTokenUsageStore,
+    InMemoryTokenUsageStore,
+    TokenUsageRecord,
+    TokenUsageStore,
+)
 from .vllmmodel import VllmModel
 
 __all__ = [
@@ -57,4 +64,10 @@ __all__ = [
     "GeminiApiKeyAuth",
     "GeminiCloudAuth",
     "GeminiModel",
+    "TokenUsageStore",
+    "InMemoryTokenUsageStore",
+    "AggregatedTokenUsageStore",
+    "TokenUsageRecord",
+    "LlmRateLimiter",
+    "set_llm_rate_limiter",
 ]
@@ -0,0 +1,193 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import json
+import logging
+from contextlib import AsyncExitStack
+from typing import TYPE_CHECKING, Any, AsyncIterator, List, Optional
+
+import httpx
+
+from wayflowcore._utils.async_helpers import run_sync_in_thread
+from wayflowcore._utils.lazy_loader import LazyLoader
+from wayflowcore.models._requesthelpers import shared_http_client, silence_generator_exit_warnings
+
+if TYPE_CHECKING:
+    # Important: do not move this import out of the TYPE_CHECKING block so long as oci is an optional dependency.
+    # Otherwise, importing the module when they are not installed would lead to an import error.
+    import oci  # type: ignore
+else:
+    oci = LazyLoader("oci")
+
+logger = logging.getLogger(__name__)
+
+_CHAT_RESOURCE_PATH = "/actions/chat"
+_EMBED_TEXT_RESOURCE_PATH = "/actions/embedText"
+
+
+class _SignableRequest:
+    def __init__(self, method: str, url: httpx.URL, headers: httpx.Headers, body: str):
+        """Minimal request object exposing the attributes read by the OCI request signers"""
+        self.method = method
+        self.url = str(url)
+        self.path_url = url.raw_path.decode("ascii")
+        self.headers = headers
+        self.body = body
+
+
+class _OciServerSentEvent:
+    def __init__(self, data: str, event: Optional[str] = None):
+        """Event of an OCI streaming response, with the same ``data`` attribute as the events of the OCI SDK"""
+        self.data = data
+        self.event = event
+
+
+class _OciEventStream:
+    def __init__(self, response: httpx.Response, exit_stack: AsyncExitStack):
+        """Open streaming response of the OCI Generative AI service, to be closed with ``aclose``"""
+        self._response = response
+        self._exit_stack = exit_stack
+
+    async def events(self) -> AsyncIterator[_OciServerSentEvent]:
+        data_lines: List[str] = []
+        event_name: Optional[str] = None
+        with silence_generator_exit_warnings():
+            async for line in self._response.aiter_lines():
+                if line == "":
+                    # a blank line dispatches the event
+                    if data_lines:
+                        yield _OciServerSentEvent(data="\n".join(data_lines), event=event_name)
+                    data_lines, event_name = [], None
+                    continue
+                if line.startswith(":"):
+                    continue
+                field, _, value = line.partition(":")
+                if value.startswith(" "):
+                    value = value[1:]
+                if field == "data":
+                    data_lines.append(value)
+                elif field == "event":
+                    event_name = value
+            if data_lines:
+                yield _OciServerSentEvent(data="\n".join(data_lines), event=event_name)
+
+    async def aclose(self) -> None:
+        await self._exit_stack.aclose()
+
+
+class _OciAsyncTransport:
+    def __init__(self, client: "oci.generative_ai_inference.GenerativeAiInferenceClient"):
+        """
+        Sends the chat and embedding requests of an OCI Generative AI client over the shared
+        ``httpx.AsyncClient`` of WayFlow, instead of the blocking ``requests`` session of the OCI SDK.
+
+        The request bodies are serialized, signed and the responses deserialized by the OCI SDK
+        client itself, so that requests and responses are identical to the ones of the SDK. Failed
+        requests raise ``oci.exceptions.ServiceError`` like the SDK does. Retries are left to the
+        caller.
+        """
+        self._base_client = client.base_client
+
+    @property
+    def _timeout(self) -> httpx.Timeout:
+        timeout = self._base_client.timeout
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            return httpx.Timeout(read_timeout, connect=connect_timeout)
+        return httpx.Timeout(timeout)
+
+    async def chat(self, chat_details: Any) -> "oci.response.Response":
+        """Async equivalent of ``GenerativeAiInferenceClient.chat`` for non-streaming requests"""
+        return await self._call(_CHAT_RESOURCE_PATH, chat_details, response_type="ChatResult")
+
+    async def open_chat_stream(self, chat_details: Any) -> _OciEventStream:
+        """Async equivalent of ``GenerativeAiInferenceClient.chat`` for streaming requests"""
+        exit_stack = AsyncExitStack()
+        try:
+            # the client is kept open until the stream is closed, in case it is a dedicated one
+            session = await exit_stack.enter_async_context(shared_http_client(trust_env=True))
+            response = await self._send(session, _CHAT_RESOURCE_PATH, chat_details, stream=True)
+            exit_stack.push_async_callback(response.aclose)
+        except BaseException:
+            await exit_stack.aclose()
+            raise
+        return _OciEventStream(response, exit_stack)
+
+    async def embed_text(self, embed_text_details: Any) -> "oci.response.Response":
+        """Async equivalent of ``GenerativeAiInferenceClient.embed_text``"""
+        return await self._call(
+            _EMBED_TEXT_RESOURCE_PATH, embed_text_details, response_type="EmbedTextResult"
+        )
+
+    async def _call(self, resource_path: str, body: Any, response_type: str) -> Any:
+        async with shared_http_client(trust_env=True) as session:
+            response = await self._send(session, resource_path, body, stream=False)
+        data = self._base_client.deserialize_response_data(response.content, response_type)
+        return oci.response.Response(response.status_code, response.headers, data, None)
+
+    async def _send(
+        self, session: httpx.AsyncClient, resource_path: str, body: Any, stream: bool
+    ) -> httpx.Response:
+        url = httpx.URL(self._base_client.endpoint + resource_path)
+        content = json.dumps(self._base_client.sanitize_for_serialization(body))
+        response = await self._send_signed(session, url, content, stream)
+        if response.status_code == 401 and hasattr(
+            self._base_client.signer, "refresh_security_token"
+        ):
+            # the security token of instance and resource principals may have expired, the OCI
+            # SDK also refreshes it and retries once
+            await response.aclose()
+            await run_sync_in_thread(self._base_client.signer.refresh_security_token)
+            response = await self._send_signed(session, url, content, stream)
+        if not response.is_success:
+            await response.aread()
+            await response.aclose()
+            self._raise_service_error(response, resource_path)
+        return response
+
+    async def _send_signed(
+        self, session: httpx.AsyncClient, url: httpx.URL, content: str, stream: bool
+    ) -> httpx.Response:
+        headers = httpx.Headers(
+            {
+                "accept": "application/json, text/event-stream",
+                "content-type": "application/json",
+                "opc-client-info": oci.base_client.USER_INFO,
+                "user-agent": self._base_client.user_agent,
+                "opc-request-id": self._base_client.build_request_id(),
+            }
+        )
+        signable_request = _SignableRequest("POST", url, headers, content)
+        signer = self._base_client.signer
+        if hasattr(signer, "refresh_security_token"):
+            # signers based on security tokens might need to fetch a new token, which is blocking
+            await run_sync_in_thread(signer, signable_request)
+        else:
+            signer(signable_request)
+
+        request = session.build_request(
+            "POST",
+            url,
+            headers=signable_request.headers,
+            content=signable_request.body.encode("utf-8"),
+            timeout=self._timeout,
+        )
+        logger.debug("Sending request to OCI endpoint %s", url)
+        return await session.send(request, stream=stream)
+
+    def _raise_service_error(self, response: httpx.Response, resource_path: str) -> None:
+        service_code, message, deserialized_data = (
+            self._base_client.get_deserialized_service_code_and_message(response)
+        )
+        raise oci.exceptions.ServiceError(
+            response.status_code,
+            service_code,
+            response.headers,
+            message,
+            target_service="generative_ai_inference",
+            request_endpoint=f"POST {self._base_client.endpoint}{resource_path}",
+            deserialized_data=deserialized_data,
+        )
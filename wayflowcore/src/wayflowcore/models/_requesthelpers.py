@@ -4,15 +4,19 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+import asyncio
 import json
 import logging
 import ssl
 import sys
+import threading
 import time
-from contextlib import contextmanager
+import weakref
+from contextlib import asynccontextmanager, contextmanager
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 from enum import Enum
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from random import Random, SystemRandom
 from typing import (
     TYPE_CHECKING,
@@ -35,6 +39,8 @@ from typing import (
 import anyio
 import httpx
 
+from wayflowcore._utils.singleton import Singleton
+from wayflowcore.models.ratelimiting import _report_rate_limited_response
 from wayflowcore.retrypolicy import RetryJitter, RetryPolicy
 
 if TYPE_CHECKING:
@@ -200,6 +206,9 @@ def _compute_wait_before_next_attempt(
     rng: Random,
 ) -> Optional[float]:
     wait_time_seconds = _get_retry_after_seconds(retry_after_value)
+    if status_code == 429:
+        # all the retry loops go through here, let the endpoint limiter slow down the other requests
+        _report_rate_limited_response(wait_time_seconds)
     if wait_time_seconds is None:
         wait_time_seconds = _compute_wait_seconds(
             policy,
@@ -504,6 +513,95 @@ async def execute_async_with_retry(
     raise RuntimeError("Retry attempts were exhausted unexpectedly.")
 
 
+async def send_with_retries(
+    send: Callable[[httpx.Request], Awaitable[httpx.Response]],
+    request: httpx.Request,
+    retry_policy: Optional[RetryPolicy],
+    total_elapsed_time_seconds: Optional[float] = DEFAULT_TOTAL_ELAPSED_TIME_SECONDS,
+) -> httpx.Response:
+    """Send a request and retry retryable transport or HTTP failures.
+
+    Parameters
+    ----------
+    send:
+        Function sending the request once, e.g. ``httpx.AsyncClient.send``.
+    request:
+        Request to send.
+    retry_policy:
+        Retry configuration to apply. When ``None``, the request is sent once.
+    total_elapsed_time_seconds:
+        Maximum total retry budget across all attempts. ``None`` disables this budget.
+
+    Returns
+    -------
+    httpx.Response
+        The successful response, or the last unsuccessful one when retries are exhausted or the
+        failure is not retryable.
+    """
+    if retry_policy is None:
+        return await send(request)
+
+    policy = retry_policy
+    previous_wait_time_seconds: Optional[float] = None
+    last_exc: Optional[BaseException] = None
+    time_started = anyio.current_time()
+
+    for request_attempt_num in range(policy.total_attempts):
+        try:
+            response = await send(request)
+        except httpx.TransportError as exc:
+            if _is_tls_or_cert_error(exc) or request_attempt_num >= policy.total_attempts - 1:
+                raise
+
+            last_exc = exc
+            wait_time_seconds = _compute_wait_before_next_attempt(
+                policy=policy,
+                attempt_num=request_attempt_num,
+                status_code=None,
+                retry_after_value=None,
+                previous_wait_seconds=previous_wait_time_seconds,
+                time_started=time_started,
+                elapsed_time_seconds_fn=anyio.current_time,
+                total_elapsed_time_seconds=total_elapsed_time_seconds,
+                rng=_DEFAULT_RNG,
+            )
+            if wait_time_seconds is None:
+                raise
+            previous_wait_time_seconds = wait_time_seconds
+            await anyio.sleep(wait_time_seconds)
+            continue
+
+        if response.is_success:
+            return response
+
+        response_error_text = _stringify_response_error(await response.aread())
+        if request_attempt_num >= policy.total_attempts - 1 or not _is_retryable_http_error(
+            policy, response.status_code, response_error_text
+        ):
+            return response
+
+        wait_time_seconds = _compute_wait_before_next_attempt(
+            policy=policy,
+            attempt_num=request_attempt_num,
+            status_code=response.status_code,
+            retry_after_value=response.headers.get("retry-after"),
+            previous_wait_seconds=previous_wait_time_seconds,
+            time_started=time_started,
+            elapsed_time_seconds_fn=anyio.current_time,
+            total_elapsed_time_seconds=total_elapsed_time_seconds,
+            rng=_DEFAULT_RNG,
+        )
+        if wait_time_seconds is None:
+            return response
+        previous_wait_time_seconds = wait_time_seconds
+        await response.aclose()
+        await anyio.sleep(wait_time_seconds)
+
+    if last_exc is not None:
+        raise last_exc
+    raise RuntimeError("Request failed after retry attempts were exhausted.")
+
+
 class RetryingAsyncClient(httpx.AsyncClient):
     """HTTPX async client that applies ``RetryPolicy`` to transport and HTTP failures."""
 
@@ -528,78 +626,166 @@ class RetryingAsyncClient(httpx.AsyncClient):
         follow_redirects: Any = httpx.USE_CLIENT_DEFAULT,
     ) -> httpx.Response:
         """Send a request and retry retryable transport or HTTP failures."""
-        if self._retry_policy is None:
-            return await super().send(
+
+        async def _send_once(request: httpx.Request) -> httpx.Response:
+            return await super(RetryingAsyncClient, self).send(
                 request,
                 stream=stream,
                 auth=auth,
                 follow_redirects=follow_redirects,
             )
 
-        policy = self._retry_policy if self._retry_policy is not None else RetryPolicy()
-        previous_wait_time_seconds: Optional[float] = None
-        last_exc: Optional[BaseException] = None
-        time_started = anyio.current_time()
+        return await send_with_retries(
+            _send_once,
+            request,
+            retry_policy=self._retry_policy,
+            total_elapsed_time_seconds=self._total_elapsed_time_seconds,
+        )
 
-        for request_attempt_num in range(policy.total_attempts):
-            try:
-                response = await super().send(
-                    request,
-                    stream=stream,
-                    auth=auth,
-                    follow_redirects=follow_redirects,
-                )
-            except httpx.TransportError as exc:
-                if _is_tls_or_cert_error(exc) or request_attempt_num >= policy.total_attempts - 1:
-                    raise
 
-                last_exc = exc
-                wait_time_seconds = _compute_wait_before_next_attempt(
-                    policy=policy,
-                    attempt_num=request_attempt_num,
-                    status_code=None,
-                    retry_after_value=None,
-                    previous_wait_seconds=previous_wait_time_seconds,
-                    time_started=time_started,
-                    elapsed_time_seconds_fn=anyio.current_time,
-                    total_elapsed_time_seconds=self._total_elapsed_time_seconds,
-                    rng=_DEFAULT_RNG,
-                )
-                if wait_time_seconds is None:
-                    raise
-                previous_wait_time_seconds = wait_time_seconds
-                await anyio.sleep(wait_time_seconds)
-                continue
+DEFAULT_HTTP_CLIENT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+"""Default connection limits of the shared HTTP clients."""
 
-            if response.is_success:
-                return response
+_HttpClientKey = Tuple[Optional[str], VerifyType, bool]
+_HttpClients = Dict[_HttpClientKey, httpx.AsyncClient]
 
-            response_error_text = _stringify_response_error(await response.aread())
-            if request_attempt_num >= policy.total_attempts - 1 or not _is_retryable_http_error(
-                policy, response.status_code, response_error_text
-            ):
-                return response
 
-            wait_time_seconds = _compute_wait_before_next_attempt(
-                policy=policy,
-                attempt_num=request_attempt_num,
-                status_code=response.status_code,
-                retry_after_value=response.headers.get("retry-after"),
-                previous_wait_seconds=previous_wait_time_seconds,
-                time_started=time_started,
-                elapsed_time_seconds_fn=anyio.current_time,
-                total_elapsed_time_seconds=self._total_elapsed_time_seconds,
-                rng=_DEFAULT_RNG,
-            )
-            if wait_time_seconds is None:
-                return response
-            previous_wait_time_seconds = wait_time_seconds
-            await response.aclose()
-            await anyio.sleep(wait_time_seconds)
+async def _close_clients_on_loop_shutdown(clients: _HttpClients) -> AsyncGenerator[None, None]:
+    # Event loops finalize the pending async generators before closing (e.g. in ``asyncio.run``
+    # and ``anyio.run``), which is the last chance to gracefully close the connections of the
+    # clients bound to the loop
+    try:
+        yield
+    finally:
+        for client in list(clients.values()):
+            await client.aclose()
+        clients.clear()
+
+
+class SharedHttpClients(metaclass=Singleton):
+    def __init__(self) -> None:
+        """
+        Singleton class managing the ``httpx.AsyncClient`` shared by all the remote calls of
+        WayFlow (LLMs, embedding models, API calls), so that their connections are kept alive and
+        reused across requests instead of opening a new connection (and TLS handshake) per request.
+
+        Clients are created per event loop, since their connections cannot be used from another
+        loop, and per proxy and TLS configuration. The connections to each host are pooled within
+        a client. The clients of a loop are closed when the loop shuts down.
+        """
+        self.limits = DEFAULT_HTTP_CLIENT_LIMITS
+        self.http2 = False
+        self._lock = threading.Lock()
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _HttpClients]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._finalizers: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGenerator[None, None]]"
+        ) = weakref.WeakKeyDictionary()
+
+    def configure(self, limits: Optional[httpx.Limits] = None, http2: bool = False) -> None:
+        """
+        Configures the clients created from now on.
+
+        Parameters
+        ----------
+        limits:
+            Connection limits of each client. Defaults to ``DEFAULT_HTTP_CLIENT_LIMITS``.
+        http2:
+            Whether to use HTTP/2 when servers support it. Requires the ``h2`` package.
+        """
+        self.limits = limits if limits is not None else DEFAULT_HTTP_CLIENT_LIMITS
+        self.http2 = http2
+
+    def _create_client(
+        self, proxy: Optional[str], verify: VerifyType, trust_env: bool
+    ) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            proxy=proxy,
+            verify=verify,
+            trust_env=trust_env,
+            limits=self.limits,
+            http2=self.http2,
+            # Cookies set by a server must not leak into the requests of other components
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        )
 
-        if last_exc is not None:
-            raise last_exc
-        raise RuntimeError("Request failed after retry attempts were exhausted.")
+    async def get_client(
+        self, proxy: Optional[str] = None, verify: VerifyType = True, trust_env: bool = False
+    ) -> Optional[httpx.AsyncClient]:
+        """
+        Gets the client of the running event loop for the given configuration.
+
+        Returns ``None`` when not running in an asyncio event loop, in which case the caller should
+        use a dedicated client.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+        key = (proxy, verify, trust_env)
+        with self._lock:
+            clients = self._clients.get(loop)
+            if clients is None:
+                clients = {}
+                self._clients[loop] = clients
+                finalizer = _close_clients_on_loop_shutdown(clients)
+                self._finalizers[loop] = finalizer
+            else:
+                finalizer = None
+            client = clients.get(key)
+            if client is None:
+                client = self._create_client(proxy, verify, trust_env)
+                clients[key] = client
+        if finalizer is not None:
+            # Starting the generator registers it to the loop for finalization
+            await finalizer.__anext__()
+        return client
+
+    async def aclose(self) -> None:
+        """Closes the clients of the running event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        with self._lock:
+            clients = self._clients.pop(loop, {})
+            finalizer = self._finalizers.pop(loop, None)
+        if finalizer is not None:
+            await finalizer.aclose()
+        for client in clients.values():
+            await client.aclose()
+
+
+def configure_shared_http_clients(
+    limits: Optional[httpx.Limits] = None, http2: bool = False
+) -> None:
+    """Configures the connection limits and HTTP version of the shared WayFlow HTTP clients"""
+    SharedHttpClients().configure(limits=limits, http2=http2)
+
+
+async def close_shared_http_clients() -> None:
+    """Closes the shared WayFlow HTTP clients of the running event loop"""
+    await SharedHttpClients().aclose()
+
+
+@asynccontextmanager
+async def shared_http_client(
+    proxy: Optional[str] = None, verify: VerifyType = True, trust_env: bool = False
+) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """
+    Yields the shared client for the given configuration, or a dedicated client closed on exit
+    when no shared client is available.
+    """
+    client = await SharedHttpClients().get_client(proxy=proxy, verify=verify, trust_env=trust_env)
+    if client is not None:
+        yield client
+        return
+    async with httpx.AsyncClient(proxy=proxy, verify=verify, trust_env=trust_env) as client:
+        yield client
 
 
 async def _parse_streaming_response_text(stream_lines: AsyncIterable[str]) -> str:
@@ -651,14 +837,13 @@ async def request_post_with_retries(
             # Ignore ambient proxy environment variables with `trust_env=False` to prevent injected
             # HTTPS proxy settings from hijack localhost TLS test traffic and cause the client to
             # validate the proxy certificate instead of the test server certificate.
-            async with httpx.AsyncClient(
+            async with shared_http_client(
                 proxy=proxy,
-                timeout=timeout,
                 # Preserve the caller's TLS verification mode or CA bundle configuration.
                 verify=verify,
                 trust_env=False,
             ) as session:
-                response = await session.post(**request_params)
+                response = await session.post(timeout=timeout, **request_params)
             if response.status_code == 200:
                 try:
                     return response.json()  # type: ignore
@@ -789,14 +974,15 @@ async def request_streaming_post_with_retries(
             try:
                 # Match non-streaming behavior: only use the explicit `proxy` argument and do
                 # not inherit proxy settings from the process environment.
-                async with httpx.AsyncClient(
+                async with shared_http_client(
                     proxy=proxy,
-                    timeout=timeout,
                     # Preserve the caller's TLS verification mode or CA bundle configuration.
                     verify=verify,
                     trust_env=False,
                 ) as session:
-                    async with session.stream("POST", **request_params) as response:
+                    async with session.stream(
+                        "POST", timeout=timeout, **request_params
+                    ) as response:
                         if response.status_code == 200:
                             async for chunk in response.aiter_lines():
                                 yield chunk
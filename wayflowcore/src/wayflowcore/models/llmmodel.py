@@ -5,10 +5,21 @@
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
 import logging
+import warnings
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, AsyncIterable, Dict, Iterable, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    AsyncIterable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
 
 from wayflowcore._metadata import MetadataType
 from wayflowcore._utils.async_helpers import async_to_sync_iterator, run_async_in_sync
@@ -26,11 +37,18 @@ from ._requesthelpers import (
     TaggedMessageChunkTypeWithTokenUsage,
 )
 from .llmgenerationconfig import LlmGenerationConfig
+from .ratelimiting import (
+    LlmRateLimiter,
+    SharedLlmRateLimiters,
+    _rate_limited_request,
+    _RateLimitedRequest,
+)
 from .tokenusagehelpers import (
     _get_approximate_num_reasoning_tokens_from_wayflowcore_message,
     _get_approximate_num_token_from_wayflowcore_list_of_messages,
     _get_approximate_num_token_from_wayflowcore_message,
 )
+from .tokenusagestore import InMemoryTokenUsageStore, TokenUsageRecord, TokenUsageStore
 
 if TYPE_CHECKING:
     from wayflowcore.conversation import Conversation
@@ -141,13 +159,9 @@ class LlmModel(Component, SerializableObject, ABC):
         self.model_id = model_id
         self.generation_config = generation_config
 
-        # count tokens per conversation, per step (first key is conversation, second is step)
-        self.token_usages_flow: Dict[str, Dict[str, TokenUsage]] = defaultdict(
-            lambda: defaultdict(lambda: TokenUsage(exact_count=True)),
-        )
-        self.token_usages_flexible: Dict[str, TokenUsage] = defaultdict(
-            lambda: TokenUsage(exact_count=True)
-        )
+        # token usage of the conversations using this model. Can be replaced by any other store,
+        # for example to share it between models or to flush the usage records to a datastore
+        self.token_usage_store: TokenUsageStore = InMemoryTokenUsageStore()
         self.token_usage_standalone: TokenUsage = TokenUsage(exact_count=True)
 
         self.agent_template = agent_template or self.default_agent_template
@@ -222,7 +236,9 @@ class LlmModel(Component, SerializableObject, ABC):
             llm=self, prompt=prompt, name=f"LlmGeneration[{self._get_display_name()}]"
         ) as span:
             logger.debug("LLM generating: %s", prompt)
-            completion = await self._generate_impl(prompt)
+            async with self._rate_limited_generation(prompt) as rate_limited_request:
+                completion = await self._generate_impl(prompt)
+                rate_limited_request.token_usage = completion.token_usage
             logger.debug("LLM output: %s", completion.message)
             self._update_token_usage(
                 conversation=_conversation, prompt=prompt, completion=completion
@@ -287,11 +303,14 @@ class LlmModel(Component, SerializableObject, ABC):
         ) as span:
             logger.debug("LLM generating: %s", prompt)
             final_chunk: Optional["Message"] = None
-            async for chunk_type, chunk, token_usage in self._stream_generate_impl(prompt):
-                if chunk_type == StreamChunkType.END_CHUNK:
-                    final_chunk = chunk
-                    logger.debug("Llm streamed the final chunk: %s", final_chunk)
-                yield chunk_type, chunk
+            async with self._rate_limited_generation(prompt) as rate_limited_request:
+                async for chunk_type, chunk, token_usage in self._stream_generate_impl(prompt):
+                    rate_limited_request.record_first_response()
+                    if chunk_type == StreamChunkType.END_CHUNK:
+                        final_chunk = chunk
+                        rate_limited_request.token_usage = token_usage
+                        logger.debug("Llm streamed the final chunk: %s", final_chunk)
+                    yield chunk_type, chunk
 
             if final_chunk is None:
                 raise ValueError("No end chunk was streamed")
@@ -302,6 +321,33 @@ class LlmModel(Component, SerializableObject, ABC):
             )
             span.record_end_span_event(completion=completion_chunk)
 
+    @property
+    def _rate_limit_endpoint(self) -> Optional[str]:
+        """URL of the endpoint the model sends its requests to, used to find its rate limiter."""
+        return None
+
+    def _get_rate_limiter(self) -> Optional[LlmRateLimiter]:
+        endpoint = self._rate_limit_endpoint
+        if not endpoint:
+            return None
+        return SharedLlmRateLimiters().get(endpoint, self.model_id)
+
+    def _rate_limited_generation(self, prompt: Prompt) -> AsyncContextManager[_RateLimitedRequest]:
+        rate_limiter = self._get_rate_limiter()
+        return _rate_limited_request(
+            rate_limiter, self._estimate_num_tokens(prompt) if rate_limiter is not None else 0
+        )
+
+    def _estimate_num_tokens(self, prompt: Prompt) -> int:
+        # tokens are estimated like the providers do to enforce their limits: the prompt
+        # tokens plus the maximum number of generated tokens
+        num_tokens = _get_approximate_num_token_from_wayflowcore_list_of_messages(
+            prompt.messages, prompt.tools
+        )
+        if prompt.generation_config is not None and prompt.generation_config.max_tokens:
+            num_tokens += prompt.generation_config.max_tokens
+        return num_tokens
+
     def _update_token_usage(
         self,
         conversation: Optional["Conversation"],
@@ -336,6 +382,9 @@ class LlmModel(Component, SerializableObject, ABC):
         if conversation is None:
             # generate was standalone
             self.token_usage_standalone += completion.token_usage
+            self.token_usage_store.record(
+                TokenUsageRecord(model_id=self.model_id, token_usage=token_usage)
+            )
             return
 
         conversation.token_usage += token_usage
@@ -344,19 +393,26 @@ class LlmModel(Component, SerializableObject, ABC):
 
         from wayflowcore.executors._flowconversation import FlowConversation
 
-        if isinstance(conversation, FlowConversation):
-            # generate with flow
-            self.token_usages_flow[conversation.conversation_id][
-                conversation.current_step_name
-            ] += token_usage
-        else:
-            self.token_usages_flexible[conversation.conversation_id] += token_usage
+        self.token_usage_store.record(
+            TokenUsageRecord(
+                model_id=self.model_id,
+                token_usage=token_usage,
+                conversation_id=conversation.conversation_id,
+                component_name=conversation.component.name,
+                step_name=(
+                    conversation.current_step_name
+                    if isinstance(conversation, FlowConversation)
+                    else None
+                ),
+            )
+        )
 
     def get_total_token_consumption(self, conversation_id: str) -> TokenUsage:
         """Calculate and return the total token consumption for a given conversation.
 
-        This method computes the aggregate token usage for the specified conversation
-        by summing the token usages.
+        This method returns the token usage of the specified conversation accounted by
+        the ``token_usage_store`` of the model. It raises a ``ValueError`` if the store does
+        not track the token usage of individual conversations.
 
         Parameters
         ----------
@@ -368,13 +424,58 @@ class LlmModel(Component, SerializableObject, ABC):
         TokenUsage:
             A TokenUsage object that gathers all token usage information.
         """
-        total_token_usage = TokenUsage(exact_count=True)
-        if conversation_id in self.token_usages_flexible:
-            total_token_usage += self.token_usages_flexible[conversation_id]
-        if conversation_id in self.token_usages_flow:
-            for step_name, token_usage in self.token_usages_flow[conversation_id].items():
-                total_token_usage += token_usage
-        return total_token_usage
+        return self.token_usage_store.get_conversation_token_usage(conversation_id)
+
+    @property
+    def token_usages_flow(self) -> Dict[str, Dict[str, TokenUsage]]:
+        """
+        Token usage of the flow conversations using this model, per conversation ID and step name.
+
+        .. deprecated:: 26.2
+            Use ``get_total_token_consumption`` or the ``token_usage_store`` of the model instead.
+        """
+        warnings.warn(
+            "`LlmModel.token_usages_flow` is deprecated since wayflowcore==26.2.0 and will be removed "
+            "in a future release. Please use `LlmModel.get_total_token_consumption` or the "
+            "`LlmModel.token_usage_store` instead.",
+            DeprecationWarning,
+        )
+        # default dicts, as the attribute used to be, so that unknown conversations have no usage
+        token_usages_flow: Dict[str, Dict[str, TokenUsage]] = defaultdict(
+            lambda: defaultdict(lambda: TokenUsage(exact_count=True))
+        )
+        for conversation_id, (
+            _,
+            step_token_usages,
+        ) in self.token_usage_store._get_token_usages_per_conversation().items():
+            if step_token_usages is not None:
+                token_usages_flow[conversation_id].update(step_token_usages)
+        return token_usages_flow
+
+    @property
+    def token_usages_flexible(self) -> Dict[str, TokenUsage]:
+        """
+        Token usage of the conversations using this model outside of flows, per conversation ID.
+
+        .. deprecated:: 26.2
+            Use ``get_total_token_consumption`` or the ``token_usage_store`` of the model instead.
+        """
+        warnings.warn(
+            "`LlmModel.token_usages_flexible` is deprecated since wayflowcore==26.2.0 and will be "
+            "removed in a future release. Please use `LlmModel.get_total_token_consumption` or the "
+            "`LlmModel.token_usage_store` instead.",
+            DeprecationWarning,
+        )
+        token_usages_flexible: Dict[str, TokenUsage] = defaultdict(
+            lambda: TokenUsage(exact_count=True)
+        )
+        for conversation_id, (
+            token_usage,
+            step_token_usages,
+        ) in self.token_usage_store._get_token_usages_per_conversation().items():
+            if step_token_usages is None:
+                token_usages_flexible[conversation_id] = token_usage
+        return token_usages_flexible
 
     @abstractmethod
     async def _generate_impl(self, prompt: Prompt) -> LlmCompletion: ...
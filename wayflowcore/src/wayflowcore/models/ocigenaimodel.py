@@ -5,7 +5,6 @@
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 import json
 import logging
-import time
 import uuid
 import warnings
 from abc import ABC, abstractmethod
@@ -15,19 +14,19 @@ from typing import (
     TYPE_CHECKING,
     Any,
     AsyncIterable,
+    AsyncIterator,
     Callable,
     Dict,
-    Iterator,
     List,
     Optional,
     Tuple,
     cast,
 )
 
+import anyio
 from pydantic import BaseModel
 
 from wayflowcore._metadata import MetadataType
-from wayflowcore._utils.async_helpers import run_sync_in_thread, sync_to_async_iterator
 from wayflowcore._utils.formatting import build_tool_output_payload, format_tool_output_for_llm
 from wayflowcore._utils.lazy_loader import LazyLoader
 from wayflowcore.idgeneration import IdGenerator
@@ -40,6 +39,7 @@ from wayflowcore.tools import Tool, ToolRequest
 from wayflowcore.transforms import CanonicalizationMessageTransform
 
 from ._modelhelpers import _is_gemma_model, _is_llama_legacy_model
+from ._ociasynctransport import _OciAsyncTransport, _OciEventStream
 from ._openaihelpers import _ChatCompletionsAPIProcessor, _ResponsesAPIProcessor
 from ._openaihelpers._utils import _safe_json_loads
 from ._requesthelpers import (
@@ -50,7 +50,6 @@ from ._requesthelpers import (
     _classify_oci_service_error_for_retry,
     _compute_wait_before_next_attempt,
     execute_async_with_retry,
-    execute_sync_with_retry,
 )
 from .llmgenerationconfig import LlmGenerationConfig
 from .llmmodel import LlmCompletion, LlmModel, Prompt
@@ -280,6 +279,7 @@ class OCIGenAIModel(LlmModel):
         self.provider = provider
 
         self._client = None
+        self._oci_transport: Optional[_OciAsyncTransport] = None
         self._oci_serving_mode = None
         self.api_type = api_type
         self.conversation_store_id = conversation_store_id
@@ -329,6 +329,7 @@ class OCIGenAIModel(LlmModel):
                     ),
                 )
             )
+            self._oci_transport = _OciAsyncTransport(self._client)
 
             if self.serving_mode == ServingMode.ON_DEMAND:
                 self._oci_serving_mode = oci.generative_ai_inference.models.OnDemandServingMode(
@@ -438,22 +439,22 @@ class OCIGenAIModel(LlmModel):
     async def _generate_impl_oci_sdk(self, prompt: Prompt) -> "LlmCompletion":
         provider = _MODEL_PROVIDER_TO_FORMATTER.get(self.provider, _GenericOciApiFormatter)
 
-        response = await run_sync_in_thread(self._post_with_retry, provider, prompt)
+        response = await self._post_with_retry(provider, prompt)
         logger.debug(f"Raw remote oci genai response: {response.data}")
 
         response_message = provider.convert_completion_into_message(response)
         response_message = prompt.parse_output(response_message)
         return LlmCompletion(message=response_message, token_usage=provider.extract_usage(response))
 
-    def _post_with_retry(self, provider: "_OciApiFormatter", prompt: Prompt) -> Any:
+    async def _post_with_retry(self, provider: "_OciApiFormatter", prompt: Prompt) -> Any:
         policy = self.retry_policy or RetryPolicy()
         previous_wait_seconds: Optional[float] = None
         # Use a monotonic clock because the retry budget depends on elapsed time, not wall time.
-        time_started = time.monotonic()
+        time_started = anyio.current_time()
 
         for attempt in range(policy.total_attempts):
             try:
-                return self._post(provider=provider, prompt=prompt)
+                return await self._post(provider=provider, prompt=prompt)
             except oci.exceptions.ServiceError as e:
                 # If OCI rejects specific generation params, we try adapting the prompt config.
                 error_message = e.message
@@ -485,7 +486,7 @@ class OCIGenAIModel(LlmModel):
                     retry_after_value=retry_after_value,
                     previous_wait_seconds=previous_wait_seconds,
                     time_started=time_started,
-                    elapsed_time_seconds_fn=time.monotonic,
+                    elapsed_time_seconds_fn=anyio.current_time,
                     total_elapsed_time_seconds=600.0,
                     rng=_DEFAULT_RNG,
                 )
@@ -493,13 +494,13 @@ class OCIGenAIModel(LlmModel):
                     raise RuntimeError("OCI request retry budget exhausted")
 
                 previous_wait_seconds = wait_seconds
-                time.sleep(wait_seconds)
+                await anyio.sleep(wait_seconds)
 
         raise RuntimeError("OCI request failed after maximum attempts")
 
-    def _post(self, provider: "_OciApiFormatter", prompt: Prompt) -> Any:
+    async def _post(self, provider: "_OciApiFormatter", prompt: Prompt) -> Any:
         self._init_client_if_needed()
-        if self._client is None or self._oci_serving_mode is None:
+        if self._oci_transport is None or self._oci_serving_mode is None:
             raise ValueError("Could not initialize the OCI client")
 
         request = provider.convert_prompt_into_request(prompt, self.model_id)
@@ -511,19 +512,22 @@ class OCIGenAIModel(LlmModel):
             chat_request=request,
         )
 
-        return self._client.chat(chat_details=chat_details)
+        return await self._oci_transport.chat(chat_details=chat_details)
 
-    def _post_stream_with_retry(self, provider: "_OciApiFormatter", prompt: Prompt) -> Any:
+    async def _post_stream_with_retry(
+        self, provider: "_OciApiFormatter", prompt: Prompt
+    ) -> _OciEventStream:
         self._init_client_if_needed()
-        if self._client is None or self._oci_serving_mode is None:
+        oci_transport = self._oci_transport
+        if oci_transport is None or self._oci_serving_mode is None:
             raise ValueError("Could not initialize the OCI client")
 
         request = provider.convert_prompt_into_request(prompt, self.model_id)
         logger.debug(f"Streaming request to remote oci genai endpoint: {json.loads(str(request))}")
         request.is_stream = True
 
-        return execute_sync_with_retry(
-            lambda: self._client.chat(
+        return await execute_async_with_retry(
+            lambda: oci_transport.open_chat_stream(
                 chat_details=oci.generative_ai_inference.models.ChatDetails(
                     compartment_id=self.compartment_id,
                     serving_mode=self._oci_serving_mode,
@@ -552,19 +556,16 @@ class OCIGenAIModel(LlmModel):
         self,
         prompt: Prompt,
     ) -> AsyncIterable[TaggedMessageChunkTypeWithTokenUsage]:
-        self._init_client_if_needed()
-        if self._client is None or self._oci_serving_mode is None:
-            raise ValueError("Could not initialize the OCI client")
-
         provider = _MODEL_PROVIDER_TO_FORMATTER.get(self.provider, _GenericOciApiFormatter)
 
-        response = await run_sync_in_thread(self._post_stream_with_retry, provider, prompt)
-        async for chunk in sync_to_async_iterator(
-            provider.convert_oci_chunk_iterator_into_tagged_chunk_iterator(
-                iterator=response.data.events(), post_processing=prompt.parse_output
-            )
-        ):
-            yield chunk
+        event_stream = await self._post_stream_with_retry(provider, prompt)
+        try:
+            async for chunk in provider.convert_oci_chunk_iterator_into_tagged_chunk_iterator(
+                iterator=event_stream.events(), post_processing=prompt.parse_output
+            ):
+                yield chunk
+        finally:
+            await event_stream.aclose()
 
     async def _stream_generate_impl_openai_sdk(
         self,
@@ -605,6 +606,10 @@ class OCIGenAIModel(LlmModel):
             ):
                 yield chunk
 
+    @property
+    def _rate_limit_endpoint(self) -> Optional[str]:
+        return self.client_config.service_endpoint
+
     @property
     def config(self) -> Dict[str, Any]:
         return {
@@ -679,9 +684,9 @@ class _OciApiFormatter(ABC):
     @staticmethod
     @abstractmethod
     def convert_oci_chunk_iterator_into_tagged_chunk_iterator(
-        iterator: Iterator[Any],
+        iterator: AsyncIterable[Any],
         post_processing: Optional[Callable[["Message"], "Message"]] = None,
-    ) -> Iterator[TaggedMessageChunkTypeWithTokenUsage]: ...
+    ) -> AsyncIterator[TaggedMessageChunkTypeWithTokenUsage]: ...
 
     @staticmethod
     def extract_usage(response: Dict[str, Any]) -> Optional[TokenUsage]:
@@ -840,10 +845,10 @@ class _GenericOciApiFormatter(_OciApiFormatter):
         )
 
     @staticmethod
-    def convert_oci_chunk_iterator_into_tagged_chunk_iterator(
-        iterator: Iterator[Any],
+    async def convert_oci_chunk_iterator_into_tagged_chunk_iterator(
+        iterator: AsyncIterable[Any],
         post_processing: Optional[Callable[["Message"], "Message"]] = None,
-    ) -> Iterator[TaggedMessageChunkTypeWithTokenUsage]:
+    ) -> AsyncIterator[TaggedMessageChunkTypeWithTokenUsage]:
         from wayflowcore.messagelist import Message, MessageType
 
         # start the stream
@@ -851,7 +856,7 @@ class _GenericOciApiFormatter(_OciApiFormatter):
 
         accumulated_text = ""
         tool_deltas = []
-        for raw_chunk in iterator:
+        async for raw_chunk in iterator:
             chunk = json.loads(raw_chunk.data)
             text_delta, tool_requests = "", None
 
@@ -1133,10 +1138,10 @@ class _CohereOciApiFormatter(_OciApiFormatter):
         return Message(content=text_content, tool_requests=tool_requests, role="assistant")
 
     @staticmethod
-    def convert_oci_chunk_iterator_into_tagged_chunk_iterator(
-        iterator: Iterator[Any],
+    async def convert_oci_chunk_iterator_into_tagged_chunk_iterator(
+        iterator: AsyncIterable[Any],
         post_processing: Optional[Callable[["Message"], "Message"]] = None,
-    ) -> Iterator[TaggedMessageChunkTypeWithTokenUsage]:
+    ) -> AsyncIterator[TaggedMessageChunkTypeWithTokenUsage]:
         from wayflowcore.messagelist import Message, MessageType
 
         # start the stream
@@ -1145,7 +1150,7 @@ class _CohereOciApiFormatter(_OciApiFormatter):
         tool_calls = []
         accumulated_text = ""
 
-        for raw_chunk in iterator:
+        async for raw_chunk in iterator:
             response = json.loads(raw_chunk.data)
             text_content = ""
 
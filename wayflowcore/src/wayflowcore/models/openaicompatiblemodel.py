@@ -248,6 +248,10 @@ class OpenAICompatibleModel(LlmModel):
             async for chunk in api_processor._json_iterator_from_stream_of_api_str(line_iterator):
                 yield chunk
 
+    @property
+    def _rate_limit_endpoint(self) -> Optional[str]:
+        return self.base_url
+
     @property
     def config(self) -> Dict[str, Any]:
         self._warn_about_runtime_only_configuration()
@@ -0,0 +1,442 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import asyncio
+import logging
+import math
+import re
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Callable, Deque, Dict, Optional, Tuple
+
+import anyio
+
+from wayflowcore._utils.singleton import Singleton
+from wayflowcore.tokenusage import TokenUsage
+
+logger = logging.getLogger(__name__)
+
+
+class _TokenBucket:
+    def __init__(self, capacity_per_minute: float):
+        self.capacity = capacity_per_minute
+        self.refill_rate = capacity_per_minute / 60.0
+        self.available = capacity_per_minute
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.available = min(
+            self.capacity, self.available + (now - self.updated_at) * self.refill_rate
+        )
+        self.updated_at = now
+
+    def time_until_available(self, amount: float, now: float) -> float:
+        self._refill(now)
+        # requests larger than the bucket would never be sent otherwise
+        amount = min(amount, self.capacity)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) / self.refill_rate
+
+    def consume(self, amount: float, now: float) -> None:
+        self._refill(now)
+        # the balance can become negative when correcting an underestimated consumption,
+        # which delays the next requests until the debt is repaid
+        self.available = min(self.capacity, self.available - amount)
+
+
+def _get_threadsafe_scheduler() -> Callable[[Callable[[], None]], Any]:
+    """Returns a function scheduling a callback in the running event loop from any thread"""
+    try:
+        return asyncio.get_running_loop().call_soon_threadsafe
+    except RuntimeError:
+        import trio  # type: ignore
+
+        return trio.lowlevel.current_trio_token().run_sync_soon  # type: ignore
+
+
+class _RateLimitedRequest:
+    def __init__(self, limiter: Optional["LlmRateLimiter"], estimated_tokens: int):
+        self.limiter = limiter
+        self.estimated_tokens = estimated_tokens
+        self.admitted_at: Optional[float] = None if limiter is not None else time.monotonic()
+        self.first_response_at: Optional[float] = None
+        self.token_usage: Optional[TokenUsage] = None
+        self.rate_limited = False
+        self._wake_event: Optional[anyio.Event] = None
+        self._thread_id = threading.get_ident()
+        self._schedule_threadsafe: Optional[Callable[[Callable[[], None]], Any]] = None
+
+    def _prepare_wait(self) -> anyio.Event:
+        """Creates the event the queued request waits on. Called from the loop of the request."""
+        if self._schedule_threadsafe is None:
+            self._schedule_threadsafe = _get_threadsafe_scheduler()
+        self._wake_event = anyio.Event()
+        return self._wake_event
+
+    def _set_wake_event(self) -> None:
+        if self._wake_event is not None:
+            self._wake_event.set()
+
+    def wake(self) -> None:
+        """Wakes the task waiting for this request, from any thread or event loop"""
+        if self._wake_event is None:
+            return
+        if threading.get_ident() == self._thread_id or self._schedule_threadsafe is None:
+            self._set_wake_event()
+            return
+        try:
+            self._schedule_threadsafe(self._set_wake_event)
+        except RuntimeError:
+            # the loop of the request is closed, so the request is not waiting anymore
+            pass
+
+    def record_first_response(self) -> None:
+        if self.first_response_at is None:
+            self.first_response_at = time.monotonic()
+
+
+_ACTIVE_RATE_LIMITED_REQUEST: ContextVar[Optional[_RateLimitedRequest]] = ContextVar(
+    "_ACTIVE_RATE_LIMITED_REQUEST", default=None
+)
+
+
+class LlmRateLimiter:
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: int = 32,
+        min_concurrency: int = 1,
+        latency_threshold: Optional[float] = None,
+        decrease_factor: float = 0.5,
+    ):
+        """
+        Client-side limiter of the generation requests sent to an LLM endpoint.
+
+        Requests wait in a first-in first-out queue until they can be sent without exceeding the
+        request and token rates of the endpoint, and the number of concurrent requests.
+        The rates are enforced with token buckets. The number of tokens of a request is estimated
+        from its prompt and its ``max_tokens`` before sending it, and corrected with the actual token
+        usage of the generation once it completes.
+
+        The concurrency limit adapts to the endpoint (additive increase, multiplicative decrease):
+        it grows by one request for every window of successful requests, and is multiplied by
+        ``decrease_factor`` when the endpoint answers with a 429 status or when a request is slower
+        than ``latency_threshold``. The concurrency is decreased at most once per window of requests,
+        so that a burst of rejected requests only decreases it once. When a 429 response carries a
+        ``Retry-After`` header, no request is sent to the endpoint until then.
+
+        Limiters are shared by all the models targeting the same endpoint with ``set_llm_rate_limiter``.
+
+        Parameters
+        ----------
+        requests_per_minute:
+            Maximum number of requests sent per minute. If None, the request rate is not limited.
+        tokens_per_minute:
+            Maximum number of tokens (prompt and generation) consumed per minute.
+            If None, the token rate is not limited.
+        max_concurrency:
+            Maximum number of concurrent requests. This is also the initial concurrency limit.
+        min_concurrency:
+            Minimum number of concurrent requests the concurrency limit can decrease to.
+        latency_threshold:
+            Time in seconds after which a request is considered a sign of overload of the endpoint,
+            measured until its response (or its first chunk when streaming). If None, only 429
+            responses decrease the concurrency limit.
+        decrease_factor:
+            Factor by which the concurrency limit is multiplied when the endpoint is overloaded.
+
+        Examples
+        --------
+        >>> from wayflowcore.models import LlmRateLimiter, set_llm_rate_limiter
+        >>> set_llm_rate_limiter(
+        ...     "https://api.openai.com",
+        ...     LlmRateLimiter(requests_per_minute=500, tokens_per_minute=200_000),
+        ...     model_id="gpt-4o",
+        ... )
+        >>> # removing the limiter
+        >>> set_llm_rate_limiter("https://api.openai.com", None, model_id="gpt-4o")
+
+        """
+        if requests_per_minute is not None and requests_per_minute <= 0:
+            raise ValueError(
+                f"`requests_per_minute` should be positive, but was {requests_per_minute}"
+            )
+        if tokens_per_minute is not None and tokens_per_minute <= 0:
+            raise ValueError(f"`tokens_per_minute` should be positive, but was {tokens_per_minute}")
+        if min_concurrency < 1:
+            raise ValueError(f"`min_concurrency` should be at least 1, but was {min_concurrency}")
+        if max_concurrency < min_concurrency:
+            raise ValueError(
+                f"`max_concurrency` should be at least `min_concurrency` ({min_concurrency}), "
+                f"but was {max_concurrency}"
+            )
+        if latency_threshold is not None and latency_threshold <= 0:
+            raise ValueError(f"`latency_threshold` should be positive, but was {latency_threshold}")
+        if not 0 < decrease_factor < 1:
+            raise ValueError(
+                f"`decrease_factor` should be between 0 and 1 (excluded), but was {decrease_factor}"
+            )
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.latency_threshold = latency_threshold
+        self.decrease_factor = decrease_factor
+
+        self._lock = threading.Lock()
+        self._request_bucket = (
+            _TokenBucket(requests_per_minute) if requests_per_minute is not None else None
+        )
+        self._token_bucket = (
+            _TokenBucket(tokens_per_minute) if tokens_per_minute is not None else None
+        )
+        self._concurrency_limit = float(max_concurrency)
+        self._num_in_flight = 0
+        self._queue: Deque[_RateLimitedRequest] = deque()
+        self._paused_until = 0.0
+        self._last_decrease_at = float("-inf")
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current maximum number of concurrent requests."""
+        return max(self.min_concurrency, int(self._concurrency_limit))
+
+    @property
+    def num_in_flight(self) -> int:
+        """Number of requests currently sent to the endpoint."""
+        return self._num_in_flight
+
+    @property
+    def num_queued(self) -> int:
+        """Number of requests waiting to be sent to the endpoint."""
+        return len(self._queue)
+
+    def _admit_queued_requests(self, now: float) -> float:
+        """
+        Admits the queued requests in order, as long as they can be sent, and wakes them up.
+        Returns the time to wait before the first queued request can be sent, which is infinite
+        when it waits for a request to complete.
+        """
+        head = self._queue[0] if self._queue else None
+        wait_time = 0.0
+        while self._queue:
+            if self._num_in_flight >= self.concurrency_limit:
+                wait_time = math.inf
+                break
+            queued_request = self._queue[0]
+            wait_time = self._paused_until - now
+            if self._request_bucket is not None:
+                wait_time = max(wait_time, self._request_bucket.time_until_available(1, now))
+            if self._token_bucket is not None:
+                wait_time = max(
+                    wait_time,
+                    self._token_bucket.time_until_available(queued_request.estimated_tokens, now),
+                )
+            if wait_time > 0:
+                break
+
+            self._queue.popleft()
+            self._num_in_flight += 1
+            if self._request_bucket is not None:
+                self._request_bucket.consume(1, now)
+            if self._token_bucket is not None:
+                self._token_bucket.consume(
+                    min(queued_request.estimated_tokens, self._token_bucket.capacity), now
+                )
+            queued_request.admitted_at = now
+            queued_request.wake()
+        if self._queue and (self._queue[0] is not head or wait_time != math.inf):
+            # only the first queued request waits for the rate and pause delays, it is woken up
+            # so that it schedules its delay when it changes or when it stops waiting for capacity
+            self._queue[0].wake()
+        return max(wait_time, 0.0)
+
+    async def _acquire(self, estimated_tokens: int) -> _RateLimitedRequest:
+        request = _RateLimitedRequest(self, estimated_tokens)
+        with self._lock:
+            self._queue.append(request)
+        try:
+            while True:
+                with self._lock:
+                    wait_time = self._admit_queued_requests(time.monotonic())
+                    if request.admitted_at is not None:
+                        return request
+                    # the event is created under the lock, so that a request admitted by another
+                    # task right after the lock is released still wakes this one up
+                    wake_event = request._prepare_wait()
+                    if self._queue[0] is not request:
+                        wait_time = math.inf
+                with anyio.move_on_after(wait_time):
+                    await wake_event.wait()
+        except BaseException:
+            with self._lock:
+                if request.admitted_at is not None:
+                    self._num_in_flight -= 1
+                else:
+                    self._queue.remove(request)
+                # the capacity or the first place of the queue may be freed for other requests
+                self._admit_queued_requests(time.monotonic())
+            raise
+
+    def _decrease_concurrency(self, request: _RateLimitedRequest, now: float) -> None:
+        # requests sent before the last decrease were sent under the previous limit,
+        # their failures should not decrease the limit again
+        if request.admitted_at is None or request.admitted_at < self._last_decrease_at:
+            return
+        self._concurrency_limit = max(
+            float(self.min_concurrency), self._concurrency_limit * self.decrease_factor
+        )
+        self._last_decrease_at = now
+        logger.info(
+            "LLM endpoint is overloaded, decreasing the concurrency limit to %s requests",
+            self.concurrency_limit,
+        )
+
+    def _on_rate_limited(
+        self, request: _RateLimitedRequest, retry_after_seconds: Optional[float]
+    ) -> None:
+        with self._lock:
+            now = time.monotonic()
+            request.rate_limited = True
+            if retry_after_seconds is not None:
+                self._paused_until = max(self._paused_until, now + retry_after_seconds)
+            self._decrease_concurrency(request, now)
+
+    def _adapt_to_completed_request(
+        self, request: _RateLimitedRequest, succeeded: bool, now: float
+    ) -> None:
+        if self._token_bucket is not None and request.token_usage is not None:
+            token_usage = request.token_usage
+            actual_tokens = token_usage.total_tokens or (
+                token_usage.input_tokens + token_usage.output_tokens
+            )
+            if actual_tokens > 0:
+                self._token_bucket.consume(
+                    actual_tokens - min(request.estimated_tokens, self._token_bucket.capacity),
+                    now,
+                )
+        if request.rate_limited or request.admitted_at is None:
+            # rate limited requests already decreased the concurrency when they were rejected
+            return
+        latency = (request.first_response_at or now) - request.admitted_at
+        if self.latency_threshold is not None and latency > self.latency_threshold:
+            self._decrease_concurrency(request, now)
+        elif succeeded:
+            self._concurrency_limit = min(
+                float(self.max_concurrency),
+                self._concurrency_limit + 1.0 / self._concurrency_limit,
+            )
+
+    def _release(self, request: _RateLimitedRequest, succeeded: bool) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._num_in_flight -= 1
+            self._adapt_to_completed_request(request, succeeded, now)
+            # hand the freed capacity to the queued requests right away
+            self._admit_queued_requests(now)
+
+
+def _normalize_endpoint(endpoint: str) -> str:
+    return re.sub(r"^[a-zA-Z][a-zA-Z0-9+.-]*://", "", endpoint).rstrip("/")
+
+
+class SharedLlmRateLimiters(metaclass=Singleton):
+    def __init__(self) -> None:
+        """
+        Singleton class holding the rate limiters shared by all the models targeting the same
+        endpoint, whatever the event loop or thread they are used from.
+
+        Limiters are registered per endpoint URL (the scheme and trailing slashes are ignored) and
+        optionally per model. A limiter registered for a model takes precedence over the limiter
+        registered for all the models of the endpoint.
+        """
+        self._lock = threading.Lock()
+        self._limiters: Dict[Tuple[str, Optional[str]], LlmRateLimiter] = {}
+
+    def set(
+        self, endpoint: str, rate_limiter: Optional[LlmRateLimiter], model_id: Optional[str] = None
+    ) -> None:
+        """Registers the limiter of an endpoint, or removes it if ``rate_limiter`` is None."""
+        key = (_normalize_endpoint(endpoint), model_id)
+        with self._lock:
+            if rate_limiter is None:
+                self._limiters.pop(key, None)
+            else:
+                self._limiters[key] = rate_limiter
+
+    def get(self, endpoint: str, model_id: Optional[str] = None) -> Optional[LlmRateLimiter]:
+        """Returns the limiter of a model of an endpoint, if any."""
+        endpoint = _normalize_endpoint(endpoint)
+        with self._lock:
+            if not self._limiters:
+                return None
+            return self._limiters.get((endpoint, model_id)) or self._limiters.get((endpoint, None))
+
+    def clear(self) -> None:
+        """Removes all the registered limiters."""
+        with self._lock:
+            self._limiters.clear()
+
+
+def set_llm_rate_limiter(
+    endpoint: str, rate_limiter: Optional[LlmRateLimiter], model_id: Optional[str] = None
+) -> None:
+    """
+    Sets the rate limiter shared by all the models targeting an endpoint.
+
+    Parameters
+    ----------
+    endpoint:
+        URL of the endpoint, e.g. the ``base_url`` of OpenAI-compatible models or the
+        ``service_endpoint`` of OCI GenAI models.
+    rate_limiter:
+        The rate limiter of the endpoint. If None, the limiter of the endpoint is removed.
+    model_id:
+        Optional model to which the limiter applies. If None, the limiter is shared by all the
+        models of the endpoint that do not have their own limiter.
+    """
+    SharedLlmRateLimiters().set(endpoint, rate_limiter, model_id=model_id)
+
+
+@asynccontextmanager
+async def _rate_limited_request(
+    rate_limiter: Optional[LlmRateLimiter], estimated_tokens: int
+) -> AsyncGenerator[_RateLimitedRequest, None]:
+    """
+    Waits until a request can be sent with the given limiter, and tracks it until it completes.
+    Without limiter, the request is sent right away.
+    """
+    if rate_limiter is None:
+        request = _RateLimitedRequest(None, estimated_tokens)
+    else:
+        request = await rate_limiter._acquire(estimated_tokens)
+    # requests without limiter also set the active request, so that their rate limited
+    # responses are not attributed to the limiter of an enclosing request
+    context_token = _ACTIVE_RATE_LIMITED_REQUEST.set(request)
+    succeeded = False
+    try:
+        yield request
+        succeeded = True
+    finally:
+        try:
+            _ACTIVE_RATE_LIMITED_REQUEST.reset(context_token)
+        except ValueError:
+            # the request was closed from another context (e.g. a stream garbage collected)
+            pass
+        if rate_limiter is not None:
+            rate_limiter._release(request, succeeded=succeeded)
+
+
+def _report_rate_limited_response(retry_after_seconds: Optional[float]) -> None:
+    """Reports a 429 response of the endpoint to the limiter of the active request, if any."""
+    request = _ACTIVE_RATE_LIMITED_REQUEST.get()
+    if request is not None and request.limiter is not None:
+        request.limiter._on_rate_limited(request, retry_after_seconds)
@@ -0,0 +1,453 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import copy
+import logging
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from wayflowcore.tokenusage import TokenUsage
+
+if TYPE_CHECKING:
+    from wayflowcore.datastore import Datastore, Entity
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TokenUsageRecord:
+    """
+    Token usage of a single LLM generation.
+
+    Parameters
+    ----------
+    model_id:
+        ID of the model that performed the generation.
+    token_usage:
+        Tokens consumed by the generation.
+    conversation_id:
+        ID of the conversation in which the generation happened, ``None`` for standalone generations.
+    component_name:
+        Name of the agent or flow executing the conversation, ``None`` for standalone generations.
+    step_name:
+        Name of the flow step that performed the generation, ``None`` outside of flows.
+    created_at:
+        Timestamp of the generation, in seconds since the epoch.
+    """
+
+    model_id: str
+    token_usage: TokenUsage
+    conversation_id: Optional[str] = None
+    component_name: Optional[str] = None
+    step_name: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+
+    def _to_entity(self) -> Dict[str, Any]:
+        return {
+            "model_id": self.model_id,
+            "conversation_id": self.conversation_id or "",
+            "component_name": self.component_name or "",
+            "step_name": self.step_name or "",
+            "input_tokens": self.token_usage.input_tokens,
+            "output_tokens": self.token_usage.output_tokens,
+            "cached_tokens": self.token_usage.cached_tokens,
+            "reasoning_tokens": self.token_usage.reasoning_tokens,
+            "total_tokens": self.token_usage.total_tokens,
+            "exact_count": self.token_usage.exact_count,
+            "created_at": self.created_at,
+        }
+
+
+# last_used_at, token_usage, token_usage_per_step (None outside of flows)
+_ConversationTokenUsage = Tuple[float, TokenUsage, Optional[Dict[str, TokenUsage]]]
+
+
+def _copy_token_usage(token_usage: Optional[TokenUsage]) -> TokenUsage:
+    usage = TokenUsage(exact_count=True)
+    if token_usage is not None:
+        usage += token_usage
+    return usage
+
+
+class TokenUsageStore(ABC):
+    # whether the store can report the token usage of individual conversations
+    _tracks_conversation_token_usage: bool = True
+
+    def __init__(
+        self,
+        datastore: Optional["Datastore"] = None,
+        collection_name: str = "token_usages",
+        flush_batch_size: int = 100,
+    ):
+        """
+        Base class for the stores accounting the token usage of LLM models.
+
+        Stores are called after each generation of the models using them, and can optionally
+        flush the usage records to a datastore, in batches. Full batches are written in a background
+        thread, so that generations are not blocked by the datastore. If writing a batch fails, the
+        error is logged and its records are dropped. The thread is stopped when the store is closed
+        with ``close``, garbage collected, or at program termination.
+
+        Parameters
+        ----------
+        datastore:
+            Optional datastore to which the usage records are flushed. When ``None``, the records
+            are only accounted in memory.
+
+            .. important::
+
+                The datastore needs to have a collection called ``collection_name``, whose entries
+                are defined with ``TokenUsageStore.get_entity_definition``.
+
+        collection_name:
+            Name of the collection of the datastore in which the usage records are written.
+        flush_batch_size:
+            Number of usage records that are buffered before being written to the datastore.
+            Remaining records can be written at any time with ``flush``.
+        """
+        if flush_batch_size < 1:
+            raise ValueError(f"`flush_batch_size` should be at least 1, but was {flush_batch_size}")
+        self.datastore = datastore
+        self.collection_name = collection_name
+        self.flush_batch_size = flush_batch_size
+        self._lock = threading.Lock()
+        self._pending_records: List[TokenUsageRecord] = []
+        self._write_executor: Optional[ThreadPoolExecutor] = None
+        self._pending_writes: Set["Future[None]"] = set()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # copies (e.g. of the LLM models using the store) keep the accounted token usage, but the
+        # records pending to be written stay owned by the original store
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_write_executor"] = None
+        state["_pending_records"] = []
+        state["_pending_writes"] = set()
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "TokenUsageStore":
+        # the datastore is an external resource, shared with the copies
+        store_copy = self.__class__.__new__(self.__class__)
+        memo[id(self)] = store_copy
+        state = self.__getstate__()
+        datastore = state.pop("datastore")
+        store_copy.__setstate__({**copy.deepcopy(state, memo), "datastore": datastore})
+        return store_copy
+
+    def record(self, record: TokenUsageRecord) -> None:
+        """
+        Accounts the token usage of a generation, and flushes the pending records in the background
+        when a batch is full.
+        """
+        with self._lock:
+            self._record_impl(record)
+            if self.datastore is None:
+                return
+            self._pending_records.append(record)
+            if len(self._pending_records) < self.flush_batch_size:
+                return
+            records, self._pending_records = self._pending_records, []
+            if self._write_executor is None:
+                # a single worker keeps the batches in order and bounds the load on the datastore
+                self._write_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="wayflow_token_usage_store"
+                )
+                # stops the writer thread once the store is garbage collected, or at program
+                # termination. Batches already submitted are still written
+                weakref.finalize(self, self._write_executor.shutdown, wait=False)
+            future = self._write_executor.submit(self._write_records_in_background, records)
+            self._pending_writes.add(future)
+        # registered outside of the lock, since the callback runs directly if the write is done
+        future.add_done_callback(self._on_write_done)
+
+    def flush(self) -> None:
+        """
+        Writes the pending usage records to the datastore, after waiting for the batches being
+        written in the background.
+        """
+        with self._lock:
+            records, self._pending_records = self._pending_records, []
+            pending_writes = list(self._pending_writes)
+        if pending_writes:
+            wait(pending_writes)
+        if records:
+            self._write_records(records)
+
+    def close(self) -> None:
+        """
+        Writes the pending usage records to the datastore and stops the background writer thread.
+        The store can still be used afterwards, the thread is started again when needed.
+        """
+        self.flush()
+        with self._lock:
+            write_executor, self._write_executor = self._write_executor, None
+        if write_executor is not None:
+            write_executor.shutdown(wait=True)
+
+    def _write_records(self, records: List[TokenUsageRecord]) -> None:
+        if self.datastore is None:
+            return
+        logger.debug("Flushing %s token usage records", len(records))
+        self.datastore.create(self.collection_name, [record._to_entity() for record in records])
+
+    def _write_records_in_background(self, records: List[TokenUsageRecord]) -> None:
+        try:
+            self._write_records(records)
+        except Exception:
+            logger.exception(
+                "Failed to write %s token usage records to the datastore, they are dropped",
+                len(records),
+            )
+
+    def _on_write_done(self, future: "Future[None]") -> None:
+        with self._lock:
+            self._pending_writes.discard(future)
+
+    @abstractmethod
+    def _record_impl(self, record: TokenUsageRecord) -> None:
+        """Accounts a usage record. Called while holding the lock of the store."""
+
+    @abstractmethod
+    def get_conversation_token_usage(self, conversation_id: str) -> TokenUsage:
+        """
+        Returns the total token usage of a conversation.
+
+        Parameters
+        ----------
+        conversation_id:
+            ID of the conversation.
+        """
+
+    def _get_token_usages_per_conversation(
+        self,
+    ) -> Dict[str, Tuple[TokenUsage, Optional[Dict[str, TokenUsage]]]]:
+        # Returns, for each tracked conversation, its total token usage and its usage per flow step
+        # (None for conversations executed outside of flows). Only used by the deprecated
+        # ``token_usages_flow`` and ``token_usages_flexible`` attributes of ``LlmModel``.
+        raise ValueError(
+            f"`{self.__class__.__name__}` does not track the token usage of individual conversations. "
+            "Use an `InMemoryTokenUsageStore` instead."
+        )
+
+    @staticmethod
+    def get_entity_definition() -> "Entity":
+        from wayflowcore.datastore import Entity
+        from wayflowcore.property import (
+            BooleanProperty,
+            FloatProperty,
+            IntegerProperty,
+            StringProperty,
+        )
+
+        return Entity(
+            properties={
+                "model_id": StringProperty(),
+                "conversation_id": StringProperty(),
+                "component_name": StringProperty(),
+                "step_name": StringProperty(),
+                "input_tokens": IntegerProperty(),
+                "output_tokens": IntegerProperty(),
+                "cached_tokens": IntegerProperty(),
+                "reasoning_tokens": IntegerProperty(),
+                "total_tokens": IntegerProperty(),
+                "exact_count": BooleanProperty(),
+                "created_at": FloatProperty(),
+            }
+        )
+
+
+class InMemoryTokenUsageStore(TokenUsageStore):
+    def __init__(
+        self,
+        max_conversations: Optional[int] = 10_000,
+        conversation_ttl: Optional[float] = None,
+        datastore: Optional["Datastore"] = None,
+        collection_name: str = "token_usages",
+        flush_batch_size: int = 100,
+    ):
+        """
+        Token usage store accounting the total token usage of each conversation in memory, and
+        the token usage of each step for flow conversations.
+
+        The number of tracked conversations is bounded: the least recently used conversations are
+        evicted when ``max_conversations`` is exceeded, and conversations that did not use the model
+        for ``conversation_ttl`` seconds are evicted. The token usage of an evicted conversation
+        restarts from 0 if it uses the model again, so ``max_conversations`` should be larger than
+        the number of conversations running concurrently. A warning is logged when a conversation is
+        evicted before expiring.
+
+        Parameters
+        ----------
+        max_conversations:
+            Maximum number of conversations whose token usage is kept.
+            If None, there is no limit on the number of conversations.
+        conversation_ttl:
+            Time in seconds after its last generation after which the token usage of a conversation is evicted.
+            If None, conversations are only evicted when ``max_conversations`` is exceeded.
+        datastore:
+            Optional datastore to which the usage records are flushed. See ``TokenUsageStore``.
+        collection_name:
+            Name of the collection of the datastore in which the usage records are written.
+        flush_batch_size:
+            Number of usage records that are buffered before being written to the datastore.
+        """
+        if max_conversations is not None and max_conversations < 1:
+            raise ValueError(
+                f"`max_conversations` should be at least 1, but was {max_conversations}"
+            )
+        if conversation_ttl is not None and conversation_ttl <= 0:
+            raise ValueError(f"`conversation_ttl` should be positive, but was {conversation_ttl}")
+        super().__init__(
+            datastore=datastore, collection_name=collection_name, flush_batch_size=flush_batch_size
+        )
+        self.max_conversations = max_conversations
+        self.conversation_ttl = conversation_ttl
+        # conversation_id -> (last_used_at, token_usage, token_usage_per_step), ordered from least to
+        # most recently used. The usage per step is None for conversations executed outside of flows
+        self._conversations: "OrderedDict[str, _ConversationTokenUsage]" = OrderedDict()
+
+    def _remove_expired_conversations(self, now: float) -> None:
+        if self.conversation_ttl is None:
+            return
+        # entries are ordered by last use, so expired entries are at the beginning
+        while self._conversations:
+            last_used_at, _, _ = next(iter(self._conversations.values()))
+            if now - last_used_at <= self.conversation_ttl:
+                break
+            self._conversations.popitem(last=False)
+
+    def _record_impl(self, record: TokenUsageRecord) -> None:
+        if record.conversation_id is None:
+            return
+        now = time.time()
+        self._remove_expired_conversations(now)
+        _, token_usage, step_token_usages = self._conversations.pop(
+            record.conversation_id, (now, None, None)
+        )
+        token_usage = token_usage or TokenUsage(exact_count=True)
+        token_usage += record.token_usage
+        if record.step_name is not None:
+            step_token_usages = step_token_usages or {}
+            if record.step_name not in step_token_usages:
+                step_token_usages[record.step_name] = TokenUsage(exact_count=True)
+            step_token_usages[record.step_name] += record.token_usage
+        self._conversations[record.conversation_id] = (now, token_usage, step_token_usages)
+        if self.max_conversations is not None:
+            while len(self._conversations) > self.max_conversations:
+                evicted_conversation_id, (last_used_at, _, _) = self._conversations.popitem(
+                    last=False
+                )
+                # the conversation did not expire, so it might still be running
+                logger.warning(
+                    "Evicting the token usage of conversation %s, last used %.1f seconds ago, as more "
+                    "than %s conversations are tracked. Its token usage restarts from 0, including "
+                    "for the token limit execution interrupts.",
+                    evicted_conversation_id,
+                    now - last_used_at,
+                    self.max_conversations,
+                )
+
+    def get_conversation_token_usage(self, conversation_id: str) -> TokenUsage:
+        with self._lock:
+            self._remove_expired_conversations(time.time())
+            _, token_usage, _ = self._conversations.get(conversation_id, (0.0, None, None))
+            return _copy_token_usage(token_usage)
+
+    def _get_token_usages_per_conversation(
+        self,
+    ) -> Dict[str, Tuple[TokenUsage, Optional[Dict[str, TokenUsage]]]]:
+        with self._lock:
+            self._remove_expired_conversations(time.time())
+            token_usages = {}
+            for conversation_id, (_, token_usage, step_token_usages) in self._conversations.items():
+                if step_token_usages is not None:
+                    step_token_usages = {
+                        step_name: _copy_token_usage(step_token_usage)
+                        for step_name, step_token_usage in step_token_usages.items()
+                    }
+                token_usages[conversation_id] = (_copy_token_usage(token_usage), step_token_usages)
+            return token_usages
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._remove_expired_conversations(time.time())
+            return len(self._conversations)
+
+
+class AggregatedTokenUsageStore(TokenUsageStore):
+    _tracks_conversation_token_usage = False
+
+    def __init__(
+        self,
+        datastore: Optional["Datastore"] = None,
+        collection_name: str = "token_usages",
+        flush_batch_size: int = 100,
+    ):
+        """
+        Token usage store only keeping aggregated counters per model, per agent or flow, and per step.
+
+        Its memory usage does not depend on the number of conversations, but it cannot report the
+        token usage of individual conversations, so it cannot be used with
+        ``SoftTokenLimitExecutionInterrupt``. Per-conversation records can still be kept by flushing
+        them to a datastore.
+
+        Parameters
+        ----------
+        datastore:
+            Optional datastore to which the usage records are flushed. See ``TokenUsageStore``.
+        collection_name:
+            Name of the collection of the datastore in which the usage records are written.
+        flush_batch_size:
+            Number of usage records that are buffered before being written to the datastore.
+        """
+        super().__init__(
+            datastore=datastore, collection_name=collection_name, flush_batch_size=flush_batch_size
+        )
+        self._per_model: Dict[str, TokenUsage] = {}
+        self._per_component: Dict[str, TokenUsage] = {}
+        self._per_step: Dict[Tuple[str, str], TokenUsage] = {}
+
+    def _record_impl(self, record: TokenUsageRecord) -> None:
+        counters: List[Tuple[Dict[Any, TokenUsage], Any]] = [(self._per_model, record.model_id)]
+        if record.component_name is not None:
+            counters.append((self._per_component, record.component_name))
+            if record.step_name is not None:
+                counters.append((self._per_step, (record.component_name, record.step_name)))
+        for counter, key in counters:
+            if key not in counter:
+                counter[key] = TokenUsage(exact_count=True)
+            counter[key] += record.token_usage
+
+    def get_conversation_token_usage(self, conversation_id: str) -> TokenUsage:
+        raise ValueError(
+            "`AggregatedTokenUsageStore` does not track the token usage of individual conversations. "
+            "Use an `InMemoryTokenUsageStore` instead."
+        )
+
+    def get_token_usage_per_model(self) -> Dict[str, TokenUsage]:
+        """Returns the token usage of each model, including standalone generations."""
+        with self._lock:
+            return {key: _copy_token_usage(usage) for key, usage in self._per_model.items()}
+
+    def get_token_usage_per_component(self) -> Dict[str, TokenUsage]:
+        """Returns the token usage of each agent or flow, by name."""
+        with self._lock:
+            return {key: _copy_token_usage(usage) for key, usage in self._per_component.items()}
+
+    def get_token_usage_per_step(self) -> Dict[Tuple[str, str], TokenUsage]:
+        """Returns the token usage of each flow step, by flow name and step name."""
+        with self._lock:
+            return {key: _copy_token_usage(usage) for key, usage in self._per_step.items()}
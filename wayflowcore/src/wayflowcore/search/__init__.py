@@ -10,6 +10,7 @@ from .vectorgenerator import SimpleVectorGenerator, VectorGenerator
 from .vectorindex import (
     BaseInMemoryVectorIndex,
     EntityVectorIndex,
+    IVFEntityVectorIndex,
     OracleDatabaseVectorIndex,
     VectorIndex,
 )
@@ -22,6 +23,7 @@ __all__ = [
     "VectorIndex",
     "BaseInMemoryVectorIndex",
     "EntityVectorIndex",
+    "IVFEntityVectorIndex",
     "VectorGenerator",
     "SimpleVectorGenerator",
     "SimilarityMetric",
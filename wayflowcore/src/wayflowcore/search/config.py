@@ -89,6 +89,21 @@ class VectorRetrieverConfig(SerializableDataclass, RetrieverConfig):
             - inner_product (SimilarityMetric.DOT)
     **index_params
         Additional parameters for the index configuration.
+
+        For ``InMemoryDatastore``, ``index_type`` selects the in-memory index of the vector config
+        used by this retriever:
+
+        - ``"flat"`` (default): exact search with ``EntityVectorIndex``;
+        - ``"ivf"``: approximate search with ``IVFEntityVectorIndex``. The other parameters
+          (e.g. ``nprobe``, ``num_partitions``, ``min_training_size``) are passed to the index.
+          Increasing ``nprobe`` improves the recall at the cost of latency.
+
+        The other parameters configure the storage of the vectors of both index types, to reduce
+        their memory footprint: ``storage_dtype`` (``"float32"``, ``"float16"``, ``"int8"`` or
+        ``"binary"``), ``rescore_factor`` and ``keep_vectors_in_items``
+        (see ``EntityVectorIndex``).
+
+        Example: ``index_params={"index_type": "ivf", "nprobe": 16, "storage_dtype": "int8"}``.
     """
 
     vectors: Optional[Union[str, "VectorConfig"]] = None
@@ -7,6 +7,7 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List
 
+from wayflowcore._utils.async_helpers import run_sync_in_thread
 from wayflowcore.embeddingmodels import EmbeddingModel
 from wayflowcore.search.config import ConcatSerializerConfig, VectorConfig
 
@@ -32,6 +33,18 @@ class VectorGenerator(ABC):
             List of vectors, one per entity.
         """
 
+    async def generate_vectors_async(
+        self,
+        entities: List[Dict[str, Any]],
+    ) -> List[List[float]]:
+        """Generate vectors for a list of entities, in an asynchronous manner.
+        See the ``generate_vectors`` method to get details about the parameters.
+
+        Generators without a native asynchronous implementation run
+        ``generate_vectors`` in a worker thread, so that the event loop is not blocked.
+        """
+        return await run_sync_in_thread(self.generate_vectors, entities)
+
 
 class SimpleVectorGenerator(VectorGenerator):
     """Vector generator for simple vector generation.
@@ -79,3 +92,7 @@ class SimpleVectorGenerator(VectorGenerator):
         vectors = self.embedding_model.embed(texts)
 
         return vectors
+
+    async def generate_vectors_async(self, entities: List[Dict[str, Any]]) -> List[List[float]]:
+        texts = [self.serializer.serialize(entity) for entity in entities]
+        return await self.embedding_model.embed_async(texts)
@@ -4,13 +4,34 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+import json
 import warnings
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, cast
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import numpy as np
 import numpy.typing as npt
 
+from wayflowcore._utils.io_utils import (
+    load_columnar_records,
+    save_columnar_records,
+    secure_save_npy,
+    secure_write_json,
+)
 from wayflowcore._utils.lazy_loader import LazyLoader
 from wayflowcore.datastore.entity import EntityAsDictT
 from wayflowcore.exceptions import DatastoreError
@@ -44,10 +65,56 @@ class VectorIndex(ABC):
     ) -> List[Dict[str, Any]]:
         """Search for k nearest neighbors with additional filtering and exclusion options."""
 
+    def search_batch(
+        self,
+        query_vectors: List[List[float]],
+        k: int,
+        metric: SimilarityMetric = SimilarityMetric.COSINE,
+        where: Optional[Dict[str, Any]] = None,
+        columns_to_exclude: Optional[List[str]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for the k nearest neighbors of several query vectors at once.
+
+        Indices can override this method to share work between the queries. By default,
+        the queries are searched one after the other.
+
+        Parameters
+        ----------
+        query_vectors
+            Query vectors.
+        k
+            Number of results to return for each query.
+        metric
+            Distance metric to use to get neighbours.
+        where
+            Filter out results by specific row/column entries, for all queries.
+        columns_to_exclude
+            Columns to exclude while returning the final results.
+
+        Returns
+        -------
+        List[List[Dict[str, Any]]]
+            List of matching items for each query vector, in the order of the query vectors.
+        """
+        return [
+            self.search(
+                query_vector,
+                k,
+                metric=metric,
+                where=where,
+                columns_to_exclude=columns_to_exclude,
+            )
+            for query_vector in query_vectors
+        ]
+
 
 class OracleDatabaseVectorIndex(VectorIndex):
     """Base class for OracleDB vector indices. Acts as an interface between the Vector Index on OracleDB and Wayflow"""
 
+    # Additional columns used to split and order the results of batched searches
+    _QUERY_INDEX_COLUMN = "wayflow_query_index"
+    _DISTANCE_COLUMN = "wayflow_distance"
+
     def __init__(
         self,
         engine: "sqlalchemy.Engine",
@@ -112,6 +179,94 @@ class OracleDatabaseVectorIndex(VectorIndex):
             List of matching items.
         """
 
+        query, vector_distance = self._prepare_select(metric, where, columns_to_exclude)
+
+        result_rows = self._execute(
+            query.order_by(vector_distance(query_vector)).fetch(k, oracle_fetch_approximate=True)
+        )
+
+        result: List[Dict[str, Any]] = []
+        for row in result_rows:
+            result.append(self._coerce_row(row))
+        return result
+
+    def search_batch(
+        self,
+        query_vectors: List[List[float]],
+        k: int,
+        metric: SimilarityMetric = SimilarityMetric.COSINE,
+        where: Optional[Dict[str, Any]] = None,
+        columns_to_exclude: Optional[List[str]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for the k nearest neighbors of several query vectors with a single SQL query.
+
+        The approximate top-k queries of all query vectors are combined with ``UNION ALL``, so that
+        all the results are retrieved in one round trip to the database.
+
+        Parameters
+        ----------
+        query_vectors
+            Query vectors.
+        k
+            Number of results to return for each query.
+        metric
+            Distance metric to use to get neighbours. See ``search`` for the supported metrics.
+        where
+            Filter out results by specific row/column entries, for all queries.
+        columns_to_exclude
+            Columns to exclude while returning the final results.
+
+        Returns
+        -------
+        List[List[Dict[str, Any]]]
+            List of matching items for each query vector, in the order of the query vectors.
+        """
+        if len(query_vectors) == 0:
+            return []
+
+        query, vector_distance = self._prepare_select(metric, where, columns_to_exclude)
+
+        per_query_selects = []
+        for query_index, query_vector in enumerate(query_vectors):
+            distance = vector_distance(query_vector)
+            per_query_select = (
+                query.add_columns(
+                    sqlalchemy.literal(query_index).label(self._QUERY_INDEX_COLUMN),
+                    distance.label(self._DISTANCE_COLUMN),
+                )
+                .order_by(distance)
+                .fetch(k, oracle_fetch_approximate=True)
+                .subquery()
+            )
+            per_query_selects.append(sqlalchemy.select(per_query_select))
+
+        result_rows = self._execute(sqlalchemy.union_all(*per_query_selects))
+
+        # The order of the rows is not guaranteed across the branches of the union
+        rows_per_query: List[List[Any]] = [[] for _ in query_vectors]
+        for row in result_rows:
+            rows_per_query[row[self._QUERY_INDEX_COLUMN]].append(row)
+
+        results: List[List[Dict[str, Any]]] = []
+        for rows in rows_per_query:
+            rows.sort(key=lambda row: row[self._DISTANCE_COLUMN])
+            results.append(
+                [
+                    self._coerce_row(
+                        row, excluded_keys={self._QUERY_INDEX_COLUMN, self._DISTANCE_COLUMN}
+                    )
+                    for row in rows
+                ]
+            )
+        return results
+
+    def _prepare_select(
+        self,
+        metric: SimilarityMetric,
+        where: Optional[Dict[str, Any]],
+        columns_to_exclude: Optional[List[str]],
+    ) -> Tuple["sqlalchemy.Select[Any]", Any]:
+        """Build the filtered select statement and get the distance function of the metric."""
         if not hasattr(self.vector_column, metric):
             raise ValueError(f"Invalid Distance Metric specified: {metric}")
 
@@ -136,21 +291,21 @@ class OracleDatabaseVectorIndex(VectorIndex):
                         f"{column_name} passed through `where` method is not present in the table {self.table}",
                         UserWarning,
                     )
+        return query, vector_distance
 
+    def _execute(self, statement: Any) -> List[Any]:
         with self.engine.connect() as connection:
             try:
-                results = connection.execute(
-                    query.order_by(vector_distance(query_vector)).fetch(
-                        k, oracle_fetch_approximate=True
-                    )
-                )
-                result_rows = results.mappings().all()
+                results = connection.execute(statement)
+                return list(results.mappings().all())
             except sqlalchemy.exc.DatabaseError as e:
                 raise DatastoreError(
                     "SQL query execution failed. See stacktrace to find out more "
                     "(note: bind variables should be provided with the :varname syntax)"
                 ) from e
 
+    @staticmethod
+    def _coerce_row(row: Any, excluded_keys: Optional[Set[str]] = None) -> Dict[str, Any]:
         def _coerce_value(value: Any) -> Any:
             # Convert driver-/library-specific wrappers to plain Python objects
             # - Oracle LOBs -> read() to get bytes/str
@@ -171,11 +326,12 @@ class OracleDatabaseVectorIndex(VectorIndex):
             # Keep builtin/stdlib scalar types as-is; SQLAlchemy already returns Python types for most columns
             return value
 
-        result: List[Dict[str, Any]] = []
-        for row in result_rows:
-            # row is a RowMapping; ensure keys are plain strings and values are plain Python objects
-            result.append({str(k): _coerce_value(v) for k, v in row.items()})
-        return result
+        # row is a RowMapping; ensure keys are plain strings and values are plain Python objects
+        return {
+            str(k): _coerce_value(v)
+            for k, v in row.items()
+            if not excluded_keys or str(k) not in excluded_keys
+        }
 
 
 class BaseInMemoryVectorIndex(VectorIndex):
@@ -184,7 +340,28 @@ class BaseInMemoryVectorIndex(VectorIndex):
     # Memory limit for batched computations prevents OOM errors on large datasets
     _MAX_SIMILARITY_MEMORY_CONSUMPTION_BYTES = 100000000  # 100MB
 
-    def __init__(self, dimension: int, metric: SimilarityMetric = SimilarityMetric.COSINE):
+    # Removed items are only marked as deleted (tombstoned) and are physically dropped once they
+    # represent this fraction of the stored vectors, which keeps removals O(1) amortized
+    _COMPACTION_TOMBSTONE_RATIO = 0.25
+
+    # Numpy dtype used to store the vectors for each storage dtype. Binary vectors are stored as
+    # packed sign bits, 8 dimensions per byte
+    _STORAGE_DTYPES: Dict[str, Any] = {
+        "float32": np.float32,
+        "float16": np.float16,
+        "int8": np.int8,
+        "binary": np.uint8,
+    }
+    # Number of bits set in each byte value, used to compute Hamming distances on packed bits
+    _POPCOUNT_TABLE = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+    def __init__(
+        self,
+        dimension: int,
+        metric: SimilarityMetric = SimilarityMetric.COSINE,
+        storage_dtype: str = "float32",
+        rescore_factor: int = 4,
+    ):
         """Initialize the vector index.
 
         Parameters
@@ -195,13 +372,49 @@ class BaseInMemoryVectorIndex(VectorIndex):
             Distance metric to use (SimilarityMetric.COSINE, SimilarityMetric.EUCLIDEAN, SimilarityMetric.DOT).
             Must be one of the SimilarityMetric enum values.
             Default: SimilarityMetric.COSINE.
+        storage_dtype
+            Type used to store the vectors in memory:
+
+            - ``"float32"`` (default): full precision;
+            - ``"float16"``: half precision, 2x less memory;
+            - ``"int8"``: scalar quantization with a per-dimension scale, 4x less memory;
+            - ``"binary"``: sign bits ranked by Hamming distance, 32x less memory. Only suited
+              to high dimensional vectors, and usually requires a higher ``rescore_factor``
+              (e.g. 10) to reach a good recall.
+        rescore_factor
+            With quantized storage, the ``k * rescore_factor`` best candidates of the approximate
+            search are re-scored exactly with the full-precision vectors, when available.
         """
+        if storage_dtype not in self._STORAGE_DTYPES:
+            raise ValueError(
+                f"Unknown storage dtype: {storage_dtype}. Available dtypes are: {list(self._STORAGE_DTYPES)}"
+            )
+        if rescore_factor < 1:
+            raise ValueError(
+                f"rescore_factor should be a positive integer, but got {rescore_factor}"
+            )
         self.dimension = dimension
         self.metric = metric
+        self.storage_dtype = storage_dtype
+        self.rescore_factor = rescore_factor
+        # Per-dimension scales of the int8 quantization, only grown as larger values are added
+        self._int8_scales: Optional[npt.NDArray[np.float32]] = None
         self.vectors: Optional[npt.NDArray[Any]] = None
         self.vectors_arr_size = 0
         self.items: List[Dict[str, Any]] = []  # General storage for entities
         self.num_vectors = 0
+        # Stable identifiers of the items, used to update or remove them in place.
+        # _item_ids is aligned with self.items, and _item_id_to_row_id only contains live items
+        self._item_ids: List[Hashable] = []
+        self._item_id_to_row_id: Dict[Hashable, int] = {}
+        # Rows of removed items, which are skipped at search time until the next compaction
+        self._tombstones = np.zeros(0, dtype=bool)
+        self._num_tombstones = 0
+        # Lazily built inverted indices used for filtered search:
+        # column name -> column value -> sorted row ids of the items having this value.
+        # A column maps to None when one of its values is unhashable (e.g. a list), in which case
+        # filtering on that column falls back to a linear scan over the items.
+        self._inverted_indices: Dict[str, Optional[Dict[Any, List[int]]]] = {}
 
     def search(
         self,
@@ -213,6 +426,10 @@ class BaseInMemoryVectorIndex(VectorIndex):
     ) -> List[Dict[str, Any]]:
         """Search for k nearest neighbors using efficient batched computation.
 
+        When ``where`` filters are given, the rows matching all filters are resolved first using
+        per-column inverted indices, and the distances are only computed for these rows. The
+        search therefore always returns up to ``k`` results satisfying the filters.
+
         Parameters
         ----------
         query_vector
@@ -235,53 +452,314 @@ class BaseInMemoryVectorIndex(VectorIndex):
         if self.vectors is None or self.num_vectors == 0 or len(self.items) == 0:
             return []
 
+        # Restrict the search to the rows matching the filters before computing any distance
+        row_ids: Optional[npt.NDArray[np.intp]] = None
+        if where:
+            row_ids = self._get_matching_row_ids(where)
+        if self._num_tombstones > 0:
+            row_ids = self._get_live_row_ids(row_ids)
+        if row_ids is not None and len(row_ids) == 0:
+            return []
+
         orig_metric = self.metric
 
         # Compatibility: override self.metric if requested for this search only
         if metric:
             self.metric = metric
 
-        # Convert query to numpy array
-        query = np.array(query_vector, dtype=np.float32).reshape(1, -1)
-        query = self._safe_normalize_vectors(query)
+        try:
+            # Convert query to numpy array
+            query = np.array(query_vector, dtype=np.float32).reshape(1, -1)
+            query = self._safe_normalize_vectors(query)
 
-        # Cap k to available vectors to avoid unnecessary work
-        k = min(k, self.num_vectors)
+            row_ids = self._get_candidate_row_ids(query, k, row_ids)
+            num_candidates = self.num_vectors if row_ids is None else len(row_ids)
 
-        # Compute distances based on metric using batched approach
-        distances, get_highest_distances = self._compute_distances(query)
+            # Cap k to available vectors to avoid unnecessary work
+            k = min(k, num_candidates)
 
-        # Use argpartition for O(n) average complexity instead of O(n log n) sort
-        # Only partially sorts to find the k best elements
-        if k >= self.num_vectors:
-            # Return all vectors
-            indices = np.arange(self.num_vectors)
-        else:
-            # argpartition finds k largest values without full sort
-            # Get the actual distances for these indices
-            # Sort only the k results
-            if get_highest_distances:
-                indices = np.argpartition(distances, -k)[-k:]
-                top_distances = distances[indices]
-                sorted_order = np.argsort(-top_distances)
-                indices = indices[sorted_order]
-            else:
-                indices = np.argpartition(distances, k)[:k]
-                top_distances = distances[indices]
-                sorted_order = np.argsort(top_distances)
-                indices = indices[sorted_order]
+            # Compute distances based on metric using batched approach
+            distances, get_highest_distances = self._compute_distances(query, row_ids)
+            if self.storage_dtype != "float32":
+                row_ids, distances, get_highest_distances = self._rescore(
+                    query, k, row_ids, distances, get_highest_distances
+                )
 
-        results = self._build_results(indices, distances, columns_to_exclude=columns_to_exclude)
+            indices = self._select_top_k(distances, k, get_highest_distances)
 
-        # Restore original metric
-        self.metric = orig_metric
+            results = self._build_results(
+                indices, distances, columns_to_exclude=columns_to_exclude, row_ids=row_ids
+            )
+        finally:
+            # Restore original metric
+            self.metric = orig_metric
+
+        return results
+
+    def search_batch(
+        self,
+        query_vectors: List[List[float]],
+        k: int,
+        metric: Optional[SimilarityMetric] = None,
+        where: Optional[Dict[str, Any]] = None,
+        columns_to_exclude: Optional[List[str]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for the k nearest neighbors of several query vectors at once.
 
-        # Apply filter if there are any
+        The distances of all queries are computed with one matrix multiplication, processed in
+        chunks of queries to cap the memory consumption, and the top-k of each query is selected
+        with a row-wise partial sort.
+
+        Parameters
+        ----------
+        query_vectors
+            Query vectors.
+        k
+            Number of results to return for each query.
+        metric
+            Distance metric to use for search (will temporarily override the instance metric for this search call).
+        where
+            Filter out results by specific row/column entries, for all queries.
+        columns_to_exclude
+            Columns to exclude while returning the final results.
+
+        Returns
+        -------
+        List[List[Dict[str, Any]]]
+            List of matching items with scores for each query vector, in the order of the query vectors.
+        """
+        if len(query_vectors) == 0:
+            return []
+        if self.storage_dtype != "float32":
+            # Quantized vectors are decoded by blocks and re-scored, one query at a time
+            return [
+                self.search(
+                    query_vector,
+                    k,
+                    metric=metric,
+                    where=where,
+                    columns_to_exclude=columns_to_exclude,
+                )
+                for query_vector in query_vectors
+            ]
+        if self.vectors is None or self.num_vectors == 0 or len(self.items) == 0:
+            return [[] for _ in query_vectors]
+
+        row_ids: Optional[npt.NDArray[np.intp]] = None
         if where:
-            results = [r for r in results if self._matches_filters(r, where)]
+            row_ids = self._get_matching_row_ids(where)
+        if self._num_tombstones > 0:
+            row_ids = self._get_live_row_ids(row_ids)
+        if row_ids is not None and len(row_ids) == 0:
+            return [[] for _ in query_vectors]
+
+        orig_metric = self.metric
+        if metric:
+            self.metric = metric
+
+        try:
+            queries = np.array(query_vectors, dtype=np.float32).reshape(len(query_vectors), -1)
+            queries = self._safe_normalize_vectors(queries)
+
+            vectors = self.vectors[: self.num_vectors] if row_ids is None else self.vectors[row_ids]
+            num_candidates = len(vectors)
+            k = min(k, num_candidates)
+            squared_norms = (
+                np.sum(vectors * vectors, axis=1)
+                if self.metric == SimilarityMetric.EUCLIDEAN
+                else None
+            )
+
+            # Number of queries whose distances fit in the memory budget
+            queries_per_chunk = max(
+                1, int(self._MAX_SIMILARITY_MEMORY_CONSUMPTION_BYTES / (4 * num_candidates))
+            )
+            results: List[List[Dict[str, Any]]] = []
+            for start_idx in range(0, len(queries), queries_per_chunk):
+                distances, get_highest_distances = self._compute_distances_batch(
+                    queries[start_idx : start_idx + queries_per_chunk], vectors, squared_norms
+                )
+                indices = self._select_top_k_batch(distances, k, get_highest_distances)
+                for query_indices, query_distances in zip(indices, distances):
+                    results.append(
+                        self._build_results(
+                            query_indices,
+                            query_distances,
+                            columns_to_exclude=columns_to_exclude,
+                            row_ids=row_ids,
+                        )
+                    )
+        finally:
+            self.metric = orig_metric
 
         return results
 
+    def _compute_distances_batch(
+        self,
+        queries: npt.NDArray[Any],
+        vectors: npt.NDArray[Any],
+        squared_norms: Optional[npt.NDArray[Any]] = None,
+    ) -> Tuple[npt.NDArray[Any], bool]:
+        """Compute the distances between several queries and the given vectors.
+
+        Returns the distances matrix of shape ``(num_queries, num_vectors)``, and whether the
+        highest distances are the best ones. ``squared_norms`` of the vectors are required for the
+        Euclidean metric.
+        """
+        # Since vectors are pre-normalized for cosine, dot product = cosine similarity
+        similarities = np.matmul(queries, vectors.T, dtype=np.float32)
+        if self.metric in (SimilarityMetric.COSINE, SimilarityMetric.DOT):
+            return similarities, True
+        elif self.metric == SimilarityMetric.EUCLIDEAN:
+            if squared_norms is None:
+                squared_norms = np.sum(vectors * vectors, axis=1)
+            # ||q - x||^2 = ||q||^2 - 2 q.x + ||x||^2, clipped against rounding errors
+            query_squared_norms = np.sum(queries * queries, axis=1, keepdims=True)
+            distances = np.maximum(query_squared_norms - 2 * similarities + squared_norms, 0)
+            return distances, False
+        raise ValueError(f"Unknown metric: {self.metric}")
+
+    @staticmethod
+    def _select_top_k_batch(
+        distances: npt.NDArray[Any], k: int, get_highest_distances: bool
+    ) -> npt.NDArray[np.intp]:
+        """Return the positions of the k best distances of each row, sorted from best to worst."""
+        keys = -distances if get_highest_distances else distances
+        if k >= distances.shape[1]:
+            return cast(npt.NDArray[np.intp], np.argsort(keys, axis=1))
+        indices = np.argpartition(keys, k - 1, axis=1)[:, :k]
+        sorted_order = np.argsort(np.take_along_axis(keys, indices, axis=1), axis=1)
+        return cast(npt.NDArray[np.intp], np.take_along_axis(indices, sorted_order, axis=1))
+
+    def _rescore(
+        self,
+        query: npt.NDArray[Any],
+        k: int,
+        row_ids: Optional[npt.NDArray[np.intp]],
+        distances: npt.NDArray[Any],
+        get_highest_distances: bool,
+    ) -> Tuple[Optional[npt.NDArray[np.intp]], npt.NDArray[Any], bool]:
+        """Re-score the best candidates of an approximate search with full-precision vectors.
+
+        Returns the re-scored rows with their exact distances, or the inputs unchanged if the
+        full-precision vectors are not available.
+        """
+        num_candidates = min(k * self.rescore_factor, len(distances))
+        positions = self._select_top_k(distances, num_candidates, get_highest_distances)
+        candidate_row_ids = positions if row_ids is None else row_ids[positions]
+        exact_vectors = self._get_rescoring_vectors(candidate_row_ids)
+        if exact_vectors is None:
+            return row_ids, distances, get_highest_distances
+        exact_distances, get_highest_distances = self._compute_distances_batch(query, exact_vectors)
+        return candidate_row_ids, exact_distances[0], get_highest_distances
+
+    def _get_rescoring_vectors(
+        self, row_ids: npt.NDArray[np.intp]
+    ) -> Optional[npt.NDArray[np.float32]]:
+        """Get the full-precision (normalized) vectors of the given rows, if they are available."""
+        return None
+
+    def _get_candidate_row_ids(
+        self, query: npt.NDArray[Any], k: int, row_ids: Optional[npt.NDArray[np.intp]]
+    ) -> Optional[npt.NDArray[np.intp]]:
+        """Get the rows to compute exact distances for, among ``row_ids`` (all the rows if None).
+
+        Exact indices consider all the rows, approximate indices can override this method to
+        only return the rows most likely to be the nearest neighbours of the query.
+        """
+        return row_ids
+
+    @staticmethod
+    def _select_top_k(
+        distances: npt.NDArray[Any], k: int, get_highest_distances: bool
+    ) -> npt.NDArray[np.intp]:
+        """Return the positions of the k best distances, sorted from best to worst."""
+        num_candidates = len(distances)
+        # Use argpartition for O(n) average complexity instead of O(n log n) sort
+        # Only partially sorts to find the k best elements
+        if k >= num_candidates:
+            # Return all vectors
+            indices = np.arange(num_candidates)
+            sorted_order = np.argsort(-distances if get_highest_distances else distances)
+            return cast(npt.NDArray[np.intp], indices[sorted_order])
+        # argpartition finds k largest values without full sort
+        # Get the actual distances for these indices
+        # Sort only the k results
+        if get_highest_distances:
+            indices = np.argpartition(distances, -k)[-k:]
+            top_distances = distances[indices]
+            sorted_order = np.argsort(-top_distances)
+        else:
+            indices = np.argpartition(distances, k)[:k]
+            top_distances = distances[indices]
+            sorted_order = np.argsort(top_distances)
+        return cast(npt.NDArray[np.intp], indices[sorted_order])
+
+    def _get_matching_row_ids(self, where: Dict[str, Any]) -> npt.NDArray[np.intp]:
+        """Get the sorted row ids of the items matching all the given filter criteria."""
+        row_ids: Optional[npt.NDArray[np.intp]] = None
+        for column_name, value in where.items():
+            column_row_ids = self._get_column_row_ids(column_name, value)
+            if row_ids is None:
+                row_ids = column_row_ids
+            else:
+                row_ids = np.intersect1d(row_ids, column_row_ids, assume_unique=True)
+            if len(row_ids) == 0:
+                break
+        if row_ids is None:
+            return np.arange(self.num_vectors, dtype=np.intp)
+        return row_ids
+
+    def _get_live_row_ids(
+        self, row_ids: Optional[npt.NDArray[np.intp]] = None
+    ) -> npt.NDArray[np.intp]:
+        """Drop the removed rows from ``row_ids`` (all the rows of the index if None)."""
+        if row_ids is None:
+            return np.flatnonzero(~self._tombstones[: self.num_vectors])
+        return row_ids[~self._tombstones[row_ids]]
+
+    def _get_column_row_ids(self, column_name: str, value: Any) -> npt.NDArray[np.intp]:
+        """Get the sorted row ids of the items whose ``column_name`` entry equals ``value``."""
+        if column_name not in self._inverted_indices:
+            self._inverted_indices[column_name] = self._build_inverted_index(column_name)
+        column_index = self._inverted_indices[column_name]
+
+        try:
+            if column_index is not None:
+                return np.array(column_index.get(value, []), dtype=np.intp)
+        except TypeError:
+            # Unhashable filter value, handled with the linear scan below
+            pass
+
+        return np.flatnonzero(
+            [self._matches_filters(item, {column_name: value}) for item in self.items]
+        ).astype(np.intp)
+
+    def _build_inverted_index(self, column_name: str) -> Optional[Dict[Any, List[int]]]:
+        """Build the mapping from the values of a column to the row ids holding them.
+
+        Returns None if the column contains unhashable values and cannot be indexed.
+        """
+        column_index: Dict[Any, List[int]] = {}
+        for row_id, item in enumerate(self.items):
+            if column_name not in item:
+                continue
+            try:
+                column_index.setdefault(item[column_name], []).append(row_id)
+            except TypeError:
+                return None
+        return column_index
+
+    def _add_to_inverted_indices(self, item: Dict[str, Any], row_id: int) -> None:
+        """Register a newly appended item in the inverted indices that were already built."""
+        for column_name, column_index in self._inverted_indices.items():
+            if column_index is None or column_name not in item:
+                continue
+            try:
+                column_index.setdefault(item[column_name], []).append(row_id)
+            except TypeError:
+                self._inverted_indices[column_name] = None
+
     def _matches_filters(self, entity: EntityAsDictT, where: Dict[str, Any]) -> bool:
         """Check if an entity matches the given filter criteria."""
         for key, value in where.items():
@@ -303,13 +781,76 @@ class BaseInMemoryVectorIndex(VectorIndex):
             return cast(npt.NDArray[np.float32], vectors / (norms + 1e-12))
         return vectors
 
+    def _encode_vectors(self, vectors: npt.NDArray[np.float32]) -> npt.NDArray[Any]:
+        """Convert float32 vectors to the storage dtype of the index."""
+        if self.storage_dtype == "float16":
+            return vectors.astype(np.float16)
+        elif self.storage_dtype == "int8":
+            scales = self._update_int8_scales(vectors)
+            quantized = np.rint(vectors / scales)
+            return np.clip(quantized, -127, 127).astype(np.int8)
+        elif self.storage_dtype == "binary":
+            return np.packbits(vectors > 0, axis=1)
+        return vectors
+
+    def _decode_vectors(self, stored_vectors: npt.NDArray[Any]) -> npt.NDArray[np.float32]:
+        """Convert stored vectors back to (approximate) float32 vectors."""
+        if self.storage_dtype == "float16":
+            return stored_vectors.astype(np.float32)
+        elif self.storage_dtype == "int8" and self._int8_scales is not None:
+            return cast(
+                npt.NDArray[np.float32], stored_vectors.astype(np.float32) * self._int8_scales
+            )
+        elif self.storage_dtype == "binary":
+            signs = np.unpackbits(stored_vectors, axis=1, count=self.dimension).astype(np.float32)
+            # Unit vectors pointing to the same orthant as the original vectors
+            return cast(npt.NDArray[np.float32], (2 * signs - 1) / np.sqrt(self.dimension))
+        return stored_vectors
+
+    def _update_int8_scales(self, vectors: npt.NDArray[np.float32]) -> npt.NDArray[np.float32]:
+        """Grow the int8 quantization scales to fit the new vectors, re-quantizing stored rows.
+
+        Returns the updated scales.
+        """
+        required_scales = np.max(np.abs(vectors), axis=0, initial=0) / 127
+        if self._int8_scales is None:
+            self._int8_scales = np.maximum(required_scales, np.finfo(np.float32).tiny).astype(
+                np.float32
+            )
+            return self._int8_scales
+        grown = required_scales > self._int8_scales
+        if np.any(grown):
+            new_scales = self._int8_scales.copy()
+            new_scales[grown] = required_scales[grown]
+            if self.vectors is not None and self.num_vectors > 0:
+                self._ensure_writable_vectors()
+                ratios = self._int8_scales[grown] / new_scales[grown]
+                stored = self.vectors[: self.num_vectors, grown].astype(np.float32)
+                self.vectors[: self.num_vectors, grown] = np.rint(stored * ratios).astype(np.int8)
+            self._int8_scales = new_scales
+        return self._int8_scales
+
+    def _ensure_writable_vectors(self) -> None:
+        """Copy in memory the vectors memory-mapped in read-only mode, before rewriting them."""
+        if self.vectors is not None and not self.vectors.flags.writeable:
+            self.vectors = np.array(self.vectors)
+
+    def _get_storage_width(self) -> int:
+        """Number of stored values per vector."""
+        if self.storage_dtype == "binary":
+            return (self.dimension + 7) // 8
+        return self.dimension
+
     def _initialize_or_resize_vectors(self, num_new_vectors: int) -> None:
         """Initialize or resize the vector array with amortized growth strategy."""
+        storage_dtype = self._STORAGE_DTYPES[self.storage_dtype]
         if self.vectors is None:
             # Pre-allocate 1.5x space to reduce future reallocations
             # This amortizes the cost of array growth over multiple insertions
-            self.vectors_arr_size = int(num_new_vectors * 1.5)
-            self.vectors = np.empty((self.vectors_arr_size, self.dimension), dtype=np.float32)
+            self.vectors_arr_size = max(1, int(num_new_vectors * 1.5))
+            self.vectors = np.empty(
+                (self.vectors_arr_size, self._get_storage_width()), dtype=storage_dtype
+            )
         elif self.num_vectors + num_new_vectors > self.vectors_arr_size:
             # Amortized doubling strategy for array growth
             # Ensures O(1) amortized insertion time and minimizes memory copies
@@ -317,16 +858,114 @@ class BaseInMemoryVectorIndex(VectorIndex):
             while new_size < self.num_vectors + num_new_vectors:
                 new_size *= 2
             self.vectors_arr_size = new_size
-            new_vectors = np.empty((self.vectors_arr_size, self.dimension), dtype=np.float32)
+            new_vectors = np.empty(
+                (self.vectors_arr_size, self._get_storage_width()), dtype=storage_dtype
+            )
             new_vectors[: self.num_vectors] = self.vectors[: self.num_vectors]
             self.vectors = new_vectors
+        if len(self._tombstones) < self.vectors_arr_size:
+            new_tombstones = np.zeros(self.vectors_arr_size, dtype=bool)
+            new_tombstones[: len(self._tombstones)] = self._tombstones
+            self._tombstones = new_tombstones
+
+    def _append(
+        self,
+        items: List[Dict[str, Any]],
+        vectors: npt.NDArray[Any],
+        item_ids: Sequence[Hashable],
+    ) -> None:
+        """Append already normalized vectors with their items at the end of the index."""
+        num_new_vectors = len(items)
+        self._initialize_or_resize_vectors(num_new_vectors)
+        if self.vectors is None:
+            raise ValueError("Vectors are not initialized properly")
+        start = self.num_vectors
+        encoded_vectors = self._encode_vectors(vectors)
+        self.vectors[start : start + num_new_vectors] = encoded_vectors
+        self._tombstones[start : start + num_new_vectors] = False
+        for offset, (item, item_id) in enumerate(zip(items, item_ids)):
+            row_id = start + offset
+            self.items.append(item)
+            self._item_ids.append(item_id)
+            self._item_id_to_row_id[item_id] = row_id
+            self._add_to_inverted_indices(item, row_id)
+        self.num_vectors += num_new_vectors
+
+    def remove(self, item_ids: Sequence[Hashable]) -> None:
+        """Remove items from the index, without rebuilding it.
+
+        Removed items are tombstoned and skipped by searches, and the index is compacted once
+        enough of them accumulated. Unknown identifiers are ignored.
 
-    def _compute_distances(self, query: npt.NDArray[Any]) -> Tuple[npt.NDArray[Any], bool]:
-        """Compute distances between query and indexed vectors."""
+        Parameters
+        ----------
+        item_ids
+            Identifiers of the items to remove, as given when they were added to the index.
+        """
+        for item_id in item_ids:
+            row_id = self._item_id_to_row_id.pop(item_id, None)
+            if row_id is not None:
+                self._tombstones[row_id] = True
+                self._num_tombstones += 1
+        if self._num_tombstones > self._COMPACTION_TOMBSTONE_RATIO * self.num_vectors:
+            self.compact()
+
+    def compact(self) -> None:
+        """Physically drop the removed items from the index."""
+        if self._num_tombstones == 0 or self.vectors is None:
+            return
+        live_row_ids = self._get_live_row_ids()
+        num_live = len(live_row_ids)
+        self._ensure_writable_vectors()
+        self.vectors[:num_live] = self.vectors[live_row_ids]
+        self.items = [self.items[row_id] for row_id in live_row_ids]
+        self._item_ids = [self._item_ids[row_id] for row_id in live_row_ids]
+        self._item_id_to_row_id = {item_id: row_id for row_id, item_id in enumerate(self._item_ids)}
+        self._tombstones[:] = False
+        self._num_tombstones = 0
+        self.num_vectors = num_live
+        self._inverted_indices = {}
+
+    def _reset(self) -> None:
+        """Drop all the items from the index."""
+        self.items = []
+        self.vectors = None
+        self.vectors_arr_size = 0
+        self.num_vectors = 0
+        self._int8_scales = None
+        self._item_ids = []
+        self._item_id_to_row_id = {}
+        self._tombstones = np.zeros(0, dtype=bool)
+        self._num_tombstones = 0
+        self._inverted_indices = {}
+
+    def _compute_distances(
+        self, query: npt.NDArray[Any], row_ids: Optional[npt.NDArray[np.intp]] = None
+    ) -> Tuple[npt.NDArray[Any], bool]:
+        """Compute distances between query and indexed vectors.
+
+        Parameters
+        ----------
+        query
+            Query vector, of shape ``(1, dimension)``.
+        row_ids
+            Rows of the index to compute the distances for. If None, distances are computed for all
+            the indexed vectors.
+
+        Returns
+        -------
+        Tuple[np.ndarray, bool]
+            The distances, aligned with ``row_ids`` if given, and whether the highest distances
+            are the best ones.
+        """
         if self.vectors is None:
             raise ValueError(
                 "Vectors are not initialized properly. Make sure the index build function is called to initialize the vectors"
             )
+        if self.storage_dtype != "float32":
+            return self._compute_quantized_distances(query, row_ids)
+        vectors = self.vectors[: self.num_vectors] if row_ids is None else self.vectors[row_ids]
+        num_vectors = len(vectors)
         if self.metric == SimilarityMetric.COSINE:
             # Single matrix multiplication for all distances
             # Leverages highly optimized BLAS routines in numpy
@@ -336,12 +975,10 @@ class BaseInMemoryVectorIndex(VectorIndex):
                 1,
                 int(
                     self._MAX_SIMILARITY_MEMORY_CONSUMPTION_BYTES
-                    / (4 * self.num_vectors * self.dimension)
+                    / (4 * num_vectors * self.dimension)
                 ),
             )
-            distances = np.matmul(
-                query, self.vectors[: self.num_vectors].T, dtype=np.float32
-            ).flatten()
+            distances = np.matmul(query, vectors.T, dtype=np.float32).flatten()
             return distances, True  # get_highest_distances = True
 
         elif self.metric == SimilarityMetric.EUCLIDEAN:
@@ -352,10 +989,10 @@ class BaseInMemoryVectorIndex(VectorIndex):
                 1, int(self._MAX_SIMILARITY_MEMORY_CONSUMPTION_BYTES / (4 * self.dimension))
             )
 
-            distances = np.zeros(self.num_vectors, dtype=np.float32)
-            for start_idx in range(0, self.num_vectors, batch_size):
-                end_idx = min(self.num_vectors, start_idx + batch_size)
-                batch_vectors = self.vectors[start_idx:end_idx]
+            distances = np.zeros(num_vectors, dtype=np.float32)
+            for start_idx in range(0, num_vectors, batch_size):
+                end_idx = min(num_vectors, start_idx + batch_size)
+                batch_vectors = vectors[start_idx:end_idx]
                 # Efficient squared distance using vectorized operations
                 diff = query - batch_vectors
                 distances[start_idx:end_idx] = np.sum(diff * diff, axis=1)
@@ -363,18 +1000,57 @@ class BaseInMemoryVectorIndex(VectorIndex):
             return distances, False  # get_highest_distances = False
 
         elif self.metric == SimilarityMetric.DOT:
-            distances = np.matmul(
-                query, self.vectors[: self.num_vectors].T, dtype=np.float32
-            ).flatten()
+            distances = np.matmul(query, vectors.T, dtype=np.float32).flatten()
             return distances, True  # get_highest_distances = True
         else:
             raise ValueError(f"Unknown metric: {self.metric}")
 
+    def _compute_quantized_distances(
+        self, query: npt.NDArray[Any], row_ids: Optional[npt.NDArray[np.intp]] = None
+    ) -> Tuple[npt.NDArray[Any], bool]:
+        """Compute approximate distances between the query and the quantized indexed vectors.
+
+        Binary vectors are compared with the Hamming distance between the signs of the query
+        and of the vectors. Other vectors are decoded to float32 in memory-capped blocks.
+        """
+        if self.vectors is None:
+            raise ValueError(
+                "Vectors are not initialized properly. Make sure the index build function is called to initialize the vectors"
+            )
+        num_vectors = self.num_vectors if row_ids is None else len(row_ids)
+        distances = np.empty(num_vectors, dtype=np.float32)
+        get_highest_distances = self.metric != SimilarityMetric.EUCLIDEAN
+        query_bits = np.packbits(query > 0, axis=1)
+        batch_size = max(
+            1, int(self._MAX_SIMILARITY_MEMORY_CONSUMPTION_BYTES / (4 * self.dimension))
+        )
+        for start_idx in range(0, num_vectors, batch_size):
+            end_idx = min(num_vectors, start_idx + batch_size)
+            stored_vectors = (
+                self.vectors[start_idx:end_idx]
+                if row_ids is None
+                else self.vectors[row_ids[start_idx:end_idx]]
+            )
+            if self.storage_dtype == "binary":
+                hamming_distances = self._POPCOUNT_TABLE[
+                    np.bitwise_xor(stored_vectors, query_bits)
+                ].sum(axis=1, dtype=np.int32)
+                # Fewer differing signs means more similar, whatever the metric
+                distances[start_idx:end_idx] = -hamming_distances
+                get_highest_distances = True
+            else:
+                batch_distances, get_highest_distances = self._compute_distances_batch(
+                    query, self._decode_vectors(stored_vectors)
+                )
+                distances[start_idx:end_idx] = batch_distances[0]
+        return distances, get_highest_distances
+
     def _build_results(
         self,
         indices: npt.NDArray[np.intp],
         distances: npt.NDArray[Any],
         columns_to_exclude: Optional[List[str]] = None,
+        row_ids: Optional[npt.NDArray[np.intp]] = None,
     ) -> List[Dict[str, Any]]:
         """Build search results from indices and distances.
 
@@ -386,12 +1062,16 @@ class BaseInMemoryVectorIndex(VectorIndex):
             Distance/similarity scores.
         columns_to_exclude
             Columns (keys) to exclude from the returned results.
+        row_ids
+            Row ids the distances were computed for. If given, ``indices`` index into ``row_ids``
+            (and ``distances``) instead of directly into the items.
         """
         results = []
         exclude_set = set(columns_to_exclude) if columns_to_exclude else set()
         for idx in indices:
             idx = int(idx)
-            item_copy = self.items[idx].copy()
+            row_id = idx if row_ids is None else int(row_ids[idx])
+            item_copy = self.items[row_id].copy()
 
             # Remove excluded columns, but keep _score
             for key in exclude_set:
@@ -434,18 +1114,83 @@ class BaseInMemoryVectorIndex(VectorIndex):
     @property
     def entities(self) -> List[Dict[str, Any]]:
         """Entities getter for accessing items."""
+        if self._num_tombstones > 0:
+            return [self.items[row_id] for row_id in self._get_live_row_ids()]
         return self.items
 
     @entities.setter
     def entities(self, value: List[Dict[str, Any]]) -> None:
         """Entities setter."""
         self.items = value
+        self._inverted_indices = {}
 
 
 class EntityVectorIndex(BaseInMemoryVectorIndex):
-    """Vector index for entity-based indexing."""
+    """Vector index for entity-based indexing.
 
-    def build(self, data: List[Dict[str, Any]], vector_field: Optional[str] = None) -> None:
+    Besides being built at once with ``build``, the index supports in-place updates keyed by
+    stable item identifiers with ``upsert`` and ``remove``.
+
+    To reduce the memory footprint, the vectors can be stored quantized with ``storage_dtype``,
+    and dropped from the stored entities with ``keep_vectors_in_items=False``. The full-precision
+    vectors of the entities are used to re-score the best candidates of quantized searches.
+
+    The index can be saved to a directory with ``save`` and reopened with ``load``, which
+    memory-maps the vectors: processes loading the same index share its pages.
+    """
+
+    # Name of the index type in the ``index_params`` of retriever configs and saved indices
+    _INDEX_TYPE = "flat"
+    _SAVE_FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        dimension: int,
+        metric: SimilarityMetric = SimilarityMetric.COSINE,
+        storage_dtype: str = "float32",
+        rescore_factor: int = 4,
+        keep_vectors_in_items: bool = True,
+    ):
+        """Initialize the vector index.
+
+        Parameters
+        ----------
+        dimension
+            Dimension of the vectors.
+        metric
+            Distance metric to use (SimilarityMetric.COSINE, SimilarityMetric.EUCLIDEAN, SimilarityMetric.DOT).
+            Default: SimilarityMetric.COSINE.
+        storage_dtype
+            Type used to store the vectors in memory: ``"float32"`` (default), ``"float16"``,
+            ``"int8"`` or ``"binary"``.
+        rescore_factor
+            With quantized storage, the ``k * rescore_factor`` best candidates of the approximate
+            search are re-scored exactly with the vectors of the entities.
+        keep_vectors_in_items
+            Whether the stored entities keep their vector field. When False, the vectors are only
+            stored in the index (search results do not contain them anymore) and quantized
+            searches are not re-scored. Binary storage requires the vectors to be kept.
+        """
+        super().__init__(
+            dimension=dimension,
+            metric=metric,
+            storage_dtype=storage_dtype,
+            rescore_factor=rescore_factor,
+        )
+        if storage_dtype == "binary" and not keep_vectors_in_items:
+            raise ValueError(
+                "Binary storage only keeps the signs of the vectors, which are not precise enough "
+                "to rank the results. Use keep_vectors_in_items=True to re-score them."
+            )
+        self.vector_field: Optional[str] = None
+        self.keep_vectors_in_items = keep_vectors_in_items
+
+    def build(
+        self,
+        data: List[Dict[str, Any]],
+        vector_field: Optional[str] = None,
+        item_ids: Optional[Sequence[Hashable]] = None,
+    ) -> None:
         """Build index from entities with vectors.
 
         Parameters
@@ -454,6 +1199,9 @@ class EntityVectorIndex(BaseInMemoryVectorIndex):
             List of entities containing vectors.
         vector_field
             Name of the field containing vectors (required).
+        item_ids
+            Stable identifiers of the entities, used to later update or remove them in place.
+            Defaults to the positions of the entities in ``data``.
 
         Raises
         ------
@@ -462,37 +1210,537 @@ class EntityVectorIndex(BaseInMemoryVectorIndex):
         """
         if vector_field is None:
             raise ValueError("vector_field is required for EntityVectorIndex")
+        self.vector_field = vector_field
+
+        self._reset()
+        self.upsert(data, item_ids=item_ids)
+
+    def upsert(
+        self,
+        data: List[Dict[str, Any]],
+        item_ids: Optional[Sequence[Hashable]] = None,
+        vector_field: Optional[str] = None,
+    ) -> None:
+        """Insert entities into the index, replacing the ones with the same identifiers.
+
+        Only the given entities are processed, the rest of the index is left untouched.
+        Entities without a valid vector are removed from the index.
+
+        Parameters
+        ----------
+        data
+            List of entities containing vectors.
+        item_ids
+            Stable identifiers of the entities. Defaults to the positions of the entities in ``data``.
+        vector_field
+            Name of the field containing vectors. Defaults to the one the index was built with.
+
+        Raises
+        ------
+        ValueError
+            If no vector_field was provided when building the index or in this call.
+        """
+        vector_field = vector_field or self.vector_field
+        if vector_field is None:
+            raise ValueError("vector_field is required for EntityVectorIndex")
+        self.vector_field = vector_field
+
+        if item_ids is None:
+            item_ids = range(len(data))
+        if len(item_ids) != len(data):
+            raise ValueError(
+                f"Expected as many item ids as entities, but got {len(item_ids)} ids for {len(data)} entities"
+            )
+        # The last entity wins if the same identifier is given several times
+        entities_by_id = dict(zip(item_ids, data))
+        self.remove([item_id for item_id in entities_by_id if item_id in self._item_id_to_row_id])
 
         # Extract vectors and filter entities that have them
         valid_items = []
+        valid_item_ids = []
         vectors_list = []
 
-        for i, entity in enumerate(data):
+        for item_id, entity in entities_by_id.items():
             if vector_field in entity and entity[vector_field] is not None:
                 vector = entity[vector_field]
                 if isinstance(vector, list) and len(vector) == self.dimension:
+                    if not self.keep_vectors_in_items:
+                        entity = {
+                            key: value for key, value in entity.items() if key != vector_field
+                        }
                     valid_items.append(entity)
+                    valid_item_ids.append(item_id)
                     vectors_list.append(vector)
 
-        if vectors_list:
-            self.items = valid_items
+        if not vectors_list:
+            if self.num_vectors == 0:
+                self._reset()
+            return
+
+        # Use float32 instead of float64 - reduces memory by 50%
+        # while maintaining sufficient precision for similarity search
+        vectors_array = np.array(vectors_list, dtype=np.float32)
+
+        # Normalize vectors once during indexing for cosine similarity
+        vectors_array = self._safe_normalize_vectors(vectors_array)
+
+        self._append(valid_items, vectors_array, valid_item_ids)
+
+    def _get_rescoring_vectors(
+        self, row_ids: npt.NDArray[np.intp]
+    ) -> Optional[npt.NDArray[np.float32]]:
+        if not self.keep_vectors_in_items or self.vector_field is None:
+            return None
+        vectors = np.array(
+            [self.items[row_id][self.vector_field] for row_id in row_ids.tolist()],
+            dtype=np.float32,
+        ).reshape(len(row_ids), self.dimension)
+        return cast(npt.NDArray[np.float32], self._safe_normalize_vectors(vectors))
+
+    def _get_init_params(self) -> Dict[str, Any]:
+        """Get the constructor parameters of the index, besides the dimension and metric."""
+        return {
+            "storage_dtype": self.storage_dtype,
+            "rescore_factor": self.rescore_factor,
+            "keep_vectors_in_items": self.keep_vectors_in_items,
+        }
+
+    def save(self, directory: Union[str, Path]) -> None:
+        """Save the index to a directory.
+
+        The vectors are written as a raw ``vectors.npy`` array, the entities in a columnar
+        ``entities.json`` sidecar and the configuration of the index in ``index.json``.
+        Removed items are not saved. The item identifiers must be strings or integers.
+
+        Parameters
+        ----------
+        directory
+            Directory to save the index to. It is created if it does not exist.
+        """
+        directory = Path(directory)
+        live_row_ids = self._get_live_row_ids()
+        item_ids = [self._item_ids[row_id] for row_id in live_row_ids.tolist()]
+        if not all(isinstance(item_id, (str, int)) for item_id in item_ids):
+            raise ValueError("Only indices with string or integer item ids can be saved")
+
+        if self.vectors is None:
+            vectors = np.empty(
+                (0, self._get_storage_width()), dtype=self._STORAGE_DTYPES[self.storage_dtype]
+            )
+        else:
+            vectors = self.vectors[live_row_ids]
+        secure_save_npy(vectors, directory / "vectors.npy")
+        save_columnar_records(
+            [self.items[row_id] for row_id in live_row_ids.tolist()], directory, "entities"
+        )
+        metadata = {
+            "format_version": self._SAVE_FORMAT_VERSION,
+            "index_type": self._INDEX_TYPE,
+            "dimension": self.dimension,
+            "metric": self.metric.value,
+            "vector_field": self.vector_field,
+            "index_params": self._get_init_params(),
+            "item_ids": item_ids,
+            "int8_scales": self._int8_scales.tolist() if self._int8_scales is not None else None,
+            **self._save_state(directory, live_row_ids),
+        }
+        secure_write_json(metadata, directory / "index.json")
+
+    @staticmethod
+    def load(
+        directory: Union[str, Path], mmap_mode: Optional[Literal["r", "c"]] = "c"
+    ) -> "EntityVectorIndex":
+        """Load an index saved with ``save``.
+
+        The returned index has the type of the saved index (e.g. ``IVFEntityVectorIndex``).
 
-            # Initialize or resize vector array
-            num_new_vectors = len(vectors_list)
-            self._initialize_or_resize_vectors(num_new_vectors)
+        Parameters
+        ----------
+        directory
+            Directory the index was saved to.
+        mmap_mode
+            Memory-mapping mode of the vectors (see ``numpy.load``). With the default ``"c"``
+            (copy-on-write), the vectors are only read from disk when accessed and are shared
+            between the processes loading the same index, while updates of the index stay
+            private to each process. With ``"r"``, the vectors are read-only and are copied in
+            memory if an update needs to rewrite them. Use None to read the vectors in memory.
 
-            # Use float32 instead of float64 - reduces memory by 50%
-            # while maintaining sufficient precision for similarity search
-            vectors_array = np.array(vectors_list, dtype=np.float32)
+        Returns
+        -------
+        EntityVectorIndex
+            The loaded index.
+        """
+        directory = Path(directory)
+        metadata = json.loads((directory / "index.json").read_text(encoding="utf-8"))
+        if metadata.get("format_version") != EntityVectorIndex._SAVE_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported vector index format version: {metadata.get('format_version')}"
+            )
+        index = _create_entity_vector_index(
+            metadata["dimension"],
+            SimilarityMetric(metadata["metric"]),
+            {"index_type": metadata["index_type"], **metadata["index_params"]},
+        )
+        index.vector_field = metadata["vector_field"]
+        vectors = np.load(directory / "vectors.npy", mmap_mode=mmap_mode, allow_pickle=False)
+        items = load_columnar_records(directory, "entities")
+        index._load_state(directory, vectors, items, metadata)
+        return index
+
+    def _save_state(self, directory: Path, live_row_ids: npt.NDArray[np.intp]) -> Dict[str, Any]:
+        """Save the state specific to the index type, and return its metadata."""
+        return {}
+
+    def _load_state(
+        self,
+        directory: Path,
+        vectors: npt.NDArray[Any],
+        items: List[Dict[str, Any]],
+        metadata: Dict[str, Any],
+    ) -> None:
+        """Restore the state of a saved index from its vectors, entities and metadata."""
+        self._reset()
+        if len(vectors) == 0:
+            return
+        self.vectors = vectors
+        self.vectors_arr_size = self.num_vectors = len(vectors)
+        self.items = items
+        self._item_ids = list(metadata["item_ids"])
+        self._item_id_to_row_id = {item_id: row_id for row_id, item_id in enumerate(self._item_ids)}
+        self._tombstones = np.zeros(self.num_vectors, dtype=bool)
+        if metadata["int8_scales"] is not None:
+            self._int8_scales = np.array(metadata["int8_scales"], dtype=np.float32)
+
+
+class IVFEntityVectorIndex(EntityVectorIndex):
+    """Approximate vector index for entity-based indexing, using an inverted file (IVF).
+
+    The vectors are partitioned with k-means, and a search only computes exact distances for
+    the vectors of the ``nprobe`` partitions whose centroids are the closest to the query.
+    Probing more partitions improves the recall at the cost of a higher latency.
+
+    The partitioning is trained when the index is built, and retrained when entities are upserted
+    once the index doubled in size, so that searches never modify the index. Indices smaller than
+    ``min_training_size`` are searched exhaustively.
+    """
+
+    _INDEX_TYPE = "ivf"
+    _KMEANS_MAX_TRAINING_VECTORS_PER_PARTITION = 256
 
-            # Normalize vectors once during indexing for cosine similarity
-            vectors_array = self._safe_normalize_vectors(vectors_array)
+    def __init__(
+        self,
+        dimension: int,
+        metric: SimilarityMetric = SimilarityMetric.COSINE,
+        num_partitions: Optional[int] = None,
+        nprobe: int = 8,
+        min_training_size: int = 1000,
+        kmeans_iterations: int = 10,
+        seed: int = 0,
+        storage_dtype: str = "float32",
+        rescore_factor: int = 4,
+        keep_vectors_in_items: bool = True,
+    ):
+        """Initialize the vector index.
+
+        Parameters
+        ----------
+        dimension
+            Dimension of the vectors.
+        metric
+            Distance metric to use (SimilarityMetric.COSINE, SimilarityMetric.EUCLIDEAN, SimilarityMetric.DOT).
+            Default: SimilarityMetric.COSINE.
+        num_partitions
+            Number of k-means partitions. Defaults to the square root of the number of vectors
+            at training time.
+        nprobe
+            Number of partitions to search. Higher values increase recall and latency. More
+            partitions are searched if the probed ones contain less than ``k`` candidates.
+        min_training_size
+            Minimum number of vectors to train the partitioning. Smaller indices are searched
+            exhaustively.
+        kmeans_iterations
+            Number of k-means iterations used to train the partitioning.
+        seed
+            Seed of the random generator used for the k-means initialization.
+        storage_dtype
+            Type used to store the vectors in memory, see ``EntityVectorIndex``.
+        rescore_factor
+            Re-scoring factor of quantized searches, see ``EntityVectorIndex``.
+        keep_vectors_in_items
+            Whether the stored entities keep their vector field, see ``EntityVectorIndex``.
+        """
+        super().__init__(
+            dimension=dimension,
+            metric=metric,
+            storage_dtype=storage_dtype,
+            rescore_factor=rescore_factor,
+            keep_vectors_in_items=keep_vectors_in_items,
+        )
+        if nprobe < 1:
+            raise ValueError(f"nprobe should be a positive integer, but got {nprobe}")
+        if num_partitions is not None and num_partitions < 1:
+            raise ValueError(
+                f"num_partitions should be a positive integer, but got {num_partitions}"
+            )
+        self.num_partitions = num_partitions
+        self.nprobe = nprobe
+        self.min_training_size = min_training_size
+        self.kmeans_iterations = kmeans_iterations
+        self.seed = seed
+        self._centroids: Optional[npt.NDArray[np.float32]] = None
+        self._trained_size = 0
+        # Partition of each row (aligned with self.items) and rows of each partition
+        self._row_partitions: List[int] = []
+        self._partition_row_ids: List[List[int]] = []
+        # Array versions of the rows of each partition, cached until the partition changes
+        self._partition_row_ids_arrays: Dict[int, npt.NDArray[np.intp]] = {}
+
+    def upsert(
+        self,
+        data: List[Dict[str, Any]],
+        item_ids: Optional[Sequence[Hashable]] = None,
+        vector_field: Optional[str] = None,
+    ) -> None:
+        super().upsert(data, item_ids=item_ids, vector_field=vector_field)
+        # building the index also upserts its entities, so it is trained here as well
+        self._train_if_needed()
+
+    def _reset(self) -> None:
+        super()._reset()
+        self._centroids = None
+        self._trained_size = 0
+        self._row_partitions = []
+        self._partition_row_ids = []
+        self._partition_row_ids_arrays = {}
+
+    def _append(
+        self,
+        items: List[Dict[str, Any]],
+        vectors: npt.NDArray[Any],
+        item_ids: Sequence[Hashable],
+    ) -> None:
+        start = self.num_vectors
+        super()._append(items, vectors, item_ids)
+        if self._centroids is not None:
+            self._assign_rows_to_partitions(np.arange(start, self.num_vectors))
+
+    def compact(self) -> None:
+        if self._num_tombstones == 0 or self.vectors is None:
+            return
+        live_row_partitions = (
+            [self._row_partitions[row_id] for row_id in self._get_live_row_ids()]
+            if self._centroids is not None
+            else []
+        )
+        super().compact()
+        if self._centroids is not None:
+            self._row_partitions = live_row_partitions
+            self._partition_row_ids = [[] for _ in range(len(self._centroids))]
+            self._partition_row_ids_arrays = {}
+            for row_id, partition in enumerate(live_row_partitions):
+                self._partition_row_ids[partition].append(row_id)
+
+    def _get_init_params(self) -> Dict[str, Any]:
+        return {
+            **super()._get_init_params(),
+            "num_partitions": self.num_partitions,
+            "nprobe": self.nprobe,
+            "min_training_size": self.min_training_size,
+            "kmeans_iterations": self.kmeans_iterations,
+            "seed": self.seed,
+        }
+
+    def _save_state(self, directory: Path, live_row_ids: npt.NDArray[np.intp]) -> Dict[str, Any]:
+        if self._centroids is None:
+            return {"trained_size": 0}
+        secure_save_npy(self._centroids, directory / "centroids.npy")
+        row_partitions = np.array(self._row_partitions, dtype=np.int64)[live_row_ids]
+        secure_save_npy(row_partitions, directory / "row_partitions.npy")
+        return {"trained_size": self._trained_size}
+
+    def _load_state(
+        self,
+        directory: Path,
+        vectors: npt.NDArray[Any],
+        items: List[Dict[str, Any]],
+        metadata: Dict[str, Any],
+    ) -> None:
+        super()._load_state(directory, vectors, items, metadata)
+        if metadata["trained_size"] == 0 or self.num_vectors == 0:
+            return
+        centroids = np.load(directory / "centroids.npy", allow_pickle=False)
+        self._centroids = centroids
+        self._trained_size = metadata["trained_size"]
+        self._row_partitions = np.load(directory / "row_partitions.npy").tolist()
+        self._partition_row_ids = [[] for _ in range(len(centroids))]
+        for row_id, partition in enumerate(self._row_partitions):
+            self._partition_row_ids[partition].append(row_id)
+
+    def _has_enough_vectors_to_probe(self) -> bool:
+        num_live_vectors = self.num_vectors - self._num_tombstones
+        return num_live_vectors >= max(1, self.min_training_size)
+
+    def _train_if_needed(self) -> None:
+        """Train the partitioning if it is not trained yet, or if the index doubled in size."""
+        if not self._has_enough_vectors_to_probe():
+            return
+        num_live_vectors = self.num_vectors - self._num_tombstones
+        if self._centroids is None or num_live_vectors >= 2 * self._trained_size:
+            self._train()
+
+    def _train(self) -> None:
+        """Train the k-means centroids on the live vectors and assign all rows to partitions."""
+        if self.vectors is None:
+            raise ValueError(
+                "Vectors are not initialized properly. Make sure the index build function is called to initialize the vectors"
+            )
+        live_row_ids = self._get_live_row_ids()
+        num_partitions = self.num_partitions or max(1, int(np.sqrt(len(live_row_ids))))
+        num_partitions = min(num_partitions, len(live_row_ids))
+
+        rng = np.random.default_rng(self.seed)
+        max_training_vectors = num_partitions * self._KMEANS_MAX_TRAINING_VECTORS_PER_PARTITION
+        if len(live_row_ids) > max_training_vectors:
+            training_row_ids = np.sort(
+                rng.choice(live_row_ids, size=max_training_vectors, replace=False)
+            )
+        else:
+            training_row_ids = live_row_ids
+        training_vectors = self._decode_vectors(self.vectors[training_row_ids])
+
+        centroids = training_vectors[
+            rng.choice(len(training_vectors), size=num_partitions, replace=False)
+        ].copy()
+        for _ in range(self.kmeans_iterations):
+            assignments = self._find_nearest_centroids(training_vectors, centroids)
+            counts = np.bincount(assignments, minlength=num_partitions)
+            # Per-dimension bincount is much faster than np.add.at to sum the vectors by partition
+            sums = np.stack(
+                [
+                    np.bincount(
+                        assignments, weights=training_vectors[:, dim], minlength=num_partitions
+                    )
+                    for dim in range(self.dimension)
+                ],
+                axis=1,
+            )
+            non_empty = counts > 0
+            centroids[non_empty] = sums[non_empty] / counts[non_empty, None]
+            # Re-seed empty partitions with random training vectors
+            num_empty = int(np.sum(~non_empty))
+            if num_empty > 0:
+                centroids[~non_empty] = training_vectors[
+                    rng.choice(len(training_vectors), size=num_empty, replace=False)
+                ]
+
+        self._centroids = centroids.astype(np.float32)
+        self._trained_size = len(live_row_ids)
+        self._row_partitions = []
+        self._partition_row_ids = [[] for _ in range(num_partitions)]
+        self._partition_row_ids_arrays = {}
+        self._assign_rows_to_partitions(np.arange(self.num_vectors))
+
+    def _find_nearest_centroids(
+        self, vectors: npt.NDArray[Any], centroids: npt.NDArray[Any]
+    ) -> npt.NDArray[np.intp]:
+        """Find the closest centroid (in L2 distance) of each vector, in memory-capped batches."""
+        centroid_norms = np.sum(centroids * centroids, axis=1)
+        batch_size = max(
+            1, int(self._MAX_SIMILARITY_MEMORY_CONSUMPTION_BYTES / (4 * len(centroids)))
+        )
+        assignments = np.empty(len(vectors), dtype=np.intp)
+        for start_idx in range(0, len(vectors), batch_size):
+            batch = vectors[start_idx : start_idx + batch_size]
+            # ||x - c||^2 = ||x||^2 - 2 x.c + ||c||^2, and ||x||^2 does not change the argmin
+            distances = centroid_norms - 2 * np.matmul(batch, centroids.T, dtype=np.float32)
+            assignments[start_idx : start_idx + batch_size] = np.argmin(distances, axis=1)
+        return assignments
+
+    def _assign_rows_to_partitions(self, row_ids: npt.NDArray[np.intp]) -> None:
+        if self._centroids is None or self.vectors is None or len(row_ids) == 0:
+            return
+        partitions = self._find_nearest_centroids(
+            self._decode_vectors(self.vectors[row_ids]), self._centroids
+        )
+        for row_id, partition in zip(row_ids.tolist(), partitions.tolist()):
+            self._row_partitions.append(partition)
+            self._partition_row_ids[partition].append(row_id)
+            self._partition_row_ids_arrays.pop(partition, None)
+
+    def _get_partition_row_ids(self, partition: int) -> npt.NDArray[np.intp]:
+        if partition not in self._partition_row_ids_arrays:
+            self._partition_row_ids_arrays[partition] = np.array(
+                self._partition_row_ids[partition], dtype=np.intp
+            )
+        return self._partition_row_ids_arrays[partition]
+
+    def search_batch(
+        self,
+        query_vectors: List[List[float]],
+        k: int,
+        metric: Optional[SimilarityMetric] = None,
+        where: Optional[Dict[str, Any]] = None,
+        columns_to_exclude: Optional[List[str]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        # Each query probes its own partitions, so the queries are searched one after the other
+        return [
+            self.search(
+                query_vector,
+                k,
+                metric=metric,
+                where=where,
+                columns_to_exclude=columns_to_exclude,
+            )
+            for query_vector in query_vectors
+        ]
 
-            if self.vectors is not None:
-                self.vectors[:num_new_vectors] = vectors_array
-            self.num_vectors = num_new_vectors
+    def _get_candidate_row_ids(
+        self, query: npt.NDArray[Any], k: int, row_ids: Optional[npt.NDArray[np.intp]]
+    ) -> Optional[npt.NDArray[np.intp]]:
+        if self._centroids is None or not self._has_enough_vectors_to_probe():
+            return row_ids
 
+        if self.metric == SimilarityMetric.DOT:
+            partition_order = np.argsort(-np.matmul(self._centroids, query[0]))
         else:
-            self.items = []
-            self.vectors = None
-            self.num_vectors = 0
+            partition_order = np.argsort(np.sum((self._centroids - query) ** 2, axis=1))
+
+        allowed_rows: Optional[npt.NDArray[np.bool_]] = None
+        if row_ids is not None:
+            allowed_rows = np.zeros(self.num_vectors, dtype=bool)
+            allowed_rows[row_ids] = True
+
+        candidates: List[npt.NDArray[np.intp]] = []
+        num_candidates = 0
+        for num_probed, partition in enumerate(partition_order, start=1):
+            partition_row_ids = self._get_partition_row_ids(int(partition))
+            if allowed_rows is not None:
+                partition_row_ids = partition_row_ids[allowed_rows[partition_row_ids]]
+            candidates.append(partition_row_ids)
+            num_candidates += len(partition_row_ids)
+            # Keep probing while there are not enough candidates to return k results
+            if num_probed >= self.nprobe and num_candidates >= k:
+                break
+        return np.sort(np.concatenate(candidates))
+
+
+def _create_entity_vector_index(
+    dimension: int,
+    metric: SimilarityMetric = SimilarityMetric.COSINE,
+    index_params: Optional[Dict[str, Any]] = None,
+) -> EntityVectorIndex:
+    """Create an in-memory entity vector index from the ``index_params`` of a retriever config.
+
+    The ``index_type`` parameter selects the index: ``"flat"`` (default) for an exact index, or
+    ``"ivf"`` for an approximate ``IVFEntityVectorIndex``. The index is configured by the remaining
+    parameters (e.g. ``storage_dtype``).
+    """
+    index_params = dict(index_params or {})
+    index_type = index_params.pop("index_type", "flat")
+    if index_type == "flat":
+        return EntityVectorIndex(dimension, metric, **index_params)
+    elif index_type == "ivf":
+        return IVFEntityVectorIndex(dimension, metric, **index_params)
+    raise ValueError(
+        f"Unknown in-memory index type: {index_type}. Available types are: ['flat', 'ivf']"
+    )
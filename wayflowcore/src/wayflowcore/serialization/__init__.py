@@ -4,6 +4,7 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+from .formats import SerializationFormat
 from .serializer import (
     autodeserialize,
     deserialize,
@@ -16,6 +17,7 @@ __all__ = [
     "autodeserialize",
     "deserialize",
     "deserialize_from_dict",
+    "SerializationFormat",
     "serialize",
     "serialize_to_dict",
 ]
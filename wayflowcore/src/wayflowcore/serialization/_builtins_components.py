@@ -28,6 +28,7 @@ _BUILTIN_COMPONENTS = {
     "AuthConfig",
     "BooleanProperty",
     "BranchingStep",
+    "CachedEmbeddingModel",
     "CallableMessageTransform",
     "CatchExceptionStep",
     "ChoiceSelectionStep",
@@ -202,6 +203,7 @@ _BUILTIN_COMPONENTS = {
     "_NullExecutionInterrupt",
     "_PythonMergeToolRequestAndCallsTransform",
     "_ReactMergeToolRequestAndCallsTransform",
+    "_StreamingTextContent",
     "_TokenConsumptionEvent",
     "_ToolRequestAndCallsTransform",
 }
@@ -650,6 +650,9 @@ class WayflowBuiltinsDeserializationPlugin(WayflowDeserializationPlugin):
                 )
                 extra_arguments["raise_exceptions"] = agentspec_component.raise_exceptions
                 extra_arguments["max_iterations"] = agentspec_component.max_iterations
+                extra_arguments["max_concurrent_tool_calls"] = (
+                    agentspec_component.max_concurrent_tool_calls
+                )
                 extra_arguments["initial_message"] = agentspec_component.initial_message
                 extra_arguments["caller_input_mode"] = agentspec_component.caller_input_mode
                 extra_arguments["agents"] = [
@@ -1196,6 +1199,7 @@ class WayflowBuiltinsDeserializationPlugin(WayflowDeserializationPlugin):
                 id=agentspec_component.id,
                 context_providers=context_providers,
                 variables=variables,
+                max_concurrent_steps=getattr(agentspec_component, "max_concurrent_steps", 1),
                 __metadata_info__=metadata_info,
             )
             return flow
@@ -332,6 +332,7 @@ from wayflowcore.datastore.postgres import (
 from wayflowcore.datastore.postgres import (
     TlsPostgresDatabaseConnectionConfig as RuntimeTlsPostgresDatabaseConnectionConfig,
 )
+from wayflowcore.embeddingmodels import CachedEmbeddingModel as RuntimeCachedEmbeddingModel
 from wayflowcore.embeddingmodels import EmbeddingModel as RuntimeEmbeddingModel
 from wayflowcore.embeddingmodels import OCIGenAIEmbeddingModel as RuntimeOCIGenAIEmbeddingModel
 from wayflowcore.embeddingmodels import OllamaEmbeddingModel as RuntimeOllamaEmbeddingModel
@@ -1036,6 +1037,11 @@ class WayflowBuiltinsSerializationPlugin(WayflowSerializationPlugin):
         runtime_embedding_model: RuntimeEmbeddingModel,
         referenced_objects: Optional[Dict[str, Any]] = None,
     ) -> AgentSpecPluginEmbeddingConfig:
+        if isinstance(runtime_embedding_model, RuntimeCachedEmbeddingModel):
+            # caching and batching are runtime optimizations, only the wrapped model is exported
+            return self._embeddingmodel_convert_to_agentspec(
+                conversion_context, runtime_embedding_model.embedding_model, referenced_objects
+            )
         kwargs = dict(
             name=runtime_embedding_model.name,
             description=runtime_embedding_model.description,
@@ -2253,6 +2259,12 @@ class WayflowBuiltinsSerializationPlugin(WayflowSerializationPlugin):
                     != extended_agent_model_fields["max_iterations"].default
                 )
             )
+            or (
+                concurrency_default := (
+                    runtime_agent.max_concurrent_tool_calls
+                    != extended_agent_model_fields["max_concurrent_tool_calls"].default
+                )
+            )
             or (has_subagents := len(agents) > 0)
             or (has_subflows := len(flows) > 0)
         ):
@@ -2281,6 +2293,7 @@ class WayflowBuiltinsSerializationPlugin(WayflowSerializationPlugin):
                 transforms=transforms,
                 can_finish_conversation=runtime_agent.can_finish_conversation,
                 max_iterations=runtime_agent.max_iterations,
+                max_concurrent_tool_calls=runtime_agent.max_concurrent_tool_calls,
                 initial_message=runtime_agent.initial_message,
                 caller_input_mode=runtime_agent.caller_input_mode,
                 human_in_the_loop=runtime_agent.caller_input_mode == CallerInputMode.ALWAYS,
@@ -2661,13 +2674,14 @@ class WayflowBuiltinsSerializationPlugin(WayflowSerializationPlugin):
             id=runtime_flow.id,
         )
 
-        if context_providers_dict or flow_state:
-            # has context providers, required a custom component
+        if context_providers_dict or flow_state or runtime_flow.max_concurrent_steps != 1:
+            # has context providers, state or concurrent steps, required a custom component
             context_providers = list(context_providers_dict.values())
             return AgentSpecExtendedFlow(
                 **flow_args,
                 context_providers=context_providers,
                 state=flow_state,
+                max_concurrent_steps=runtime_flow.max_concurrent_steps,
             )
         else:
             # can use agentspec flow
@@ -0,0 +1,188 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import base64
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+import yaml
+
+from wayflowcore._utils.lazy_loader import LazyLoader
+
+if TYPE_CHECKING:
+    # Important: do not move these imports out of the TYPE_CHECKING
+    # block so long as msgpack and zstandard are optional dependencies.
+    # Otherwise, importing the module when they are not installed would lead to an import error.
+    import msgpack
+    import zstandard
+else:
+    msgpack = LazyLoader("msgpack")
+    zstandard = LazyLoader("zstandard")
+
+
+class SerializationFormat(str, Enum):
+    """Wire format of serialized WayFlow objects"""
+
+    YAML = "yaml"
+    """Human-readable YAML text. This is the default format."""
+    JSON = "json"
+    """Compact JSON text, much faster to produce and parse than YAML"""
+    MSGPACK = "msgpack"
+    """Binary MessagePack encoding, the fastest and most compact format. Requires the ``msgpack`` package."""
+
+
+_ZSTD_MAGIC_NUMBER = b"\x28\xb5\x2f\xfd"
+# values JSON cannot represent, which YAML supports natively, are encoded as
+# ``{"__wayflow_type__": <type>, "value": <value>}``. Dictionaries that contain the reserved key or
+# have keys that are not strings are encoded as a list of key-value pairs, so that decoding them is
+# never ambiguous and their keys are not turned into strings
+_JSON_TYPE_KEY = "__wayflow_type__"
+_JSON_VALUE_KEY = "value"
+_JSON_DATETIME_TYPE = "datetime"
+_JSON_DATE_TYPE = "date"
+_JSON_BYTES_TYPE = "bytes"
+_JSON_DICT_TYPE = "dict"
+_MSGPACK_DATETIME_EXT_TYPE = 1
+_MSGPACK_DATE_EXT_TYPE = 2
+
+
+def _encode_json_value(value: Any) -> Any:
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        if _JSON_TYPE_KEY in value or not all(isinstance(key, str) for key in value):
+            return {
+                _JSON_TYPE_KEY: _JSON_DICT_TYPE,
+                _JSON_VALUE_KEY: [
+                    [_encode_json_value(key), _encode_json_value(item)]
+                    for key, item in value.items()
+                ],
+            }
+        return {key: _encode_json_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_json_value(item) for item in value]
+    if isinstance(value, (int, float)) or value is None:
+        return value
+    if isinstance(value, datetime):
+        return {_JSON_TYPE_KEY: _JSON_DATETIME_TYPE, _JSON_VALUE_KEY: value.isoformat()}
+    if isinstance(value, date):
+        return {_JSON_TYPE_KEY: _JSON_DATE_TYPE, _JSON_VALUE_KEY: value.isoformat()}
+    if isinstance(value, bytes):
+        return {
+            _JSON_TYPE_KEY: _JSON_BYTES_TYPE,
+            _JSON_VALUE_KEY: base64.b64encode(value).decode("ascii"),
+        }
+    raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serializable")
+
+
+def _decode_json_object(obj: Dict[str, Any]) -> Any:
+    # user dictionaries containing the reserved key are always encoded as pairs, so any object
+    # with this key is an encoded value
+    if _JSON_TYPE_KEY not in obj:
+        return obj
+    value_type, value = obj[_JSON_TYPE_KEY], obj[_JSON_VALUE_KEY]
+    if value_type == _JSON_DATETIME_TYPE:
+        return datetime.fromisoformat(value)
+    if value_type == _JSON_DATE_TYPE:
+        return date.fromisoformat(value)
+    if value_type == _JSON_BYTES_TYPE:
+        return base64.b64decode(value)
+    if value_type == _JSON_DICT_TYPE:
+        # keys encoded as lists were tuples, which JSON cannot represent
+        return {(tuple(key) if isinstance(key, list) else key): item for key, item in value}
+    raise ValueError(f"Unknown encoded JSON value type: {value_type}")
+
+
+def _encode_msgpack_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return msgpack.ExtType(_MSGPACK_DATETIME_EXT_TYPE, value.isoformat().encode("utf-8"))
+    if isinstance(value, date):
+        return msgpack.ExtType(_MSGPACK_DATE_EXT_TYPE, value.isoformat().encode("utf-8"))
+    raise TypeError(f"Object of type {value.__class__.__name__} is not MessagePack serializable")
+
+
+def _decode_msgpack_ext(code: int, data: bytes) -> Any:
+    if code == _MSGPACK_DATETIME_EXT_TYPE:
+        return datetime.fromisoformat(data.decode("utf-8"))
+    if code == _MSGPACK_DATE_EXT_TYPE:
+        return date.fromisoformat(data.decode("utf-8"))
+    return msgpack.ExtType(code, data)
+
+
+def _dump_serialized_dict(
+    obj_as_dict: Any,
+    serialization_format: SerializationFormat = SerializationFormat.YAML,
+    compress: bool = False,
+) -> Union[str, bytes]:
+    """
+    Encodes the dictionary representation of a serialized object in the given format.
+    Returns text for YAML and JSON, and bytes for MessagePack or when compressed with zstd.
+    """
+    serialization_format = SerializationFormat(serialization_format)
+    encoded: Union[str, bytes]
+    if serialization_format == SerializationFormat.YAML:
+        encoded = yaml.dump(obj_as_dict)
+    elif serialization_format == SerializationFormat.JSON:
+        encoded = json.dumps(
+            _encode_json_value(obj_as_dict), separators=(",", ":"), ensure_ascii=False
+        )
+    elif serialization_format == SerializationFormat.MSGPACK:
+        encoded = msgpack.packb(obj_as_dict, default=_encode_msgpack_value, use_bin_type=True)
+    else:
+        raise NotImplementedError(f"Serialization format {serialization_format} is not supported")
+
+    if compress:
+        if isinstance(encoded, str):
+            encoded = encoded.encode("utf-8")
+        encoded = zstandard.ZstdCompressor().compress(encoded)
+    return encoded
+
+
+def _detect_serialization_format(obj: Union[str, bytes]) -> SerializationFormat:
+    if isinstance(obj, bytes):
+        # serialized objects are mappings, which start with one of these markers in MessagePack
+        if obj and (0x80 <= obj[0] <= 0x8F or obj[0] in (0xDE, 0xDF)):
+            return SerializationFormat.MSGPACK
+        obj = obj.decode("utf-8")
+    if obj.lstrip().startswith("{"):
+        return SerializationFormat.JSON
+    return SerializationFormat.YAML
+
+
+def _load_serialized_dict(
+    obj: Union[str, bytes], serialization_format: Optional[SerializationFormat] = None
+) -> Any:
+    """
+    Decodes the dictionary representation of a serialized object. The format and the zstd
+    compression are detected when the format is not given.
+    """
+    if isinstance(obj, bytes) and obj.startswith(_ZSTD_MAGIC_NUMBER):
+        obj = zstandard.ZstdDecompressor().decompress(obj)
+
+    format_is_detected = serialization_format is None
+    if serialization_format is None:
+        serialization_format = _detect_serialization_format(obj)
+    serialization_format = SerializationFormat(serialization_format)
+
+    if serialization_format == SerializationFormat.MSGPACK:
+        if isinstance(obj, str):
+            raise ValueError("MessagePack serialized objects should be bytes, but got a string")
+        return msgpack.unpackb(obj, ext_hook=_decode_msgpack_ext, raw=False, strict_map_key=False)
+
+    text = obj.decode("utf-8") if isinstance(obj, bytes) else obj
+    if serialization_format == SerializationFormat.JSON:
+        try:
+            if _JSON_TYPE_KEY in text:
+                return json.loads(text, object_hook=_decode_json_object)
+            # avoids a Python call per object when there is no encoded value to decode
+            return json.loads(text)
+        except json.JSONDecodeError:
+            if not format_is_detected:
+                raise
+            # YAML flow mappings also start with a brace, and JSON is valid YAML
+    return yaml.safe_load(text)
@@ -18,15 +18,16 @@ from typing import (
     Dict,
     ForwardRef,
     List,
+    Literal,
     Optional,
     Type,
     TypeVar,
+    Union,
     cast,
     get_type_hints,
+    overload,
 )
 
-import yaml
-
 from wayflowcore._metadata import METADATA_KEY, MetadataType, ObjectWithMetadata
 from wayflowcore.exceptions import DataclassFieldDeserializationError
 from wayflowcore.idgeneration import IdGenerator
@@ -48,6 +49,11 @@ from wayflowcore.serialization._typingutils import (
     respects_literal,
 )
 from wayflowcore.serialization.context import DeserializationContext, SerializationContext
+from wayflowcore.serialization.formats import (
+    SerializationFormat,
+    _dump_serialized_dict,
+    _load_serialized_dict,
+)
 
 if TYPE_CHECKING:
     from wayflowcore.serialization.plugins import (
@@ -512,13 +518,38 @@ def serialize_to_dict(
         return serialization_context.get_reference_dict(obj)
 
 
+@overload
+def serialize(
+    obj: SerializableObject,
+    serialization_context: Optional[SerializationContext] = None,
+    plugins: Optional[List["WayflowSerializationPlugin"]] = None,
+    serialization_format: Literal[
+        SerializationFormat.YAML, SerializationFormat.JSON
+    ] = SerializationFormat.YAML,
+    compress: Literal[False] = False,
+) -> str: ...
+
+
+@overload
+def serialize(
+    obj: SerializableObject,
+    serialization_context: Optional[SerializationContext] = None,
+    plugins: Optional[List["WayflowSerializationPlugin"]] = None,
+    serialization_format: SerializationFormat = SerializationFormat.YAML,
+    compress: bool = False,
+) -> Union[str, bytes]: ...
+
+
 def serialize(
     obj: SerializableObject,
     serialization_context: Optional[SerializationContext] = None,
     plugins: Optional[List["WayflowSerializationPlugin"]] = None,
-) -> str:
+    serialization_format: SerializationFormat = SerializationFormat.YAML,
+    compress: bool = False,
+) -> Union[str, bytes]:
     """
-    Serializes an object into a YAML string representation.
+    Serializes an object into a YAML string representation, or into one of the more compact
+    formats of ``SerializationFormat``.
 
     Parameters
     ----------
@@ -530,20 +561,27 @@ def serialize(
     plugins:
         List of plugins to be used in the SerializationContext.
         If a serialization context instance is provided, this list is ignored.
+    serialization_format:
+        Format of the serialized object. Defaults to YAML. JSON and MessagePack are much faster to
+        produce and to load, which matters when serializing large conversations.
+    compress:
+        Whether to compress the serialized object with zstd. Requires the ``zstandard`` package.
 
     Returns
     -------
-        A YAML string representation of the object.
+        A string representation of the object for YAML and JSON, or bytes for MessagePack and
+        compressed objects.
 
     Examples
     --------
     >>> from wayflowcore.serialization.serializer import serialize
     >>>
     >>> serialized_assistant_as_str = serialize(assistant)
+    >>> serialized_assistant_as_json = serialize(assistant, serialization_format="json")
 
     """
     obj_as_dict = serialize_to_dict(obj, serialization_context, plugins)
-    return yaml.dump(obj_as_dict)
+    return _dump_serialized_dict(obj_as_dict, serialization_format, compress)
 
 
 T = TypeVar("T", bound=SerializableObject)
@@ -640,9 +678,10 @@ def _set_component_id(component: ObjectWithMetadata, reference: str) -> None:
 
 def deserialize(
     deserialization_type: Type[T],
-    obj: str,
+    obj: Union[str, bytes],
     deserialization_context: Optional[DeserializationContext] = None,
     plugins: Optional[List["WayflowDeserializationPlugin"]] = None,
+    serialization_format: Optional[SerializationFormat] = None,
 ) -> T:
     """
     Deserializes an object from its text representation and its corresponding class.
@@ -652,13 +691,16 @@ def deserialize(
     deserialization_type:
         The type of the object to be deserialized.
     obj:
-        The text representation of the object to be deserialized.
+        The text or binary representation of the object to be deserialized.
     deserialization_context:
         Context for deserialization operations, to avoid deserializing a same object twice.
         If not provided, a new ``DeserializationContext`` will be created.
     plugins:
         List of plugins to be used in the DeserializationContext.
         If a deserialization context instance is provided, this list is ignored.
+    serialization_format:
+        Format of the serialized object. If not provided, it is detected from the object,
+        as well as whether it was compressed.
 
     Returns
     -------
@@ -681,7 +723,7 @@ def deserialize(
             UserWarning,
         )
 
-    obj_as_dict: Dict[str, Any] = yaml.safe_load(obj)
+    obj_as_dict: Dict[str, Any] = _load_serialized_dict(obj, serialization_format)
 
     component_type: str = obj_as_dict["_component_type"]
 
@@ -694,9 +736,10 @@ def deserialize(
 
 
 def autodeserialize(
-    obj: str,
+    obj: Union[str, bytes],
     deserialization_context: Optional[DeserializationContext] = None,
     plugins: Optional[List["WayflowDeserializationPlugin"]] = None,
+    serialization_format: Optional[SerializationFormat] = None,
 ) -> SerializableObject:
     """
     Deserializes an object from its text representation.
@@ -704,13 +747,16 @@ def autodeserialize(
     Parameters
     ----------
     obj:
-        The text representation of the object to be deserialized.
+        The text or binary representation of the object to be deserialized.
     deserialization_context:
         Context for deserialization operations, to avoid deserializing a same object twice.
         If not provided, a new ``DeserializationContext`` will be created.
     plugins:
         List of plugins to be used in the DeserializationContext.
         If a deserialization context instance is provided, this list is ignored.
+    serialization_format:
+        Format of the serialized object. If not provided, it is detected from the object,
+        as well as whether it was compressed.
 
     Returns
     -------
@@ -733,7 +779,7 @@ def autodeserialize(
             UserWarning,
         )
 
-    obj_as_dict: Dict[str, Any] = yaml.safe_load(obj)
+    obj_as_dict: Dict[str, Any] = _load_serialized_dict(obj, serialization_format)
     return autodeserialize_from_dict(obj_as_dict, deserialization_context)
 
 
@@ -23,7 +23,7 @@ from wayflowcore._utils._templating_helpers import (
     render_nested_object_template,
     render_str_template,
 )
-from wayflowcore.models._requesthelpers import RetryingAsyncClient
+from wayflowcore.models._requesthelpers import send_with_retries, shared_http_client
 from wayflowcore.property import IntegerProperty, Property, StringProperty, string_to_property
 from wayflowcore.retrypolicy import RetryPolicy
 from wayflowcore.steps.step import Step, StepResult
@@ -829,16 +829,18 @@ class ApiCallStep(Step):
             3 if self.num_retry_on_bad_http_request is None else self.num_retry_on_bad_http_request
         )
         total_elapsed_cap_seconds = 600.0
-        if policy is not None:
-            async with RetryingAsyncClient(
-                retry_policy=policy,
-                timeout=httpx.Timeout(policy.request_timeout),
-                total_elapsed_time_seconds=total_elapsed_cap_seconds,
-            ) as client:
-                return await client.request(**request)
-
-        response: httpx.Response
-        async with httpx.AsyncClient() as client:
+        # Reuse the connections kept alive across calls; environment proxies are honored as
+        # with a default httpx client
+        async with shared_http_client(trust_env=True) as client:
+            if policy is not None:
+                return await send_with_retries(
+                    client.send,
+                    client.build_request(timeout=httpx.Timeout(policy.request_timeout), **request),
+                    retry_policy=policy,
+                    total_elapsed_time_seconds=total_elapsed_cap_seconds,
+                )
+
+            response: httpx.Response
             for attempt in range(max_attempts):
                 try:
                     response = await client.request(**request)
@@ -856,6 +858,10 @@ class ApiCallStep(Step):
 
         return response
 
+    @property
+    def _can_be_executed_concurrently(self) -> bool:
+        return True
+
     async def _invoke_step_async(
         self, inputs: Dict[str, Any], conversation: "FlowConversation"
     ) -> StepResult:
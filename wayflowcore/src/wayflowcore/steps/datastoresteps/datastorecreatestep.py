@@ -159,11 +159,11 @@ class DatastoreCreateStep(Step):
     ) -> List[Property]:
         return [get_entity_as_dict_property(cls.CREATED_ENTITY)]
 
-    def _invoke_step(
+    async def _invoke_step_async(
         self,
         inputs: Dict[str, Any],
         conversation: "FlowConversation",
     ) -> StepResult:
         collection_name = render_template(self.collection_name, inputs)
-        updated_entities = self.datastore.create(collection_name, inputs[self.ENTITY])
+        updated_entities = await self.datastore.create_async(collection_name, inputs[self.ENTITY])
         return StepResult(outputs={self.CREATED_ENTITY: updated_entities})
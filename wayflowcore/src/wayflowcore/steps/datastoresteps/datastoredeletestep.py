@@ -192,12 +192,12 @@ class DatastoreDeleteStep(Step):
     ) -> List[Property]:
         return []
 
-    def _invoke_step(
+    async def _invoke_step_async(
         self,
         inputs: Dict[str, Any],
         conversation: "FlowConversation",
     ) -> StepResult:
         collection_name = render_template(self.collection_name, inputs)
         where = set_values_on_templated_where(self.where, inputs, self.input_descriptors)
-        self.datastore.delete(collection_name, where)
+        await self.datastore.delete_async(collection_name, where)
         return StepResult(outputs={})
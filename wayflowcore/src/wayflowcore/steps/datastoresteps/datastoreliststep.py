@@ -219,7 +219,7 @@ class DatastoreListStep(Step):
         else:
             return [ListProperty(name=cls.ENTITIES, item_type=get_entity_as_dict_property())]
 
-    def _invoke_step(
+    async def _invoke_step_async(
         self,
         inputs: Dict[str, Any],
         conversation: "FlowConversation",
@@ -229,7 +229,7 @@ class DatastoreListStep(Step):
             where = set_values_on_templated_where(self.where, inputs, self.input_descriptors)
         else:
             where = None
-        listed_entities = self.datastore.list(collection_name, where, self.limit)
+        listed_entities = await self.datastore.list_async(collection_name, where, self.limit)
         if getattr(self, "unpack_single_entity_from_list", False):
             if len(listed_entities) == 0:
                 raise RuntimeError(
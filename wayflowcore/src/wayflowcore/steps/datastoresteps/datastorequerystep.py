@@ -237,10 +237,10 @@ class DatastoreQueryStep(Step):
             )
         ]
 
-    def _invoke_step(
+    async def _invoke_step_async(
         self,
         inputs: Dict[str, Any],
         conversation: "FlowConversation",
     ) -> StepResult:
-        result = self.datastore.query(self.query, bind=inputs["bind_variables"])
+        result = await self.datastore.query_async(self.query, bind=inputs["bind_variables"])
         return StepResult(outputs={self.RESULT: result})
@@ -206,14 +206,14 @@ class DatastoreUpdateStep(Step):
     ) -> List[Property]:
         return [ListProperty(name=cls.ENTITIES, item_type=get_entity_as_dict_property())]
 
-    def _invoke_step(
+    async def _invoke_step_async(
         self,
         inputs: Dict[str, Any],
         conversation: "FlowConversation",
     ) -> StepResult:
         collection_name = render_template(self.collection_name, inputs)
         where = set_values_on_templated_where(self.where, inputs, self.input_descriptors)
-        updated_entities = self.datastore.update(
+        updated_entities = await self.datastore.update_async(
             collection_name, where, inputs[DatastoreUpdateStep.UPDATE]
         )
         return StepResult(outputs={self.ENTITIES: updated_entities})
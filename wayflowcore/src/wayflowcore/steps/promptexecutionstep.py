@@ -406,6 +406,11 @@ class PromptExecutionStep(Step):
             descriptors = _append_logprob_output(descriptors)
         return descriptors
 
+    @property
+    def _can_be_executed_concurrently(self) -> bool:
+        # the generation only produces outputs, unless it is posted to the conversation
+        return not self.send_message
+
     async def _invoke_step_async(
         self, inputs: Dict[str, Any], conversation: "FlowConversation"
     ) -> StepResult:
@@ -936,6 +936,15 @@ class Step(ComponentWithInputsOutputs, SerializableObject, metaclass=_StepRegist
         # not yielding
         return False
 
+    @property
+    def _can_be_executed_concurrently(self) -> bool:
+        """
+        Indicates if the step can be executed concurrently with other independent steps of a flow.
+        Such steps should not modify the conversation (messages, variables, sub-conversations),
+        since their side effects would happen in a non-deterministic order.
+        """
+        return False
+
     def sub_flows(self) -> Optional[List["Flow"]]:
         """
         Returns the sub-flows this step uses, if it does.
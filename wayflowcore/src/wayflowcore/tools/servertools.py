@@ -300,9 +300,7 @@ class ServerTool(Tool):
         append_message: bool = False,
         raise_exceptions: bool = False,
     ) -> Optional["ToolResult"]:
-        from wayflowcore.executors._agentconversation import AgentConversation
         from wayflowcore.executors._agentexecutor import _serialize_output
-        from wayflowcore.messagelist import Message, MessageType
         from wayflowcore.tracing.span import ToolExecutionSpan
 
         inputs = tool_request.args
@@ -332,30 +330,10 @@ class ServerTool(Tool):
                 return tool_result
 
             if append_message:
-                if not isinstance(output, Exception):
-                    # Check if tool output is copyable, otherwise raise or stringify
-                    output = self._check_tool_outputs_copyable(
-                        output,
-                        raise_exceptions=raise_exceptions,
-                    )
-
-                tool_result = ToolResult(
-                    content=output, tool_request_id=tool_request.tool_request_id
-                )
-                sender = None
-                recipients = None
-                if isinstance(conversation, AgentConversation):
-                    sender = conversation.component.agent_id
-                    recipients = {conversation.component.agent_id}
-                    conversation.state.current_tool_request = None
-                conversation.message_list.append_message(
-                    Message(
-                        tool_result=tool_result,
-                        message_type=MessageType.TOOL_RESULT,
-                        sender=sender,
-                        recipients=recipients,
-                    )
+                tool_result = self._append_tool_result_message(
+                    conversation, tool_result, raise_exceptions=raise_exceptions
                 )
+                output = tool_result.content
 
             span.record_end_span_event(
                 output=output,
@@ -369,6 +347,41 @@ class ServerTool(Tool):
 
         return tool_result
 
+    def _append_tool_result_message(
+        self,
+        conversation: "Conversation",
+        tool_result: ToolResult,
+        raise_exceptions: bool = False,
+    ) -> ToolResult:
+        """Appends the result of the tool to the conversation, and returns the appended result"""
+        from wayflowcore.executors._agentconversation import AgentConversation
+        from wayflowcore.messagelist import Message, MessageType
+
+        output = tool_result.content
+        if not isinstance(output, Exception):
+            # Check if tool output is copyable, otherwise raise or stringify
+            output = self._check_tool_outputs_copyable(
+                output,
+                raise_exceptions=raise_exceptions,
+            )
+
+        tool_result = ToolResult(content=output, tool_request_id=tool_result.tool_request_id)
+        sender = None
+        recipients = None
+        if isinstance(conversation, AgentConversation):
+            sender = conversation.component.agent_id
+            recipients = {conversation.component.agent_id}
+            conversation.state.current_tool_request = None
+        conversation.message_list.append_message(
+            Message(
+                tool_result=tool_result,
+                message_type=MessageType.TOOL_RESULT,
+                sender=sender,
+                recipients=recipients,
+            )
+        )
+        return tool_result
+
     async def _run_async_generator_streaming(self, *args: Any, **kwargs: Any) -> Any:
         """
         Execute an async-generator tool with streaming support.
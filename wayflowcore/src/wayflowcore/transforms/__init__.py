@@ -5,7 +5,11 @@
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
 from .canonicalizationtransform import CanonicalizationMessageTransform
-from .summarization import ConversationSummarizationTransform, MessageSummarizationTransform
+from .summarization import (
+    ConversationSummarizationTransform,
+    MessageSummarizationTransform,
+    SummarizationMode,
+)
 from .transforms import (
     AppendTrailingSystemMessageToUserMessageTransform,
     CallableMessageTransform,
@@ -25,4 +29,5 @@ __all__ = [
     "MessageTransform",
     "RemoveEmptyNonUserMessageTransform",
     "SplitPromptOnMarkerMessageTransform",
+    "SummarizationMode",
 ]
@@ -4,16 +4,22 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+import heapq
 import logging
+import threading
 import time
 import warnings
+from collections import OrderedDict
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Tuple, Union, cast
 
+import anyio
+
 from wayflowcore._metadata import MetadataType
 from wayflowcore._utils._templating_helpers import render_template
 from wayflowcore._utils.formatting import stringify
 from wayflowcore.conversation import _get_current_conversation_id
+from wayflowcore.datastore._relational import RelationalDatastore
 from wayflowcore.datastore.entity import Entity
 from wayflowcore.datastore.inmemory import _INMEMORY_USER_WARNING, InMemoryDatastore
 from wayflowcore.messagelist import ImageContent, Message, MessageContent, TextContent
@@ -55,6 +61,12 @@ class _MessageCache:
     This class manages a cache with configurable size and lifetime limits, storing and retrieving
     cached content using a datastore interface. It handles automatic eviction of expired and least
     recently used entries.
+
+    The recency and the creation time of the entries are tracked in memory, with an ordered dictionary
+    and an expiry heap, so that finding the entries to evict does not require listing the collection.
+    Entries are written through to the datastore and looked up by key, so that entries stored by other
+    processes sharing the datastore are also found. The entries already in the datastore are only
+    listed the first time an entry is stored with a size or lifetime limit, to be tracked for eviction.
     """
 
     MANAGED_FIELDS = ["created_at", "last_used_at"]
@@ -82,62 +94,136 @@ class _MessageCache:
         # Validate that the user provided datastore has the required fields.
         self._validate_datastore_schema()
 
+        self._lock = threading.Lock()
+        # creation time of the cached entries, from the least to the most recently used one
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+        # (created_at, cache_key) pairs. Pairs of evicted entries are discarded when popped
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._entries_loaded = False
+
     def _get_cache_schema(self, collection_name: str, entity_def: Entity) -> dict[str, Entity]:
         return {collection_name: entity_def}
 
+    def _load_entries(self) -> None:
+        # the datastore might already contain entries, e.g. if it is persistent. They only need to be
+        # tracked to be evicted, so they are loaded on the first store rather than on creation
+        if self._entries_loaded or (
+            self.max_cache_size is None and self.max_cache_lifetime is None
+        ):
+            return
+        self._entries_loaded = True
+        cached_entries = self.datastore.list(self.collection_name)
+        cached_entries.sort(key=lambda c: c.get("last_used_at", 0))
+        for cached_entry in cached_entries:
+            self._track_entry(cached_entry["cache_key"], float(cached_entry.get("created_at", 0)))
+
+    def _track_entry(self, cache_key: str, created_at: float) -> None:
+        if self._entries.get(cache_key) != created_at and self.max_cache_lifetime is not None:
+            heapq.heappush(self._expiry_heap, (created_at, cache_key))
+        self._entries[cache_key] = created_at
+        self._entries.move_to_end(cache_key)
+        if len(self._expiry_heap) > 2 * len(self._entries) + 32:
+            # too many discarded pairs, rebuild the heap from the tracked entries
+            self._expiry_heap = [
+                (entry_created_at, key) for key, entry_created_at in self._entries.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _is_expired(self, created_at: float, now_time: float) -> bool:
+        return (
+            self.max_cache_lifetime is not None and now_time - created_at > self.max_cache_lifetime
+        )
+
     def _remove_expired_conversations(self) -> None:
         if self.max_cache_lifetime is None:
             return
-        cached_conversations = self.datastore.list(self.collection_name)
         now_time = time.time()
-        for conversation in cached_conversations:
-            if now_time - conversation["created_at"] > self.max_cache_lifetime:
-                self.datastore.delete(self.collection_name, conversation)
+        expired_keys = []
+        while self._expiry_heap and self._is_expired(self._expiry_heap[0][0], now_time):
+            created_at, cache_key = heapq.heappop(self._expiry_heap)
+            if self._entries.get(cache_key) == created_at:
+                del self._entries[cache_key]
+                expired_keys.append(cache_key)
+        if not expired_keys:
+            return
+        if isinstance(self.datastore, RelationalDatastore):
+            # a single indexed statement, that also removes the expired entries of other processes
+            self.datastore.data_tables[self.collection_name]._delete_lower_than(
+                "created_at", now_time - self.max_cache_lifetime
+            )
+        else:
+            self._delete_entries(expired_keys)
 
     def _remove_lru(self) -> None:
-        # Sort by created_at such that oldest comes first
-        cached_conversations = self.datastore.list(self.collection_name)
-        cached_conversations.sort(key=lambda c: c.get("last_used_at", 0))
-        cache_key = cached_conversations[0].get("cache_key")
-        self.datastore.delete(self.collection_name, {"cache_key": cache_key})
+        if self.max_cache_size is None:
+            return
+        evicted_keys = []
+        while len(self._entries) > self.max_cache_size:
+            cache_key, _ = self._entries.popitem(last=False)
+            evicted_keys.append(cache_key)
+        self._delete_entries(evicted_keys)
+
+    def _delete_entries(self, cache_keys: List[str]) -> None:
+        if not cache_keys:
+            return
+        if isinstance(self.datastore, RelationalDatastore):
+            self.datastore.data_tables[self.collection_name]._delete_in("cache_key", cache_keys)
+        else:
+            for cache_key in cache_keys:
+                self.datastore.delete(self.collection_name, {"cache_key": cache_key})
 
     def retrieve(self, cache_key: str) -> Optional[Dict[str, Any]]:
-        self._remove_expired_conversations()
-        cached_conversation = self.datastore.list(
-            self.collection_name,
-            where={"cache_key": cache_key},
-        )
-
-        if len(cached_conversation) == 0:
-            return None
-        content = cached_conversation[0]
+        with self._lock:
+            self._remove_expired_conversations()
+            cached_conversation = self.datastore.list(
+                self.collection_name,
+                where={"cache_key": cache_key},
+                limit=1,
+            )
 
-        self.datastore.update(
-            self.collection_name,
-            {"cache_key": cache_key},
-            {"last_used_at": time.time()},
-        )
-        return content
+            if len(cached_conversation) == 0:
+                # might have been evicted by another process sharing the datastore
+                self._entries.pop(cache_key, None)
+                return None
+            content = cached_conversation[0]
+            # relational datastores might return decimals
+            created_at = float(content["created_at"])
+            if self._is_expired(created_at, time.time()):
+                self._entries.pop(cache_key, None)
+                self._delete_entries([cache_key])
+                return None
+
+            self.datastore.update(
+                self.collection_name,
+                {"cache_key": cache_key},
+                {"last_used_at": time.time()},
+            )
+            self._track_entry(cache_key, created_at)
+            return content
 
     def store(self, cache_key: str, content: Dict[str, Any]) -> None:
-        # This implementation is inefficient. A future improvement could optimize this could be to add
-        # a method that returns the number of rows per collection in the Datastore interface.
-        cache_size = len(self.datastore.list(self.collection_name))
-        if self.max_cache_size and cache_size > self.max_cache_size:
-            self._remove_lru()
         self._validate_content(content)
-
-        created_at = time.time()
-        self._remove_expired_conversations()
-        self.datastore.create(
-            self.collection_name,
-            {
+        with self._lock:
+            self._load_entries()
+            self._remove_expired_conversations()
+            created_at = time.time()
+            entry = {
                 "cache_key": cache_key,
                 **content,
                 "created_at": created_at,
                 "last_used_at": created_at,
-            },
-        )
+            }
+            # the entry might already be stored, by this process or another one sharing the
+            # datastore, so it is replaced rather than duplicated
+            if isinstance(self.datastore, RelationalDatastore):
+                self.datastore.data_tables[self.collection_name]._replace(
+                    {"cache_key": cache_key}, entry
+                )
+            else:
+                self.datastore.delete(self.collection_name, {"cache_key": cache_key})
+                self.datastore.create(self.collection_name, entry)
+            self._track_entry(cache_key, created_at)
+            self._remove_lru()
 
     def _validate_content(self, content: Dict[str, Any]) -> None:
         for field in self.MANAGED_FIELDS:
@@ -180,42 +266,134 @@ class _MessageCache:
                 )
 
 
+class SummarizationMode(str, Enum):
+    """Strategy used to summarize content that does not fit in a single summarization request"""
+
+    REFINE = "refine"
+    """The chunks of the content are summarized one after the other, each request refining the summary of the
+    previous chunks. This makes one sequential LLM request per chunk, so the latency grows linearly with the size
+    of the content, but the total number of tokens is the lowest."""
+    MAP_REDUCE = "map_reduce"
+    """The chunks of the content are summarized concurrently, and their summaries are then merged hierarchically.
+    The latency is about one LLM request per level of the merge tree instead of one per chunk, at the cost of the
+    additional merge requests, whose inputs are the intermediate summaries."""
+
+
 class _Summarizer:
     """
     A helper class for summarizing message contents using an LLM.
     """
 
     _PROMPT_TEMPLATE = "{instructions}\n\nPrevious summary:\n{previous_summary}\n\nAdded content:\n"
+    _MAP_PROMPT_TEMPLATE = "{instructions}\n\nContent (part {part} of {num_parts}):\n"
+    _REDUCE_PROMPT_TEMPLATE = (
+        "{instructions}\n\nThe following are the summaries of consecutive parts of the content. "
+        "Merge them into a single summary:\n"
+    )
 
     def __init__(
-        self, llm: "LlmModel", summarization_instructions: str, summarized_content_template: str
+        self,
+        llm: "LlmModel",
+        summarization_instructions: str,
+        summarized_content_template: str,
+        summarization_mode: SummarizationMode = SummarizationMode.REFINE,
+        max_concurrent_summarizations: int = 4,
     ) -> None:
         self.llm = llm
         self.summarization_instructions = summarization_instructions
         self.summarized_content_template = summarized_content_template
+        self.summarization_mode = SummarizationMode(summarization_mode)
+        if max_concurrent_summarizations < 1:
+            raise ValueError(
+                f"`max_concurrent_summarizations` should be at least 1, but was {max_concurrent_summarizations}"
+            )
+        self.max_concurrent_summarizations = max_concurrent_summarizations
 
-    async def _summarize_chunk(self, previous_summary: str, chunk: List[MessageContent]) -> str:
-        prompt = self._PROMPT_TEMPLATE.format(
-            instructions=self.summarization_instructions, previous_summary=previous_summary
-        )
+    async def _generate_summary(self, prompt: str, chunk: List[MessageContent]) -> str:
         contents = [TextContent(prompt)] + chunk
         prompt_obj = Prompt([Message(contents=contents)])
         completion = await self.llm.generate_async(prompt_obj)
         return completion.message.content
 
-    async def summarize(self, contents: List[MessageContent], max_tokens: int) -> str:
+    async def _summarize_chunk(self, previous_summary: str, chunk: List[MessageContent]) -> str:
+        prompt = self._PROMPT_TEMPLATE.format(
+            instructions=self.summarization_instructions, previous_summary=previous_summary
+        )
+        return await self._generate_summary(prompt, chunk)
+
+    @staticmethod
+    def _split_in_chunks(
+        contents: List[MessageContent], max_tokens: int, min_chunk_size: int = 1
+    ) -> List[List[MessageContent]]:
+        chunks: List[List[MessageContent]] = []
         chunk: List[MessageContent] = []
         tokens_in_chunk = 0
-        summary = "Nothing summarized yet"
         for content in contents:
-            tokens_in_chunk += CountTokensHeuristics.tokens_in_messagecontents([content])
-            if tokens_in_chunk > max_tokens and chunk:
-                summary = await self._summarize_chunk(summary, chunk)
+            tokens_in_content = CountTokensHeuristics.tokens_in_messagecontents([content])
+            if tokens_in_chunk + tokens_in_content > max_tokens and len(chunk) >= min_chunk_size:
+                chunks.append(chunk)
                 chunk = []
                 tokens_in_chunk = 0
             chunk.append(content)
+            tokens_in_chunk += tokens_in_content
         if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    async def _generate_summaries_concurrently(
+        self, prompts_and_chunks: List[Tuple[str, List[MessageContent]]]
+    ) -> List[str]:
+        limiter = anyio.CapacityLimiter(self.max_concurrent_summarizations)
+        summaries: List[str] = [""] * len(prompts_and_chunks)
+
+        async def _generate(idx: int, prompt: str, chunk: List[MessageContent]) -> None:
+            async with limiter:
+                summaries[idx] = await self._generate_summary(prompt, chunk)
+
+        async with anyio.create_task_group() as tg:
+            for idx, (prompt, chunk) in enumerate(prompts_and_chunks):
+                tg.start_soon(_generate, idx, prompt, chunk)
+        return summaries
+
+    async def _summarize_refine(self, contents: List[MessageContent], max_tokens: int) -> str:
+        summary = "Nothing summarized yet"
+        for chunk in self._split_in_chunks(contents, max_tokens):
             summary = await self._summarize_chunk(summary, chunk)
+        return summary
+
+    async def _summarize_map_reduce(self, contents: List[MessageContent], max_tokens: int) -> str:
+        chunks = self._split_in_chunks(contents, max_tokens)
+        summaries = await self._generate_summaries_concurrently(
+            [
+                (
+                    self._MAP_PROMPT_TEMPLATE.format(
+                        instructions=self.summarization_instructions,
+                        part=part,
+                        num_parts=len(chunks),
+                    ),
+                    chunk,
+                )
+                for part, chunk in enumerate(chunks, start=1)
+            ]
+        )
+        reduce_prompt = self._REDUCE_PROMPT_TEMPLATE.format(
+            instructions=self.summarization_instructions
+        )
+        while len(summaries) > 1:
+            # each group merges at least two summaries, so that every level reduces their number
+            groups = self._split_in_chunks(
+                [TextContent(summary) for summary in summaries], max_tokens, min_chunk_size=2
+            )
+            summaries = await self._generate_summaries_concurrently(
+                [(reduce_prompt, group) for group in groups]
+            )
+        return summaries[0] if summaries else "Nothing summarized yet"
+
+    async def summarize(self, contents: List[MessageContent], max_tokens: int) -> str:
+        if self.summarization_mode == SummarizationMode.MAP_REDUCE:
+            summary = await self._summarize_map_reduce(contents, max_tokens)
+        else:
+            summary = await self._summarize_refine(contents, max_tokens)
         final_summary = render_template(
             self.summarized_content_template, inputs={"summary": summary}
         )
@@ -268,6 +446,13 @@ class MessageSummarizationTransform(MessageTransform):
     max_cache_lifetime:
         max lifetime of a message in the cache in seconds.
         If None, cached data persists indefinitely.
+    summarization_mode:
+        How messages too large to be summarized in a single LLM request are summarized. ``"refine"`` summarizes
+        their chunks sequentially, while ``"map_reduce"`` summarizes them concurrently and merges the summaries,
+        which is faster for large messages at the cost of more tokens. See ``SummarizationMode``.
+    max_concurrent_summarizations:
+        Maximum number of concurrent LLM requests when summarizing in ``"map_reduce"`` mode.
+
     Examples
     --------
     >>> from wayflowcore.transforms import MessageSummarizationTransform
@@ -294,6 +479,8 @@ class MessageSummarizationTransform(MessageTransform):
         cache_collection_name: str = DEFAULT_CACHE_COLLECTION_NAME,
         max_cache_size: Optional[int] = 10_000,
         max_cache_lifetime: Optional[int] = 4 * 3600,
+        summarization_mode: SummarizationMode = SummarizationMode.REFINE,
+        max_concurrent_summarizations: int = 4,
         name: Optional[str] = None,
         id: Optional[str] = None,
         description: Optional[str] = None,
@@ -308,7 +495,15 @@ class MessageSummarizationTransform(MessageTransform):
         self.cache_collection_name = cache_collection_name
         self.max_cache_size = max_cache_size
         self.max_cache_lifetime = max_cache_lifetime
-        self._summarizer = _Summarizer(llm, summarization_instructions, summarized_message_template)
+        self._summarizer = _Summarizer(
+            llm,
+            summarization_instructions,
+            summarized_message_template,
+            summarization_mode=summarization_mode,
+            max_concurrent_summarizations=max_concurrent_summarizations,
+        )
+        self.summarization_mode = self._summarizer.summarization_mode
+        self.max_concurrent_summarizations = max_concurrent_summarizations
         self.max_message_size = max_message_size
         if self.max_message_size <= 0:
             raise ValueError("max_message_size must be a positive integer.")
@@ -319,7 +514,8 @@ class MessageSummarizationTransform(MessageTransform):
             with warnings.catch_warnings():
                 warnings.filterwarnings("ignore", message=f"{_INMEMORY_USER_WARNING}*")
                 datastore = InMemoryDatastore(
-                    {self.cache_collection_name: self.get_entity_definition()}
+                    {self.cache_collection_name: self.get_entity_definition()},
+                    indexed_columns={self.cache_collection_name: ["cache_key"]},
                 )
             warnings.warn(_SUMMARIZATION_WARNING_MESSAGE)
 
@@ -427,6 +623,8 @@ class MessageSummarizationTransform(MessageTransform):
             "cache_collection_name": self.cache_collection_name,
             "max_cache_size": self.max_cache_size,
             "max_cache_lifetime": self.max_cache_lifetime,
+            "summarization_mode": self.summarization_mode.value,
+            "max_concurrent_summarizations": self.max_concurrent_summarizations,
             "id": self.id,
             "name": self.name,
             "description": self.description,
@@ -464,6 +662,8 @@ class MessageSummarizationTransform(MessageTransform):
             ),
             max_cache_size=input_dict.get("max_cache_size", 10_000),
             max_cache_lifetime=input_dict.get("max_cache_lifetime", 4 * 3600),
+            summarization_mode=input_dict.get("summarization_mode", SummarizationMode.REFINE),
+            max_concurrent_summarizations=input_dict.get("max_concurrent_summarizations", 4),
             id=input_dict.get("id"),
             name=input_dict.get("name"),
             description=input_dict.get("description"),
@@ -506,6 +706,12 @@ class ConversationSummarizationTransform(MessageTransform):
         If None, cached data persists indefinitely.
     cache_collection_name:
         the collection in the cache datastore where summarized conversations will be stored
+    summarization_mode:
+        How conversations too large to be summarized in a single LLM request are summarized. ``"refine"``
+        summarizes their chunks sequentially, while ``"map_reduce"`` summarizes them concurrently and merges the
+        summaries, which is faster for large conversations at the cost of more tokens. See ``SummarizationMode``.
+    max_concurrent_summarizations:
+        Maximum number of concurrent LLM requests when summarizing in ``"map_reduce"`` mode.
 
     Examples
     --------
@@ -537,6 +743,8 @@ class ConversationSummarizationTransform(MessageTransform):
         max_cache_size: Optional[int] = 10_000,
         max_cache_lifetime: Optional[int] = 4 * 3600,
         cache_collection_name: str = DEFAULT_CACHE_COLLECTION_NAME,
+        summarization_mode: SummarizationMode = SummarizationMode.REFINE,
+        max_concurrent_summarizations: int = 4,
         name: Optional[str] = None,
         id: Optional[str] = None,
         description: Optional[str] = None,
@@ -548,8 +756,14 @@ class ConversationSummarizationTransform(MessageTransform):
         self.llm = llm
         self.summarization_instructions = summarization_instructions
         self._summarizer = _Summarizer(
-            llm, summarization_instructions, summarized_conversation_template
+            llm,
+            summarization_instructions,
+            summarized_conversation_template,
+            summarization_mode=summarization_mode,
+            max_concurrent_summarizations=max_concurrent_summarizations,
         )
+        self.summarization_mode = self._summarizer.summarization_mode
+        self.max_concurrent_summarizations = max_concurrent_summarizations
         self.max_num_messages = max_num_messages
         self.max_num_characters = max_num_characters
         self.min_num_messages = min_num_messages
@@ -579,7 +793,8 @@ class ConversationSummarizationTransform(MessageTransform):
             with warnings.catch_warnings():
                 warnings.filterwarnings("ignore", message=f"{_INMEMORY_USER_WARNING}*")
                 datastore = InMemoryDatastore(
-                    {self.cache_collection_name: self.get_entity_definition()}
+                    {self.cache_collection_name: self.get_entity_definition()},
+                    indexed_columns={self.cache_collection_name: ["cache_key"]},
                 )
             warnings.warn(_SUMMARIZATION_WARNING_MESSAGE)
         if datastore is not None:
@@ -743,6 +958,8 @@ class ConversationSummarizationTransform(MessageTransform):
             "max_cache_size": self.max_cache_size,
             "max_cache_lifetime": self.max_cache_lifetime,
             "cache_collection_name": self.cache_collection_name,
+            "summarization_mode": self.summarization_mode.value,
+            "max_concurrent_summarizations": self.max_concurrent_summarizations,
             "id": self.id,
             "name": self.name,
             "description": self.description,
@@ -781,6 +998,8 @@ class ConversationSummarizationTransform(MessageTransform):
             cache_collection_name=input_dict.get(
                 "cache_collection_name", cls.DEFAULT_CACHE_COLLECTION_NAME
             ),
+            summarization_mode=input_dict.get("summarization_mode", SummarizationMode.REFINE),
+            max_concurrent_summarizations=input_dict.get("max_concurrent_summarizations", 4),
             id=input_dict.get("id"),
             name=input_dict.get("name"),
             description=input_dict.get("description"),
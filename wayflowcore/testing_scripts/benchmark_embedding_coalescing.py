@@ -0,0 +1,124 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+# type: ignore
+"""
+This script compares the number of requests and the latency of concurrent single-query embedding calls,
+with and without coalescing of the concurrent requests.
+
+The embedding endpoint is simulated: each request takes a fixed round-trip time plus a small time
+per embedded text, and the endpoint serves a limited number of requests at a time, like a loaded
+vLLM server would.
+
+The script can be executed as follows:
+
+python benchmark_embedding_coalescing.py \
+    --num-queries 200 \
+    --max-coalescing-delay 0.005
+
+Use `python benchmark_embedding_coalescing.py -h` for more information.
+"""
+
+import argparse
+import time
+
+import anyio
+
+from wayflowcore.embeddingmodels import VllmEmbeddingModel
+
+
+class SimulatedVllmEmbeddingModel(VllmEmbeddingModel):
+    def __init__(self, round_trip_time, time_per_text, max_concurrent_requests, **kwargs):
+        super().__init__(
+            base_url="http://simulated.url", model_id="simulated", api_key="simulated", **kwargs
+        )
+        self.round_trip_time = round_trip_time
+        self.time_per_text = time_per_text
+        self.limiter = anyio.CapacityLimiter(max_concurrent_requests)
+        self.num_requests = 0
+
+    async def _embed_batch_async(self, data):
+        self.num_requests += 1
+        async with self.limiter:
+            await anyio.sleep(self.round_trip_time + self.time_per_text * len(data))
+        return [[float(len(text))] for text in data]
+
+
+async def run_queries(model, num_queries):
+    latencies = []
+
+    async def _query(idx):
+        start = time.perf_counter()
+        await model.embed_async([f"query {idx}"])
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for idx in range(num_queries):
+            tg.start_soon(_query, idx)
+    return time.perf_counter() - start, sorted(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--num-queries", type=int, default=200, help="Number of concurrent single-query calls"
+    )
+    parser.add_argument(
+        "--max-coalescing-delay",
+        type=float,
+        default=0.005,
+        help="Maximum time in seconds a coalesced batch waits for other queries",
+    )
+    parser.add_argument(
+        "--max-coalesced-batch-size",
+        type=int,
+        default=64,
+        help="Maximum number of texts of a coalesced request",
+    )
+    parser.add_argument(
+        "--round-trip-time",
+        type=float,
+        default=0.02,
+        help="Simulated time in seconds of a request, independently of its size",
+    )
+    parser.add_argument(
+        "--time-per-text",
+        type=float,
+        default=0.0005,
+        help="Simulated time in seconds to embed each text of a request",
+    )
+    parser.add_argument(
+        "--max-concurrent-requests",
+        type=int,
+        default=8,
+        help="Number of requests the simulated endpoint serves at a time",
+    )
+    args = parser.parse_args()
+
+    print(f"{'mode':>12}{'requests':>10}{'total (ms)':>12}{'p50 (ms)':>10}{'p99 (ms)':>10}")
+    for mode, max_coalescing_delay in [
+        ("individual", None),
+        ("coalesced", args.max_coalescing_delay),
+    ]:
+        model = SimulatedVllmEmbeddingModel(
+            round_trip_time=args.round_trip_time,
+            time_per_text=args.time_per_text,
+            max_concurrent_requests=args.max_concurrent_requests,
+            max_coalescing_delay=max_coalescing_delay,
+            max_coalesced_batch_size=args.max_coalesced_batch_size,
+        )
+        total_time, latencies = anyio.run(run_queries, model, args.num_queries)
+        p50 = latencies[len(latencies) // 2]
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(
+            f"{mode:>12}{model.num_requests:>10}{total_time * 1000:>12.1f}"
+            f"{p50 * 1000:>10.1f}{p99 * 1000:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
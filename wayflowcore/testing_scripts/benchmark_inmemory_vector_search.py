@@ -0,0 +1,99 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+# type: ignore
+"""
+This script measures the recall and latency of the approximate in-memory vector index
+(``IVFEntityVectorIndex``) against the exact index (``EntityVectorIndex``) on synthetic
+clustered embeddings, for several values of ``nprobe``.
+
+The script can be executed as follows:
+
+python benchmark_inmemory_vector_search.py \
+    --num-vectors 200000 \
+    --dimension 256 \
+    --nprobe 1 4 8 16 32
+
+Use `python benchmark_inmemory_vector_search.py -h` for more information.
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from wayflowcore.search import EntityVectorIndex, IVFEntityVectorIndex, SimilarityMetric
+
+
+def make_vectors(num_vectors, centers, noise_scale, rng):
+    assignments = rng.integers(len(centers), size=num_vectors)
+    noise = rng.normal(scale=noise_scale, size=(num_vectors, centers.shape[1]))
+    return centers[assignments] + noise.astype(np.float32)
+
+
+def timed_searches(index, queries, k):
+    start = time.perf_counter()
+    results = [{r["id"] for r in index.search(query, k=k)} for query in queries]
+    return results, (time.perf_counter() - start) / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--num-vectors", type=int, default=100_000)
+    parser.add_argument("--dimension", type=int, default=256)
+    parser.add_argument("--num-clusters", type=int, default=512)
+    parser.add_argument(
+        "--noise-scale", type=float, default=1.5, help="Spread of the vectors around the clusters"
+    )
+    parser.add_argument("--num-queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--num-partitions", type=int, default=None)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    parser.add_argument(
+        "--metric", choices=[m.value for m in SimilarityMetric], default="cosine_distance"
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    metric = SimilarityMetric(args.metric)
+    # Embeddings of real documents are clustered by topic, queries fall close to some topics
+    centers = rng.normal(size=(args.num_clusters, args.dimension)).astype(np.float32)
+    vectors = make_vectors(args.num_vectors, centers, args.noise_scale, rng)
+    entities = [{"id": i, "embedding": v.tolist()} for i, v in enumerate(vectors)]
+    queries = make_vectors(args.num_queries, centers, args.noise_scale, rng).tolist()
+
+    exact_index = EntityVectorIndex(args.dimension, metric)
+    exact_index.build(entities, "embedding")
+    exact_results, exact_latency = timed_searches(exact_index, queries, args.k)
+    print(f"exact index: {exact_latency * 1000:.2f} ms/query")
+    start = time.perf_counter()
+    exact_index.search_batch(queries, k=args.k)
+    batch_latency = (time.perf_counter() - start) / len(queries)
+    print(f"exact index, batched: {batch_latency * 1000:.2f} ms/query")
+
+    start = time.perf_counter()
+    ivf_index = IVFEntityVectorIndex(args.dimension, metric, num_partitions=args.num_partitions)
+    ivf_index.build(entities, "embedding")
+    print(
+        f"ivf index: trained {len(ivf_index._centroids)} partitions "
+        f"in {time.perf_counter() - start:.2f} s"
+    )
+
+    print(f"{'nprobe':>8} {'recall@' + str(args.k):>10} {'ms/query':>10} {'speedup':>8}")
+    for nprobe in args.nprobe:
+        ivf_index.nprobe = nprobe
+        ivf_results, ivf_latency = timed_searches(ivf_index, queries, args.k)
+        recall = np.mean(
+            [len(exact & approx) / args.k for exact, approx in zip(exact_results, ivf_results)]
+        )
+        print(
+            f"{nprobe:>8} {recall:>10.3f} {ivf_latency * 1000:>10.2f} "
+            f"{exact_latency / ivf_latency:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+# type: ignore
+"""
+This script compares concurrent generations sent to an overloaded LLM endpoint, with and without
+a client-side rate limiter.
+
+The endpoint is simulated: it serves a limited number of concurrent requests and rejects the other
+ones with a 429 status and a ``Retry-After`` delay, after which the rejected requests are retried
+like the HTTP helpers of WayFlow do. Without limiter, the clients retry in bursts; with the limiter,
+the generations queue on the client and the concurrency adapts to the capacity of the endpoint.
+
+The script can be executed as follows:
+
+python benchmark_llm_rate_limiting.py \
+    --num-generations 200 \
+    --endpoint-capacity 16
+
+Use `python benchmark_llm_rate_limiting.py -h` for more information.
+"""
+
+import argparse
+import time
+
+import anyio
+
+from wayflowcore.messagelist import Message, MessageType
+from wayflowcore.models import LlmRateLimiter, StreamChunkType, set_llm_rate_limiter
+from wayflowcore.models._requesthelpers import _DEFAULT_RNG, _compute_wait_before_next_attempt
+from wayflowcore.models.llmmodel import LlmCompletion, LlmModel
+from wayflowcore.retrypolicy import RetryPolicy
+
+ENDPOINT = "http://simulated.endpoint"
+
+
+class SimulatedEndpoint:
+    def __init__(self, capacity, latency, retry_after):
+        self.capacity = capacity
+        self.latency = latency
+        self.retry_after = retry_after
+        self.num_in_flight = 0
+        self.num_requests = 0
+        self.num_rejected = 0
+
+    async def post(self):
+        """Returns the status code of the request"""
+        self.num_requests += 1
+        if self.num_in_flight >= self.capacity:
+            self.num_rejected += 1
+            return 429
+        self.num_in_flight += 1
+        try:
+            await anyio.sleep(self.latency)
+        finally:
+            self.num_in_flight -= 1
+        return 200
+
+
+class SimulatedLlm(LlmModel):
+    def __init__(self, endpoint):
+        super().__init__(
+            model_id="simulated",
+            generation_config=None,
+            __metadata_info__=None,
+            supports_structured_generation=False,
+            supports_tool_calling=False,
+        )
+        self.endpoint = endpoint
+        self.retry_policy = RetryPolicy(max_attempts=20, max_retry_delay=2.0)
+
+    @property
+    def _rate_limit_endpoint(self):
+        return ENDPOINT
+
+    async def _generate_impl(self, prompt):
+        time_started = anyio.current_time()
+        for attempt_num in range(self.retry_policy.total_attempts):
+            if await self.endpoint.post() == 200:
+                return LlmCompletion(Message(content="ok", message_type=MessageType.AGENT), None)
+            wait_time_seconds = _compute_wait_before_next_attempt(
+                policy=self.retry_policy,
+                attempt_num=attempt_num,
+                status_code=429,
+                retry_after_value=str(self.endpoint.retry_after),
+                previous_wait_seconds=None,
+                time_started=time_started,
+                elapsed_time_seconds_fn=anyio.current_time,
+                total_elapsed_time_seconds=None,
+                rng=_DEFAULT_RNG,
+            )
+            await anyio.sleep(wait_time_seconds)
+        raise RuntimeError("Generation failed after maximum retries")
+
+    async def _stream_generate_impl(self, prompt):
+        message = (await self._generate_impl(prompt)).message
+        yield StreamChunkType.START_CHUNK, Message(content="", message_type=MessageType.AGENT), None
+        yield StreamChunkType.END_CHUNK, message, None
+
+    @property
+    def config(self):
+        return {}
+
+
+async def run_generations(llm, num_generations):
+    async with anyio.create_task_group() as tg:
+        for _ in range(num_generations):
+            tg.start_soon(llm.generate_async, "Hello")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--num-generations", type=int, default=200, help="Number of concurrent generations"
+    )
+    parser.add_argument(
+        "--endpoint-capacity",
+        type=int,
+        default=16,
+        help="Number of concurrent requests served by the simulated endpoint",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.2, help="Time in seconds to serve a request"
+    )
+    parser.add_argument(
+        "--retry-after",
+        type=float,
+        default=1.0,
+        help="Retry-After delay in seconds of the rejected requests",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=64,
+        help="Initial and maximum concurrency of the rate limiter",
+    )
+    args = parser.parse_args()
+
+    print(f"{'mode':>10}{'requests':>10}{'429s':>8}{'total (s)':>11}")
+    for mode in ["no limiter", "limiter"]:
+        rate_limiter = LlmRateLimiter(max_concurrency=args.max_concurrency)
+        set_llm_rate_limiter(ENDPOINT, rate_limiter if mode == "limiter" else None)
+        endpoint = SimulatedEndpoint(args.endpoint_capacity, args.latency, args.retry_after)
+        start = time.perf_counter()
+        anyio.run(run_generations, SimulatedLlm(endpoint), args.num_generations)
+        total_time = time.perf_counter() - start
+        print(f"{mode:>10}{endpoint.num_requests:>10}{endpoint.num_rejected:>8}{total_time:>11.2f}")
+    set_llm_rate_limiter(ENDPOINT, None)
+
+
+if __name__ == "__main__":
+    main()
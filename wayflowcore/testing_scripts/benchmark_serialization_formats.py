@@ -0,0 +1,171 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+# type: ignore
+"""
+This script compares the serialization formats of WayFlow (YAML, JSON and MessagePack, with and
+without zstd compression) on representative conversation states: a flow conversation that looped
+over many turns, and an agent conversation with a long message history and tool calls.
+
+For each state and format, it reports the size of the serialized state and the time to encode it
+from its dictionary representation (shared by all formats), to decode it, and to fully serialize
+and deserialize the conversation.
+
+The script can be executed as follows:
+
+python benchmark_serialization_formats.py \
+    --num-turns 50 200 \
+    --repeats 5
+
+Use `python benchmark_serialization_formats.py -h` for more information.
+"""
+
+import argparse
+import importlib.util
+import time
+
+from wayflowcore.agent import Agent
+from wayflowcore.controlconnection import ControlFlowEdge
+from wayflowcore.flow import Flow
+from wayflowcore.messagelist import Message, MessageType
+from wayflowcore.models import VllmModel
+from wayflowcore.property import StringProperty
+from wayflowcore.serialization import (
+    SerializationFormat,
+    autodeserialize,
+    serialize,
+    serialize_to_dict,
+)
+from wayflowcore.serialization.formats import _dump_serialized_dict, _load_serialized_dict
+from wayflowcore.steps import InputMessageStep, OutputMessageStep
+from wayflowcore.tools import ClientTool, ToolRequest, ToolResult
+
+LOREM = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt "
+    "ut labore et dolore magna aliqua. "
+)
+
+
+def make_flow_conversation(num_turns):
+    output_step = OutputMessageStep(message_template="Answer: " + LOREM, name="output")
+    input_step = InputMessageStep(message_template=None, name="input")
+    flow = Flow(
+        begin_step=output_step,
+        control_flow_edges=[
+            ControlFlowEdge(source_step=output_step, destination_step=input_step),
+            ControlFlowEdge(source_step=input_step, destination_step=output_step),
+        ],
+    )
+    conversation = flow.start_conversation()
+    conversation.execute()
+    for turn in range(num_turns):
+        conversation.append_user_message(f"Question {turn}: " + LOREM)
+        conversation.execute()
+    return conversation
+
+
+def make_agent_conversation(num_turns):
+    tool = ClientTool(
+        name="search",
+        description="Searches the knowledge base",
+        input_descriptors=[StringProperty(name="query")],
+    )
+    agent = Agent(
+        llm=VllmModel(model_id="model", host_port="localhost:8000"),
+        tools=[tool],
+        custom_instruction="You are a helpful assistant. " + LOREM,
+    )
+    conversation = agent.start_conversation()
+    for turn in range(num_turns):
+        conversation.append_user_message(f"Question {turn}: " + LOREM)
+        tool_request = ToolRequest(name="search", args={"query": LOREM}, tool_request_id=str(turn))
+        conversation.append_message(
+            Message(message_type=MessageType.TOOL_REQUEST, tool_requests=[tool_request])
+        )
+        conversation.append_message(
+            Message(
+                message_type=MessageType.TOOL_RESULT,
+                tool_result=ToolResult(content=LOREM * 4, tool_request_id=str(turn)),
+            )
+        )
+        conversation.append_agent_message(f"Answer {turn}: " + LOREM)
+    return conversation
+
+
+def best_time(fn, repeats):
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def get_available_configurations():
+    configurations = [(SerializationFormat.YAML, False), (SerializationFormat.JSON, False)]
+    if importlib.util.find_spec("msgpack") is not None:
+        configurations.append((SerializationFormat.MSGPACK, False))
+    if importlib.util.find_spec("zstandard") is not None:
+        configurations += [(fmt, True) for fmt, _ in list(configurations)]
+    return configurations
+
+
+def benchmark(name, conversation, repeats):
+    obj_as_dict = serialize_to_dict(conversation)
+    print(f"\n{name} ({len(conversation.get_messages())} messages)")
+    print(
+        f"{'format':<16}{'size (kB)':>12}{'encode (ms)':>14}{'decode (ms)':>14}"
+        f"{'serialize (ms)':>17}{'deserialize (ms)':>19}"
+    )
+    for serialization_format, compress in get_available_configurations():
+        serialized_dict = _dump_serialized_dict(obj_as_dict, serialization_format, compress)
+        serialized_conversation = serialize(
+            conversation, serialization_format=serialization_format, compress=compress
+        )
+        encode_time = best_time(
+            lambda: _dump_serialized_dict(obj_as_dict, serialization_format, compress), repeats
+        )
+        decode_time = best_time(lambda: _load_serialized_dict(serialized_dict), repeats)
+        serialize_time = best_time(
+            lambda: serialize(
+                conversation, serialization_format=serialization_format, compress=compress
+            ),
+            repeats,
+        )
+        deserialize_time = best_time(lambda: autodeserialize(serialized_conversation), repeats)
+        label = serialization_format.value + ("+zstd" if compress else "")
+        print(
+            f"{label:<16}{len(serialized_dict) / 1000:>12.1f}{encode_time * 1000:>14.2f}"
+            f"{decode_time * 1000:>14.2f}{serialize_time * 1000:>17.2f}"
+            f"{deserialize_time * 1000:>19.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--num-turns",
+        type=int,
+        nargs="+",
+        default=[50, 200],
+        help="Number of turns of the benchmarked conversations",
+    )
+    parser.add_argument("--repeats", type=int, default=5, help="Best of N timings are reported")
+    args = parser.parse_args()
+
+    for num_turns in args.num_turns:
+        benchmark(
+            f"Flow conversation, {num_turns} turns", make_flow_conversation(num_turns), args.repeats
+        )
+        benchmark(
+            f"Agent conversation, {num_turns} turns",
+            make_agent_conversation(num_turns),
+            args.repeats,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+# type: ignore
+"""
+This script measures the time to accumulate streamed chunks into the messages of a conversation,
+for streams of increasing length. The time per chunk should stay constant as the streams get longer.
+
+For comparison, it also reports the time of the previous accumulation, which concatenated each
+chunk to the text content of the message and was quadratic in the length of the stream.
+
+The script can be executed as follows:
+
+python benchmark_streaming_accumulation.py \
+    --num-chunks 1000 10000 100000 \
+    --chunk-size 4
+
+Use `python benchmark_streaming_accumulation.py -h` for more information.
+"""
+
+import argparse
+import time
+
+import anyio
+
+from wayflowcore.messagelist import Message, MessageList, MessageType, TextContent
+from wayflowcore.models import StreamChunkType
+
+
+def make_chunk_messages(chunks):
+    return (
+        [(StreamChunkType.START_CHUNK, Message(content="", message_type=MessageType.AGENT))]
+        + [
+            (StreamChunkType.TEXT_CHUNK, Message(content=chunk, message_type=MessageType.AGENT))
+            for chunk in chunks
+        ]
+        + [
+            (
+                StreamChunkType.END_CHUNK,
+                Message(content="".join(chunks), message_type=MessageType.AGENT),
+            )
+        ]
+    )
+
+
+async def stream(chunk_messages):
+    for chunk_message in chunk_messages:
+        yield chunk_message
+
+
+def accumulate_with_message_list(chunk_messages):
+    message_list = MessageList()
+    anyio.run(message_list._stream_message, stream(chunk_messages))
+    return message_list.messages[-1].content
+
+
+def accumulate_with_concatenation(chunk_messages):
+    message = Message(content="", message_type=MessageType.AGENT)
+    for chunk_type, chunk_message in chunk_messages:
+        if chunk_type != StreamChunkType.TEXT_CHUNK:
+            continue
+        last_text_content = next(
+            iter(c for c in message.contents[::-1] if isinstance(c, TextContent)), None
+        )
+        if last_text_content is None:
+            last_text_content = TextContent(content="")
+            message.contents.append(last_text_content)
+        last_text_content.content += chunk_message.content
+    return message.content
+
+
+def best_time(fn, chunk_messages, repeats):
+    durations = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(chunk_messages)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--num-chunks",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000],
+        help="Number of chunks of the benchmarked streams",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=4, help="Number of characters of each chunk"
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Best of N timings are reported")
+    args = parser.parse_args()
+
+    print(
+        f"{'chunks':>10}{'stream (ms)':>14}{'us/chunk':>11}"
+        f"{'concatenation (ms)':>21}{'us/chunk':>11}"
+    )
+    for num_chunks in args.num_chunks:
+        chunk_messages = make_chunk_messages(["x" * args.chunk_size for _ in range(num_chunks)])
+        stream_time = best_time(accumulate_with_message_list, chunk_messages, args.repeats)
+        concatenation_time = best_time(accumulate_with_concatenation, chunk_messages, args.repeats)
+        print(
+            f"{num_chunks:>10}{stream_time * 1000:>14.1f}{stream_time / num_chunks * 1e6:>11.2f}"
+            f"{concatenation_time * 1000:>21.1f}{concatenation_time / num_chunks * 1e6:>11.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
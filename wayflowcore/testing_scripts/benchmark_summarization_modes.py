@@ -0,0 +1,161 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+# type: ignore
+"""
+This script compares the latency and the token consumption of the summarization modes of the
+summarization transforms (``refine`` and ``map_reduce``) when summarizing a large content, such as
+a large tool output.
+
+The LLM is simulated: each request takes a fixed latency plus a latency per input token, and
+returns a summary of a fixed size. The numbers of requests and of tokens are estimated with the
+same heuristics as the transforms.
+
+The script can be executed as follows:
+
+python benchmark_summarization_modes.py \
+    --content-tokens 50000 200000 \
+    --max-concurrent-summarizations 4 8
+
+Use `python benchmark_summarization_modes.py -h` for more information.
+"""
+
+import argparse
+import time
+
+import anyio
+
+from wayflowcore.messagelist import Message, MessageType, TextContent
+from wayflowcore.models import StreamChunkType
+from wayflowcore.models.llmmodel import LlmCompletion, LlmModel
+from wayflowcore.models.tokenusagehelpers import CountTokensHeuristics
+from wayflowcore.transforms import SummarizationMode
+from wayflowcore.transforms.summarization import _Summarizer
+
+CHARS_PER_TOKEN = 4
+
+
+class SimulatedLlm(LlmModel):
+    def __init__(self, request_latency, latency_per_1k_input_tokens, summary_tokens):
+        super().__init__(
+            model_id="simulated",
+            generation_config=None,
+            __metadata_info__=None,
+            supports_structured_generation=False,
+            supports_tool_calling=False,
+        )
+        self.request_latency = request_latency
+        self.latency_per_1k_input_tokens = latency_per_1k_input_tokens
+        self.summary_tokens = summary_tokens
+        self.num_requests = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    async def _generate_impl(self, prompt):
+        input_tokens = sum(
+            CountTokensHeuristics.tokens_in_messagecontents(message.contents)
+            for message in prompt.messages
+        )
+        self.num_requests += 1
+        self.input_tokens += input_tokens
+        self.output_tokens += self.summary_tokens
+        await anyio.sleep(
+            self.request_latency + self.latency_per_1k_input_tokens * input_tokens / 1000
+        )
+        summary = "s" * (self.summary_tokens * CHARS_PER_TOKEN)
+        return LlmCompletion(Message(content=summary, message_type=MessageType.AGENT), None)
+
+    async def _stream_generate_impl(self, prompt):
+        message = (await self._generate_impl(prompt)).message
+        yield StreamChunkType.START_CHUNK, Message(content="", message_type=MessageType.AGENT), None
+        yield StreamChunkType.END_CHUNK, message, None
+
+    @property
+    def config(self):
+        return {}
+
+
+def make_contents(content_tokens, paragraph_tokens=500):
+    paragraph = "x" * (paragraph_tokens * CHARS_PER_TOKEN)
+    return [TextContent(paragraph) for _ in range(max(1, content_tokens // paragraph_tokens))]
+
+
+def benchmark(args, content_tokens, summarization_mode, max_concurrent_summarizations):
+    llm = SimulatedLlm(args.request_latency, args.latency_per_1k_input_tokens, args.summary_tokens)
+    summarizer = _Summarizer(
+        llm,
+        "Summarize",
+        "{{summary}}",
+        summarization_mode=summarization_mode,
+        max_concurrent_summarizations=max_concurrent_summarizations,
+    )
+    contents = make_contents(content_tokens)
+    start = time.perf_counter()
+    anyio.run(summarizer.summarize, contents, args.chunk_tokens)
+    duration = time.perf_counter() - start
+    return duration, llm.num_requests, llm.input_tokens, llm.output_tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--content-tokens",
+        type=int,
+        nargs="+",
+        default=[20_000, 200_000],
+        help="Number of tokens of the summarized contents",
+    )
+    parser.add_argument(
+        "--chunk-tokens",
+        type=int,
+        default=CountTokensHeuristics.tokens_in_chars(20_000),
+        help="Maximum number of tokens per summarization request",
+    )
+    parser.add_argument(
+        "--max-concurrent-summarizations",
+        type=int,
+        nargs="+",
+        default=[4, 8],
+        help="Maximum numbers of concurrent requests benchmarked for the map_reduce mode",
+    )
+    parser.add_argument(
+        "--summary-tokens", type=int, default=300, help="Number of tokens of each summary"
+    )
+    parser.add_argument(
+        "--request-latency", type=float, default=0.5, help="Latency of each request, in seconds"
+    )
+    parser.add_argument(
+        "--latency-per-1k-input-tokens",
+        type=float,
+        default=0.05,
+        help="Additional latency per thousand input tokens of each request, in seconds",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'content tokens':>15}{'mode':>18}{'requests':>10}{'input tokens':>14}"
+        f"{'output tokens':>15}{'latency (s)':>13}"
+    )
+    for content_tokens in args.content_tokens:
+        configurations = [(SummarizationMode.REFINE, 1)] + [
+            (SummarizationMode.MAP_REDUCE, concurrency)
+            for concurrency in args.max_concurrent_summarizations
+        ]
+        for summarization_mode, concurrency in configurations:
+            duration, num_requests, input_tokens, output_tokens = benchmark(
+                args, content_tokens, summarization_mode, concurrency
+            )
+            label = summarization_mode.value
+            if summarization_mode == SummarizationMode.MAP_REDUCE:
+                label += f" (x{concurrency})"
+            print(
+                f"{content_tokens:>15}{label:>18}{num_requests:>10}{input_tokens:>14}"
+                f"{output_tokens:>15}{duration:>13.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,10 @@
 # This software is under the Apache License 2.0
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+import asyncio
+import threading
 from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 
 import anyio
 import pytest
@@ -11,9 +14,13 @@ from anyio import to_thread
 
 from wayflowcore._utils.async_helpers import (
     AsyncContext,
+    BackgroundEventLoop,
+    SyncExecutionMode,
     async_to_sync_iterator,
     get_execution_context,
+    get_sync_execution_mode,
     run_async_in_sync,
+    set_sync_execution_mode,
     sync_to_async_iterator,
     transform_async_into_sync,
     transform_sync_into_async,
@@ -193,3 +200,92 @@ def test_can_transform_nested():
 
     _wrap = transform_async_into_sync(_wrap_async)
     assert _wrap() == "hallo"
+
+
+@pytest.fixture
+def persistent_event_loop_mode():
+    set_sync_execution_mode(SyncExecutionMode.PERSISTENT_EVENT_LOOP)
+    try:
+        yield
+    finally:
+        set_sync_execution_mode(SyncExecutionMode.NEW_EVENT_LOOP)
+        BackgroundEventLoop().shutdown()
+
+
+async def _get_running_loop():
+    return asyncio.get_running_loop()
+
+
+def test_sync_calls_use_a_new_event_loop_by_default():
+    assert get_sync_execution_mode() == SyncExecutionMode.NEW_EVENT_LOOP
+    assert run_async_in_sync(_get_running_loop) is not run_async_in_sync(_get_running_loop)
+    assert not BackgroundEventLoop().is_live
+
+
+def test_sync_calls_share_the_background_event_loop_in_persistent_mode(
+    persistent_event_loop_mode,
+):
+    first_loop = run_async_in_sync(_get_running_loop)
+    assert run_async_in_sync(_get_running_loop) is first_loop
+    assert not first_loop.is_closed()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        loops = list(executor.map(lambda _: run_async_in_sync(_get_running_loop), range(4)))
+    assert all(loop is first_loop for loop in loops)
+
+    BackgroundEventLoop().shutdown()
+    assert first_loop.is_closed()
+    # the loop is started again on next use
+    assert run_async_in_sync(_get_running_loop) is not first_loop
+
+
+def test_persistent_mode_propagates_context_variables_and_exceptions(
+    persistent_event_loop_mode,
+):
+    var: ContextVar[str] = ContextVar("var", default="default")
+
+    async def _get_var():
+        return var.get()
+
+    async def _raise():
+        raise ValueError("some error")
+
+    var.set("caller value")
+    assert run_async_in_sync(_get_var) == "caller value"
+    with pytest.raises(ValueError, match="some error"):
+        run_async_in_sync(_raise)
+
+
+def test_persistent_mode_can_be_used_from_main_event_loop(persistent_event_loop_mode):
+    async def execute():
+        return run_async_in_sync(async_work)
+
+    with pytest.warns(
+        UserWarning, match="You are calling an asynchronous method in a synchronous method"
+    ):
+        assert anyio.run(execute) is True
+
+
+def test_persistent_mode_does_not_deadlock_from_background_event_loop(
+    persistent_event_loop_mode,
+):
+    async def _nested_sync_call():
+        return run_async_in_sync(async_work), threading.get_ident()
+
+    with pytest.warns(
+        UserWarning, match="You are calling an asynchronous method in a synchronous method"
+    ):
+        result, thread_id = run_async_in_sync(_nested_sync_call)
+    assert result is True
+    assert thread_id != threading.get_ident()
+
+
+def test_can_iterate_with_sync_iterator_in_persistent_mode(persistent_event_loop_mode):
+    _run_async_iterator_in_sync_context()
+    _run_async_iterator_in_sync_context()
+    assert BackgroundEventLoop().is_live
+
+
+def test_set_sync_execution_mode_rejects_invalid_modes():
+    with pytest.raises(ValueError, match="Expected a SyncExecutionMode"):
+        set_sync_execution_mode("persistent_event_loop")
@@ -362,7 +362,6 @@ def test_no_previous_response_id_does_not_reuse_conversation(server_url) -> None
     "arg_name,arg_value",
     [
         ("max_tool_calls", 1),
-        ("parallel_tool_calls", True),
         ("prompt", {"id": "1"}),
         ("reasoning", {"effort": "minimal"}),
         ("safety_identifier", "something"),
@@ -396,7 +395,6 @@ def test_unsupported_arguments_raise(server_url, arg_name, arg_value):
     ["argument", "value"],
     [
         ("max_tool_calls", 5),
-        ("parallel_tool_calls", True),
         ("prompt", {"id": "random_id"}),
         ("reasoning", {"effort": "high"}),
         ("safety_identifier", "none"),
@@ -0,0 +1,465 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import json
+import threading
+import time
+import warnings
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List, Optional
+
+import anyio
+import pytest
+
+from wayflowcore.agentserver import ServerStorageConfig
+from wayflowcore.agentserver._statedeltas import _apply_state_delta, _compute_state_delta
+from wayflowcore.agentserver.openairesponses.models.openairesponsespydanticmodels import (
+    CreateResponse,
+    ResponseCompletedEvent,
+)
+from wayflowcore.agentserver.openairesponses.services.wayflowservice import (
+    WayFlowOpenAIResponsesService,
+)
+from wayflowcore.controlconnection import ControlFlowEdge
+from wayflowcore.datastore import InMemoryDatastore
+from wayflowcore.flow import Flow
+from wayflowcore.serialization import SerializationFormat
+from wayflowcore.steps import InputMessageStep, OutputMessageStep
+
+
+class _BlockingInMemoryDatastore(InMemoryDatastore):
+    """Datastore whose entity creations wait until they are released"""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.release_writes = threading.Event()
+
+    def create(self, *args: Any, **kwargs: Any) -> Any:
+        if not self.release_writes.wait(timeout=10):
+            raise TimeoutError("The write was never released")
+        return super().create(*args, **kwargs)
+
+
+def _create_service(
+    storage_config: ServerStorageConfig, datastore_cls: type = InMemoryDatastore
+) -> WayFlowOpenAIResponsesService:
+    output_step = OutputMessageStep(message_template="hello", name="output")
+    input_step = InputMessageStep(message_template=None, name="input")
+    chat_flow = Flow(
+        begin_step=output_step,
+        control_flow_edges=[
+            ControlFlowEdge(source_step=output_step, destination_step=input_step),
+            ControlFlowEdge(source_step=input_step, destination_step=output_step),
+        ],
+    )
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="InMemoryDatastore is for DEVELOPMENT")
+        storage = datastore_cls(
+            schema=storage_config.to_schema(),
+            indexed_columns=storage_config.to_indexed_columns(),
+        )
+    return WayFlowOpenAIResponsesService(
+        agents={"agent": chat_flow}, storage=storage, storage_config=storage_config
+    )
+
+
+@pytest.fixture
+def blocking_service() -> Iterator[WayFlowOpenAIResponsesService]:
+    service = _create_service(ServerStorageConfig(), _BlockingInMemoryDatastore)
+    yield service
+    service.storage.release_writes.set()
+    service.shutdown()
+
+
+@pytest.fixture
+def delta_service() -> Iterator[WayFlowOpenAIResponsesService]:
+    service = _create_service(ServerStorageConfig(state_storage_mode="delta", snapshot_interval=3))
+    yield service
+    service.shutdown()
+
+
+async def _collect_events(service: WayFlowOpenAIResponsesService, **kwargs: Any) -> List[Any]:
+    return [event async for event in service.create_response(CreateResponse(**kwargs))]
+
+
+@pytest.mark.anyio
+async def test_response_is_streamed_without_waiting_for_its_state_to_be_written(
+    blocking_service,
+):
+    events = await _collect_events(blocking_service, model="agent", input="hi")
+
+    assert isinstance(events[-1], ResponseCompletedEvent)
+    response_id = events[-1].response.id
+    assert response_id in blocking_service._pending_writes
+
+    blocking_service.storage.release_writes.set()
+    response = await blocking_service.get_response(response_id)
+    assert response.id == response_id
+    assert response_id not in blocking_service._pending_writes
+
+
+@pytest.mark.anyio
+async def test_following_response_waits_for_the_previous_state_to_be_written(
+    blocking_service,
+):
+    events = await _collect_events(blocking_service, model="agent", input="hi")
+    response_id = events[-1].response.id
+
+    async def _release_writes_later() -> None:
+        await anyio.sleep(0.2)
+        blocking_service.storage.release_writes.set()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_release_writes_later)
+        events = await _collect_events(
+            blocking_service, model="agent", input="hi again", previous_response_id=response_id
+        )
+
+    assert isinstance(events[-1], ResponseCompletedEvent)
+    assert events[-1].response.conversation.id == events[0].response.conversation.id
+
+
+def _submit_fake_write(
+    service: WayFlowOpenAIResponsesService, response_id: str, conversation_id: str
+) -> None:
+    response = SimpleNamespace(id=response_id, conversation=SimpleNamespace(id=conversation_id))
+    anyio.run(service._submit_write, response, None, None)
+
+
+def test_writes_of_a_conversation_are_applied_in_order():
+    service = _create_service(ServerStorageConfig(max_storage_workers=4))
+    release_first_write = threading.Event()
+    saved_response_ids = []
+
+    def _save_state(response: Any, state: Any, base_turn_state: Any) -> None:
+        if response.id == "first":
+            release_first_write.wait(timeout=10)
+        saved_response_ids.append(response.id)
+
+    service._save_state = _save_state
+    try:
+        _submit_fake_write(service, "first", "conversation")
+        _submit_fake_write(service, "second", "conversation")
+        _submit_fake_write(service, "other", "other_conversation")
+        deadline = time.monotonic() + 10
+        while "other" not in saved_response_ids and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        release_first_write.set()
+        service.shutdown()
+    # the writes of other conversations are not blocked
+    assert saved_response_ids == ["other", "first", "second"]
+    assert service._pending_writes == {}
+
+
+def test_concurrent_writes_do_not_exceed_the_maximum_number_of_pending_writes():
+    service = _create_service(ServerStorageConfig(max_storage_workers=8, max_pending_writes=2))
+    release_writes = threading.Event()
+    started_writes = []
+
+    def _save_state(response: Any, state: Any, base_turn_state: Any) -> None:
+        started_writes.append(response.id)
+        release_writes.wait(timeout=10)
+
+    service._save_state = _save_state
+    threads = [
+        threading.Thread(target=_submit_fake_write, args=(service, f"response_{i}", f"conv_{i}"))
+        for i in range(8)
+    ]
+    try:
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        assert len(started_writes) == 2
+        assert len(service._all_pending_writes) == 2
+    finally:
+        release_writes.set()
+        for thread in threads:
+            thread.join(timeout=10)
+        service.shutdown()
+    assert len(started_writes) == 8
+
+
+def test_storage_config_rejects_invalid_worker_counts():
+    with pytest.raises(ValueError, match="max_storage_workers"):
+        ServerStorageConfig(max_storage_workers=0)
+    with pytest.raises(ValueError, match="max_pending_writes"):
+        ServerStorageConfig(max_pending_writes=0)
+
+
+@pytest.mark.anyio
+async def test_shutdown_waits_for_pending_writes(blocking_service):
+    events = await _collect_events(blocking_service, model="agent", input="hi")
+    response_id = events[-1].response.id
+
+    blocking_service.storage.release_writes.set()
+    blocking_service.shutdown()
+
+    assert blocking_service._pending_writes == {}
+    assert (await blocking_service.get_response(response_id)).id == response_id
+
+
+def test_state_delta_only_contains_changes():
+    previous = {
+        "unchanged": {"name": "flow", "steps": ["a", "b"]},
+        "messages": ["hello", "hi"],
+        "edited": ["hello", "draft"],
+        "status": {"id": "1", "done": False},
+        "removed": 1,
+    }
+    current = {
+        "unchanged": {"name": "flow", "steps": ["a", "b"]},
+        "messages": ["hello", "hi", "hello again"],
+        "edited": ["hello", "final"],
+        "status": {"id": "1", "done": True},
+        "added": [1],
+    }
+
+    delta = _compute_state_delta(previous, current)
+
+    assert delta == {
+        "set": {"added": [1]},
+        "unset": ["removed"],
+        "dicts": {"status": {"set": {"done": True}}},
+        "lists": {
+            "messages": {"keep": 2, "extend": ["hello again"]},
+            "edited": {"keep": 1, "extend": ["final"]},
+        },
+    }
+    assert _apply_state_delta(previous, delta) == current
+    assert _compute_state_delta(current, current) == {}
+
+
+def _get_stored_turns(service: WayFlowOpenAIResponsesService) -> List[Dict[str, Any]]:
+    config = service.storage_config
+    turns = service.storage.list(collection_name=config.table_name)
+    return sorted(turns, key=lambda turn: turn[config.created_at_column_name])
+
+
+async def _create_turns_from(
+    service: WayFlowOpenAIResponsesService, previous_response_id: Optional[str], num_turns: int
+) -> List[str]:
+    response_ids: List[str] = []
+    for _ in range(num_turns):
+        events = await _collect_events(
+            service, model="agent", input="hi", previous_response_id=previous_response_id
+        )
+        previous_response_id = events[-1].response.id
+        response_ids.append(previous_response_id)
+    service.shutdown()  # waits for the writes
+    return response_ids
+
+
+async def _create_turns(service: WayFlowOpenAIResponsesService, num_turns: int) -> List[str]:
+    return await _create_turns_from(service, previous_response_id=None, num_turns=num_turns)
+
+
+def _is_delta_turn(service: WayFlowOpenAIResponsesService, turn: Dict[str, Any]) -> bool:
+    metadata = json.loads(turn[service.storage_config.extra_metadata_column_name])
+    return "state_delta" in metadata
+
+
+@pytest.mark.anyio
+async def test_delta_storage_mode_stores_deltas_between_snapshots(delta_service):
+    response_ids = await _create_turns(delta_service, num_turns=5)
+
+    config = delta_service.storage_config
+    turns = {turn[config.turn_id_column_name]: turn for turn in _get_stored_turns(delta_service)}
+    assert [_is_delta_turn(delta_service, turns[response_id]) for response_id in response_ids] == [
+        False,
+        True,
+        True,
+        False,
+        True,
+    ]
+    for response_id in response_ids:
+        serialized_state = turns[response_id][config.conversation_turn_state_column_name]
+        # the definition of the flow is only stored in the snapshots
+        assert ("OutputMessageStep" in serialized_state) is not _is_delta_turn(
+            delta_service, turns[response_id]
+        )
+
+    conversation, stored_turn_state = delta_service._load_state(
+        previous_response_id=response_ids[-1], conversation_id=None, agent_id="agent"
+    )
+    assert stored_turn_state.turns_since_snapshot == 1
+    assert [message.content for message in conversation.get_messages()] == ["hi", "hello"] * 5
+
+
+@pytest.mark.anyio
+async def test_delta_storage_mode_states_match_full_storage_mode(delta_service):
+    full_service = _create_service(ServerStorageConfig())
+    delta_response_ids = await _create_turns(delta_service, num_turns=4)
+    full_response_ids = await _create_turns(full_service, num_turns=4)
+
+    for delta_response_id, full_response_id in zip(delta_response_ids, full_response_ids):
+        delta_conversation, _ = delta_service._load_state(
+            previous_response_id=delta_response_id, conversation_id=None, agent_id="agent"
+        )
+        full_conversation, _ = full_service._load_state(
+            previous_response_id=full_response_id, conversation_id=None, agent_id="agent"
+        )
+        assert [m.content for m in delta_conversation.get_messages()] == [
+            m.content for m in full_conversation.get_messages()
+        ]
+        assert delta_conversation.state.step_history == full_conversation.state.step_history
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("base_turn_id_column_name", ["base_turn_id", None])
+async def test_deleting_a_turn_keeps_the_following_delta_turns_loadable(base_turn_id_column_name):
+    delta_service = _create_service(
+        ServerStorageConfig(
+            state_storage_mode="delta",
+            snapshot_interval=3,
+            base_turn_id_column_name=base_turn_id_column_name,
+        )
+    )
+    response_ids = await _create_turns(delta_service, num_turns=3)
+
+    await delta_service.delete_response(response_ids[1])
+
+    config = delta_service.storage_config
+    turns = {turn[config.turn_id_column_name]: turn for turn in _get_stored_turns(delta_service)}
+    assert response_ids[1] not in turns
+    assert not _is_delta_turn(delta_service, turns[response_ids[2]])
+    conversation, _ = delta_service._load_state(
+        previous_response_id=response_ids[2], conversation_id=None, agent_id="agent"
+    )
+    assert len(conversation.get_messages()) == 6
+
+
+@pytest.mark.anyio
+async def test_deleting_a_turn_only_reads_the_turns_depending_on_it(delta_service):
+    response_ids = await _create_turns(delta_service, num_turns=6)
+
+    config = delta_service.storage_config
+    read_turn_ids = []
+    list_turns = delta_service.storage.list
+
+    def _list_and_record_read_turns(*args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        turns = list_turns(*args, **kwargs)
+        read_turn_ids.extend(turn[config.turn_id_column_name] for turn in turns)
+        return turns
+
+    delta_service.storage.list = _list_and_record_read_turns
+    await delta_service.delete_response(response_ids[3])
+    # the deleted snapshot, its dependent delta turn, and the snapshot to reconstruct it from
+    assert read_turn_ids == [response_ids[3], response_ids[4], response_ids[3]]
+    delta_service.storage.list = list_turns
+
+    turns = {turn[config.turn_id_column_name]: turn for turn in _get_stored_turns(delta_service)}
+    assert turns[response_ids[4]][config.base_turn_id_column_name] == ""
+    assert turns[response_ids[5]][config.base_turn_id_column_name] == response_ids[4]
+    conversation, _ = delta_service._load_state(
+        previous_response_id=response_ids[5], conversation_id=None, agent_id="agent"
+    )
+    assert len(conversation.get_messages()) == 12
+
+
+@pytest.mark.anyio
+async def test_loading_a_delta_turn_only_reads_the_turns_up_to_the_latest_snapshot(delta_service):
+    response_ids = await _create_turns(delta_service, num_turns=5)
+
+    config = delta_service.storage_config
+    read_turn_ids = []
+    list_turns = delta_service.storage.list
+
+    def _list_and_record_read_turns(*args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        turns = list_turns(*args, **kwargs)
+        read_turn_ids.extend(turn[config.turn_id_column_name] for turn in turns)
+        return turns
+
+    delta_service.storage.list = _list_and_record_read_turns
+    delta_service._load_state(
+        previous_response_id=response_ids[-1], conversation_id=None, agent_id="agent"
+    )
+    # the last turn is a delta on the snapshot of the previous turn
+    assert read_turn_ids == [response_ids[-1], response_ids[-2]]
+
+
+@pytest.mark.anyio
+async def test_deleting_a_turn_waits_for_the_turns_being_written_on_top_of_it():
+    service = _create_service(
+        ServerStorageConfig(state_storage_mode="delta", snapshot_interval=3),
+        _BlockingInMemoryDatastore,
+    )
+    service.storage.release_writes.set()
+    (first_response_id,) = await _create_turns(service, num_turns=1)
+
+    service.storage.release_writes.clear()
+    events = await _collect_events(
+        service, model="agent", input="hi", previous_response_id=first_response_id
+    )
+    second_response_id = events[-1].response.id
+
+    async def _release_writes_later() -> None:
+        await anyio.sleep(0.2)
+        service.storage.release_writes.set()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_release_writes_later)
+        await service.delete_response(first_response_id)
+    service.shutdown()
+
+    config = service.storage_config
+    turns = {turn[config.turn_id_column_name]: turn for turn in _get_stored_turns(service)}
+    assert list(turns) == [second_response_id]
+    assert not _is_delta_turn(service, turns[second_response_id])
+    conversation, _ = service._load_state(
+        previous_response_id=second_response_id, conversation_id=None, agent_id="agent"
+    )
+    assert len(conversation.get_messages()) == 4
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "storage_config",
+    [
+        ServerStorageConfig(serialization_format="json"),
+        ServerStorageConfig(serialization_format="msgpack", compress_states=True),
+        ServerStorageConfig(
+            serialization_format="msgpack", state_storage_mode="delta", snapshot_interval=3
+        ),
+    ],
+)
+async def test_states_are_stored_in_the_configured_serialization_format(storage_config):
+    if storage_config.serialization_format == SerializationFormat.MSGPACK:
+        pytest.importorskip("msgpack")
+    if storage_config.compress_states:
+        pytest.importorskip("zstandard")
+    service = _create_service(storage_config)
+    response_ids = await _create_turns(service, num_turns=4)
+
+    for turn in _get_stored_turns(service):
+        serialized_state = turn[storage_config.conversation_turn_state_column_name]
+        if storage_config.serialization_format == SerializationFormat.JSON:
+            json.loads(serialized_state)
+        else:
+            assert serialized_state.startswith("base64:")
+    conversation, _ = service._load_state(
+        previous_response_id=response_ids[-1], conversation_id=None, agent_id="agent"
+    )
+    assert [message.content for message in conversation.get_messages()] == ["hi", "hello"] * 4
+
+
+@pytest.mark.anyio
+async def test_states_stored_in_another_serialization_format_can_still_be_loaded():
+    service = _create_service(ServerStorageConfig())
+    response_ids = await _create_turns(service, num_turns=2)
+
+    service.storage_config.serialization_format = SerializationFormat.JSON
+    response_ids += await _create_turns_from(service, response_ids[-1], num_turns=1)
+
+    conversation, _ = service._load_state(
+        previous_response_id=response_ids[-1], conversation_id=None, agent_id="agent"
+    )
+    assert len(conversation.get_messages()) == 6
+
+
+def test_storage_config_rejects_unknown_serialization_formats():
+    with pytest.raises(ValueError, match="serialization_format"):
+        ServerStorageConfig(serialization_format="xml")
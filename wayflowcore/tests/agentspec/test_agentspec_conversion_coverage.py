@@ -152,6 +152,7 @@ EXCLUDED_COMPONENTS = {
     "ToolBox",
     # Runtime components that can't be serialized to agentspec
     "CallableMessageTransform",  # takes a callable function which is not serializable
+    "CachedEmbeddingModel",  # runtime wrapper, only the wrapped embedding model is exported
     "RelationalDatastore",
     "Datastore",
 }
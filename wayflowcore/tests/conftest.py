@@ -170,6 +170,32 @@ def dummy_oci_client_config_with_user_authentication():
     )
 
 
+@pytest.fixture
+def oci_client_config_with_generated_key():
+    """User authentication config with a freshly generated key, able to sign requests offline"""
+    pytest.importorskip("oci")
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    user_config = OCIUserAuthenticationConfig(
+        DUMMY_OCI_USER_CONFIG_DICT["user"],
+        private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption(),
+        ).decode(),
+        DUMMY_OCI_USER_CONFIG_DICT["fingerprint"],
+        DUMMY_OCI_USER_CONFIG_DICT["tenancy"],
+        DUMMY_OCI_USER_CONFIG_DICT["region"],
+    )
+    return OCIClientConfigWithUserAuthentication(
+        service_endpoint="https://inference.generativeai.us-chicago-1.oci.oraclecloud.com",
+        compartment_id="ocid1.compartment.oc1..aaaaaaaa",
+        user_config=user_config,
+    )
+
+
 @pytest.fixture
 def oci_user_authentication_config():
     oci_config_file_path = "~/.oci/config"
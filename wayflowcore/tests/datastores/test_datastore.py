@@ -8,6 +8,7 @@ import copy
 import threading
 import warnings
 
+import anyio
 import pytest
 import yaml
 
@@ -367,6 +368,138 @@ def test_any_type_in_bind_var(testing_db_data_store: RelationalDatastore):
         testing_db_data_store.query(query, bind={"bindvar": b"4352345q3wtsdfcvd"})
 
 
+@pytest.mark.anyio
+async def test_basic_async_operations(testing_data_store: Datastore):
+    assert await testing_data_store.list_async("employees") == []
+
+    new_joiner = await testing_data_store.create_async("employees", EMPLOYEE_0)
+    assert new_joiner == EMPLOYEE_0
+
+    promoted_employees = await testing_data_store.update_async(
+        "employees", where={"ID": EMPLOYEE_0["ID"]}, update={"salary": 150000.0}
+    )
+    assert promoted_employees == [{**EMPLOYEE_0, "salary": 150000.0}]
+    assert await testing_data_store.list_async("employees", limit=1) == promoted_employees
+
+    await testing_data_store.delete_async("employees", where={"ID": EMPLOYEE_0["ID"]})
+    assert await testing_data_store.list_async("employees") == []
+
+
+class _SqliteDatastore(RelationalDatastore):
+    def _serialize_to_dict(self, serialization_context):
+        raise NotImplementedError()
+
+    @classmethod
+    def _deserialize_from_dict(cls, input_dict, deserialization_context):
+        raise NotImplementedError()
+
+
+@pytest.fixture
+def sqlite_data_store_without_async_driver(tmp_path):
+    import sqlalchemy
+
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'datastore.db'}")
+    with engine.begin() as connection:
+        connection.execute(
+            sqlalchemy.text(
+                "CREATE TABLE employees (id INTEGER PRIMARY KEY, name VARCHAR(400) NOT NULL)"
+            )
+        )
+    num_factory_calls = []
+
+    def async_engine_factory():
+        num_factory_calls.append(1)
+        raise ImportError("No module named 'aiosqlite'")
+
+    schema = {"employees": Entity(properties={"ID": IntegerProperty(), "name": StringProperty()})}
+    datastore = _SqliteDatastore(schema, engine, async_engine_factory=async_engine_factory)
+    yield datastore, num_factory_calls
+    engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_relational_async_operations_fall_back_to_threads_without_async_driver(
+    sqlite_data_store_without_async_driver,
+):
+    datastore, num_factory_calls = sqlite_data_store_without_async_driver
+
+    created = await datastore.create_async("employees", [{"ID": 1, "name": "Dwayne Chute"}])
+    assert created == [{"ID": 1, "name": "Dwayne Chute"}]
+    with pytest.raises(DatastoreConstraintViolationError):
+        await datastore.create_async("employees", {"ID": 1, "name": "Joe Happens"})
+    assert await datastore.update_async("employees", {"ID": 1}, {"name": "Pam Beefly"}) == [
+        {"ID": 1, "name": "Pam Beefly"}
+    ]
+    assert await datastore.query_async(
+        "SELECT name FROM employees WHERE ID = :id", bind={"id": 1}
+    ) == [{"name": "Pam Beefly"}]
+    with pytest.raises(DatastoreError):
+        await datastore.query_async("SELECT * FROM employees WHERE")
+    await datastore.delete_async("employees", {"ID": 1})
+    assert await datastore.list_async("employees") == []
+    # the unavailable async engine is not created again for every operation
+    assert len(num_factory_calls) == 1
+
+
+def test_relational_replace_deletes_the_matching_rows_and_creates_the_entity(
+    sqlite_data_store_without_async_driver,
+):
+    datastore, _ = sqlite_data_store_without_async_driver
+    datastore.create("employees", [{"ID": 1, "name": "Dwayne Chute"}, {"ID": 2, "name": "Joe"}])
+
+    datastore.data_tables["employees"]._replace({"name": "Dwayne Chute"}, {"ID": 3, "name": "Pam"})
+
+    assert sorted(datastore.list("employees"), key=lambda e: e["ID"]) == [
+        {"ID": 2, "name": "Joe"},
+        {"ID": 3, "name": "Pam"},
+    ]
+
+
+def test_async_engines_are_created_per_event_loop_and_disposed_on_loop_shutdown():
+    from wayflowcore.datastore._relational import _AsyncEngines
+
+    class _FakeAsyncEngine:
+        def __init__(self):
+            self.is_disposed = False
+
+        async def dispose(self):
+            self.is_disposed = True
+
+    created_engines = []
+
+    def async_engine_factory():
+        created_engines.append(_FakeAsyncEngine())
+        return created_engines[-1]
+
+    async_engines = _AsyncEngines(async_engine_factory)
+
+    async def get_engine_twice():
+        first_engine = await async_engines.get_engine()
+        assert await async_engines.get_engine() is first_engine
+        return first_engine
+
+    first_loop_engine = anyio.run(get_engine_twice)
+    assert first_loop_engine.is_disposed
+    second_loop_engine = anyio.run(get_engine_twice)
+    assert second_loop_engine is not first_loop_engine
+    assert created_engines == [first_loop_engine, second_loop_engine]
+
+
+def test_async_engines_are_not_used_without_greenlet(monkeypatch):
+    import sys
+
+    from wayflowcore.datastore._relational import _AsyncEngines, _create_async_engine
+
+    # importing a module set to None in sys.modules raises an ImportError
+    monkeypatch.setitem(sys.modules, "greenlet", None)
+    with pytest.raises(ImportError):
+        _create_async_engine("sqlite+aiosqlite://")
+
+    async_engines = _AsyncEngines(lambda: _create_async_engine("sqlite+aiosqlite://"))
+    assert anyio.run(async_engines.get_engine) is None
+    assert not async_engines._is_available
+
+
 def test_oracle_connection_error():
     connection_config = TlsOracleDatabaseConnectionConfig("myuser", "42", "mydatabase")
     with pytest.raises(DatastoreError):
@@ -566,3 +699,79 @@ def test_inmemory_datastore_warns_on_init():
         _ = InMemoryDatastore(
             schema={"Hello World": Entity(properties={"ID": IntegerProperty(default_value=0)})}
         )
+
+
+def get_indexed_inmemory_datastore():
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message=f"{_INMEMORY_USER_WARNING}*")
+        return InMemoryDatastore(
+            get_basic_office_entities(),
+            indexed_columns={"employees": ["ID", "department_name"]},
+        )
+
+
+def test_inmemory_datastore_indexed_columns_lookups():
+    datastore = get_indexed_inmemory_datastore()
+    employees = [
+        EMPLOYEE_0 | {"ID": i, "department_name": "sales" if i % 2 else "hr"} for i in range(100)
+    ]
+    datastore.create("employees", employees)
+
+    assert datastore.list("employees", where={"ID": 7}) == [employees[7]]
+    assert datastore.list("employees", where={"department_name": "hr"}, limit=3) == [
+        employees[0],
+        employees[2],
+        employees[4],
+    ]
+    assert datastore.list("employees", where={"ID": 7, "department_name": "hr"}) == []
+    assert datastore.list("employees", where={"ID": 7, "salary": 120000.0}) == [employees[7]]
+    assert datastore.list("employees", where={"ID": 1000}) == []
+
+    datastore.update("employees", where={"ID": 7}, update={"department_name": "hr", "ID": 1000})
+    assert datastore.list("employees", where={"ID": 7}) == []
+    assert datastore.list("employees", where={"ID": 1000, "department_name": "hr"}) == [
+        employees[7] | {"department_name": "hr", "ID": 1000}
+    ]
+
+    # Deleting most entities compacts the table, the indexes must follow the rows
+    datastore.delete("employees", where={"department_name": "hr"})
+    assert len(datastore.list("employees")) == 49
+    assert datastore.list("employees", where={"department_name": "hr"}) == []
+    assert datastore.list("employees", where={"ID": 99}) == [employees[99]]
+    datastore.create("employees", EMPLOYEE_0 | {"ID": 0})
+    assert datastore.list("employees", where={"ID": 0}) == [EMPLOYEE_0 | {"ID": 0}]
+    assert datastore.list("employees")[-1] == EMPLOYEE_0 | {"ID": 0}
+
+
+def test_inmemory_datastore_indexed_columns_match_unindexed_datastore():
+    indexed_datastore = get_indexed_inmemory_datastore()
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message=f"{_INMEMORY_USER_WARNING}*")
+        datastore = InMemoryDatastore(get_basic_office_entities())
+    for i in range(30):
+        employee = EMPLOYEE_0 | {"ID": i % 7, "department_name": f"department_{i % 3}"}
+        for store in (indexed_datastore, datastore):
+            store.create("employees", employee)
+            if i % 4 == 3:
+                store.delete("employees", where={"ID": i % 7, "department_name": "department_0"})
+            if i % 5 == 4:
+                store.update("employees", where={"ID": i % 7}, update={"salary": float(i)})
+    for where in [{"ID": 3}, {"department_name": "department_1"}, {"ID": 2, "salary": 29.0}]:
+        assert indexed_datastore.list("employees", where=where) == datastore.list(
+            "employees", where=where
+        )
+    assert indexed_datastore.list("employees") == datastore.list("employees")
+
+
+def test_inmemory_datastore_indexed_columns_are_validated_and_serialized():
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message=f"{_INMEMORY_USER_WARNING}*")
+        with pytest.raises(ValueError, match="not part of the datastore schema"):
+            InMemoryDatastore(get_basic_office_entities(), indexed_columns={"products": ["ID"]})
+        with pytest.raises(ValueError, match="not a property"):
+            InMemoryDatastore(get_basic_office_entities(), indexed_columns={"employees": ["age"]})
+
+    datastore = get_indexed_inmemory_datastore()
+    with pytest.warns(UserWarning, match=_INMEMORY_USER_WARNING):
+        reloaded_datastore = autodeserialize(serialize(datastore))
+    assert reloaded_datastore.indexed_columns == {"employees": ["ID", "department_name"]}
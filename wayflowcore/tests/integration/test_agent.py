@@ -5,6 +5,7 @@
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 import asyncio
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 from textwrap import dedent
@@ -24,6 +25,7 @@ from wayflowcore.executors._agentexecutor import (
     _SUBMIT_TOOL_NAME,
     _TALK_TO_USER_INPUT_PARAM,
     _TALK_TO_USER_TOOL_NAME,
+    _sequential_tool_calls,
 )
 from wayflowcore.executors.executionstatus import (
     FinishedStatus,
@@ -2459,6 +2461,132 @@ def test_agent_handles_parallel_tool_calls_with_canonicalized_native_template():
     _check_each_tool_request_is_followed_by_single_matching_tool_result(conversation.get_messages())
 
 
+@tool
+async def slow_echo_tool(
+    text: Annotated[str, "text to return"], delay: Annotated[float, "seconds to wait"]
+) -> str:
+    """some tool"""
+    await asyncio.sleep(delay)
+    return text
+
+
+def _run_agent_with_tool_requests(agent, tool_requests):
+    conversation = agent.start_conversation(messages="do something")
+    with patch_llm(agent.llm, outputs=[tool_requests, "done"], patch_internal=True):
+        start = time.perf_counter()
+        conversation.execute()
+        duration = time.perf_counter() - start
+    _check_each_tool_request_is_followed_by_single_matching_tool_result(conversation.get_messages())
+    tool_results = [m.tool_result for m in conversation.get_messages() if m.tool_result]
+    return conversation, tool_results, duration
+
+
+@pytest.mark.parametrize("max_concurrent_tool_calls, min_duration", [(1, 0.9), (4, 0.0)])
+def test_agent_executes_server_tool_calls_concurrently(max_concurrent_tool_calls, min_duration):
+    agent = Agent(
+        tools=[slow_echo_tool],
+        llm=DummyModel(),
+        max_concurrent_tool_calls=max_concurrent_tool_calls,
+    )
+    # the first requests take the longest, but their results must come first
+    tool_requests = [
+        ToolRequest(
+            name="slow_echo_tool",
+            args={"text": f"result {i}", "delay": 0.4 - 0.1 * i},
+            tool_request_id=f"id{i}",
+        )
+        for i in range(4)
+    ]
+
+    conversation, tool_results, duration = _run_agent_with_tool_requests(agent, tool_requests)
+
+    assert [r.tool_request_id for r in tool_results] == ["id0", "id1", "id2", "id3"]
+    assert [r.content for r in tool_results] == [f"result {i}" for i in range(4)]
+    assert conversation.get_last_message().content == "done"
+    assert duration >= min_duration
+    if max_concurrent_tool_calls > 1:
+        assert duration < 0.8
+
+
+def test_agent_executes_client_tools_sequentially_between_concurrent_tool_calls():
+    client_tool = ClientTool(name="client_tool", description="some tool", parameters={})
+    agent = Agent(
+        tools=[slow_echo_tool, client_tool], llm=DummyModel(), max_concurrent_tool_calls=4
+    )
+    conversation = agent.start_conversation(messages="do something")
+
+    with patch_llm(
+        agent.llm,
+        outputs=[
+            [
+                ToolRequest("slow_echo_tool", {"text": "a", "delay": 0.1}, "id1"),
+                ToolRequest("slow_echo_tool", {"text": "b", "delay": 0.0}, "id2"),
+                ToolRequest("client_tool", {}, "id3"),
+                ToolRequest("slow_echo_tool", {"text": "c", "delay": 0.0}, "id4"),
+            ]
+        ],
+        patch_internal=True,
+    ):
+        status = conversation.execute()
+
+    assert isinstance(status, ToolRequestStatus)
+    assert [tr.tool_request_id for tr in status.tool_requests] == ["id3"]
+    tool_results = [m.tool_result for m in conversation.get_messages() if m.tool_result]
+    assert [r.content for r in tool_results] == ["a", "b"]
+
+    conversation.append_tool_result(ToolResult(content="client result", tool_request_id="id3"))
+    with patch_llm(agent.llm, outputs=["done"], patch_internal=True):
+        conversation.execute()
+
+    tool_results = [m.tool_result for m in conversation.get_messages() if m.tool_result]
+    assert [r.content for r in tool_results] == ["a", "b", "client result", "c"]
+
+
+def test_exception_during_concurrent_tool_calls():
+    agent = Agent(
+        tools=[slow_echo_tool, failing_tool],
+        llm=DummyModel(),
+        max_concurrent_tool_calls=4,
+        raise_exceptions=True,
+    )
+    conversation = agent.start_conversation(messages="do something")
+
+    with pytest.raises(RuntimeError, match="Simulated tool failure"):
+        with patch_llm(
+            agent.llm,
+            outputs=[
+                [
+                    ToolRequest("slow_echo_tool", {"text": "a", "delay": 0.0}, "id1"),
+                    ToolRequest("failing_tool", {}, "id2"),
+                    ToolRequest("slow_echo_tool", {"text": "c", "delay": 0.0}, "id3"),
+                ]
+            ],
+            patch_internal=True,
+        ):
+            conversation.execute()
+
+    _check_each_tool_request_is_followed_by_single_matching_tool_result(conversation.get_messages())
+    tool_results = [m.tool_result for m in conversation.get_messages() if m.tool_result]
+    assert [r.tool_request_id for r in tool_results] == ["id1", "id2", "id3"]
+
+
+def test_sequential_tool_calls_context_disables_concurrent_tool_calls():
+    agent = Agent(tools=[slow_echo_tool], llm=DummyModel(), max_concurrent_tool_calls=4)
+    tool_requests = [
+        ToolRequest("slow_echo_tool", {"text": str(i), "delay": 0.3}, f"id{i}") for i in range(3)
+    ]
+    with _sequential_tool_calls():
+        _, tool_results, duration = _run_agent_with_tool_requests(agent, tool_requests)
+
+    assert [r.content for r in tool_results] == ["0", "1", "2"]
+    assert duration >= 0.9
+
+
+def test_agent_max_concurrent_tool_calls_must_be_positive():
+    with pytest.raises(ValueError, match="max_concurrent_tool_calls"):
+        Agent(llm=DummyModel(), max_concurrent_tool_calls=0)
+
+
 def test_exception_during_parallel_tool_calls_with_agent(remotely_hosted_llm):
     sub_agent = Agent(
         llm=remotely_hosted_llm,
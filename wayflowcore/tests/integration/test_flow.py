@@ -4,6 +4,8 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 import logging
+import time
+from typing import Dict
 
 import anyio
 import pytest
@@ -11,17 +13,24 @@ import pytest
 from wayflowcore import Flow
 from wayflowcore.controlconnection import ControlFlowEdge
 from wayflowcore.dataconnection import DataFlowEdge
+from wayflowcore.events.event import FlowExecutionIterationStartedEvent
+from wayflowcore.events.eventlistener import GenericEventListener, register_event_listeners
 from wayflowcore.executors.executionstatus import FinishedStatus, UserMessageRequestStatus
+from wayflowcore.models.llmmodel import LlmCompletion, Prompt
 from wayflowcore.property import AnyProperty, DictProperty, StringProperty
 from wayflowcore.steps import (
     BranchingStep,
     InputMessageStep,
     OutputMessageStep,
+    PromptExecutionStep,
     StartStep,
+    TemplateRenderingStep,
     ToolExecutionStep,
 )
 from wayflowcore.tools import ServerTool, tool
 
+from ..testhelpers.dummy import DummyModel
+
 STEP_1 = OutputMessageStep(
     "{{step_name}}",
     input_descriptors=[StringProperty("step_name", default_value="step_1")],
@@ -492,3 +501,152 @@ def test_node_does_not_have_outgoing_edges():
                 ControlFlowEdge(source_step=step_1, destination_step=step_2),
             ],
         )
+
+
+class _SlowDummyModel(DummyModel):
+    def __init__(self, delays: Dict[str, float]):
+        super().__init__()
+        self.delays = delays
+
+    async def _generate_impl(self, prompt: Prompt) -> LlmCompletion:
+        await anyio.sleep(self.delays[prompt.messages[-1].content])
+        return await super()._generate_impl(prompt)
+
+
+def _create_fan_out_flow(max_concurrent_steps: int, send_message: bool = False) -> Flow:
+    # the first questions take the longest, but their outputs must be recorded first
+    llm = _SlowDummyModel(delays={"question a": 0.3, "question b": 0.2, "question c": 0.1})
+    llm.set_next_output({f"question {k}": f"answer {k}" for k in "abc"})
+    prompt_steps = [
+        PromptExecutionStep(
+            prompt_template=f"question {k}",
+            llm=llm,
+            send_message=send_message,
+            output_mapping={PromptExecutionStep.OUTPUT: f"answer_{k}"},
+            name=f"prompt_{k}",
+        )
+        for k in "abc"
+    ]
+    join_step = TemplateRenderingStep(
+        template="{{answer_a}}, {{answer_b}}, {{answer_c}}",
+        name="join",
+    )
+    return Flow.from_steps(
+        [*prompt_steps, join_step],
+        max_concurrent_steps=max_concurrent_steps,
+    )
+
+
+@pytest.mark.parametrize("max_concurrent_steps, min_duration", [(1, 0.55), (3, 0.0)])
+def test_flow_executes_independent_steps_concurrently(max_concurrent_steps, min_duration):
+    flow = _create_fan_out_flow(max_concurrent_steps)
+    started_step_names = []
+    event_listener = GenericEventListener(
+        event_classes=[FlowExecutionIterationStartedEvent],
+        function=lambda e: started_step_names.append(e.execution_state.current_step_name),
+    )
+    conversation = flow.start_conversation()
+
+    with register_event_listeners([event_listener]):
+        start = time.perf_counter()
+        status = conversation.execute()
+        duration = time.perf_counter() - start
+
+    expected_step_names = ["__StartStep__", "prompt_a", "prompt_b", "prompt_c", "join"]
+    assert isinstance(status, FinishedStatus)
+    assert status.output_values[TemplateRenderingStep.OUTPUT] == "answer a, answer b, answer c"
+    assert conversation.state.step_history == expected_step_names
+    assert started_step_names == expected_step_names
+    assert duration >= min_duration
+    if max_concurrent_steps > 1:
+        assert duration < 0.5
+
+
+def test_flow_only_groups_independent_steps_supporting_concurrent_execution():
+    assert _create_fan_out_flow(max_concurrent_steps=1)._concurrent_step_groups == {}
+    assert _create_fan_out_flow(max_concurrent_steps=2)._concurrent_step_groups == {
+        "prompt_a": ["prompt_a", "prompt_b", "prompt_c"],
+        "prompt_b": ["prompt_b", "prompt_c"],
+    }
+    # steps posting messages to the conversation are not executed concurrently
+    flow = _create_fan_out_flow(max_concurrent_steps=2, send_message=True)
+    assert flow._concurrent_step_groups == {}
+
+    llm = DummyModel()
+    step_a = PromptExecutionStep(prompt_template="question a", llm=llm, name="step_a")
+    step_b = PromptExecutionStep(prompt_template="{{text}}", llm=llm, name="step_b")
+    step_c = PromptExecutionStep(prompt_template="question c", llm=llm, name="step_c")
+    flow = Flow.from_steps(
+        [step_a, step_b, step_c],
+        data_flow_edges=[DataFlowEdge(step_a, PromptExecutionStep.OUTPUT, step_b, "text")],
+        max_concurrent_steps=2,
+    )
+    assert flow._concurrent_step_groups == {"step_b": ["step_b", "step_c"]}
+
+
+def test_flow_with_invalid_max_concurrent_steps_raises():
+    with pytest.raises(ValueError, match="`max_concurrent_steps` should be at least 1"):
+        Flow.from_steps([OutputMessageStep("hello")], max_concurrent_steps=0)
+
+
+def test_exception_during_concurrent_steps_is_raised_after_previous_steps_outputs():
+    llm = _SlowDummyModel(delays={"question a": 0.1, "question b": 0.0})
+    llm.set_next_output({"question a": "answer a"})
+    flow = Flow.from_steps(
+        [
+            PromptExecutionStep(prompt_template=f"question {k}", llm=llm, name=f"prompt_{k}")
+            for k in "ab"
+        ],
+        max_concurrent_steps=2,
+    )
+    conversation = flow.start_conversation()
+
+    with pytest.raises(ValueError, match="missing key `question b`"):
+        conversation.execute()
+
+    assert conversation.state.step_history == ["__StartStep__", "prompt_a", "prompt_b"]
+    assert conversation.state._flow_output_value_dict == {PromptExecutionStep.OUTPUT: "answer a"}
+
+
+def test_flow_compiles_edges_into_execution_plan():
+    start_step = StartStep(input_descriptors=[StringProperty("user_input")], name="start")
+    branching_step = BranchingStep(
+        branch_name_mapping={"yes": "yes_branch"},
+        name="branching",
+        input_mapping={BranchingStep.NEXT_BRANCH_NAME: "user_input"},
+    )
+    yes_step = OutputMessageStep("{{user_input}}", name="yes_step")
+    no_step = OutputMessageStep("no", name="no_step")
+    flow = Flow(
+        begin_step=start_step,
+        control_flow_edges=[
+            ControlFlowEdge(start_step, branching_step),
+            ControlFlowEdge(branching_step, yes_step, source_branch="yes_branch"),
+            ControlFlowEdge(branching_step, no_step, source_branch=BranchingStep.BRANCH_DEFAULT),
+            ControlFlowEdge(yes_step, None),
+            ControlFlowEdge(no_step, None),
+        ],
+        data_flow_edges=[
+            DataFlowEdge(start_step, "user_input", branching_step, "user_input"),
+            DataFlowEdge(start_step, "user_input", yes_step, "user_input"),
+        ],
+    )
+
+    execution_plan = flow._execution_plan
+    assert execution_plan.step_names_by_id[id(yes_step)] == "yes_step"
+    assert dict(execution_plan.outgoing_data_edges["start"]) == {
+        "user_input": (("branching", "user_input"), ("yes_step", "user_input"))
+    }
+    assert execution_plan.inputs_from_start_step["yes_step"] == {"user_input"}
+    assert execution_plan.get_next_step_name("branching", "yes_branch") == "yes_step"
+    assert execution_plan.get_next_step_name("branching", BranchingStep.BRANCH_DEFAULT) == "no_step"
+    assert execution_plan.get_next_step_name("yes_step", BranchingStep.BRANCH_NEXT) is None
+    assert execution_plan.get_next_step_name("yes_step", BranchingStep.BRANCH_SELF) == "yes_step"
+    with pytest.raises(ValueError, match="which is not part of the configured control flow edges"):
+        execution_plan.get_next_step_name("branching", "unknown_branch")
+
+    for user_input, expected_message in [("yes", "yes"), ("other", "no")]:
+        conversation = flow.start_conversation(inputs={"user_input": user_input})
+        status = conversation.execute()
+        assert isinstance(status, FinishedStatus)
+        assert conversation.get_last_message().content == expected_message
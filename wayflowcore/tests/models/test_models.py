@@ -9,11 +9,14 @@ import datetime
 import json
 import logging
 import os
+import threading
 from copy import deepcopy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from textwrap import dedent
 from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple, Union
 
+import anyio
 import httpx
 import pytest
 
@@ -27,7 +30,11 @@ from wayflowcore.messagelist import (
     TextTokenLogProb,
 )
 from wayflowcore.models import StreamChunkType
-from wayflowcore.models._requesthelpers import RetryingAsyncClient, request_post_with_retries
+from wayflowcore.models._requesthelpers import (
+    RetryingAsyncClient,
+    SharedHttpClients,
+    request_post_with_retries,
+)
 from wayflowcore.models.llmgenerationconfig import LlmGenerationConfig
 from wayflowcore.models.llmmodel import LlmModel, Prompt
 from wayflowcore.models.llmmodelfactory import LlmModelFactory
@@ -184,6 +191,9 @@ class _FakeAsyncClient:
     async def __aexit__(self, exc_type, exc, tb):
         return False
 
+    async def aclose(self):
+        pass
+
     async def post(self, **kwargs):
         self.calls += 1
         return self._responses.pop(0)
@@ -217,19 +227,20 @@ async def test_request_post_with_retry_policy_honors_request_timeout(monkeypatch
     captured: dict[str, Any] = {}
 
     class _Client:
-        def __init__(self, **kwargs):
-            captured.update(kwargs)
-
         async def __aenter__(self):
             return self
 
         async def __aexit__(self, exc_type, exc, tb):
             return False
 
+        async def aclose(self):
+            pass
+
         async def post(self, **kwargs):
+            captured.update(kwargs)
             return _FakeResponse(200, json_body={"ok": True})
 
-    monkeypatch.setattr(httpx, "AsyncClient", lambda **kwargs: _Client(**kwargs))
+    monkeypatch.setattr(httpx, "AsyncClient", lambda **kwargs: _Client())
 
     out = await request_post_with_retries(
         request_params={"url": "https://example.com", "json": {}},
@@ -300,20 +311,11 @@ async def test_apicallstep_retries_on_429_and_honors_retry_after(monkeypatch):
 async def test_apicallstep_retry_policy_honors_request_timeout(monkeypatch):
     captured: dict[str, Any] = {}
 
-    class _Client:
-        def __init__(self, *args, **kwargs):
-            captured.update(kwargs)
-
-        async def __aenter__(self):
-            return self
-
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
-
-        async def request(self, *args, **kwargs):
-            return httpx.Response(200, content=b"{}")
+    async def _fake_send(self, request, *args, **kwargs):
+        captured.update(request.extensions)
+        return httpx.Response(200, content=b"{}")
 
-    monkeypatch.setattr("wayflowcore.steps.apicallstep.RetryingAsyncClient", _Client)
+    monkeypatch.setattr(httpx.AsyncClient, "send", _fake_send)
 
     step = ApiCallStep(
         url="https://example.com",
@@ -323,7 +325,7 @@ async def test_apicallstep_retry_policy_honors_request_timeout(monkeypatch):
     response = await step._execute_request({"url": "https://example.com", "method": "GET"})
 
     assert response.status_code == 200
-    assert captured["timeout"] == httpx.Timeout(9.0)
+    assert captured["timeout"] == httpx.Timeout(9.0).as_dict()
 
 
 @pytest.mark.anyio
@@ -349,6 +351,9 @@ async def test_llmmodel_retries_on_429(monkeypatch):
         async def __aexit__(self, exc_type, exc, tb):
             return False
 
+        async def aclose(self):
+            pass
+
         async def post(self, **kwargs):
             return await _fake_post(**kwargs)
 
@@ -391,6 +396,9 @@ async def test_embeddingmodel_retries_on_429(monkeypatch):
         async def __aexit__(self, exc_type, exc, tb):
             return False
 
+        async def aclose(self):
+            pass
+
         async def post(self, **kwargs):
             return await _fake_post(**kwargs)
 
@@ -429,6 +437,64 @@ async def test_retrying_async_client_does_not_retry_tls_errors(monkeypatch):
     assert calls["n"] == 1
 
 
+@pytest.fixture
+def keep_alive_server():
+    client_ports = []
+
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            client_ports.append(self.client_address[1])
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = json.dumps({"ok": True}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", client_ports
+    server.shutdown()
+    server.server_close()
+
+
+def test_requests_reuse_connections_of_shared_http_client(keep_alive_server):
+    url, client_ports = keep_alive_server
+
+    async def _post_several_times():
+        for _ in range(5):
+            out = await request_post_with_retries(request_params={"url": url, "json": {}})
+            assert out == {"ok": True}
+        return await SharedHttpClients().get_client()
+
+    client = anyio.run(_post_several_times)
+
+    assert len(client_ports) == 5
+    assert len(set(client_ports)) == 1
+    # the clients are closed when their event loop shuts down
+    assert client.is_closed
+
+
+@pytest.mark.anyio
+async def test_shared_http_clients_are_created_per_configuration():
+    shared_clients = SharedHttpClients()
+    client = await shared_clients.get_client()
+    assert await shared_clients.get_client() is client
+    assert await shared_clients.get_client(verify=False) is not client
+    assert await shared_clients.get_client(proxy="http://localhost:3128") is not client
+
+    await shared_clients.aclose()
+    assert client.is_closed
+    assert await shared_clients.get_client() is not client
+
+
 @tool
 def get_location(
     company_name: Annotated[str, "Name of the company to search the location for"],
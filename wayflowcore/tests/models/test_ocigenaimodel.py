@@ -4,6 +4,7 @@
 # (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
 # (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
 
+import json
 import logging
 import os
 import re
@@ -488,7 +489,8 @@ def test_model_uses_proper_provider(
         raise StopAtMock()
 
     with patch(
-        "oci.generative_ai_inference.GenerativeAiInferenceClient.chat", side_effect=raise_exception
+        "wayflowcore.models._ociasynctransport._OciAsyncTransport.chat",
+        side_effect=raise_exception,
     ) as mock:
         try:
             prompt = PromptTemplate.from_string(
@@ -575,3 +577,115 @@ def test_oci_openai_responses_generation_config_supports_reasoning(oci_reasoning
 
     assert len(completion.message.contents) > 0
     assert completion.token_usage is None or completion.token_usage.exact_count
+
+
+@pytest.fixture
+def oci_llm_with_user_authentication(oci_client_config_with_generated_key):
+    return OCIGenAIModel(
+        model_id="meta.llama-3.3-70b-instruct",
+        client_config=oci_client_config_with_generated_key,
+        compartment_id="ocid1.compartment.oc1..aaaaaaaa",
+        retry_policy=RetryPolicy(max_attempts=2, initial_retry_delay=0.01, jitter=None),
+    )
+
+
+def _oci_chat_result(text: str) -> dict:
+    return {
+        "modelId": "meta.llama-3.3-70b-instruct",
+        "modelVersion": "1.0.0",
+        "chatResponse": {
+            "apiFormat": "GENERIC",
+            "timeCreated": "2026-01-01T00:00:00.000Z",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "ASSISTANT", "content": [{"type": "TEXT", "text": text}]},
+                    "finishReason": "stop",
+                }
+            ],
+            "usage": {"promptTokens": 12, "completionTokens": 3, "totalTokens": 15},
+        },
+    }
+
+
+@pytest.fixture
+def mock_oci_endpoint():
+    import httpx
+
+    sent_requests = []
+    responses = []
+
+    async def _send(request, stream=False, **kwargs):
+        sent_requests.append(request)
+        return responses.pop(0)
+
+    def _queue_response(status_code, json=None, content=None, headers=None):
+        responses.append(httpx.Response(status_code, json=json, content=content, headers=headers))
+
+    with patch("httpx.AsyncClient.send", side_effect=_send):
+        yield sent_requests, _queue_response
+
+
+def test_oci_generation_is_signed_and_sent_over_httpx(
+    oci_llm_with_user_authentication, mock_oci_endpoint
+):
+    sent_requests, queue_response = mock_oci_endpoint
+    queue_response(200, json=_oci_chat_result("Hello there"))
+
+    completion = oci_llm_with_user_authentication.generate("Hello")
+
+    assert completion.message.content == "Hello there"
+    assert completion.token_usage.total_tokens == 15
+    (request,) = sent_requests
+    assert str(request.url).endswith("/20231130/actions/chat")
+    assert request.headers["authorization"].startswith('Signature algorithm="rsa-sha256"')
+    assert "x-content-sha256" in request.headers
+    body = json.loads(request.content)
+    assert body["compartmentId"] == "ocid1.compartment.oc1..aaaaaaaa"
+    assert body["servingMode"]["modelId"] == "meta.llama-3.3-70b-instruct"
+
+
+def test_oci_generation_retries_asynchronously_on_retryable_errors(
+    oci_llm_with_user_authentication, mock_oci_endpoint
+):
+    sent_requests, queue_response = mock_oci_endpoint
+    queue_response(429, json={"code": "TooManyRequests", "message": "Slow down"})
+    queue_response(200, json=_oci_chat_result("Hello there"))
+
+    with patch("time.sleep", side_effect=AssertionError("the retries should not block")):
+        completion = oci_llm_with_user_authentication.generate("Hello")
+
+    assert completion.message.content == "Hello there"
+    assert len(sent_requests) == 2
+
+
+def test_oci_generation_raises_service_errors(oci_llm_with_user_authentication, mock_oci_endpoint):
+    import oci
+
+    _, queue_response = mock_oci_endpoint
+    queue_response(404, json={"code": "NotAuthorizedOrNotFound", "message": "Unknown model"})
+
+    with pytest.raises(oci.exceptions.ServiceError, match="Unknown model") as error:
+        oci_llm_with_user_authentication.generate("Hello")
+    assert error.value.status == 404
+    assert error.value.code == "NotAuthorizedOrNotFound"
+
+
+def test_oci_streaming_parses_server_sent_events(
+    oci_llm_with_user_authentication, mock_oci_endpoint
+):
+    sent_requests, queue_response = mock_oci_endpoint
+    events = [
+        {"index": 0, "message": {"role": "ASSISTANT", "content": [{"type": "TEXT", "text": t}]}}
+        for t in ["Hello", " there"]
+    ] + [{"finishReason": "stop"}]
+    queue_response(
+        200,
+        content="".join(f"data: {json.dumps(event)}\n\n" for event in events).encode(),
+        headers={"content-type": "text/event-stream"},
+    )
+
+    chunks = list(oci_llm_with_user_authentication.stream_generate("Hello"))
+
+    assert [message.content for _, message in chunks] == ["", "Hello", " there", "Hello there"]
+    assert json.loads(sent_requests[0].content)["chatRequest"]["isStream"] is True
@@ -0,0 +1,247 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import threading
+import time
+
+import anyio
+import pytest
+
+from wayflowcore.messagelist import Message, MessageType
+from wayflowcore.models import LlmCompletion, LlmRateLimiter, Prompt, set_llm_rate_limiter
+from wayflowcore.models._requesthelpers import _compute_wait_before_next_attempt
+from wayflowcore.models.ratelimiting import (
+    SharedLlmRateLimiters,
+    _rate_limited_request,
+    _TokenBucket,
+)
+from wayflowcore.retrypolicy import RetryPolicy
+from wayflowcore.tokenusage import TokenUsage
+
+from ..testhelpers.dummy import DummyModel
+
+ENDPOINT = "http://llm.endpoint"
+
+
+class _ConcurrencyTracker:
+    def __init__(self):
+        self.current_concurrency = 0
+        self.max_concurrency = 0
+
+
+class _EndpointModel(DummyModel):
+    def __init__(self, latency=0.02, tracker=None):
+        super().__init__()
+        self.model_id = "endpoint-model"
+        self.latency = latency
+        self.tracker = tracker or _ConcurrencyTracker()
+
+    @property
+    def _rate_limit_endpoint(self):
+        return ENDPOINT
+
+    async def _generate_impl(self, prompt):
+        self.tracker.current_concurrency += 1
+        self.tracker.max_concurrency = max(
+            self.tracker.max_concurrency, self.tracker.current_concurrency
+        )
+        await anyio.sleep(self.latency)
+        self.tracker.current_concurrency -= 1
+        return LlmCompletion(
+            Message(content="answer", message_type=MessageType.AGENT),
+            TokenUsage(input_tokens=10, output_tokens=5, total_tokens=15, exact_count=True),
+        )
+
+
+@pytest.fixture(autouse=True)
+def clear_rate_limiters():
+    yield
+    SharedLlmRateLimiters().clear()
+
+
+def _report_429(retry_after_value=None):
+    _compute_wait_before_next_attempt(
+        policy=RetryPolicy(),
+        attempt_num=0,
+        status_code=429,
+        retry_after_value=retry_after_value,
+        previous_wait_seconds=None,
+        time_started=0.0,
+        elapsed_time_seconds_fn=lambda: 0.0,
+        total_elapsed_time_seconds=None,
+        rng=None,
+    )
+
+
+async def _generate_concurrently(llm, num_generations):
+    async with anyio.create_task_group() as tg:
+        for _ in range(num_generations):
+            tg.start_soon(llm.generate_async, "Hello")
+
+
+def test_token_bucket_refills_over_time():
+    bucket = _TokenBucket(capacity_per_minute=60)
+    now = bucket.updated_at
+    bucket.consume(60, now)
+    assert bucket.time_until_available(2, now) == pytest.approx(2.0)
+    assert bucket.time_until_available(2, now + 2) == 0
+    # requests larger than the bucket only wait for a full bucket
+    assert bucket.time_until_available(1000, now + 10) == pytest.approx(50.0)
+
+
+def test_rate_limiters_are_shared_per_endpoint_and_model():
+    endpoint_limiter, model_limiter = LlmRateLimiter(), LlmRateLimiter()
+    set_llm_rate_limiter("https://llm.endpoint/", endpoint_limiter)
+    set_llm_rate_limiter("llm.endpoint", model_limiter, model_id="endpoint-model")
+
+    assert SharedLlmRateLimiters().get(ENDPOINT, "endpoint-model") is model_limiter
+    assert SharedLlmRateLimiters().get(ENDPOINT, "other-model") is endpoint_limiter
+    assert SharedLlmRateLimiters().get("http://other.endpoint", "endpoint-model") is None
+    assert _EndpointModel()._get_rate_limiter() is model_limiter
+
+    set_llm_rate_limiter(ENDPOINT, None, model_id="endpoint-model")
+    assert _EndpointModel()._get_rate_limiter() is endpoint_limiter
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_queues_generations_above_the_concurrency_limit():
+    rate_limiter = LlmRateLimiter(max_concurrency=3)
+    set_llm_rate_limiter(ENDPOINT, rate_limiter)
+    tracker = _ConcurrencyTracker()
+    first_llm, second_llm = _EndpointModel(tracker=tracker), _EndpointModel(tracker=tracker)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_generate_concurrently, first_llm, 5)
+        tg.start_soon(_generate_concurrently, second_llm, 5)
+        await anyio.sleep(0.005)
+        assert rate_limiter.num_in_flight == 3
+        assert rate_limiter.num_queued == 7
+
+    assert tracker.max_concurrency == 3
+    assert rate_limiter.num_in_flight == rate_limiter.num_queued == 0
+
+
+@pytest.mark.anyio
+async def test_queued_generations_are_woken_up_instead_of_polling(monkeypatch):
+    rate_limiter = LlmRateLimiter(max_concurrency=1)
+    set_llm_rate_limiter(ENDPOINT, rate_limiter)
+    num_admission_checks = 0
+    admit_queued_requests = rate_limiter._admit_queued_requests
+
+    def counting_admit_queued_requests(now):
+        nonlocal num_admission_checks
+        num_admission_checks += 1
+        return admit_queued_requests(now)
+
+    monkeypatch.setattr(rate_limiter, "_admit_queued_requests", counting_admit_queued_requests)
+    await _generate_concurrently(_EndpointModel(latency=0.05), 5)
+    # polling would check the limiter every few milliseconds for each of the queued requests
+    assert num_admission_checks < 30
+
+
+def test_queued_generations_are_woken_up_from_another_event_loop():
+    rate_limiter = LlmRateLimiter(max_concurrency=1)
+    set_llm_rate_limiter(ENDPOINT, rate_limiter)
+    tracker = _ConcurrencyTracker()
+    threads = [
+        threading.Thread(
+            target=anyio.run,
+            args=(_generate_concurrently, _EndpointModel(latency=0.05, tracker=tracker), 2),
+        )
+        for _ in range(2)
+    ]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert time.monotonic() - start < 2
+    assert tracker.max_concurrency == 1
+    assert rate_limiter.num_in_flight == rate_limiter.num_queued == 0
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_delays_generations_above_the_request_rate():
+    # bucket of 2 requests, refilled at 20 requests per second
+    rate_limiter = LlmRateLimiter(requests_per_minute=1200)
+    rate_limiter._request_bucket.capacity = rate_limiter._request_bucket.available = 2
+    set_llm_rate_limiter(ENDPOINT, rate_limiter)
+
+    start = time.monotonic()
+    await _generate_concurrently(_EndpointModel(latency=0), 4)
+    assert time.monotonic() - start >= 0.09
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_accounts_estimated_and_actual_tokens():
+    rate_limiter = LlmRateLimiter(tokens_per_minute=600)
+    set_llm_rate_limiter(ENDPOINT, rate_limiter)
+    llm = _EndpointModel(latency=0.05)
+    estimated_tokens = llm._estimate_num_tokens(
+        Prompt(messages=[Message(content="Hello", message_type=MessageType.USER)])
+    )
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(llm.generate_async, "Hello")
+        await anyio.sleep(0.01)
+        assert 600 - rate_limiter._token_bucket.available == pytest.approx(estimated_tokens, abs=1)
+    # the estimate is replaced by the actual usage of the generation
+    assert 600 - rate_limiter._token_bucket.available == pytest.approx(15, abs=1)
+
+
+@pytest.mark.anyio
+async def test_rate_limited_responses_decrease_concurrency_once_per_window():
+    rate_limiter = LlmRateLimiter(max_concurrency=8)
+
+    async def _rate_limited_generation():
+        async with _rate_limited_request(rate_limiter, estimated_tokens=10):
+            await anyio.sleep(0.01)
+            _report_429(retry_after_value="0.2")
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(4):
+            tg.start_soon(_rate_limited_generation)
+
+    assert rate_limiter.concurrency_limit == 4
+    start = time.monotonic()
+    async with _rate_limited_request(rate_limiter, estimated_tokens=10):
+        # the requests are paused until the retry-after of the endpoint
+        assert time.monotonic() - start >= 0.1
+
+
+@pytest.mark.anyio
+async def test_rate_limiter_increases_concurrency_after_successes_and_decreases_it_when_slow():
+    rate_limiter = LlmRateLimiter(max_concurrency=4, latency_threshold=0.05)
+    rate_limiter._concurrency_limit = 2.0
+    set_llm_rate_limiter(ENDPOINT, rate_limiter)
+
+    await _generate_concurrently(_EndpointModel(latency=0), 4)
+    assert rate_limiter.concurrency_limit == 3
+
+    await _EndpointModel(latency=0.06).generate_async("Hello")
+    assert rate_limiter.concurrency_limit == 1
+
+
+@pytest.mark.anyio
+async def test_rate_limited_responses_without_limiter_are_ignored():
+    async with _rate_limited_request(None, estimated_tokens=0):
+        _report_429(retry_after_value="1")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(requests_per_minute=0),
+        dict(tokens_per_minute=0),
+        dict(min_concurrency=0),
+        dict(max_concurrency=0),
+        dict(latency_threshold=0),
+        dict(decrease_factor=1),
+    ],
+)
+def test_rate_limiter_rejects_invalid_parameters(kwargs):
+    with pytest.raises(ValueError, match=list(kwargs)[0]):
+        LlmRateLimiter(**kwargs)
@@ -0,0 +1,295 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import copy
+import logging
+import threading
+import warnings
+
+import pytest
+
+from wayflowcore.agent import Agent
+from wayflowcore.datastore.inmemory import _INMEMORY_USER_WARNING, InMemoryDatastore
+from wayflowcore.executors.interrupts.executioninterrupt import InterruptedExecutionStatus
+from wayflowcore.executors.interrupts.tokenlimitexecutioninterrupt import (
+    SoftTokenLimitExecutionInterrupt,
+)
+from wayflowcore.flow import Flow
+from wayflowcore.models import (
+    AggregatedTokenUsageStore,
+    InMemoryTokenUsageStore,
+    TokenUsageRecord,
+    TokenUsageStore,
+)
+from wayflowcore.steps import PromptExecutionStep
+from wayflowcore.tokenusage import TokenUsage
+
+from ..testhelpers.dummy import DummyModel
+
+
+def _record(conversation_id, output_tokens=1, **kwargs):
+    return TokenUsageRecord(
+        model_id="model",
+        token_usage=TokenUsage(output_tokens=output_tokens, exact_count=True),
+        conversation_id=conversation_id,
+        **kwargs,
+    )
+
+
+def test_inmemory_token_usage_store_evicts_least_recently_used_conversations():
+    store = InMemoryTokenUsageStore(max_conversations=2)
+    store.record(_record("a"))
+    store.record(_record("b"))
+    store.record(_record("a", output_tokens=2))
+    store.record(_record("c"))
+
+    assert len(store) == 2
+    assert store.get_conversation_token_usage("a").output_tokens == 3
+    assert store.get_conversation_token_usage("b").output_tokens == 0
+    assert store.get_conversation_token_usage("c").output_tokens == 1
+
+
+def test_inmemory_token_usage_store_warns_when_evicting_conversations_before_they_expire(caplog):
+    store = InMemoryTokenUsageStore(max_conversations=1)
+    with caplog.at_level(logging.WARNING, logger="wayflowcore.models.tokenusagestore"):
+        store.record(_record("a"))
+        assert caplog.text == ""
+        store.record(_record("b"))
+    assert "Evicting the token usage of conversation a" in caplog.text
+
+
+def test_inmemory_token_usage_store_evicts_expired_conversations(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("wayflowcore.models.tokenusagestore.time.time", lambda: now)
+    store = InMemoryTokenUsageStore(max_conversations=None, conversation_ttl=10)
+    store.record(_record("a"))
+    now += 5
+    store.record(_record("b"))
+    now += 6
+
+    assert store.get_conversation_token_usage("a").output_tokens == 0
+    assert store.get_conversation_token_usage("b").output_tokens == 1
+    assert len(store) == 1
+
+
+def test_token_usage_store_returns_copies_of_its_counters():
+    store = InMemoryTokenUsageStore()
+    store.record(_record("a"))
+    store.get_conversation_token_usage("a").output_tokens += 10
+    assert store.get_conversation_token_usage("a").output_tokens == 1
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(max_conversations=0),
+        dict(conversation_ttl=0),
+        dict(flush_batch_size=0),
+    ],
+)
+def test_inmemory_token_usage_store_rejects_invalid_parameters(kwargs):
+    with pytest.raises(ValueError, match=list(kwargs)[0]):
+        InMemoryTokenUsageStore(**kwargs)
+
+
+def test_aggregated_token_usage_store_counts_per_model_component_and_step():
+    store = AggregatedTokenUsageStore()
+    store.record(_record("a", component_name="flow", step_name="step1"))
+    store.record(_record("b", output_tokens=2, component_name="flow", step_name="step2"))
+    store.record(_record("c", output_tokens=4, component_name="agent"))
+    store.record(_record(None, output_tokens=8))
+
+    assert store.get_token_usage_per_model()["model"].output_tokens == 15
+    per_component = store.get_token_usage_per_component()
+    assert {name: usage.output_tokens for name, usage in per_component.items()} == {
+        "flow": 3,
+        "agent": 4,
+    }
+    per_step = store.get_token_usage_per_step()
+    assert {key: usage.output_tokens for key, usage in per_step.items()} == {
+        ("flow", "step1"): 1,
+        ("flow", "step2"): 2,
+    }
+    with pytest.raises(ValueError, match="does not track"):
+        store.get_conversation_token_usage("a")
+
+
+def test_token_usage_store_flushes_records_to_datastore_in_batches():
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message=f"{_INMEMORY_USER_WARNING}*")
+        datastore = InMemoryDatastore({"usages": TokenUsageStore.get_entity_definition()})
+    store = AggregatedTokenUsageStore(
+        datastore=datastore, collection_name="usages", flush_batch_size=3
+    )
+    for conversation_id in ["a", "b"]:
+        store.record(_record(conversation_id, component_name="agent"))
+    assert datastore.list("usages") == []
+
+    store.record(_record(None))
+    # full batches are written in the background, flushing waits for them
+    store.flush()
+    records = datastore.list("usages")
+    assert [record["conversation_id"] for record in records] == ["a", "b", ""]
+    assert all(record["output_tokens"] == 1 for record in records)
+
+    store.record(_record("c"))
+    store.flush()
+    assert len(datastore.list("usages")) == 4
+
+
+def test_token_usage_store_writes_batches_outside_of_the_calling_thread(caplog):
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message=f"{_INMEMORY_USER_WARNING}*")
+
+        class _FailingDatastore(InMemoryDatastore):
+            def create(self, collection_name, entities):
+                writing_threads.append(threading.current_thread())
+                raise ConnectionError("datastore is down")
+
+        writing_threads = []
+        datastore = _FailingDatastore({"usages": TokenUsageStore.get_entity_definition()})
+    store = InMemoryTokenUsageStore(
+        datastore=datastore, collection_name="usages", flush_batch_size=2
+    )
+
+    with caplog.at_level(logging.ERROR, logger="wayflowcore.models.tokenusagestore"):
+        # the generation accounting its usage does not fail when the datastore does
+        store.record(_record("a"))
+        store.record(_record("a"))
+        store.flush()
+
+    assert writing_threads and writing_threads[0] is not threading.current_thread()
+    assert "Failed to write 2 token usage records" in caplog.text
+    assert store.get_conversation_token_usage("a").output_tokens == 2
+
+
+def test_token_usage_store_writer_thread_is_stopped_when_closing_the_store():
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message=f"{_INMEMORY_USER_WARNING}*")
+        datastore = InMemoryDatastore({"usages": TokenUsageStore.get_entity_definition()})
+    store = InMemoryTokenUsageStore(
+        datastore=datastore, collection_name="usages", flush_batch_size=1
+    )
+    store.record(_record("a"))
+    store.close()
+    assert len(datastore.list("usages")) == 1
+    assert not any(
+        thread.name.startswith("wayflow_token_usage_store") for thread in threading.enumerate()
+    )
+
+    # the writer thread is started again when needed
+    store.record(_record("a"))
+    store.close()
+    assert len(datastore.list("usages")) == 2
+
+
+def test_llm_models_with_token_usage_stores_can_be_deep_copied():
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message=f"{_INMEMORY_USER_WARNING}*")
+        datastore = InMemoryDatastore({"usages": TokenUsageStore.get_entity_definition()})
+    llm = DummyModel()
+    llm.token_usage_store = InMemoryTokenUsageStore(
+        datastore=datastore, collection_name="usages", flush_batch_size=2
+    )
+    llm.token_usage_store.record(_record("a", output_tokens=2))
+
+    llm_copy = copy.deepcopy(llm)
+
+    copied_store = llm_copy.token_usage_store
+    assert copied_store is not llm.token_usage_store
+    assert copied_store.get_conversation_token_usage("a").output_tokens == 2
+    # the pending records stay owned by the original store, so they are not written twice
+    copied_store.record(_record("a"))
+    copied_store.flush()
+    assert len(datastore.list("usages")) == 1
+    assert llm.token_usage_store.get_conversation_token_usage("a").output_tokens == 2
+
+
+def test_llm_records_token_usage_of_agent_and_flow_conversations():
+    llm = DummyModel()
+    llm.token_usage_store = AggregatedTokenUsageStore()
+
+    agent = Agent(llm=llm, name="my_agent")
+    conversation = agent.start_conversation()
+    conversation.append_user_message("Hello")
+    llm.set_next_output("Hello there")
+    conversation.execute()
+
+    flow = Flow.from_steps(
+        [PromptExecutionStep(llm=llm, prompt_template="Hi", name="prompt_step")], name="my_flow"
+    )
+    llm.set_next_output("Hi there")
+    flow.start_conversation().execute()
+
+    assert set(llm.token_usage_store.get_token_usage_per_component()) == {"my_agent", "my_flow"}
+    assert set(llm.token_usage_store.get_token_usage_per_step()) == {("my_flow", "prompt_step")}
+    assert llm.token_usage_store.get_token_usage_per_model()["dummy"].output_tokens > 0
+
+
+def test_token_limit_interrupt_uses_the_token_usage_store_of_the_llm():
+    llm = DummyModel()
+    agent = Agent(llm=llm)
+    conversation = agent.start_conversation()
+    conversation.append_user_message("Hello")
+    llm.set_next_output("Hello there, how can I help you today?")
+    conversation.execute()
+    assert llm.get_total_token_consumption(conversation.conversation_id).output_tokens > 0
+
+    conversation.append_user_message("Tell me more")
+    llm.set_next_output("More")
+    status = conversation.execute(
+        execution_interrupts=[SoftTokenLimitExecutionInterrupt(tokens_per_model={llm: 1})]
+    )
+    assert isinstance(status, InterruptedExecutionStatus)
+
+
+def test_deprecated_llm_token_usage_attributes_are_built_from_the_token_usage_store():
+    llm = DummyModel()
+
+    agent = Agent(llm=llm)
+    agent_conversation = agent.start_conversation()
+    agent_conversation.append_user_message("Hello")
+    llm.set_next_output("Hello there")
+    agent_conversation.execute()
+
+    flow = Flow.from_steps([PromptExecutionStep(llm=llm, prompt_template="Hi", name="prompt_step")])
+    flow_conversation = flow.start_conversation()
+    llm.set_next_output("Hi there")
+    flow_conversation.execute()
+
+    with pytest.warns(DeprecationWarning, match="token_usages_flexible"):
+        token_usages_flexible = llm.token_usages_flexible
+    assert set(token_usages_flexible) == {agent_conversation.conversation_id}
+    assert token_usages_flexible[agent_conversation.conversation_id].output_tokens > 0
+
+    with pytest.warns(DeprecationWarning, match="token_usages_flow"):
+        token_usages_flow = llm.token_usages_flow
+    assert set(token_usages_flow) == {flow_conversation.conversation_id}
+    assert set(token_usages_flow[flow_conversation.conversation_id]) == {"prompt_step"}
+    assert (
+        token_usages_flow[flow_conversation.conversation_id]["prompt_step"].output_tokens
+        == llm.get_total_token_consumption(flow_conversation.conversation_id).output_tokens
+    )
+
+    # as before their deprecation, unknown conversations have no token usage
+    with pytest.warns(DeprecationWarning):
+        assert llm.token_usages_flexible["unknown"].total_tokens == 0
+    with pytest.warns(DeprecationWarning):
+        assert llm.token_usages_flow["unknown"]["unknown_step"].total_tokens == 0
+    with pytest.warns(DeprecationWarning):
+        assert (
+            llm.token_usages_flow[flow_conversation.conversation_id]["unknown_step"].total_tokens
+            == 0
+        )
+
+
+def test_token_limit_interrupt_rejects_models_not_tracking_conversation_token_usage():
+    llm = DummyModel()
+    llm.token_usage_store = AggregatedTokenUsageStore()
+    with pytest.raises(ValueError, match="does not track the token usage"):
+        SoftTokenLimitExecutionInterrupt(tokens_per_model={llm: 1})
+    with pytest.raises(ValueError, match="does not track the token usage"):
+        SoftTokenLimitExecutionInterrupt(all_models=[DummyModel(), llm], total_tokens=1)
@@ -0,0 +1,718 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import threading
+
+import anyio
+import numpy as np
+import pytest
+
+from wayflowcore.search import EntityVectorIndex, IVFEntityVectorIndex, SimilarityMetric
+
+DIMENSION = 8
+
+
+def _make_entities(num_entities: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    vectors = rng.normal(size=(num_entities, DIMENSION)).astype(np.float32)
+    return [
+        {
+            "id": i,
+            "category": "rare" if i % 50 == 0 else "common",
+            "parity": i % 2,
+            "tags": ["a", "b"] if i % 3 == 0 else ["c"],
+            "embedding": vectors[i].tolist(),
+        }
+        for i in range(num_entities)
+    ]
+
+
+def _exact_ranking(entities, query, metric, where=None):
+    candidates = [e for e in entities if not where or all(e.get(c) == v for c, v in where.items())]
+    vectors = np.array([e["embedding"] for e in candidates], dtype=np.float32)
+    query_arr = np.array(query, dtype=np.float32)
+    if metric == SimilarityMetric.COSINE:
+        scores = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)) @ (
+            query_arr / np.linalg.norm(query_arr)
+        )
+    elif metric == SimilarityMetric.DOT:
+        scores = vectors @ query_arr
+    else:
+        scores = -np.sum((vectors - query_arr) ** 2, axis=1)
+    order = np.argsort(-scores, kind="stable")
+    return [candidates[i]["id"] for i in order]
+
+
+@pytest.fixture
+def entities():
+    return _make_entities(500)
+
+
+@pytest.mark.parametrize("metric", list(SimilarityMetric))
+def test_filtered_search_returns_k_results_matching_filter(entities, metric):
+    index = EntityVectorIndex(DIMENSION, metric)
+    index.build(entities, "embedding")
+    query = _make_entities(1, seed=42)[0]["embedding"]
+
+    results = index.search(query, k=5, where={"category": "rare"})
+
+    # 10 entities out of 500 are "rare", a post-top-k filter would most likely return none
+    assert len(results) == 5
+    assert all(r["category"] == "rare" for r in results)
+    expected_ids = _exact_ranking(entities, query, metric, where={"category": "rare"})[:5]
+    assert [r["id"] for r in results] == expected_ids
+
+
+@pytest.mark.parametrize("metric", list(SimilarityMetric))
+def test_search_without_filter_returns_sorted_top_k(entities, metric):
+    index = EntityVectorIndex(DIMENSION, metric)
+    index.build(entities, "embedding")
+    query = _make_entities(1, seed=7)[0]["embedding"]
+
+    results = index.search(query, k=10)
+
+    assert [r["id"] for r in results] == _exact_ranking(entities, query, metric)[:10]
+    scores = [r["_score"] for r in results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_filtered_search_with_multiple_filters(entities):
+    index = EntityVectorIndex(DIMENSION)
+    index.build(entities, "embedding")
+    query = entities[0]["embedding"]
+
+    results = index.search(query, k=100, where={"category": "rare", "parity": 0})
+
+    assert len(results) == 10
+    assert all(r["category"] == "rare" and r["parity"] == 0 for r in results)
+    assert results[0]["id"] == 0
+
+
+def test_filtered_search_returns_fewer_results_when_not_enough_matches(entities):
+    index = EntityVectorIndex(DIMENSION)
+    index.build(entities, "embedding")
+    query = entities[0]["embedding"]
+
+    assert len(index.search(query, k=20, where={"category": "rare"})) == 10
+    assert index.search(query, k=20, where={"category": "unknown"}) == []
+    assert index.search(query, k=20, where={"unknown_column": "rare"}) == []
+
+
+def test_filtered_search_on_unhashable_values(entities):
+    index = EntityVectorIndex(DIMENSION)
+    index.build(entities, "embedding")
+    query = entities[0]["embedding"]
+
+    results = index.search(query, k=500, where={"tags": ["a", "b"]})
+
+    assert len(results) == len([e for e in entities if e["tags"] == ["a", "b"]])
+    assert all(r["tags"] == ["a", "b"] for r in results)
+
+
+def test_filtered_search_is_consistent_after_rebuild(entities):
+    index = EntityVectorIndex(DIMENSION)
+    index.build(entities, "embedding")
+    query = entities[0]["embedding"]
+    assert len(index.search(query, k=100, where={"category": "rare"})) == 10
+
+    index.build(entities[:100], "embedding")
+
+    assert len(index.search(query, k=100, where={"category": "rare"})) == 2
+
+
+def test_metric_override_is_restored_after_search(entities):
+    index = EntityVectorIndex(DIMENSION, SimilarityMetric.DOT)
+    index.build(entities, "embedding")
+
+    index.search(entities[0]["embedding"], k=3, metric=SimilarityMetric.EUCLIDEAN)
+
+    assert index.metric == SimilarityMetric.DOT
+
+
+def test_upsert_adds_and_replaces_entities_in_place(entities):
+    index = EntityVectorIndex(DIMENSION)
+    index.build(entities[:10], "embedding", item_ids=[f"row_{i}" for i in range(10)])
+
+    index.upsert(entities[10:12], item_ids=["row_10", "row_11"])
+    replacement = dict(entities[0], category="replaced", embedding=entities[100]["embedding"])
+    index.upsert([replacement], item_ids=["row_0"])
+
+    assert len(index.entities) == 12
+    results = index.search(entities[100]["embedding"], k=1)
+    assert results[0]["category"] == "replaced"
+    assert [r["id"] for r in index.search(entities[11]["embedding"], k=1)] == [11]
+    assert index.search(entities[0]["embedding"], k=12, where={"category": "rare"}) == []
+
+
+def test_remove_skips_removed_entities_and_compacts(entities):
+    index = EntityVectorIndex(DIMENSION)
+    index.build(entities[:100], "embedding", item_ids=list(range(100)))
+    query = entities[0]["embedding"]
+    # build the inverted index before removing, to check it stays consistent
+    assert len(index.search(query, k=10, where={"category": "rare"})) == 2
+
+    index.remove([0, 1, 2, "unknown"])
+
+    assert index._num_tombstones == 3
+    assert len(index.entities) == 97
+    assert 0 not in [r["id"] for r in index.search(query, k=100)]
+    assert [r["id"] for r in index.search(query, k=10, where={"category": "rare"})] == [50]
+
+    index.remove(list(range(3, 40)))
+
+    # more than a quarter of the rows were removed, the index got compacted
+    assert index._num_tombstones == 0
+    assert index.num_vectors == 60
+    assert sorted(r["id"] for r in index.search(query, k=100)) == list(range(40, 100))
+    index.upsert([entities[0]], item_ids=[0])
+    assert index.search(query, k=1)[0]["id"] == 0
+
+
+def test_upsert_of_entity_without_vector_removes_it(entities):
+    index = EntityVectorIndex(DIMENSION)
+    index.build(entities[:10], "embedding")
+
+    index.upsert([dict(entities[3], embedding=[])], item_ids=[3])
+
+    assert 3 not in [e["id"] for e in index.entities]
+
+
+def test_in_memory_datastore_updates_vector_index_incrementally():
+    from wayflowcore.datastore import Entity, InMemoryDatastore
+    from wayflowcore.property import IntegerProperty, StringProperty
+    from wayflowcore.search import SearchConfig, VectorRetrieverConfig
+
+    from ..testhelpers.dummy import DummyEmbeddingModel
+
+    embedding_model = DummyEmbeddingModel()
+    schema = Entity(properties={"id": IntegerProperty(), "content": StringProperty()})
+    with pytest.warns(UserWarning):
+        datastore = InMemoryDatastore(
+            schema={"documents": schema},
+            search_configs=[SearchConfig(retriever=VectorRetrieverConfig(model=embedding_model))],
+        )
+
+    for i in range(20):
+        datastore.create("documents", {"id": i, "content": f"document number {i}"})
+    index = datastore._vector_indices["documents"]["vector_documents"]
+
+    # single-row inserts only embed the new rows, and never rebuild the index
+    assert len(embedding_model.embedded_texts) == 20
+    assert datastore._vector_indices["documents"]["vector_documents"] is index
+    assert index.num_vectors == 20
+
+    datastore.update("documents", where={"id": 3}, update={"content": "zebra giraffe"})
+    datastore.delete("documents", where={"id": 5})
+
+    assert datastore._vector_indices["documents"]["vector_documents"] is index
+    assert sorted(e["id"] for e in index.entities) == [i for i in range(20) if i != 5]
+    results = datastore.search("zebra giraffe", collection_name="documents", k=20)
+    assert len(results) == 19
+    assert all(r["id"] != 5 for r in results)
+    assert [r["content"] for r in results if r["id"] == 3] == ["zebra giraffe"]
+
+
+@pytest.mark.anyio
+async def test_in_memory_datastore_async_writes_mutate_the_index_in_the_event_loop():
+    from wayflowcore.datastore import Entity, InMemoryDatastore
+    from wayflowcore.property import IntegerProperty, StringProperty
+    from wayflowcore.search import SearchConfig, VectorRetrieverConfig
+
+    from ..testhelpers.dummy import DummyEmbeddingModel
+
+    embedding_model = DummyEmbeddingModel()
+    schema = Entity(properties={"id": IntegerProperty(), "content": StringProperty()})
+    with pytest.warns(UserWarning):
+        datastore = InMemoryDatastore(
+            schema={"documents": schema},
+            search_configs=[SearchConfig(retriever=VectorRetrieverConfig(model=embedding_model))],
+        )
+    datatable = datastore._datatables["documents"]
+    mutating_threads = []
+    for method_name in ["create_with_row_ids", "update_with_row_ids"]:
+
+        def _record_mutating_thread(*args, _method=getattr(datatable, method_name), **kwargs):
+            mutating_threads.append(threading.current_thread())
+            return _method(*args, **kwargs)
+
+        setattr(datatable, method_name, _record_mutating_thread)
+
+    async with anyio.create_task_group() as tg:
+        for i in range(10):
+            tg.start_soon(
+                datastore.create_async, "documents", {"id": i, "content": f"document number {i}"}
+            )
+            tg.start_soon(datastore.list_async, "documents")
+    await datastore.update_async("documents", where={"id": 3}, update={"content": "zebra giraffe"})
+
+    assert len(mutating_threads) == 11
+    assert all(thread is threading.current_thread() for thread in mutating_threads)
+    assert len(embedding_model.embedded_texts) == 10
+    index = datastore._vector_indices["documents"]["vector_documents"]
+    assert sorted(e["id"] for e in index.entities) == list(range(10))
+    results = await datastore.search_async("zebra giraffe", collection_name="documents", k=10)
+    assert [r["content"] for r in results if r["id"] == 3] == ["zebra giraffe"]
+
+
+@pytest.mark.parametrize("metric", list(SimilarityMetric))
+@pytest.mark.parametrize("where", [None, {"category": "rare"}, {"tags": ["c"]}])
+def test_search_batch_matches_single_query_search(entities, metric, where):
+    index = EntityVectorIndex(DIMENSION, metric)
+    index.build(entities, "embedding")
+    index.remove([0, 1, 2])
+    queries = [e["embedding"] for e in _make_entities(7, seed=3)]
+
+    batch_results = index.search_batch(queries, k=5, where=where)
+
+    assert len(batch_results) == len(queries)
+    for query, results in zip(queries, batch_results):
+        single_results = index.search(query, k=5, where=where)
+        assert [r["id"] for r in results] == [r["id"] for r in single_results]
+        assert [r["_score"] for r in results] == pytest.approx(
+            [r["_score"] for r in single_results], abs=1e-4
+        )
+
+
+def test_search_batch_processes_queries_in_chunks(entities, monkeypatch):
+    index = EntityVectorIndex(DIMENSION)
+    index.build(entities, "embedding")
+    queries = [e["embedding"] for e in _make_entities(10, seed=5)]
+    expected = [[r["id"] for r in index.search(query, k=3)] for query in queries]
+
+    # budget for the distances of 3 queries at a time
+    monkeypatch.setattr(
+        EntityVectorIndex, "_MAX_SIMILARITY_MEMORY_CONSUMPTION_BYTES", 3 * 4 * len(entities)
+    )
+    results = index.search_batch(queries, k=3, columns_to_exclude=["tags"])
+
+    assert [[r["id"] for r in query_results] for query_results in results] == expected
+    assert all("tags" not in r for query_results in results for r in query_results)
+    assert index.search_batch([], k=3) == []
+
+
+@pytest.mark.parametrize("storage_dtype", ["float16", "int8"])
+@pytest.mark.parametrize("metric", list(SimilarityMetric))
+def test_quantized_index_returns_exact_results_after_rescoring(entities, storage_dtype, metric):
+    index = EntityVectorIndex(DIMENSION, metric, storage_dtype=storage_dtype)
+    index.build(entities, "embedding")
+    exact_index = EntityVectorIndex(DIMENSION, metric)
+    exact_index.build(entities, "embedding")
+    queries = [e["embedding"] for e in _make_entities(20, seed=11)]
+
+    for query in queries:
+        results = index.search(query, k=5)
+        # the candidates are re-scored with the full-precision vectors
+        assert [r["_score"] for r in results] == pytest.approx(
+            [r["_score"] for r in exact_index.search(query, k=5)], abs=1e-5
+        )
+
+
+@pytest.mark.parametrize("metric", list(SimilarityMetric))
+def test_binary_index_has_high_recall_after_rescoring(metric):
+    # Sign bits only work for high dimensional vectors
+    dimension = 128
+    rng = np.random.default_rng(0)
+    centers = rng.normal(size=(32, dimension))
+    vectors = centers[rng.integers(32, size=2000)] + rng.normal(size=(2000, dimension))
+    entities = [{"id": i, "embedding": vector.tolist()} for i, vector in enumerate(vectors)]
+    queries = (centers[rng.integers(32, size=30)] + rng.normal(size=(30, dimension))).tolist()
+    exact_index = EntityVectorIndex(dimension, metric)
+    exact_index.build(entities, "embedding")
+    binary_index = EntityVectorIndex(dimension, metric, storage_dtype="binary", rescore_factor=10)
+    binary_index.build(entities, "embedding")
+
+    assert _recall_at_k(exact_index, binary_index, queries, k=10) >= 0.95
+
+
+@pytest.mark.parametrize(
+    "storage_dtype,bytes_per_vector", [("float16", 16), ("int8", 8), ("binary", 1)]
+)
+def test_quantized_index_stores_compact_vectors(entities, storage_dtype, bytes_per_vector):
+    index = EntityVectorIndex(DIMENSION, storage_dtype=storage_dtype)
+    index.build(entities, "embedding")
+
+    assert index.vectors.nbytes == index.vectors_arr_size * bytes_per_vector
+
+
+def test_index_can_drop_vectors_from_items(entities):
+    index = EntityVectorIndex(DIMENSION, storage_dtype="int8", keep_vectors_in_items=False)
+    index.build(entities, "embedding")
+    exact_index = EntityVectorIndex(DIMENSION)
+    exact_index.build(entities, "embedding")
+    query = _make_entities(1, seed=13)[0]["embedding"]
+
+    results = index.search(query, k=5)
+
+    assert all("embedding" not in item for item in index.items)
+    assert all("embedding" not in r for r in results)
+    assert "embedding" in entities[0]  # the given entities are left untouched
+    # without re-scoring, the int8 scores are close to the exact ones
+    assert [r["_score"] for r in results] == pytest.approx(
+        [r["_score"] for r in exact_index.search(query, k=5)], abs=0.05
+    )
+    with pytest.raises(ValueError, match="Binary storage"):
+        EntityVectorIndex(DIMENSION, storage_dtype="binary", keep_vectors_in_items=False)
+
+
+def test_int8_index_grows_quantization_scales_on_upsert(entities):
+    index = EntityVectorIndex(
+        DIMENSION, SimilarityMetric.DOT, storage_dtype="int8", keep_vectors_in_items=False
+    )
+    index.build(entities[:100], "embedding", item_ids=list(range(100)))
+    large_entities = [{**e, "embedding": [10 * x for x in e["embedding"]]} for e in entities[100:]]
+    index.upsert(large_entities, item_ids=list(range(100, 500)))
+
+    decoded = index._decode_vectors(index.vectors[: index.num_vectors])
+    expected = np.array([e["embedding"] for e in entities[:100] + large_entities], dtype=np.float32)
+    # the error is bounded by the scale of each dimension after growing it
+    assert np.all(np.abs(decoded - expected) <= index._int8_scales)
+
+
+def test_quantized_search_batch_matches_single_query_search(entities):
+    index = EntityVectorIndex(DIMENSION, storage_dtype="float16")
+    index.build(entities, "embedding")
+    queries = [e["embedding"] for e in _make_entities(5, seed=17)]
+
+    batch_results = index.search_batch(queries, k=3, where={"parity": 1})
+
+    assert batch_results == [index.search(query, k=3, where={"parity": 1}) for query in queries]
+
+
+def _make_clustered_entities(num_entities: int, num_clusters: int = 32, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(num_clusters, DIMENSION)) * 4
+    vectors = centers[rng.integers(num_clusters, size=num_entities)] + rng.normal(
+        size=(num_entities, DIMENSION)
+    )
+    return [
+        {"id": i, "category": "rare" if i % 50 == 0 else "common", "embedding": v.tolist()}
+        for i, v in enumerate(vectors)
+    ]
+
+
+def _recall_at_k(exact_index, approximate_index, queries, k, where=None):
+    hits = 0
+    for query in queries:
+        exact_ids = {r["id"] for r in exact_index.search(query, k=k, where=where)}
+        approximate_ids = {r["id"] for r in approximate_index.search(query, k=k, where=where)}
+        hits += len(exact_ids & approximate_ids)
+    return hits / (k * len(queries))
+
+
+@pytest.mark.parametrize("metric", list(SimilarityMetric))
+def test_ivf_index_has_high_recall_compared_to_exact_index(metric):
+    entities = _make_clustered_entities(4000)
+    queries = [e["embedding"] for e in _make_clustered_entities(20, seed=1)]
+    exact_index = EntityVectorIndex(DIMENSION, metric)
+    exact_index.build(entities, "embedding")
+    ivf_index = IVFEntityVectorIndex(DIMENSION, metric, num_partitions=32, nprobe=8)
+    ivf_index.build(entities, "embedding")
+
+    assert ivf_index._centroids is not None
+    assert _recall_at_k(exact_index, ivf_index, queries, k=10) >= 0.9
+
+
+def test_ivf_index_recall_increases_with_nprobe():
+    entities = _make_clustered_entities(4000)
+    queries = [e["embedding"] for e in _make_clustered_entities(20, seed=1)]
+    exact_index = EntityVectorIndex(DIMENSION)
+    exact_index.build(entities, "embedding")
+    ivf_index = IVFEntityVectorIndex(DIMENSION, num_partitions=64, nprobe=1)
+    ivf_index.build(entities, "embedding")
+
+    low_recall = _recall_at_k(exact_index, ivf_index, queries, k=10)
+    ivf_index.nprobe = 64
+    full_recall = _recall_at_k(exact_index, ivf_index, queries, k=10)
+
+    assert low_recall <= full_recall
+    assert full_recall == 1.0
+
+
+def test_ivf_index_returns_k_filtered_results():
+    entities = _make_clustered_entities(2000)
+    ivf_index = IVFEntityVectorIndex(DIMENSION, num_partitions=40, nprobe=1)
+    ivf_index.build(entities, "embedding")
+
+    results = ivf_index.search(entities[1]["embedding"], k=10, where={"category": "rare"})
+
+    # the probed partition does not contain 10 rare entities, more partitions get probed
+    assert len(results) == 10
+    assert all(r["category"] == "rare" for r in results)
+
+
+def test_ivf_index_supports_incremental_updates():
+    entities = _make_clustered_entities(2000)
+    ivf_index = IVFEntityVectorIndex(DIMENSION, num_partitions=16, nprobe=16, min_training_size=500)
+    ivf_index.build([], "embedding")
+    ivf_index.upsert(entities[:400], item_ids=list(range(400)))
+    # not enough vectors to train the partitioning, the search is exhaustive
+    assert ivf_index.search(entities[0]["embedding"], k=1)[0]["id"] == 0
+    assert ivf_index._centroids is None
+
+    ivf_index.upsert(entities[400:], item_ids=list(range(400, 2000)))
+    assert ivf_index.search(entities[1500]["embedding"], k=1)[0]["id"] == 1500
+    assert ivf_index._trained_size == 2000
+
+    ivf_index.remove(list(range(1000)))
+    assert ivf_index._num_tombstones == 0  # compacted
+    assert ivf_index.search(entities[1500]["embedding"], k=1)[0]["id"] == 1500
+    assert all(r["id"] >= 1000 for r in ivf_index.search(entities[0]["embedding"], k=50))
+
+
+def test_ivf_index_is_trained_on_upsert_and_not_modified_by_searches():
+    entities = _make_clustered_entities(2000)
+    ivf_index = IVFEntityVectorIndex(DIMENSION, num_partitions=16, nprobe=16, min_training_size=500)
+    ivf_index.build(entities[:600], "embedding")
+    assert ivf_index._trained_size == 600
+
+    ivf_index.upsert(entities[600:], item_ids=list(range(600, 2000)))
+    assert ivf_index._trained_size == 2000
+    centroids = ivf_index._centroids
+    row_partitions = list(ivf_index._row_partitions)
+
+    ivf_index.remove(list(range(1600)))
+    ivf_index.search(entities[1800]["embedding"], k=5)
+    ivf_index.search_batch([entities[0]["embedding"], entities[1900]["embedding"]], k=5)
+    assert ivf_index._centroids is centroids
+    assert ivf_index._trained_size == 2000
+    assert ivf_index._row_partitions == row_partitions[1600:]
+
+    # too few vectors are left to probe the partitions, the search is exhaustive
+    ivf_index.remove(list(range(1600, 1900)))
+    assert ivf_index.search(entities[1950]["embedding"], k=1)[0]["id"] == 1950
+    assert ivf_index._centroids is centroids
+
+
+def test_in_memory_datastore_uses_index_type_from_retriever_config():
+    from wayflowcore.datastore import Entity, InMemoryDatastore
+    from wayflowcore.property import IntegerProperty, StringProperty
+    from wayflowcore.search import SearchConfig, VectorRetrieverConfig
+
+    from ..testhelpers.dummy import DummyEmbeddingModel
+
+    retriever = VectorRetrieverConfig(
+        model=DummyEmbeddingModel(),
+        index_params={"index_type": "ivf", "nprobe": 2, "min_training_size": 10},
+    )
+    schema = Entity(properties={"id": IntegerProperty(), "content": StringProperty()})
+    with pytest.warns(UserWarning):
+        datastore = InMemoryDatastore(
+            schema={"documents": schema}, search_configs=[SearchConfig(retriever=retriever)]
+        )
+    datastore.create("documents", [{"id": i, "content": f"document number {i}"} for i in range(50)])
+
+    index = datastore._vector_indices["documents"]["vector_documents"]
+    assert isinstance(index, IVFEntityVectorIndex)
+    assert index.nprobe == 2
+    results = datastore.search("document number 7", collection_name="documents", k=3)
+    assert len(results) == 3
+
+
+def test_in_memory_datastore_search_batch_embeds_queries_once():
+    from wayflowcore.datastore import Entity, InMemoryDatastore
+    from wayflowcore.property import IntegerProperty, StringProperty
+    from wayflowcore.search import SearchConfig, VectorRetrieverConfig
+
+    from ..testhelpers.dummy import DummyEmbeddingModel
+
+    embedding_model = DummyEmbeddingModel()
+    schema = Entity(properties={"id": IntegerProperty(), "content": StringProperty()})
+    with pytest.warns(UserWarning):
+        datastore = InMemoryDatastore(
+            schema={"documents": schema},
+            search_configs=[SearchConfig(retriever=VectorRetrieverConfig(model=embedding_model))],
+        )
+    datastore.create("documents", [{"id": i, "content": f"document number {i}"} for i in range(20)])
+    queries = ["document number 3", "number 12", "zebra"]
+
+    num_calls = embedding_model.num_calls
+    batch_results = datastore.search_batch(queries, collection_name="documents", k=4)
+
+    assert embedding_model.num_calls == num_calls + 1
+    for query, results in zip(queries, batch_results):
+        # the bag-of-words embeddings have ties, only the scores are compared
+        single_results = datastore.search(query, collection_name="documents", k=4)
+        assert [r["_score"] for r in results] == pytest.approx(
+            [r["_score"] for r in single_results], abs=1e-4
+        )
+
+
+def test_ivf_index_supports_quantized_storage():
+    entities = _make_clustered_entities(2000)
+    exact_index = EntityVectorIndex(DIMENSION)
+    exact_index.build(entities, "embedding")
+    ivf_index = IVFEntityVectorIndex(
+        DIMENSION, num_partitions=16, nprobe=4, min_training_size=500, storage_dtype="int8"
+    )
+    ivf_index.build(entities, "embedding")
+    queries = [e["embedding"] for e in _make_clustered_entities(30, seed=1)]
+
+    assert ivf_index.vectors.dtype == np.int8
+    assert _recall_at_k(exact_index, ivf_index, queries, k=10) >= 0.9
+
+
+def test_in_memory_datastore_uses_storage_params_from_retriever_config():
+    from wayflowcore.datastore import Entity, InMemoryDatastore
+    from wayflowcore.property import IntegerProperty, StringProperty
+    from wayflowcore.search import SearchConfig, VectorRetrieverConfig
+
+    from ..testhelpers.dummy import DummyEmbeddingModel
+
+    retriever = VectorRetrieverConfig(
+        model=DummyEmbeddingModel(),
+        index_params={"storage_dtype": "float16", "keep_vectors_in_items": False},
+    )
+    schema = Entity(properties={"id": IntegerProperty(), "content": StringProperty()})
+    with pytest.warns(UserWarning):
+        datastore = InMemoryDatastore(
+            schema={"documents": schema}, search_configs=[SearchConfig(retriever=retriever)]
+        )
+    datastore.create("documents", [{"id": i, "content": f"document number {i}"} for i in range(20)])
+
+    index = datastore._vector_indices["documents"]["vector_documents"]
+    assert index.vectors.dtype == np.float16
+    results = datastore.search("document number 7", collection_name="documents", k=3)
+    assert len(results) == 3
+    assert all("_embedding" not in r for r in results)
+    # the datastore still holds the vectors
+    assert all("_embedding" in e for e in datastore.list("documents"))
+
+
+@pytest.mark.parametrize("storage_dtype", ["float32", "int8"])
+def test_saved_index_is_memory_mapped_on_load(entities, tmp_path, storage_dtype):
+    index = EntityVectorIndex(DIMENSION, storage_dtype=storage_dtype)
+    index.build(entities, "embedding", item_ids=[f"item_{i}" for i in range(len(entities))])
+    index.remove(["item_0", "item_1"])
+    index.save(tmp_path / "index")
+    query = _make_entities(1, seed=19)[0]["embedding"]
+
+    loaded_index = EntityVectorIndex.load(tmp_path / "index")
+
+    assert isinstance(loaded_index.vectors, np.memmap)
+    assert loaded_index.entities == index.entities
+    assert loaded_index.search(query, k=5, where={"parity": 0}) == index.search(
+        query, k=5, where={"parity": 0}
+    )
+    # updates are private to the loaded index and do not change the saved files
+    loaded_index.upsert([entities[0]], item_ids=["item_0"])
+    loaded_index.remove(["item_2"])
+    reloaded_index = EntityVectorIndex.load(tmp_path / "index", mmap_mode="r")
+    assert len(reloaded_index.entities) == len(entities) - 2
+    assert reloaded_index.search(entities[2]["embedding"], k=1)[0]["id"] == 2
+
+
+def test_int8_index_loaded_read_only_can_be_updated(entities, tmp_path):
+    index = EntityVectorIndex(
+        DIMENSION, SimilarityMetric.DOT, storage_dtype="int8", keep_vectors_in_items=False
+    )
+    index.build(entities[:100], "embedding", item_ids=list(range(100)))
+    index.save(tmp_path / "index")
+
+    loaded_index = EntityVectorIndex.load(tmp_path / "index", mmap_mode="r")
+    assert not loaded_index.vectors.flags.writeable
+    # removing enough entities compacts the vectors in place
+    loaded_index.remove(list(range(40)))
+    assert loaded_index._num_tombstones == 0
+    large_entity = {**entities[100], "embedding": [10 * x for x in entities[100]["embedding"]]}
+    loaded_index.upsert([large_entity], item_ids=[100])
+
+    assert loaded_index.search(large_entity["embedding"], k=1)[0]["id"] == 100
+    decoded = loaded_index._decode_vectors(loaded_index.vectors[: loaded_index.num_vectors])
+    expected = np.array(
+        [e["embedding"] for e in entities[40:100] + [large_entity]], dtype=np.float32
+    )
+    assert np.all(np.abs(decoded - expected) <= loaded_index._int8_scales)
+    # the saved index is left untouched
+    reloaded_index = EntityVectorIndex.load(tmp_path / "index", mmap_mode="r")
+    np.testing.assert_array_equal(reloaded_index.vectors, index.vectors[: index.num_vectors])
+
+
+def test_saved_ivf_index_keeps_its_partitions(tmp_path):
+    entities = _make_clustered_entities(2000)
+    ivf_index = IVFEntityVectorIndex(DIMENSION, num_partitions=16, nprobe=2, min_training_size=500)
+    ivf_index.build(entities, "embedding")
+    ivf_index.save(tmp_path)
+
+    loaded_index = EntityVectorIndex.load(tmp_path)
+
+    assert isinstance(loaded_index, IVFEntityVectorIndex)
+    assert loaded_index.nprobe == 2
+    np.testing.assert_array_equal(loaded_index._centroids, ivf_index._centroids)
+    queries = [e["embedding"] for e in _make_clustered_entities(10, seed=3)]
+    for query in queries:
+        assert loaded_index.search(query, k=10) == ivf_index.search(query, k=10)
+
+
+def test_in_memory_datastore_loads_saved_data_without_embedding(tmp_path):
+    from wayflowcore.datastore import Entity, InMemoryDatastore
+    from wayflowcore.property import IntegerProperty, StringProperty
+    from wayflowcore.search import SearchConfig, VectorRetrieverConfig
+    from wayflowcore.serialization.context import SerializationContext
+
+    from ..testhelpers.dummy import DummyEmbeddingModel
+
+    schema = {
+        "documents": Entity(properties={"id": IntegerProperty(), "content": StringProperty()})
+    }
+    with pytest.warns(UserWarning):
+        datastore = InMemoryDatastore(
+            schema=schema,
+            search_configs=[
+                SearchConfig(retriever=VectorRetrieverConfig(model=DummyEmbeddingModel()))
+            ],
+        )
+    datastore.create("documents", [{"id": i, "content": f"document number {i}"} for i in range(20)])
+    datastore.delete("documents", where={"id": 4})
+    datastore.save(str(tmp_path))
+
+    serialized_datastore = datastore._serialize_to_dict(SerializationContext(root=datastore))
+    assert serialized_datastore["data_directory"] == str(tmp_path)
+
+    embedding_model = DummyEmbeddingModel()
+    with pytest.warns(UserWarning):
+        loaded_datastore = InMemoryDatastore(
+            schema=schema,
+            search_configs=[SearchConfig(retriever=VectorRetrieverConfig(model=embedding_model))],
+            data_directory=serialized_datastore["data_directory"],
+        )
+
+    assert embedding_model.num_calls == 0
+    assert loaded_datastore.list("documents") == datastore.list("documents")
+    assert loaded_datastore.search("document number 7", collection_name="documents", k=3) == (
+        datastore.search("document number 7", collection_name="documents", k=3)
+    )
+    # the loaded datastore can still be updated, with new stable row ids
+    loaded_datastore.create("documents", {"id": 20, "content": "zebra giraffe"})
+    results = loaded_datastore.search("zebra giraffe", collection_name="documents", k=1)
+    assert results[0]["id"] == 20
+    # only the two queries and the new entity were embedded
+    assert len(embedding_model.embedded_texts) == 3
+
+
+def test_in_memory_datastore_indices_do_not_share_entities_with_the_caller():
+    from wayflowcore.datastore import Entity, InMemoryDatastore
+    from wayflowcore.property import IntegerProperty, StringProperty
+    from wayflowcore.search import SearchConfig, VectorRetrieverConfig
+
+    from ..testhelpers.dummy import DummyEmbeddingModel
+
+    schema = Entity(properties={"id": IntegerProperty(), "content": StringProperty()})
+    with pytest.warns(UserWarning):
+        datastore = InMemoryDatastore(
+            schema={"documents": schema},
+            search_configs=[
+                SearchConfig(retriever=VectorRetrieverConfig(model=DummyEmbeddingModel()))
+            ],
+        )
+
+    created = datastore.create("documents", [{"id": 0, "content": "red bike"}])
+    created[0]["content"] = "MUTATED"
+    updated = datastore.update("documents", where={"id": 0}, update={"content": "blue bike"})
+    updated[0]["content"] = "MUTATED"
+
+    results = datastore.search("blue bike", collection_name="documents", k=1)
+    assert [r["content"] for r in results] == ["blue bike"]
+    assert [e["content"] for e in datastore.list("documents")] == ["blue bike"]
@@ -37,6 +37,7 @@ ALL_SERIALIZABLE_CLASSES = {
     "AuthConfig",
     "BooleanProperty",
     "BranchingStep",
+    "CachedEmbeddingModel",
     "CallableMessageTransform",
     "CatchExceptionStep",
     "ChoiceSelectionStep",
@@ -210,6 +211,7 @@ ALL_SERIALIZABLE_CLASSES = {
     "_NullExecutionInterrupt",
     "_PythonMergeToolRequestAndCallsTransform",
     "_ReactMergeToolRequestAndCallsTransform",
+    "_StreamingTextContent",
     "_TokenConsumptionEvent",
     "VectorConfig",
     "VectorRetrieverConfig",
@@ -0,0 +1,133 @@
+# Copyright © 2026 Oracle and/or its affiliates.
+#
+# This software is under the Apache License 2.0
+# (LICENSE-APACHE or http://www.apache.org/licenses/LICENSE-2.0) or Universal Permissive License
+# (UPL) 1.0 (LICENSE-UPL or https://oss.oracle.com/licenses/upl), at your option.
+
+import json
+from datetime import date, datetime, timezone
+
+import pytest
+import yaml
+
+from wayflowcore.executors._flowconversation import FlowConversation
+from wayflowcore.flow import Flow
+from wayflowcore.serialization import (
+    SerializationFormat,
+    autodeserialize,
+    deserialize,
+    serialize,
+    serialize_to_dict,
+)
+from wayflowcore.serialization.formats import _dump_serialized_dict, _load_serialized_dict
+from wayflowcore.steps import InputMessageStep, OutputMessageStep
+
+
+@pytest.fixture
+def flow_conversation() -> FlowConversation:
+    flow = Flow.from_steps(
+        [
+            OutputMessageStep("hello"),
+            InputMessageStep("what is your name?"),
+            OutputMessageStep("nice to meet you"),
+        ]
+    )
+    conversation = flow.start_conversation()
+    conversation.execute()
+    conversation.append_user_message("Jane")
+    conversation.execute()
+    return conversation
+
+
+def _get_message_contents(conversation) -> list:
+    return [message.content for message in conversation.get_messages()]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+@pytest.mark.parametrize("serialization_format", list(SerializationFormat))
+def test_conversation_roundtrips_in_every_serialization_format(
+    flow_conversation, serialization_format, compress
+):
+    if serialization_format == SerializationFormat.MSGPACK:
+        pytest.importorskip("msgpack")
+    if compress:
+        pytest.importorskip("zstandard")
+
+    serialized_conversation = serialize(
+        flow_conversation, serialization_format=serialization_format, compress=compress
+    )
+    assert isinstance(serialized_conversation, bytes) is (
+        compress or serialization_format == SerializationFormat.MSGPACK
+    )
+
+    for new_conversation in [
+        autodeserialize(serialized_conversation),
+        deserialize(
+            FlowConversation, serialized_conversation, serialization_format=serialization_format
+        ),
+    ]:
+        assert _get_message_contents(new_conversation) == _get_message_contents(flow_conversation)
+        assert [message.time_created for message in new_conversation.get_messages()] == [
+            message.time_created for message in flow_conversation.get_messages()
+        ]
+
+
+def test_json_serialization_produces_the_same_dict_as_yaml(flow_conversation):
+    serialized_as_json = serialize(flow_conversation, serialization_format="json")
+    serialized_as_yaml = serialize(flow_conversation)
+
+    assert json.loads(serialized_as_json)["_component_type"] == "FlowConversation"
+    assert _load_serialized_dict(serialized_as_json) == yaml.safe_load(serialized_as_yaml)
+
+
+def test_json_serialization_preserves_dates_and_bytes():
+    obj_as_dict = {
+        "time": datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        "day": date(2026, 1, 2),
+        "data": b"\x00\x01",
+        "nested": [{"$datetime": "not a tag"}, {"$bytes": "AAE="}],
+    }
+    serialized = _dump_serialized_dict(obj_as_dict, SerializationFormat.JSON)
+    assert _load_serialized_dict(serialized) == obj_as_dict
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"__wayflow_type__": "datetime", "value": "2026-01-02T03:04:05"},
+        {"__wayflow_type__": "unknown"},
+        {"__wayflow_type__": "dict", "value": [["a", 1]], "other": 2},
+    ],
+)
+def test_json_serialization_does_not_decode_user_dicts_using_the_reserved_key(value):
+    obj_as_dict = {"value": value, "nested": [value]}
+    serialized = _dump_serialized_dict(obj_as_dict, SerializationFormat.JSON)
+    assert _load_serialized_dict(serialized) == obj_as_dict
+
+
+def test_json_serialization_preserves_dict_keys_that_are_not_strings():
+    obj_as_dict = {
+        "by_int": {1: "one", 2: {3: "three"}},
+        "mixed": {"a": 1, None: 2, 1.5: 3, True: 4},
+        "by_tuple": {(1, "a"): "value"},
+        "by_date": {date(2026, 1, 2): "day"},
+    }
+    serialized = _dump_serialized_dict(obj_as_dict, SerializationFormat.JSON)
+    assert _load_serialized_dict(serialized) == obj_as_dict
+
+
+def test_yaml_flow_mapping_is_detected_as_yaml():
+    assert _load_serialized_dict("{a: 1, b: [x, y]}") == {"a": 1, "b": ["x", "y"]}
+
+
+def test_serialize_rejects_unknown_formats(flow_conversation):
+    with pytest.raises(ValueError):
+        serialize(flow_conversation, serialization_format="xml")
+
+
+def test_serialize_to_dict_is_shared_by_all_formats(flow_conversation):
+    pytest.importorskip("msgpack")
+    obj_as_dict = serialize_to_dict(flow_conversation)
+    for serialization_format in SerializationFormat:
+        serialized = _dump_serialized_dict(obj_as_dict, serialization_format)
+        assert _load_serialized_dict(serialized, serialization_format) == obj_as_dict
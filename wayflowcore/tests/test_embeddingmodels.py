@@ -7,11 +7,16 @@
 import os
 import random
 import ssl
+import warnings
 from unittest.mock import MagicMock, patch
 
+import anyio
 import pytest
 import yaml
 
+from wayflowcore.datastore._relational import RelationalDatastore
+from wayflowcore.datastore.inmemory import _INMEMORY_USER_WARNING, InMemoryDatastore
+from wayflowcore.embeddingmodels import CachedEmbeddingModel
 from wayflowcore.embeddingmodels.ocigenaimodel import OCIGenAIEmbeddingModel
 from wayflowcore.embeddingmodels.ollamamodel import OllamaEmbeddingModel
 from wayflowcore.embeddingmodels.openaicompatiblemodel import (
@@ -20,9 +25,11 @@ from wayflowcore.embeddingmodels.openaicompatiblemodel import (
 )
 from wayflowcore.embeddingmodels.openaimodel import OpenAIEmbeddingModel
 from wayflowcore.embeddingmodels.vllmmodel import VllmEmbeddingModel
+from wayflowcore.retrypolicy import RetryPolicy
 from wayflowcore.serialization.serializer import autodeserialize, serialize, serialize_to_dict
 
 from .conftest import e5large_api_url, ollama_embedding_api_url
+from .testhelpers.dummy import DummyEmbeddingModel
 
 
 @pytest.fixture
@@ -559,6 +566,43 @@ def test_embedding_model_multiple_embeds_oci(
     assert all(len(embedding) == embedding_dim for embedding in embeddings)
 
 
+@pytest.mark.anyio
+async def test_oci_embedding_model_embeds_asynchronously_over_httpx(
+    oci_client_config_with_generated_key,
+):
+    """Test that async OCI embeddings are signed and sent over httpx, and retried without blocking"""
+    import httpx
+
+    embedding_model = OCIGenAIEmbeddingModel(
+        model_id="cohere.embed-english-light-v3.0",
+        config=oci_client_config_with_generated_key,
+        compartment_id="ocid1.compartment.oc1..aaaaaaaa",
+        retry_policy=RetryPolicy(max_attempts=2, initial_retry_delay=0.01, jitter=None),
+    )
+    responses = [
+        httpx.Response(503, json={"code": "ServiceUnavailable", "message": "Try again"}),
+        httpx.Response(
+            200,
+            json={"id": "id", "embeddings": [[0.1, 0.2], [0.3, 0.4]], "modelId": "model"},
+        ),
+    ]
+    sent_requests = []
+
+    async def _send(request, **kwargs):
+        sent_requests.append(request)
+        return responses.pop(0)
+
+    with patch("httpx.AsyncClient.send", side_effect=_send), patch(
+        "time.sleep", side_effect=AssertionError("the retries should not block")
+    ):
+        embeddings = await embedding_model.embed_async(["hello", "world"])
+
+    assert embeddings == [[0.1, 0.2], [0.3, 0.4]]
+    assert len(sent_requests) == 2
+    assert str(sent_requests[-1].url).endswith("/20231130/actions/embedText")
+    assert "authorization" in sent_requests[-1].headers
+
+
 def test_missing_open_api_key():
     """Test behavior when no API key is provided and not available in environment"""
     try:
@@ -920,3 +964,351 @@ def test_openaicompatibleembeddingmodel_works_without_http(request):
     assert all(isinstance(sublist, list) for sublist in embedding)
     assert all(all(isinstance(item, float) for item in sublist) for sublist in embedding)
     assert len(embedding) == 1
+
+
+class _ConcurrencyTrackingEmbeddingModel(DummyEmbeddingModel):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+        self.current_concurrency = 0
+        self.max_concurrency = 0
+
+    async def embed_async(self, data):
+        self.batches.append(list(data))
+        self.current_concurrency += 1
+        self.max_concurrency = max(self.max_concurrency, self.current_concurrency)
+        await anyio.sleep(0.02)
+        self.current_concurrency -= 1
+        return self.embed(data)
+
+
+def test_cached_embedding_model_deduplicates_and_caches_texts():
+    embedding_model = DummyEmbeddingModel()
+    cached_model = CachedEmbeddingModel(embedding_model)
+
+    embeddings = cached_model.embed(["hello world", "goodbye", "hello world"])
+    assert embedding_model.embedded_texts == ["hello world", "goodbye"]
+    assert embeddings == DummyEmbeddingModel().embed(["hello world", "goodbye", "hello world"])
+
+    assert cached_model.embed(["goodbye", "hello world"]) == [embeddings[1], embeddings[0]]
+    assert embedding_model.num_calls == 1
+
+
+def test_cached_embedding_model_splits_inputs_in_concurrent_batches():
+    embedding_model = _ConcurrencyTrackingEmbeddingModel()
+    cached_model = CachedEmbeddingModel(embedding_model, max_batch_size=3, max_concurrent_batches=2)
+    texts = [f"text {idx}" for idx in range(10)]
+
+    embeddings = cached_model.embed(texts)
+
+    assert [len(batch) for batch in embedding_model.batches] == [3, 3, 3, 1]
+    assert embedding_model.max_concurrency == 2
+    assert embeddings == DummyEmbeddingModel().embed(texts)
+
+
+def test_cached_embedding_model_evicts_least_recently_used_embeddings():
+    embedding_model = DummyEmbeddingModel()
+    cached_model = CachedEmbeddingModel(embedding_model, max_cache_size=2)
+    cached_model.embed(["a"])
+    cached_model.embed(["b"])
+    cached_model.embed(["a"])
+    cached_model.embed(["c"])
+
+    cached_model.embed(["a", "b", "c"])
+    assert embedding_model.embedded_texts == ["a", "b", "c", "b"]
+
+
+def test_cached_embedding_model_shares_embeddings_through_datastore():
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message=f"{_INMEMORY_USER_WARNING}*")
+        datastore = InMemoryDatastore(
+            {"embeddings": CachedEmbeddingModel.get_entity_definition()},
+            indexed_columns={"embeddings": ["cache_key"]},
+        )
+    first_model = DummyEmbeddingModel()
+    embeddings = CachedEmbeddingModel(
+        first_model, datastore=datastore, cache_collection_name="embeddings"
+    ).embed(["a", "b"])
+
+    second_model = DummyEmbeddingModel()
+    # models without a model id are identified by their name in the cache
+    second_model.name = first_model.name
+    cached_model = CachedEmbeddingModel(
+        second_model, datastore=datastore, cache_collection_name="embeddings"
+    )
+    assert cached_model.embed(["b", "a", "c"])[:2] == [embeddings[1], embeddings[0]]
+    assert second_model.embedded_texts == ["c"]
+    assert len(datastore.list("embeddings")) == 3
+
+
+class _SqliteDatastore(RelationalDatastore):
+    def _serialize_to_dict(self, serialization_context):
+        raise NotImplementedError()
+
+    @classmethod
+    def _deserialize_from_dict(cls, input_dict, deserialization_context):
+        raise NotImplementedError()
+
+
+@pytest.fixture
+def sqlite_embeddings_datastore(tmp_path):
+    import sqlalchemy
+
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'embeddings.db'}")
+    with engine.begin() as connection:
+        connection.execute(
+            sqlalchemy.text(
+                "CREATE TABLE embeddings (cache_key VARCHAR(64), embedding VARCHAR(4000) NOT NULL)"
+            )
+        )
+    selected_statements = []
+
+    @sqlalchemy.event.listens_for(engine, "before_cursor_execute")
+    def _record_selects(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selected_statements.append(statement)
+
+    def async_engine_factory():
+        raise ImportError("No module named 'aiosqlite'")
+
+    datastore = _SqliteDatastore(
+        {"embeddings": CachedEmbeddingModel.get_entity_definition()},
+        engine,
+        async_engine_factory=async_engine_factory,
+    )
+    yield datastore, selected_statements
+    engine.dispose()
+
+
+def test_cached_embedding_model_looks_up_relational_datastore_in_batches(
+    sqlite_embeddings_datastore,
+):
+    datastore, selected_statements = sqlite_embeddings_datastore
+    texts = [f"text {idx}" for idx in range(1200)]
+    first_model = DummyEmbeddingModel()
+    embeddings = CachedEmbeddingModel(
+        first_model, datastore=datastore, cache_collection_name="embeddings"
+    ).embed(texts)
+
+    selected_statements.clear()
+    embedding_model = DummyEmbeddingModel()
+    embedding_model.name = first_model.name
+    cached_model = CachedEmbeddingModel(
+        embedding_model, datastore=datastore, cache_collection_name="embeddings"
+    )
+    assert cached_model.embed(texts) == embeddings
+    assert embedding_model.embedded_texts == []
+    # one query per chunk of 500 keys, instead of one query per key
+    assert len(selected_statements) == 3
+
+
+class _RacingEmbeddingModel(DummyEmbeddingModel):
+    """Caches its embeddings in the datastore while embedding them, like a concurrent process would"""
+
+    def __init__(self, datastore):
+        super().__init__()
+        self.datastore = datastore
+
+    async def embed_async(self, data):
+        if self.datastore is not None:
+            other_process_model = _RacingEmbeddingModel(datastore=None)
+            other_process_model.name = self.name
+            await CachedEmbeddingModel(
+                other_process_model, datastore=self.datastore, cache_collection_name="embeddings"
+            ).embed_async(data)
+        return self.embed(data)
+
+
+def test_cached_embedding_model_does_not_store_embeddings_already_cached_by_other_processes(
+    sqlite_embeddings_datastore,
+):
+    datastore, _ = sqlite_embeddings_datastore
+    cached_model = CachedEmbeddingModel(
+        _RacingEmbeddingModel(datastore), datastore=datastore, cache_collection_name="embeddings"
+    )
+    cached_model.embed(["a", "b"])
+    assert len(datastore.list("embeddings")) == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [dict(max_batch_size=0), dict(max_concurrent_batches=0), dict(max_cache_size=0)],
+)
+def test_cached_embedding_model_rejects_invalid_parameters(kwargs):
+    with pytest.raises(ValueError, match=list(kwargs)[0]):
+        CachedEmbeddingModel(DummyEmbeddingModel(), **kwargs)
+
+
+def test_cached_embedding_model_serialization():
+    cached_model = CachedEmbeddingModel(
+        VllmEmbeddingModel(base_url="http://embedding.url", model_id="model-id"),
+        max_batch_size=32,
+        max_concurrent_batches=8,
+        max_cache_size=None,
+    )
+    deserialized_model = autodeserialize(serialize(cached_model))
+
+    assert isinstance(deserialized_model, CachedEmbeddingModel)
+    assert isinstance(deserialized_model.embedding_model, VllmEmbeddingModel)
+    assert deserialized_model.embedding_model._model_id == "model-id"
+    assert deserialized_model.max_batch_size == 32
+    assert deserialized_model.max_concurrent_batches == 8
+    assert deserialized_model.max_cache_size is None
+
+
+@pytest.fixture
+def mock_embedding_endpoint():
+    requested_inputs = []
+
+    async def post(*args, **kwargs):
+        texts = kwargs["json"]["input"]
+        requested_inputs.append(list(texts))
+        await anyio.sleep(0.01)
+        if "fail" in texts:
+            return MockResponse({"error": "invalid input"}, status_code=400)
+        return MockResponse(
+            {
+                "data": [
+                    {"embedding": [float(len(text))], "index": i} for i, text in enumerate(texts)
+                ]
+            }
+        )
+
+    with patch("httpx.AsyncClient.post", side_effect=post):
+        yield requested_inputs
+
+
+async def _embed_concurrently(model, queries):
+    results = [None] * len(queries)
+
+    async def _embed(idx):
+        try:
+            results[idx] = await model.embed_async(queries[idx])
+        except Exception as e:
+            results[idx] = e
+
+    async with anyio.create_task_group() as tg:
+        for idx in range(len(queries)):
+            tg.start_soon(_embed, idx)
+    return results
+
+
+@pytest.mark.anyio
+async def test_embedding_model_coalesces_concurrent_requests(mock_embedding_endpoint):
+    model = VllmEmbeddingModel(
+        base_url="http://embedding.url", model_id="model-id", max_coalescing_delay=0.05
+    )
+    queries = [["a" * length] for length in range(1, 6)] + [["bb", "ccc"]]
+
+    results = await _embed_concurrently(model, queries)
+
+    assert len(mock_embedding_endpoint) == 1
+    assert sorted(mock_embedding_endpoint[0]) == sorted(t for query in queries for t in query)
+    assert results == [[[float(len(text))] for text in query] for query in queries]
+
+
+@pytest.mark.anyio
+async def test_embedding_model_sends_coalesced_batch_once_full(mock_embedding_endpoint):
+    model = VllmEmbeddingModel(
+        base_url="http://embedding.url",
+        model_id="model-id",
+        max_coalescing_delay=10,
+        max_coalesced_batch_size=3,
+    )
+    queries = [[f"text {idx}"] for idx in range(6)] + [["a", "b", "c", "d"]]
+
+    with anyio.fail_after(5):
+        results = await _embed_concurrently(model, queries)
+
+    assert sorted(len(inputs) for inputs in mock_embedding_endpoint) == [3, 3, 4]
+    assert results[-1] == [[1.0]] * 4
+
+
+@pytest.mark.anyio
+async def test_embedding_model_coalescing_propagates_errors_to_all_callers(
+    mock_embedding_endpoint,
+):
+    model = VllmEmbeddingModel(
+        base_url="http://embedding.url",
+        model_id="model-id",
+        max_coalescing_delay=0.05,
+        retry_policy=RetryPolicy(max_attempts=0),
+    )
+
+    results = await _embed_concurrently(model, [["ok"], ["fail"], ["ok too"]])
+
+    assert len(mock_embedding_endpoint) == 1
+    assert all(isinstance(result, Exception) for result in results)
+
+
+@pytest.mark.anyio
+async def test_embedding_model_coalescing_serves_other_callers_when_the_leader_is_cancelled(
+    mock_embedding_endpoint,
+):
+    model = VllmEmbeddingModel(
+        base_url="http://embedding.url", model_id="model-id", max_coalescing_delay=0.05
+    )
+    leader_scope = anyio.CancelScope()
+    follower_results = []
+
+    async def _lead() -> None:
+        with leader_scope:
+            await model.embed_async(["a"])
+
+    async def _follow() -> None:
+        await anyio.sleep(0.01)
+        follower_results.append(await model.embed_async(["bb"]))
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_lead)
+        tg.start_soon(_follow)
+        # the leader is cancelled while waiting for other requests to join its batch
+        await anyio.sleep(0.03)
+        leader_scope.cancel()
+
+    assert leader_scope.cancelled_caught
+    assert mock_embedding_endpoint == [["a", "bb"]]
+    assert follower_results == [[[2.0]]]
+
+
+@pytest.mark.anyio
+async def test_embedding_model_does_not_coalesce_requests_by_default(mock_embedding_endpoint):
+    model = VllmEmbeddingModel(base_url="http://embedding.url", model_id="model-id")
+
+    await _embed_concurrently(model, [["a"], ["b"], ["c"]])
+
+    assert len(mock_embedding_endpoint) == 3
+
+
+def test_embedding_model_coalescing_works_from_sync_code(mock_embedding_endpoint):
+    model = VllmEmbeddingModel(
+        base_url="http://embedding.url", model_id="model-id", max_coalescing_delay=0.001
+    )
+    assert model.embed(["a", "bb"]) == [[1.0], [2.0]]
+    assert model.embed(["ccc"]) == [[3.0]]
+    assert mock_embedding_endpoint == [["a", "bb"], ["ccc"]]
+
+
+@pytest.mark.parametrize(
+    "kwargs", [dict(max_coalescing_delay=-1), dict(max_coalesced_batch_size=0)]
+)
+def test_embedding_model_rejects_invalid_coalescing_parameters(kwargs):
+    with pytest.raises(ValueError, match=list(kwargs)[0]):
+        VllmEmbeddingModel(
+            base_url="http://embedding.url",
+            model_id="model-id",
+            **{"max_coalescing_delay": 0.01, **kwargs},
+        )
+
+
+def test_embedding_model_coalescing_serialization():
+    model = OpenAIEmbeddingModel(
+        model_id="text-embedding-3-small",
+        api_key="key",
+        max_coalescing_delay=0.005,
+        max_coalesced_batch_size=16,
+    )
+    deserialized_model = autodeserialize(serialize(model))
+
+    assert deserialized_model.max_coalescing_delay == 0.005
+    assert deserialized_model.max_coalesced_batch_size == 16
@@ -11,9 +11,11 @@ import pytest
 from wayflowcore.agent import Agent
 from wayflowcore.controlconnection import ControlFlowEdge
 from wayflowcore.conversation import Conversation
+from wayflowcore.events.event import StepInvocationStartEvent
+from wayflowcore.events.eventlistener import GenericEventListener, register_event_listeners
 from wayflowcore.executors._events.event import Event, EventType
 from wayflowcore.executors._executionstate import ConversationExecutionState
-from wayflowcore.executors.executionstatus import UserMessageRequestStatus
+from wayflowcore.executors.executionstatus import FinishedStatus, UserMessageRequestStatus
 from wayflowcore.executors.interrupts.executioninterrupt import (
     FlexibleExecutionInterrupt,
     FlowExecutionInterrupt,
@@ -420,6 +422,103 @@ def test_flow_assistant_interrupts_are_triggered_in_parallel_subflow(
         assert_conversations_are_equivalent(conversation, conversation_with_interrupts)
 
 
+class OnStepEventExecutionInterrupt(
+    _AllEventsInterruptMixin, FlexibleExecutionInterrupt, FlowExecutionInterrupt
+):
+
+    def __init__(self, trigger_on_event: EventType, step_name: str):
+        self.trigger_on_event = trigger_on_event
+        self.step_name = step_name
+        self.triggered = False
+        self.current_event = None
+        super().__init__()
+
+    def _return_status_if_condition_is_met(
+        self, state: ConversationExecutionState, conversation: Conversation
+    ) -> Optional[InterruptedExecutionStatus]:
+        if (
+            self.current_event is not None
+            and self.current_event.type == self.trigger_on_event
+            and self.step_name == conversation.current_step_name
+            and not self.triggered
+        ):
+            self.triggered = True
+            return InterruptedExecutionStatus(
+                interrupter=self,
+                reason=f"{self.trigger_on_event} {self.step_name}",
+                _conversation_id=conversation.id,
+            )
+        return None
+
+    def on_event(
+        self, event: Event, state: ConversationExecutionState, conversation: Conversation
+    ) -> Optional[InterruptedExecutionStatus]:
+        self.current_event = event
+        return super().on_event(event, state, conversation)
+
+    def _serialize_to_dict(self, serialization_context: "SerializationContext") -> Dict[str, Any]:
+        return {"trigger_on_event": self.trigger_on_event, "step_name": self.step_name}
+
+    @classmethod
+    def _deserialize_from_dict(
+        cls, input_dict: Dict[str, Any], deserialization_context: "DeserializationContext"
+    ) -> "SerializableObject":
+        return OnStepEventExecutionInterrupt(
+            trigger_on_event=input_dict["trigger_on_event"], step_name=input_dict["step_name"]
+        )
+
+
+@pytest.mark.parametrize(
+    "event_type, expected_invoked_steps_before_resuming",
+    [
+        (EventType.EXECUTION_LOOP_ITERATION_START, ["prompt_a"]),
+        # the iteration of `prompt_a` ends when the next step is `prompt_b`
+        (EventType.EXECUTION_LOOP_ITERATION_END, ["prompt_a", "prompt_b", "prompt_c"]),
+    ],
+)
+def test_flow_interrupts_do_not_execute_concurrent_steps_twice(
+    event_type, expected_invoked_steps_before_resuming
+):
+    llm = DummyModel()
+    llm.set_next_output({f"question {k}": f"answer {k}" for k in "abc"})
+    flow = Flow.from_steps(
+        [
+            PromptExecutionStep(
+                prompt_template=f"question {k}",
+                llm=llm,
+                output_mapping={PromptExecutionStep.OUTPUT: f"answer_{k}"},
+                name=f"prompt_{k}",
+            )
+            for k in "abc"
+        ],
+        max_concurrent_steps=3,
+    )
+    assert flow._concurrent_step_groups["prompt_a"] == ["prompt_a", "prompt_b", "prompt_c"]
+    invoked_steps = []
+    event_listener = GenericEventListener(
+        event_classes=[StepInvocationStartEvent],
+        function=lambda e: (
+            invoked_steps.append(e.step.name) if e.step.name.startswith("prompt_") else None
+        ),
+    )
+    execution_interrupts = [
+        OnStepEventExecutionInterrupt(trigger_on_event=event_type, step_name="prompt_b")
+    ]
+    conversation = flow.start_conversation()
+
+    with register_event_listeners([event_listener]):
+        execution_status = conversation.execute(execution_interrupts=execution_interrupts)
+        assert isinstance(execution_status, InterruptedExecutionStatus)
+        assert invoked_steps == expected_invoked_steps_before_resuming
+
+        execution_status = conversation.execute(execution_interrupts=execution_interrupts)
+
+    assert isinstance(execution_status, FinishedStatus)
+    assert sorted(invoked_steps) == ["prompt_a", "prompt_b", "prompt_c"]
+    assert conversation.state.step_history == ["__StartStep__", "prompt_a", "prompt_b", "prompt_c"]
+    assert execution_status.output_values == {f"answer_{k}": f"answer {k}" for k in "abc"}
+
+
 def test_conversations_have_default_timeout_execution_interrupt(remotely_hosted_llm):
     assistant = create_basic_flow_assistant()
     conversation = assistant.start_conversation()
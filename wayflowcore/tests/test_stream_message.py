@@ -9,7 +9,7 @@ from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
 import pytest
 
 from wayflowcore.flowhelpers import create_single_step_flow
-from wayflowcore.messagelist import Message, MessageType
+from wayflowcore.messagelist import Message, MessageType, TextContent
 from wayflowcore.models import StreamChunkType
 from wayflowcore.steps import OutputMessageStep
 from wayflowcore.tools import ToolRequest
@@ -95,3 +95,41 @@ async def test_streaming_message_with_tools() -> None:
     assert message.tool_requests[0].tool_request_id == "1234d"
     assert message.tool_requests[0].name == "foo"
     assert message.tool_requests[0].args == {"bar": "baz"}
+
+
+@pytest.mark.anyio
+async def test_streaming_long_message_accumulates_all_chunks() -> None:
+    conversation = simple_conversation()
+    chunks = [f"token{idx} " for idx in range(10_000)]
+
+    async def llm_generator() -> AsyncIterator[Tuple[StreamChunkType, Message]]:
+        yield StreamChunkType.START_CHUNK, Message(message_type=MessageType.AGENT, content="Hi: ")
+        for idx, chunk in enumerate(chunks):
+            yield StreamChunkType.TEXT_CHUNK, Message(content=chunk)
+            if idx == 5:
+                assert conversation.get_last_message().content == "Hi: " + "".join(chunks[:6])
+        yield StreamChunkType.END_CHUNK, Message(
+            message_type=MessageType.AGENT, content="Hi: " + "".join(chunks)
+        )
+
+    message = await conversation.message_list._stream_message(llm_generator())
+    assert message.content == "Hi: " + "".join(chunks)
+    last_message = conversation.get_last_message()
+    assert last_message.content == message.content
+    assert all(type(content) is TextContent for content in last_message.contents)
+
+
+@pytest.mark.anyio
+async def test_interrupted_streaming_keeps_regular_text_contents() -> None:
+    conversation = simple_conversation()
+
+    async def llm_generator() -> AsyncIterator[Tuple[StreamChunkType, Message]]:
+        yield StreamChunkType.START_CHUNK, Message(message_type=MessageType.AGENT, content="")
+        yield StreamChunkType.TEXT_CHUNK, Message(content="Hello ")
+        yield StreamChunkType.TEXT_CHUNK, Message(content="World")
+
+    with pytest.raises(ValueError, match="no END_CHUNK"):
+        await conversation.message_list._stream_message(llm_generator())
+    last_message = conversation.get_last_message()
+    assert last_message.content == "Hello World"
+    assert [type(content) for content in last_message.contents] == [TextContent]
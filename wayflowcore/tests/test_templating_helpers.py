@@ -10,9 +10,13 @@ import jinja2
 import pytest
 
 from wayflowcore._utils._templating_helpers import (
+    _clear_template_caches,
+    _get_template_cache_info,
     check_template_validity,
     get_variable_names_from_object,
+    get_variable_names_from_str_template,
     render_nested_object_template,
+    render_str_template,
     render_template_partially,
 )
 from wayflowcore.exceptions import SecurityException
@@ -336,3 +340,38 @@ def test_check_template_validity_works_on_correct_templates(template):
 def test_check_template_validity_raises_on_incorrect_templates(template):
     with pytest.raises(jinja2.exceptions.TemplateSyntaxError):
         check_template_validity(template)
+
+
+def test_rendering_a_template_several_times_compiles_it_once() -> None:
+    _clear_template_caches()
+    template = "Hello {{ name }}, {{ greeting }}"
+
+    for name in ["Alice", "Bob", "Carol"]:
+        assert render_str_template(template, {"name": name, "greeting": "hi"}) == (
+            f"Hello {name}, hi"
+        )
+    assert render_str_template(template, {"name": "Dan"}, partial=True) == (
+        "Hello Dan, {{ greeting }}"
+    )
+
+    cache_info = _get_template_cache_info()
+    # one compilation per undefined mode, the variable names are extracted once
+    assert cache_info["compiled_templates"].misses == 2
+    assert cache_info["compiled_templates"].hits == 2
+    assert cache_info["variable_names"].misses == 1
+
+
+def test_cached_variable_names_are_not_shared_with_callers() -> None:
+    template = "{{ a }} {{ b }}"
+    variable_names = get_variable_names_from_str_template(template)
+    variable_names.append("c")
+    assert get_variable_names_from_str_template(template) == ["a", "b"]
+
+
+def test_cached_templates_are_still_sandboxed() -> None:
+    template = "{{ obj.name }}"
+    assert render_str_template(template, {"obj": {"name": "safe"}}) == "safe"
+    with pytest.raises(SecurityException, match="is not safe and raised a security error"):
+        render_str_template(template, {"obj": {"a": 1}})
+    with pytest.raises(SecurityException, match="Rendering type"):
+        render_str_template(template, {"obj": Message(content="Hello!")})
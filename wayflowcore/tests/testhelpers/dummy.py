@@ -7,6 +7,7 @@
 from typing import Annotated, Any, AsyncIterable, Dict, List, Optional, Union
 
 from wayflowcore._metadata import MetadataType
+from wayflowcore.embeddingmodels import EmbeddingModel
 from wayflowcore.executors._flowconversation import FlowConversation
 from wayflowcore.messagelist import Message, MessageType
 from wayflowcore.models import StreamChunkType, TaggedMessageChunkTypeWithTokenUsage
@@ -119,6 +120,42 @@ class DummyModel(LlmModel):
         raise NotImplementedError("Dummy models are not supported for serialization")
 
 
+class DummyEmbeddingModel(EmbeddingModel):
+    """Deterministic bag-of-words embedding model, recording every text it embeds."""
+
+    def __init__(self, dimension: int = 16):
+        super().__init__(__metadata_info__=None)
+        self.dimension = dimension
+        self.embedded_texts: List[str] = []
+        self.num_calls = 0
+
+    def _embed_text(self, text: str) -> List[float]:
+        import zlib
+
+        vector = [0.0] * self.dimension
+        for word in text.lower().split():
+            vector[zlib.crc32(word.encode()) % self.dimension] += 1.0
+        vector[0] += 1e-3  # avoid null vectors for empty texts
+        return vector
+
+    def embed(self, data: List[str]) -> List[List[float]]:
+        self.num_calls += 1
+        self.embedded_texts.extend(data)
+        return [self._embed_text(text) for text in data]
+
+    async def embed_async(self, data: List[str]) -> List[List[float]]:
+        return self.embed(data)
+
+    def _serialize_to_dict(self, serialization_context: Any) -> Dict[str, Any]:
+        return {"dimension": self.dimension}
+
+    @classmethod
+    def _deserialize_from_dict(
+        cls, input_dict: Dict[str, Any], deserialization_context: Any
+    ) -> "DummyEmbeddingModel":
+        return cls(dimension=input_dict["dimension"])
+
+
 def generate_usual_sequence_of_chunk(
     final_message: Message,
 ) -> List[TaggedMessageChunkTypeWithTokenUsage]:
@@ -8,6 +8,7 @@ import time
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
+import anyio
 import pytest
 
 from tests.testhelpers.testhelpers import retry_test
@@ -16,6 +17,7 @@ from wayflowcore.datastore.inmemory import _INMEMORY_USER_WARNING, InMemoryDatas
 from wayflowcore.managerworkers import ManagerWorkers
 from wayflowcore.messagelist import ImageContent, Message, MessageType, TextContent
 from wayflowcore.models.llmmodel import LlmCompletion, LlmModel
+from wayflowcore.serialization import deserialize, serialize
 from wayflowcore.swarm import HandoffMode, Swarm
 from wayflowcore.templates._managerworkerstemplate import _DEFAULT_MANAGERWORKERS_CHAT_TEMPLATE
 from wayflowcore.templates._swarmtemplate import _DEFAULT_SWARM_CHAT_TEMPLATE
@@ -24,8 +26,13 @@ from wayflowcore.transforms import (
     ConversationSummarizationTransform,
     MessageSummarizationTransform,
     MessageTransform,
+    SummarizationMode,
+)
+from wayflowcore.transforms.summarization import (
+    _SUMMARIZATION_WARNING_MESSAGE,
+    _MessageCache,
+    _Summarizer,
 )
-from wayflowcore.transforms.summarization import _SUMMARIZATION_WARNING_MESSAGE
 
 from ..conftest import mock_llm, patch_streaming_llm
 from ..testhelpers.patching import patch_llm
@@ -1679,7 +1686,7 @@ def test_conversation_summarization_trigger_and_cache_incremental(get_setup):
             # exclude last message which the agent just generated.
             assert transformed_messages[1:] == conversation_messsages_contents[-6:-1]
 
-    datastore.delete(collection_name=collection_name, where={})
+    datastore.delete(collection_name=collection_name, where={"cache_key": conv.id})
 
     conv.append_message(Message(message_type=MessageType.USER, content=f"hello 10"))
     # not cached, summarization should happen.
@@ -1856,3 +1863,198 @@ def test_summarization_transform_have_default_inmemory_datastore(transform_cls):
     llm = mock_llm()
     with pytest.warns(UserWarning, match=_SUMMARIZATION_WARNING_MESSAGE):
         transform = transform_cls(llm=llm)
+
+
+class _ListCountingInMemoryDatastore(InMemoryDatastore):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.num_full_listings = 0
+
+    def list(self, collection_name, where=None, limit=None):
+        if where is None:
+            self.num_full_listings += 1
+        return super().list(collection_name, where, limit)
+
+
+def _create_message_cache(datastore, max_cache_size=3, max_cache_lifetime=None):
+    return _MessageCache(
+        max_cache_size=max_cache_size,
+        max_cache_lifetime=max_cache_lifetime,
+        datastore=datastore,
+        collection_name=MESSAGE_SUMMARIZATION_CACHE_COLLECTION_NAME,
+        entity_def=MessageSummarizationTransform.get_entity_definition(),
+    )
+
+
+def _create_cache_datastore(datastore_cls=InMemoryDatastore):
+    return datastore_cls(
+        {
+            MESSAGE_SUMMARIZATION_CACHE_COLLECTION_NAME: MessageSummarizationTransform.get_entity_definition()
+        },
+        indexed_columns={MESSAGE_SUMMARIZATION_CACHE_COLLECTION_NAME: ["cache_key"]},
+    )
+
+
+@filter_in_memory_datastore_warnings
+def test_message_cache_evicts_lru_entries_without_listing_the_collection():
+    datastore = _create_cache_datastore(_ListCountingInMemoryDatastore)
+    cache = _create_message_cache(datastore, max_cache_lifetime=3600)
+    # the entries already in the datastore are listed once, on the first store
+    cache.store("a", {"cache_content": "a"})
+    num_listings_after_first_store = datastore.num_full_listings
+
+    for cache_key in ["b", "c"]:
+        cache.store(cache_key, {"cache_content": cache_key})
+    assert cache.retrieve("a") is not None
+    cache.store("d", {"cache_content": "d"})
+
+    assert datastore.num_full_listings == num_listings_after_first_store
+    cached_keys = {
+        entry["cache_key"] for entry in datastore.list(MESSAGE_SUMMARIZATION_CACHE_COLLECTION_NAME)
+    }
+    assert cached_keys == {"a", "c", "d"}
+    assert cache.retrieve("b") is None
+
+
+@filter_in_memory_datastore_warnings
+def test_message_cache_replaces_entries_stored_under_the_same_key():
+    datastore = _create_cache_datastore()
+    cache = _create_message_cache(datastore)
+
+    cache.store("a", {"cache_content": "first summary"})
+    cache.store("a", {"cache_content": "second summary"})
+
+    entries = datastore.list(MESSAGE_SUMMARIZATION_CACHE_COLLECTION_NAME)
+    assert [entry["cache_content"] for entry in entries] == ["second summary"]
+    assert cache.retrieve("a")["cache_content"] == "second summary"
+
+
+@filter_in_memory_datastore_warnings
+def test_message_cache_tracks_entries_already_in_the_datastore():
+    datastore = _create_cache_datastore()
+    first_cache = _create_message_cache(datastore)
+    for cache_key in ["a", "b", "c"]:
+        first_cache.store(cache_key, {"cache_content": cache_key})
+    first_cache.retrieve("a")
+
+    # e.g. another process, or a restarted one, using the same datastore
+    second_cache = _create_message_cache(datastore)
+    second_cache.store("d", {"cache_content": "d"})
+
+    assert second_cache.retrieve("b") is None
+    assert first_cache.retrieve("b") is None
+    for cache_key in ["a", "c", "d"]:
+        assert first_cache.retrieve(cache_key)["cache_content"] == cache_key
+
+
+@filter_in_memory_datastore_warnings
+def test_message_cache_does_not_list_the_collection_on_creation_and_retrieval():
+    datastore = _create_cache_datastore(_ListCountingInMemoryDatastore)
+    _create_message_cache(datastore).store("a", {"cache_content": "a"})
+    num_listings = datastore.num_full_listings
+
+    cache = _create_message_cache(datastore)
+    assert cache.retrieve("a")["cache_content"] == "a"
+    assert cache.retrieve("b") is None
+
+    assert datastore.num_full_listings == num_listings
+
+
+@filter_in_memory_datastore_warnings
+def test_message_cache_replaces_entries_stored_under_the_same_key_by_another_process():
+    datastore = _create_cache_datastore()
+    first_cache = _create_message_cache(datastore)
+    second_cache = _create_message_cache(datastore)
+    second_cache.store("b", {"cache_content": "b"})
+
+    first_cache.store("a", {"cache_content": "first summary"})
+    second_cache.store("a", {"cache_content": "second summary"})
+
+    entries = datastore.list(MESSAGE_SUMMARIZATION_CACHE_COLLECTION_NAME, where={"cache_key": "a"})
+    assert [entry["cache_content"] for entry in entries] == ["second summary"]
+    assert first_cache.retrieve("a")["cache_content"] == "second summary"
+
+
+class _ConcurrencyTrackingSummarizationLlm:
+    def __init__(self):
+        self.num_running_requests = 0
+        self.max_num_running_requests = 0
+        self.prompts = []
+
+    async def generate_async(self, prompt):
+        self.num_running_requests += 1
+        self.max_num_running_requests = max(
+            self.max_num_running_requests, self.num_running_requests
+        )
+        self.prompts.append(prompt)
+        await anyio.sleep(0.05)
+        self.num_running_requests -= 1
+        summarized_contents = [content.content for content in prompt.messages[0].contents[1:]]
+        return LlmCompletion(Message(f"summary of [{', '.join(summarized_contents)}]"), None)
+
+
+def _summarize_with_mode(summarization_mode, num_chunks, max_concurrent_summarizations=4):
+    llm = mock_llm()
+    summarization_llm = _ConcurrencyTrackingSummarizationLlm()
+    summarizer = _Summarizer(
+        llm,
+        "Summarize",
+        "{{summary}}",
+        summarization_mode=summarization_mode,
+        max_concurrent_summarizations=max_concurrent_summarizations,
+    )
+    contents = [TextContent(f"part{idx} " + "x" * 400) for idx in range(num_chunks)]
+    with patch.object(llm, "generate_async", summarization_llm.generate_async):
+        summary = anyio.run(summarizer.summarize, contents, 150)
+    return summary, summarization_llm
+
+
+def test_map_reduce_summarization_summarizes_chunks_concurrently():
+    summary, summarization_llm = _summarize_with_mode(SummarizationMode.MAP_REDUCE, num_chunks=8)
+
+    assert summarization_llm.max_num_running_requests == 4
+    # 8 chunk summaries, then the merges of the summaries until a single one is left
+    assert len(summarization_llm.prompts) > 8
+    for idx in range(8):
+        assert f"part{idx}" in summary
+    assert summary.index("part0") < summary.index("part7")
+
+
+def test_refine_summarization_summarizes_chunks_sequentially():
+    summary, summarization_llm = _summarize_with_mode(SummarizationMode.REFINE, num_chunks=8)
+
+    assert summarization_llm.max_num_running_requests == 1
+    assert len(summarization_llm.prompts) == 8
+    assert "part7" in summary
+
+
+def test_map_reduce_summarization_of_a_single_chunk_makes_a_single_request():
+    summary, summarization_llm = _summarize_with_mode(SummarizationMode.MAP_REDUCE, num_chunks=1)
+
+    assert len(summarization_llm.prompts) == 1
+    assert "part0" in summary
+
+
+@pytest.mark.filterwarnings(f"ignore:{_SUMMARIZATION_WARNING_MESSAGE}:UserWarning")
+@pytest.mark.parametrize(
+    "transform_type", [MessageSummarizationTransform, ConversationSummarizationTransform]
+)
+def test_summarization_mode_is_serialized(transform_type):
+    transform = transform_type(
+        llm=mock_llm(),
+        datastore=None,
+        summarization_mode="map_reduce",
+        max_concurrent_summarizations=2,
+    )
+
+    deserialized_transform = deserialize(transform_type, serialize(transform))
+
+    assert deserialized_transform.summarization_mode == SummarizationMode.MAP_REDUCE
+    assert deserialized_transform.max_concurrent_summarizations == 2
+
+
+def test_summarization_transform_rejects_invalid_concurrency():
+    with pytest.raises(ValueError, match="max_concurrent_summarizations"):
+        MessageSummarizationTransform(
+            llm=mock_llm(), datastore=None, max_concurrent_summarizations=0
+        )